@@ -2,15 +2,61 @@ import pickle
 import neat
 import os
 from core import config
+from core.simulator import network_inputs, STATE_BALL_X, STATE_BALL_VEL_X
+
+LEFT_PADDLE_FACE = 10 + config.PADDLE_WIDTH
+RIGHT_PADDLE_FACE = config.SCREEN_WIDTH - 10 - config.PADDLE_WIDTH
+BALL_SIZE = config.BALL_RADIUS * 2
 
 class NeatAgent:
-    def __init__(self, net):
+    def __init__(self, net, reaction_distance=None, decision_interval=None):
+        """
+        Args:
+            net: NEAT network (or anything with a neat.nn style activate()).
+            reaction_distance: If set, the agent stays still without
+                activating its network while the ball moves away from it or
+                is more than this many pixels from its paddle. Such agents are
+                frame-skippable: GameRunner can fast-forward the idle stretches.
+            decision_interval: Optional number of frames between network
+                activations when run by GameRunner (the last move repeats in
+                between). If None, the runner's interval is used.
+        """
         self.net = net
+        self.reaction_distance = reaction_distance
+        self.decision_interval = decision_interval
+
+    @property
+    def frame_skippable(self):
+        return self.reaction_distance is not None
+
+    def idle_window(self, ball_x, ball_vel_x, side):
+        """
+        Returns the open interval of ball X in which the agent stays still,
+        as (x_min, x_max), or None if the agent never idles. The interval is
+        valid until the ball's horizontal direction changes (a paddle hit).
+        """
+        if self.reaction_distance is None:
+            return None
+        inf = float("inf")
+        if side == "left":
+            if ball_vel_x > 0:
+                return (-inf, inf)
+            return (LEFT_PADDLE_FACE + self.reaction_distance, inf)
+        if ball_vel_x < 0:
+            return (-inf, inf)
+        return (-inf, RIGHT_PADDLE_FACE - BALL_SIZE - self.reaction_distance)
+
+    def _is_idle(self, ball_x, ball_vel_x, side):
+        window = self.idle_window(ball_x, ball_vel_x, side)
+        return window is not None and window[0] < ball_x < window[1]
 
     def get_move(self, state, side):
         """
         Calculates the move based on game state and side ('left' or 'right').
         """
+        if self.reaction_distance is not None and self._is_idle(state["ball_x"], state["ball_vel_x"], side):
+            return None
+
         if side == "left":
             my_y = state["paddle_left_y"]
             op_y = state["paddle_right_y"]
@@ -45,6 +91,17 @@ class NeatAgent:
         act = out.index(max(out))
         return "UP" if act == 0 else "DOWN" if act == 1 else None
 
+    def get_move_from_buffer(self, state, side):
+        """
+        Same as get_move, reading a simulator's flat state buffer
+        (GameSimulator.state) instead of a state dict.
+        """
+        if self.reaction_distance is not None and self._is_idle(state[STATE_BALL_X], state[STATE_BALL_VEL_X], side):
+            return None
+        out = self.net.activate(network_inputs(state, side))
+        act = out.index(max(out))
+        return "UP" if act == 0 else "DOWN" if act == 1 else None
+
 class AgentFactory:
     @staticmethod
     def load_genome(path):
@@ -10,13 +10,47 @@ import pygame
 from core import config
 from core import engine as game_engine
 from core import simulator as game_simulator
+from core.simulator import (
+    network_inputs, EVENT_HIT_LEFT, EVENT_SCORE_LEFT, EVENT_SCORE_RIGHT,
+)
 import random
-from .opponents import get_rule_based_move
-from novelty_search import NoveltyArchive, calculate_bc_from_contacts
+import time
+from .opponents import get_rule_based_move, get_rule_based_move_from_buffer, TrackerOpponent
+from .fitness_cache import FitnessCache, genome_hash
+from .hall_of_fame import HallOfFame
+from .matchmaking import SwissScheduler, swiss_rounds
+from core.early_stop import DEFAULT_POLICY as DEFAULT_EARLY_STOP
+from .telemetry import DEFAULT_TELEMETRY as TELEMETRY, activation_timers, match_telemetry, timed_match
+from novelty_search import NoveltyArchive
+from core.behavior import BC_SIZE, BehaviorAccumulator, COUNT_FIELDS, LEFT, add_counts, behavior_vector
 
 
 # Novelty Search Archive
-NOVELTY_ARCHIVE = NoveltyArchive(max_size=500, k_nearest=config.NOVELTY_K_NEAREST)
+NOVELTY_ARCHIVE = NoveltyArchive(max_size=500, k_nearest=config.NOVELTY_K_NEAREST, dims=BC_SIZE)
+
+# Evaluations of deterministic evaluators, keyed by genome content hash
+FITNESS_CACHE = FitnessCache(max_size=config.FITNESS_CACHE_SIZE)
+
+
+def open_novelty_archive(path=None, readonly=False):
+    """Replaces NOVELTY_ARCHIVE with a persistent, memory-mapped archive.
+
+    Behaviors already stored at ``path`` (from earlier runs) are kept, so
+    novelty is meaningful from the first generation on. Only the training
+    coordinator should write; other processes may map it read-only.
+
+    Args:
+        path: Archive file. Defaults to config.NOVELTY_ARCHIVE_PATH.
+        readonly: Map the archive without writing to it.
+
+    Returns:
+        NoveltyArchive: The new NOVELTY_ARCHIVE.
+    """
+    global NOVELTY_ARCHIVE
+    NOVELTY_ARCHIVE = NoveltyArchive(max_size=500, k_nearest=config.NOVELTY_K_NEAREST,
+                                     path=path or config.NOVELTY_ARCHIVE_PATH, readonly=readonly,
+                                     dims=BC_SIZE)
+    return NOVELTY_ARCHIVE
 
 
 _curriculum_ball_speed = None
@@ -43,42 +77,32 @@ def _create_network(genome, config_neat):
     return net
 
 
-def eval_genomes(genomes, config_neat, ball_speed=None):
-    """Evaluates genomes by playing against a rule-based opponent.
+def _play_rule_based_game(net, ball_speed=None, decision_interval=None, seed=None):
+    """Plays one point of the network (left) against the rule-based AI (right).
+
+    Returns:
+        float: Fitness earned (0.1 per frame, +1 per hit, +10 for scoring,
+            -5 for conceding), with the game stopped once it exceeds 2000.
+    """
+    interval = decision_interval or config.DECISION_INTERVAL
+    opponent_interval = config.RULE_BASED_DECISION_INTERVAL
+    fitness = 0
     
-    This is a basic fitness function where each genome plays a single game
-    against a simple rule-based AI. Fitness is awarded for survival time,
-    paddle hits, and scoring points.
+    game = game_simulator.GameSimulator(ball_speed=ball_speed or get_curriculum_ball_speed(), seed=seed)
     
-    Args:
-        genomes: List of (genome_id, genome) tuples from NEAT population.
-        config_neat: NEAT configuration object.
-    """
-    for genome_id, genome in genomes:
-        net = _create_network(genome, config_neat)
-        genome.fitness = 0
-        
-        game = game_simulator.GameSimulator(ball_speed=ball_speed or get_curriculum_ball_speed())
-        
-        # Genome plays as Left Paddle
-        # Rule-based plays as Right Paddle
-        
-        run = True
-        while run:
-            # Get current game state
-            state = game.get_state()
-            
+    # Genome plays as Left Paddle
+    # Rule-based plays as Right Paddle
+    
+    # Flat state buffer, updated in place by game.step()
+    state = game.state
+    
+    left_move = right_move = None
+    frame = 0
+    run = True
+    while run:
+        if frame % interval == 0:
             # Prepare inputs for the network (normalized to 0-1 range)
-            inputs = (
-                state["paddle_left_y"] / config.SCREEN_HEIGHT,
-                state["ball_x"] / config.SCREEN_WIDTH,
-                state["ball_y"] / config.SCREEN_HEIGHT,
-                state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                (state["paddle_left_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                1.0 if state["ball_vel_x"] < 0 else 0.0,
-                state["paddle_right_y"] / config.SCREEN_HEIGHT
-            )
+            inputs = network_inputs(state, "left")
             
             # Get network output
             output = net.activate(inputs)
@@ -93,36 +117,137 @@ def eval_genomes(genomes, config_neat, ball_speed=None):
             elif action_idx == 1:
                 left_move = "DOWN"
             # action_idx 2 is STAY
-            
-            # Get opponent move
-            right_move = get_rule_based_move(state, paddle="right")
-            
-            # Update game
-            score_data = game.update(left_move, right_move)
-            
-            # Fitness reward for surviving a frame
-            genome.fitness += 0.1
-            
-            # Check for scoring and hit events
-            if score_data:
-                # Reward for scoring
-                if score_data.get("scored") == "left":
-                    genome.fitness += 10  # Genome scored
-                elif score_data.get("scored") == "right":
-                    genome.fitness -= 5   # Opponent scored, penalty
-                # Reward for paddle hits
-                if score_data.get("hit_left"):
-                    genome.fitness += 1   # Successful hit by genome
-                # End episode if a point was scored
-                if score_data.get("scored"):
-                    run = False
-                # Optionally cap fitness
-                if genome.fitness > 2000:
-                    run = False
-            
-            # Optional: Cap fitness or duration to prevent infinite stalling if both are perfect
-            if genome.fitness > 2000:
+        
+        # Get opponent move
+        if frame % opponent_interval == 0:
+            right_move = get_rule_based_move_from_buffer(state, paddle="right")
+        frame += 1
+        
+        # Update game
+        events = game.step(left_move, right_move)
+        
+        # Fitness reward for surviving a frame
+        fitness += 0.1
+        
+        # Check for scoring and hit events
+        if events:
+            # Reward for scoring
+            if events & EVENT_SCORE_LEFT:
+                fitness += 10  # Genome scored
+            elif events & EVENT_SCORE_RIGHT:
+                fitness -= 5   # Opponent scored, penalty
+            # Reward for paddle hits
+            if events & EVENT_HIT_LEFT:
+                fitness += 1   # Successful hit by genome
+            # End episode if a point was scored
+            if events & (EVENT_SCORE_LEFT | EVENT_SCORE_RIGHT):
                 run = False
+        
+        # Optional: Cap fitness or duration to prevent infinite stalling if both are perfect
+        if fitness > 2000:
+            run = False
+    return fitness
+
+
+def eval_genomes(genomes, config_neat, ball_speed=None, decision_interval=None):
+    """Evaluates genomes by playing against a rule-based opponent.
+    
+    This is a basic fitness function where each genome plays a single game
+    against a simple rule-based AI. Fitness is awarded for survival time,
+    paddle hits, and scoring points.
+    
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        decision_interval: Frames between network activations (the last
+            move repeats in between). Defaults to config.DECISION_INTERVAL.
+            The rule-based opponent uses config.RULE_BASED_DECISION_INTERVAL.
+    """
+    for genome_id, genome in genomes:
+        net = _create_network(genome, config_neat)
+        genome.fitness = _play_rule_based_game(net, ball_speed=ball_speed,
+                                               decision_interval=decision_interval)
+
+
+def eval_genomes_fixed_seeds(genomes, config_neat, ball_speed=None, decision_interval=None,
+                             seeds=None, cache=None):
+    """Deterministic eval_genomes over a fixed set of serve seeds, with caching.
+    
+    Each genome plays one point against the rule-based AI per seed (with a
+    fresh network each time) and its fitness is the mean over the seeds.
+    Because the result only depends on the genome's network and the
+    settings, it is cached under ``genome_hash``: unchanged elites and
+    re-seeded genomes are not replayed.
+    
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        decision_interval: Frames between network activations. Defaults to
+            config.DECISION_INTERVAL.
+        seeds: Serve seeds. Defaults to config.FIXED_EVAL_SEEDS.
+        cache: FitnessCache to consult. Defaults to FITNESS_CACHE.
+    """
+    seeds = tuple(seeds if seeds is not None else config.FIXED_EVAL_SEEDS)
+    cache = cache if cache is not None else FITNESS_CACHE
+    settings = ("rule_based", seeds, ball_speed or get_curriculum_ball_speed(),
+                decision_interval or config.DECISION_INTERVAL, config.RULE_BASED_DECISION_INTERVAL)
+    
+    for genome_id, genome in genomes:
+        def evaluate(genome=genome):
+            total = 0
+            for seed in seeds:
+                net = _create_network(genome, config_neat)
+                total += _play_rule_based_game(net, ball_speed=settings[2],
+                                               decision_interval=decision_interval, seed=seed)
+            return total / len(seeds)
+        
+        genome.fitness = cache.get_or_compute((genome_hash(genome),) + settings, evaluate)
+
+def eval_genomes_batched(genomes, config_neat, ball_speed=None, opponent=None, seed=None,
+                         decision_interval=None):
+    """Batched variant of eval_genomes against a vectorized scripted opponent.
+    
+    All genomes play their game at once on a BatchGameSimulator, with one
+    batched network activation and one vectorized opponent call per frame.
+    Fitness uses the same rewards as eval_genomes (0.1 per frame, +1 per
+    hit, +10 for scoring, -5 for conceding); the 2000 fitness cap is applied
+    as a 20000 frame cap.
+    
+    Falls back to eval_genomes if a genome cannot be compiled.
+    
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        opponent: Optional ScriptedOpponent (see ai.opponents.OPPONENT_ZOO).
+            Defaults to the rule-based TrackerOpponent.
+        seed: Optional seed for the serve directions.
+        decision_interval: Frames between network activations. Defaults to
+            config.DECISION_INTERVAL.
+    """
+    from .batch_evaluation import PopulationNetworks, play_against_opponent
+    
+    genome_list = list(genomes)
+    if not genome_list:
+        return
+    try:
+        population = PopulationNetworks.from_genomes(genome_list, config_neat)
+    except ValueError:
+        eval_genomes(genome_list, config_neat, ball_speed=ball_speed,
+                     decision_interval=decision_interval)
+        return
+    
+    results = play_against_opponent(population, [genome_id for genome_id, _ in genome_list],
+                                    opponent if opponent is not None else TrackerOpponent(),
+                                    ball_speed=ball_speed or get_curriculum_ball_speed(),
+                                    max_frames=20000, seed=seed,
+                                    decision_interval=decision_interval or config.DECISION_INTERVAL)
+    for (_, genome), result in zip(genome_list, results):
+        bonus = {1.0: 10, 0.0: -5}.get(result["match_result"], 0)
+        genome.fitness = 0.1 * result["frames"] + result["hits"] + bonus
+
 
 def calculate_expected_score(rating_a, rating_b):
     """Calculates the expected score for player A against player B using ELO formula.
@@ -152,7 +277,8 @@ def calculate_new_rating(rating, expected_score, actual_score, k_factor=32):
     return rating + k_factor * (actual_score - expected_score)
 
 
-def eval_genomes_competitive(genomes, config_neat, ball_speed=None):
+def eval_genomes_competitive(genomes, config_neat, ball_speed=None, decision_interval=None,
+                             early_stop=None):
     """Evaluates genomes using competitive ELO-based matchmaking.
     
     Each genome plays multiple matches against randomly selected opponents from
@@ -163,23 +289,26 @@ def eval_genomes_competitive(genomes, config_neat, ball_speed=None):
     Args:
         genomes: List of (genome_id, genome) tuples from NEAT population.
         config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        decision_interval: Frames between network activations (the last
+            moves repeat in between). Defaults to config.DECISION_INTERVAL.
+        early_stop: Optional EarlyStopPolicy ending matches once their point
+            is decided (defaults to core.early_stop.DEFAULT_POLICY).
     """
+    interval = decision_interval or config.DECISION_INTERVAL
+    early_stop = early_stop or DEFAULT_EARLY_STOP
+    
     # Convert to list for easier indexing
     genome_list = list(genomes)
     
     # Initialize ELO ratings if not present
-    for _, genome in genome_list:
-        if not hasattr(genome, 'elo_rating'):
-            genome.elo_rating = config.ELO_INITIAL_RATING
-        # We don't reset fitness to 0 here because we want to track ELO over time.
-        # However, NEAT expects fitness to be set for the current generation.
-        # We will set genome.fitness = genome.elo_rating at the end.
+    _init_elo_ratings(genome_list)
     
     # Number of matches per genome
     matches_per_genome = min(5, len(genome_list) - 1)
     
-    # Track contact metrics for each genome (for novelty search)
-    genome_contact_metrics = {}
+    # Behavior counts of each genome, summed over its matches (for novelty search)
+    genome_behavior = {}
     
     # Each genome plays multiple matches
     for idx, (genome_id, genome) in enumerate(genome_list):
@@ -187,8 +316,8 @@ def eval_genomes_competitive(genomes, config_neat, ball_speed=None):
         net_left = neat.nn.RecurrentNetwork.create(genome, config_neat)
         net_left.reset()  # Reset RNN state
         
-        # Track contact metrics for novelty search
-        genome_contact_metrics[genome_id] = []
+        # Track behavior counts for novelty search
+        genome_behavior[genome_id] = [0.0] * COUNT_FIELDS
         
         # Select random opponents
         opponent_indices = [i for i in range(len(genome_list)) if i != idx]
@@ -201,6 +330,8 @@ def eval_genomes_competitive(genomes, config_neat, ball_speed=None):
             
             # Play a match
             game = game_simulator.GameSimulator(ball_speed=ball_speed or get_curriculum_ball_speed())
+            game.behavior = BehaviorAccumulator()
+            state = game.state  # Flat state buffer, updated in place
             run = True
             frame_count = 0
             max_frames = 3000  # Prevent infinite games
@@ -208,101 +339,349 @@ def eval_genomes_competitive(genomes, config_neat, ball_speed=None):
             # Match result: 1 for Left Win, 0 for Right Win, 0.5 for Draw
             match_result = 0.5 
             
+            # Stop once the rally is decided; the result stays the same
+            watch = early_stop.rally_watch(game, max_frames)
+            events = 0
+            frames_saved = 0
+            
+            # Sampled matches also time their activations (see ai.telemetry)
+            timers = activation_timers(net_left, net_right)
+            play_left, play_right = timers or (net_left, net_right)
+            match_start = time.perf_counter()
+            
             while run and frame_count < max_frames:
-                frame_count += 1
-                state = game.get_state()
+                if watch is not None:
+                    decided = watch.check(frame_count, events)
+                    if decided is not None:
+                        frames_saved, scored = decided
+                        if scored:
+                            watch.play_out(frames_saved)
+                        if scored & EVENT_SCORE_LEFT:
+                            match_result = 1.0
+                        elif scored & EVENT_SCORE_RIGHT:
+                            match_result = 0.0
+                        break
                 
-                # Left paddle (genome being evaluated)
-                inputs_left = (
-                    state["paddle_left_y"] / config.SCREEN_HEIGHT,
-                    state["ball_x"] / config.SCREEN_WIDTH,
-                    state["ball_y"] / config.SCREEN_HEIGHT,
-                    state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                    state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                    (state["paddle_left_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                    1.0 if state["ball_vel_x"] < 0 else 0.0,
-                    state["paddle_right_y"] / config.SCREEN_HEIGHT
-                )
-                output_left = net_left.activate(inputs_left)
-                action_idx_left = output_left.index(max(output_left))
-                
-                left_move = None
-                if action_idx_left == 0:
-                    left_move = "UP"
-                elif action_idx_left == 1:
-                    left_move = "DOWN"
-                
-                # Right paddle (opponent)
-                inputs_right = (
-                    state["paddle_right_y"] / config.SCREEN_HEIGHT,
-                    state["ball_x"] / config.SCREEN_WIDTH,
-                    state["ball_y"] / config.SCREEN_HEIGHT,
-                    state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                    state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                    (state["paddle_right_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                    1.0 if state["ball_vel_x"] > 0 else 0.0,  # Incoming from right perspective
-                    state["paddle_left_y"] / config.SCREEN_HEIGHT
-                )
-                output_right = net_right.activate(inputs_right)
-                action_idx_right = output_right.index(max(output_right))
+                frame_count += 1
                 
-                right_move = None
-                if action_idx_right == 0:
-                    right_move = "UP"
-                elif action_idx_right == 1:
-                    right_move = "DOWN"
+                if (frame_count - 1) % interval == 0:
+                    # Left paddle (genome being evaluated)
+                    output_left = play_left.activate(network_inputs(state, "left"))
+                    action_idx_left = output_left.index(max(output_left))
+                    
+                    left_move = None
+                    if action_idx_left == 0:
+                        left_move = "UP"
+                    elif action_idx_left == 1:
+                        left_move = "DOWN"
+                    
+                    # Right paddle (opponent)
+                    output_right = play_right.activate(network_inputs(state, "right"))
+                    action_idx_right = output_right.index(max(output_right))
+                    
+                    right_move = None
+                    if action_idx_right == 0:
+                        right_move = "UP"
+                    elif action_idx_right == 1:
+                        right_move = "DOWN"
                 
                 # Update game
-                score_data = game.update(left_move, right_move)
-                
-                # Collect contact metrics for novelty search
-                if score_data and (score_data.get("hit_left") or score_data.get("hit_right")):
-                    genome_contact_metrics[genome_id].append(score_data)
+                events = game.step(left_move, right_move)
                 
                 # Check for scoring
-                if score_data:
-                    if score_data.get("scored") == "left":
-                        match_result = 1.0 # Left Wins
-                        run = False
-                    elif score_data.get("scored") == "right":
-                        match_result = 0.0 # Right Wins (Left Loses)
-                        run = False
-            
-            # Calculate ELO updates
-            # Left Genome (genome) vs Right Genome (opp_genome)
-            rating_a = genome.elo_rating
-            rating_b = opp_genome.elo_rating
-            
-            expected_a = calculate_expected_score(rating_a, rating_b)
-            expected_b = calculate_expected_score(rating_b, rating_a)
-            
-            # Actual scores
-            actual_a = match_result
-            actual_b = 1.0 - match_result
+                if events & EVENT_SCORE_LEFT:
+                    match_result = 1.0 # Left Wins
+                    run = False
+                elif events & EVENT_SCORE_RIGHT:
+                    match_result = 0.0 # Right Wins (Left Loses)
+                    run = False
             
-            # Update ratings
-            new_rating_a = calculate_new_rating(rating_a, expected_a, actual_a, config.ELO_K_FACTOR)
-            new_rating_b = calculate_new_rating(rating_b, expected_b, actual_b, config.ELO_K_FACTOR)
+            early_stop.record(frames_saved)
+            TELEMETRY.record_match(match_telemetry(frame_count, interval,
+                                                   time.perf_counter() - match_start, timers))
+            add_counts(genome_behavior[genome_id], game.behavior.counts(LEFT))
             
-            genome.elo_rating = new_rating_a
-            opp_genome.elo_rating = new_rating_b
+            # Left Genome (genome) vs Right Genome (opp_genome)
+            _update_elo_ratings(genome, opp_genome, match_result)
             
-    # Set fitness to ELO rating + Novelty Score
+    _assign_competitive_fitness(genome_list, genome_behavior)
+
+
+def _init_elo_ratings(genome_list):
+    """Gives every genome without a rating the initial ELO rating."""
+    for _, genome in genome_list:
+        if not hasattr(genome, 'elo_rating'):
+            genome.elo_rating = config.ELO_INITIAL_RATING
+        # We don't reset fitness to 0 here because we want to track ELO over time.
+        # However, NEAT expects fitness to be set for the current generation.
+        # We will set genome.fitness = genome.elo_rating at the end.
+
+
+def _update_elo_ratings(genome, opp_genome, match_result):
+    """Applies the ELO update for one match between two genomes.
+    
+    Args:
+        genome: Left genome (the one being evaluated).
+        opp_genome: Right genome (the opponent).
+        match_result: 1.0 for a left win, 0.0 for a right win, 0.5 for a draw.
+    """
+    rating_a = genome.elo_rating
+    rating_b = opp_genome.elo_rating
+    
+    expected_a = calculate_expected_score(rating_a, rating_b)
+    expected_b = calculate_expected_score(rating_b, rating_a)
+    
+    # Actual scores
+    actual_a = match_result
+    actual_b = 1.0 - match_result
+    
+    # Update ratings
+    genome.elo_rating = calculate_new_rating(rating_a, expected_a, actual_a, config.ELO_K_FACTOR)
+    opp_genome.elo_rating = calculate_new_rating(rating_b, expected_b, actual_b, config.ELO_K_FACTOR)
+
+
+def _assign_competitive_fitness(genome_list, genome_behavior):
+    """Sets fitness to ELO rating + weighted novelty of the match behavior.
+
+    The generation's behaviors are scored against the archive in one call
+    and then added to it together.
+
+    Args:
+        genome_list: List of (genome_id, genome) tuples.
+        genome_behavior: Mapping from genome id to its behavior counts
+            (see core.behavior), summed over the genome's matches.
+    """
+    # Calculate behavioral characteristics from the accumulated counts
+    bcs = {genome_id: behavior_vector(genome_behavior[genome_id]) if genome_id in genome_behavior else None
+           for genome_id, _ in genome_list}
+    scored = [genome_id for genome_id, _ in genome_list if bcs[genome_id] is not None]
+    novelty_scores = dict(zip(scored, NOVELTY_ARCHIVE.calculate_novelty_many(
+        [bcs[genome_id] for genome_id in scored])))
+    # Add to archive for future comparisons
+    NOVELTY_ARCHIVE.add_many([bcs[genome_id] for genome_id in scored])
+
     for genome_id, genome in genome_list:
-        # Calculate behavioral characteristic from contact data
-        bc = calculate_bc_from_contacts(genome_contact_metrics.get(genome_id, []))
-        
-        if bc is not None:
-            # Calculate novelty score
-            novelty_score = NOVELTY_ARCHIVE.calculate_novelty(bc)
-            # Add to archive for future comparisons
-            NOVELTY_ARCHIVE.add_bc(bc)
+        if genome_id in novelty_scores:
             # Final fitness = ELO + weighted novelty
-            genome.fitness = max(0, genome.elo_rating + (config.NOVELTY_WEIGHT * novelty_score))
+            genome.fitness = max(0, genome.elo_rating + (config.NOVELTY_WEIGHT * novelty_scores[genome_id]))
         else:
             # No contacts, just use ELO
             genome.fitness = max(0, genome.elo_rating)
 
+
+def eval_genomes_competitive_batched(genomes, config_neat, ball_speed=None, seed=None,
+                                     decision_interval=None):
+    """Batched variant of eval_genomes_competitive.
+    
+    Every genome's recurrent network is compiled into padded NumPy tensors and
+    all of the generation's matches are stepped together: one batched
+    activation and one BatchGameSimulator update per frame, regardless of how
+    many matches are running. Matchmaking, match rules, ELO updates and the
+    novelty bonus are the same as in eval_genomes_competitive; ELO updates
+    are applied after all matches finish, in the serial evaluation order.
+    
+    Unlike the serial loop, each network starts every match with a fresh
+    recurrent state (matches are played simultaneously).
+    
+    Falls back to eval_genomes_competitive if a genome cannot be compiled.
+    
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        seed: Optional seed for the serve directions.
+        decision_interval: Frames between network activations. Defaults to
+            config.DECISION_INTERVAL.
+    """
+    from .batch_evaluation import PopulationNetworks, play_first_point_matches
+    
+    genome_list = list(genomes)
+    try:
+        population = PopulationNetworks.from_genomes(genome_list, config_neat)
+    except ValueError:
+        eval_genomes_competitive(genome_list, config_neat, ball_speed=ball_speed,
+                                 decision_interval=decision_interval)
+        return
+    
+    _init_elo_ratings(genome_list)
+    
+    # Same matchmaking as the serial evaluator
+    matches_per_genome = min(5, len(genome_list) - 1)
+    match_indices = []
+    for idx in range(len(genome_list)):
+        opponent_indices = [i for i in range(len(genome_list)) if i != idx]
+        selected_opponents = random.sample(opponent_indices, min(matches_per_genome, len(opponent_indices)))
+        match_indices.extend((idx, opp_idx) for opp_idx in selected_opponents)
+    
+    pairings = [(genome_list[a][0], genome_list[b][0]) for a, b in match_indices]
+    results = []
+    if pairings:
+        results = play_first_point_matches(population, pairings,
+                                           ball_speed=ball_speed or get_curriculum_ball_speed(),
+                                           seed=seed,
+                                           decision_interval=decision_interval or config.DECISION_INTERVAL)
+    
+    genome_behavior = {genome_id: [0.0] * COUNT_FIELDS for genome_id, _ in genome_list}
+    for (idx, opp_idx), result in zip(match_indices, results):
+        genome_id, genome = genome_list[idx]
+        add_counts(genome_behavior[genome_id], result["behavior"])
+        _update_elo_ratings(genome, genome_list[opp_idx][1], result["match_result"])
+    
+    _assign_competitive_fitness(genome_list, genome_behavior)
+
+
+_training_executor = None
+_profiler = None
+
+
+def set_profiler(profiler):
+    """Profiles the workers of the parallel evaluation pool with ``profiler``.
+
+    Must be called before the first parallel evaluation creates the pool.
+
+    Args:
+        profiler: utils.profiling.Profiler, or None to stop profiling pools
+            created from now on.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def _get_training_executor():
+    """Returns the persistent worker pool used by parallel evaluation.
+
+    The pool spans every core and lives for the rest of the run, so worker
+    start-up and NEAT config parsing are paid once.
+    """
+    global _training_executor
+    if _training_executor is None:
+        import atexit
+        import multiprocessing
+        import os
+        from .concurrent_training import ConcurrentTrainingExecutor
+
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        _training_executor = ConcurrentTrainingExecutor(
+            max_workers=multiprocessing.cpu_count(),
+            config_path=os.path.join(root_dir, config.NEAT_CONFIG_PATH),
+            profiler=_profiler)
+        atexit.register(_training_executor.close)
+    return _training_executor
+
+
+def schedule_competitive_rounds(genome_ids, num_rounds, rng):
+    """Builds rounds of disjoint pairings for round-based competitive play.
+
+    Every round pairs up a fresh shuffle of the population, so no genome
+    plays twice in one round (with an odd population size, one genome sits
+    the round out). The shuffle also decides who plays the left paddle.
+
+    Args:
+        genome_ids: Identifiers of the genomes to schedule.
+        num_rounds: Number of rounds.
+        rng: random.Random instance driving the schedule.
+
+    Returns:
+        list: One list of ``(left_id, right_id)`` tuples per round.
+    """
+    genome_ids = list(genome_ids)
+    rounds = []
+    for _ in range(num_rounds):
+        order = genome_ids[:]
+        rng.shuffle(order)
+        rounds.append([(order[i], order[i + 1]) for i in range(0, len(order) - 1, 2)])
+    return rounds
+
+
+def eval_genomes_competitive_parallel(genomes, config_neat, ball_speed=None, seed=None,
+                                      decision_interval=None, executor=None, num_rounds=None,
+                                      scheduler="random"):
+    """Round-based, parallel variant of eval_genomes_competitive.
+
+    Matches are scheduled in rounds of disjoint pairings (see
+    schedule_competitive_rounds). Each round is played in parallel on the
+    persistent worker pool, then its ELO updates are applied in pairing
+    order. Because no genome plays twice in a round and every match gets its
+    seed from the schedule, ratings do not depend on worker timing.
+
+    The default 2 * 5 rounds give each genome about as many matches as the
+    serial evaluator (five as the evaluated genome plus about five as an
+    opponent). Contact metrics are credited to the left genome of each
+    match, as in the serial evaluator.
+
+    With ``scheduler="swiss"`` each round instead pairs genomes of adjacent
+    current ELO (see ai.matchmaking.SwissScheduler), and the default drops
+    to swiss_rounds(len(genomes)) rounds.
+
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        ball_speed: Optional ball speed for curriculum learning.
+        seed: Optional seed for the schedule and match serves.
+        decision_interval: Frames between network activations. Defaults to
+            config.DECISION_INTERVAL.
+        executor: Optional ConcurrentTrainingExecutor (defaults to a shared
+            pool over all cores).
+        num_rounds: Optional number of rounds.
+        scheduler: "random" or "swiss".
+
+    Raises:
+        ValueError: If the scheduler is unknown.
+    """
+    if scheduler not in ("random", "swiss"):
+        raise ValueError(f"Unknown scheduler '{scheduler}'. Choose from: random, swiss")
+    genome_list = list(genomes)
+    genome_dict = dict(genome_list)
+    _init_elo_ratings(genome_list)
+
+    rng = random.Random(seed) if seed is not None else random.Random(random.getrandbits(64))
+    if scheduler == "swiss":
+        if num_rounds is None:
+            num_rounds = swiss_rounds(len(genome_list))
+        swiss = SwissScheduler(genome_dict, rng)
+        rounds = None
+    else:
+        if num_rounds is None:
+            num_rounds = 2 * min(5, len(genome_list) - 1)
+        rounds = schedule_competitive_rounds(genome_dict, num_rounds, rng)
+
+    executor = executor or _get_training_executor()
+    executor.broadcast_population(genome_dict,
+                                  ball_speed=ball_speed or get_curriculum_ball_speed(),
+                                  decision_interval=decision_interval)
+
+    genome_behavior = {genome_id: [0.0] * COUNT_FIELDS for genome_id in genome_dict}
+    for round_index in range(num_rounds):
+        if rounds is not None:
+            pairings = rounds[round_index]
+        else:
+            # Swiss rounds follow the ratings left by the previous round
+            pairings = swiss.next_round({genome_id: genome.elo_rating
+                                         for genome_id, genome in genome_dict.items()})
+        seeds = [rng.getrandbits(32) for _ in pairings]
+        results = executor.execute_pairings(pairings, seeds=seeds)
+        for (left_id, right_id), result in zip(pairings, results):
+            if result["behavior"] is not None:
+                add_counts(genome_behavior[left_id], result["behavior"])
+            DEFAULT_EARLY_STOP.record(result.get("frames_saved", 0))
+            _update_elo_ratings(genome_dict[left_id], genome_dict[right_id], result["match_result"])
+
+    _assign_competitive_fitness(genome_list, genome_behavior)
+
+
+def eval_genomes_competitive_swiss(genomes, config_neat, ball_speed=None, seed=None,
+                                   decision_interval=None, executor=None, num_rounds=None):
+    """Parallel competitive evaluation with Swiss-system pairing.
+
+    Same as eval_genomes_competitive_parallel(..., scheduler="swiss"): about
+    log2(pop_size) rounds of rating-adjacent pairings instead of 2 * 5
+    random rounds, so a generation plays fewer matches.
+    """
+    eval_genomes_competitive_parallel(genomes, config_neat, ball_speed=ball_speed, seed=seed,
+                                      decision_interval=decision_interval, executor=executor,
+                                      num_rounds=num_rounds, scheduler="swiss")
+
+
 def validate_genome(genome, config_neat, generation=0, record_matches=True):
     """
     Validates a genome by playing a match against the Rule-Based AI.
@@ -390,122 +769,188 @@ def validate_genome(genome, config_neat, generation=0, record_matches=True):
     win_rate = wins / num_games
     return avg_rally, win_rate
 
-# Hall of Fame Storage
-HALL_OF_FAME = []
-
-def eval_genomes_self_play(genomes, config_neat):
-    """
-    Self-Play Fitness Function.
-    Genomes play against other genomes in the population.
+def validate_genomes_batched(genomes, config_neat, opponent=None, num_games=5, seed=None):
+    """Validates many genomes at once against a vectorized scripted opponent.
+    
+    Batched counterpart of validate_genome (without match recording): every
+    genome plays ``num_games`` first-point games as the left paddle.
+    
+    Args:
+        genomes: List of (genome_id, genome) tuples.
+        config_neat: NEAT configuration object.
+        opponent: Optional ScriptedOpponent. Defaults to TrackerOpponent.
+        num_games: Games per genome.
+        seed: Optional seed for the serve directions.
+    
+    Returns:
+        dict: genome_id -> (avg_rally, win_rate), as returned by validate_genome.
     """
+    from .batch_evaluation import PopulationNetworks, play_against_opponent
+    
     genome_list = list(genomes)
-    for _, genome in genome_list:
-        genome.fitness = 0
+    if not genome_list:
+        return {}
+    population = PopulationNetworks.from_genomes(genome_list, config_neat, recurrent=False)
+    keys = [genome_id for genome_id, _ in genome_list for _ in range(num_games)]
+    results = play_against_opponent(population, keys,
+                                    opponent if opponent is not None else TrackerOpponent(),
+                                    max_frames=5000, seed=seed)
     
-    # Update Hall of Fame (Save best from previous generation if available)
-    # Note: This function is called every generation.
-    # We need a way to know if we should add to HOF.
-    # A simple way is to add the best genome of the *current* population to HOF at the END of eval?
-    # Or pass it in. 
-    # Actually, we can just add the best of the *previous* generation if we had access.
-    # But here we are evaluating.
-    # Let's just add to HOF periodically based on a global counter or similar?
-    # Or better: The training loop handles HOF additions. 
-    # But we need HOF *inside* here to play against.
-    # Let's assume HALL_OF_FAME is populated externally or we populate it here with a random sample of high fitness?
-    # Issue: We don't know fitness yet.
-    # Solution: We will rely on the training loop to populate HALL_OF_FAME.
-    
-    # Randomize list
-    random.shuffle(genome_list)
-    
-    matches_per_genome = 2
-    
-    for i in range(matches_per_genome):
+    validation = {}
+    for i, (genome_id, _) in enumerate(genome_list):
+        games = results[i * num_games:(i + 1) * num_games]
+        hits = sum(game["hits"] + game["opponent_hits"] for game in games)
+        wins = sum(game["match_result"] == 1.0 for game in games)
+        validation[genome_id] = (hits / num_games, wins / num_games)
+    return validation
+
+# Hall of Fame Storage (bounded; see ai.hall_of_fame)
+HALL_OF_FAME = HallOfFame()
+
+def schedule_self_play(genome_list, hall_of_fame, rng, matches_per_genome=2):
+    """Builds the self-play pairings for one generation.
+
+    Each of the ``matches_per_genome`` rounds pairs up a fresh shuffle of the
+    population. The left genome of a pairing faces a random Hall of Fame
+    genome instead of its partner with 20% probability (if the Hall of Fame
+    is not empty). Every pairing also gets its own match seed.
+
+    Args:
+        genome_list: List of (genome_id, genome) tuples.
+        hall_of_fame: List of Hall of Fame genomes.
+        rng: random.Random (or the random module) driving the schedule.
+        matches_per_genome: Number of rounds.
+
+    Returns:
+        list: ``(left_id, right_id, seed)`` tuples. Hall of Fame opponents
+            have ids ``("hof", index)``.
+    """
+    genome_list = list(genome_list)
+    rng.shuffle(genome_list)
+    pairings = []
+    for _ in range(matches_per_genome):
         # Shuffle for new pairings
-        random.shuffle(genome_list)
-        
+        rng.shuffle(genome_list)
         # Pair (0,1), (2,3)...
-        for j in range(0, len(genome_list), 2):
-            if j+1 >= len(genome_list):
-                break
-                
-            g1_id, g1 = genome_list[j]
-            
+        for j in range(0, len(genome_list) - 1, 2):
+            left_id = genome_list[j][0]
             # 20% chance to play against Hall of Fame if available
-            use_hof = False
-            if HALL_OF_FAME and random.random() < 0.2:
-                use_hof = True
-                g2 = random.choice(HALL_OF_FAME)
-                # g2 is a genome object. We don't update its fitness.
+            if hall_of_fame and rng.random() < 0.2:
+                right_id = ("hof", rng.randrange(len(hall_of_fame)))
             else:
-                g2_id, g2 = genome_list[j+1]
-            
-            net1 = _create_network(g1, config_neat)
-            net2 = _create_network(g2, config_neat)
-            
-            game = game_simulator.GameSimulator(ball_speed=get_curriculum_ball_speed())
-            run = True
-            frame_count = 0
-            max_frames = 10000 
-            target_score = 5 
-            
-            while run and frame_count < max_frames:
-                frame_count += 1
-                state = game.get_state()
-                
-                # Player 1 (Left)
-                inputs1 = (
-                    state["paddle_left_y"] / config.SCREEN_HEIGHT,
-                    state["ball_x"] / config.SCREEN_WIDTH,
-                    state["ball_y"] / config.SCREEN_HEIGHT,
-                    state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                    state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                    (state["paddle_left_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                    1.0 if state["ball_vel_x"] < 0 else 0.0,
-                    state["paddle_right_y"] / config.SCREEN_HEIGHT
-                )
-                out1 = net1.activate(inputs1)
-                act1 = out1.index(max(out1))
-                move1 = "UP" if act1 == 0 else "DOWN" if act1 == 1 else None
-                
-                # Player 2 (Right)
-                inputs2 = (
-                    state["paddle_right_y"] / config.SCREEN_HEIGHT,
-                    state["ball_x"] / config.SCREEN_WIDTH,
-                    state["ball_y"] / config.SCREEN_HEIGHT,
-                    state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                    state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                    (state["paddle_right_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                    1.0 if state["ball_vel_x"] > 0 else 0.0, # Incoming from right
-                    state["paddle_left_y"] / config.SCREEN_HEIGHT
-                )
-                out2 = net2.activate(inputs2)
-                act2 = out2.index(max(out2))
-                move2 = "UP" if act2 == 0 else "DOWN" if act2 == 1 else None
-                
-                score_data = game.update(move1, move2)
-                
-                # Fitness Rewards
-                g1.fitness += 0.01
-                if not use_hof:
-                    g2.fitness += 0.01
-                
-                if score_data:
-                    if score_data.get("hit_left"):
-                        g1.fitness += 1.0
-                    if score_data.get("hit_right"):
-                        if not use_hof:
-                            g2.fitness += 1.0
-                        
-                    if score_data.get("scored") == "left":
-                        g1.fitness += 5.0
-                        if not use_hof:
-                            g2.fitness -= 2.0
-                    elif score_data.get("scored") == "right":
-                        if not use_hof:
-                            g2.fitness += 5.0
-                        g1.fitness -= 2.0
-                        
-                if game.score_left >= target_score or game.score_right >= target_score:
-                    run = False
+                right_id = genome_list[j + 1][0]
+            pairings.append((left_id, right_id, rng.getrandbits(32)))
+    return pairings
+
+
+def _merge_self_play_results(genome_dict, pairings, results):
+    """Adds each match's fitness deltas to the population, in pairing order.
+
+    Hall of Fame opponents are not part of the population and keep their
+    fitness. Failed matches (results with an "error") add nothing.
+    """
+    for (left_id, right_id, _), result in zip(pairings, results):
+        if result.get("error"):
+            continue
+        genome_dict[left_id].fitness += result["left_delta"]
+        if right_id in genome_dict:
+            genome_dict[right_id].fitness += result["right_delta"]
+
+
+def _self_play_setup(genomes, seed, config_neat):
+    """Resets fitness and returns (genome_dict, hall_of_fame, pairings) for a generation."""
+    genome_list = list(genomes)
+    for _, genome in genome_list:
+        genome.fitness = 0
+
+    # Hall of Fame genomes are populated by the training loop
+    hall_of_fame = HallOfFame.of(HALL_OF_FAME, config_neat)
+    rng = random.Random(seed) if seed is not None else random
+    pairings = schedule_self_play(genome_list, hall_of_fame, rng)
+    return dict(genome_list), hall_of_fame, pairings
+
+
+def eval_genomes_self_play(genomes, config_neat, decision_interval=None, seed=None):
+    """
+    Self-Play Fitness Function.
+    Genomes play against other genomes in the population.
+    Networks are activated every decision_interval frames (default
+    config.DECISION_INTERVAL) and repeat their last move in between.
+
+    Pairings come from schedule_self_play and every match returns fitness
+    deltas that are merged in pairing order, so eval_genomes_self_play_parallel
+    gives the same fitness for the same seed.
+    """
+    from .concurrent_training import _play_self_play_match
+
+    genome_dict, hall_of_fame, pairings = _self_play_setup(genomes, seed, config_neat)
+    results = []
+    for left_id, right_id, match_seed in pairings:
+        net1 = _create_network(genome_dict[left_id], config_neat)
+        if right_id in genome_dict:
+            net2 = _create_network(genome_dict[right_id], config_neat)
+        else:
+            # Hall of Fame networks are built once and reused across generations
+            net2 = hall_of_fame.network(right_id[1], config_neat)
+        result, telemetry = timed_match(_play_self_play_match, net1, net2,
+                                        ball_speed=get_curriculum_ball_speed(),
+                                        seed=match_seed, decision_interval=decision_interval)
+        TELEMETRY.record_match(telemetry)
+        results.append(result)
+    _merge_self_play_results(genome_dict, pairings, results)
+
+
+def eval_genomes_self_play_parallel(genomes, config_neat, decision_interval=None, seed=None,
+                                    executor=None):
+    """Parallel variant of eval_genomes_self_play.
+
+    The population and Hall of Fame are broadcast once to the persistent
+    worker pool, the scheduled matches are played there, and the returned
+    fitness deltas are merged in the parent in pairing order. For a fixed
+    seed the resulting fitness equals that of eval_genomes_self_play.
+
+    Args:
+        genomes: List of (genome_id, genome) tuples from NEAT population.
+        config_neat: NEAT configuration object.
+        decision_interval: Frames between network activations. Defaults to
+            config.DECISION_INTERVAL.
+        seed: Optional seed for the pairings and match serves.
+        executor: Optional ConcurrentTrainingExecutor (defaults to a shared
+            pool over all cores).
+    """
+    genome_dict, hall_of_fame, pairings = _self_play_setup(genomes, seed, config_neat)
+    if not pairings:
+        return
+    executor = executor or _get_training_executor()
+    executor.broadcast_population(genome_dict, ball_speed=get_curriculum_ball_speed(),
+                                  decision_interval=decision_interval, hall_of_fame=hall_of_fame)
+    results = executor.execute_pairings([(left_id, right_id) for left_id, right_id, _ in pairings],
+                                        seeds=[match_seed for _, _, match_seed in pairings],
+                                        match_type="self_play")
+    _merge_self_play_results(genome_dict, pairings, results)
+
+
+# Fitness functions selectable by name in the training entry points
+FITNESS_FUNCTIONS = {
+    "rule_based": eval_genomes,
+    "rule_based_fixed_seeds": eval_genomes_fixed_seeds,
+    "competitive": eval_genomes_competitive,
+    "competitive_batched": eval_genomes_competitive_batched,
+    "competitive_parallel": eval_genomes_competitive_parallel,
+    "competitive_swiss": eval_genomes_competitive_swiss,
+    "self_play": eval_genomes_self_play,
+    "self_play_parallel": eval_genomes_self_play_parallel,
+}
+
+
+def get_fitness_function(name):
+    """Returns the fitness function registered under ``name``.
+
+    Raises:
+        ValueError: If no fitness function has that name.
+    """
+    try:
+        return FITNESS_FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown fitness function '{name}'. "
+                         f"Choose from: {', '.join(sorted(FITNESS_FUNCTIONS))}") from None
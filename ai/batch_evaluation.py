@@ -0,0 +1,298 @@
+"""Population-wide batched inference for match evaluation.
+
+Instead of activating one network per paddle per frame, every network taking
+part in a generation's matches is compiled (see ``ai.compiled_network``) and
+stacked into zero-padded weight tensors. Each frame, the actions for every
+paddle in every running game are then computed with a single batched matrix
+product, and all games are advanced together by
+``core.batch_simulator.BatchGameSimulator``.
+"""
+
+import numpy as np
+
+from core.batch_simulator import BatchGameSimulator, ACTION_STAY
+from core.behavior import BatchBehaviorAccumulator, LEFT
+from .compiled_network import (
+    CompiledNetwork,
+    NO_ACTIVATION,
+    activation_groups,
+    apply_activation_groups,
+)
+
+
+class PopulationNetworks:
+    """Compiled networks of many genomes stacked into padded tensors.
+
+    Networks are padded to the largest node count. Padding columns have zero
+    weights and NO_ACTIVATION, so they stay at zero and never influence the
+    real nodes.
+
+    Attributes:
+        keys: Identifier of each stacked network, in stacking order.
+        index: Mapping from identifier to stacking position.
+        weights: Array of shape (G, K, K).
+        biases: Array of shape (G, K).
+        responses: Array of shape (G, K).
+        activation_ids: Array of shape (G, K).
+        recurrent: True if the networks use recurrent semantics.
+        depth: Synchronous steps per activation (1 for recurrent networks).
+    """
+
+    def __init__(self, networks, keys=None):
+        """Stacks compiled networks.
+
+        Args:
+            networks: List of CompiledNetwork instances with identical input
+                and output counts and the same ``recurrent`` flag.
+            keys: Optional identifiers for the networks (defaults to their
+                positions).
+        """
+        if not networks:
+            raise ValueError("PopulationNetworks needs at least one network")
+        if len({net.recurrent for net in networks}) != 1:
+            raise ValueError("Cannot stack recurrent and feed-forward networks together")
+
+        self.keys = list(keys) if keys is not None else list(range(len(networks)))
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.num_inputs = networks[0].num_inputs
+        self.num_outputs = networks[0].num_outputs
+        self.recurrent = networks[0].recurrent
+        self.depth = max(net.depth for net in networks)
+
+        size = max(net.num_nodes for net in networks)
+        count = len(networks)
+        self.weights = np.zeros((count, size, size))
+        self.biases = np.zeros((count, size))
+        self.responses = np.ones((count, size))
+        self.activation_ids = np.full((count, size), NO_ACTIVATION, dtype=np.int64)
+        for i, net in enumerate(networks):
+            k = net.num_nodes
+            self.weights[i, :k, :k] = net.weights
+            self.biases[i, :k] = net.biases
+            self.responses[i, :k] = net.responses
+            self.activation_ids[i, :k] = net.activation_ids
+
+    @classmethod
+    def from_genomes(cls, genomes, config_neat, recurrent=True):
+        """Compiles and stacks ``(key, genome)`` pairs.
+
+        Raises:
+            ValueError: If a genome cannot be compiled.
+        """
+        genomes = list(genomes)
+        networks = [CompiledNetwork.create(genome, config_neat, recurrent=recurrent)
+                    for _, genome in genomes]
+        return cls(networks, keys=[key for key, _ in genomes])
+
+    def policy(self, keys):
+        """Builds a BatchedPolicy with one row per entry of ``keys``."""
+        return BatchedPolicy(self, np.array([self.index[key] for key in keys], dtype=np.int64))
+
+
+class BatchedPolicy:
+    """Activates one (possibly repeated) network per row in a single call.
+
+    Row ``i`` behaves like its own network instance: recurrent rows keep their
+    own hidden state, exactly as if a separate ``RecurrentNetwork`` had been
+    created for every paddle.
+    """
+
+    def __init__(self, population, network_indices, state=None):
+        self.population = population
+        self.network_indices = network_indices
+        self.weights = population.weights[network_indices]
+        self.biases = population.biases[network_indices]
+        self.responses = population.responses[network_indices]
+        self.groups = activation_groups(population.activation_ids[network_indices])
+        self.num_inputs = population.num_inputs
+        self.output_slice = slice(self.num_inputs, self.num_inputs + population.num_outputs)
+        if state is None:
+            state = np.zeros(self.biases.shape)
+        self.state = state
+
+    def __len__(self):
+        return len(self.network_indices)
+
+    def select(self, rows):
+        """Returns a policy restricted to ``rows``, keeping their hidden state."""
+        return BatchedPolicy(self.population, self.network_indices[rows], self.state[rows])
+
+    def _step(self, values, inputs):
+        values[:, :self.num_inputs] = inputs
+        z = self.biases + self.responses * np.matmul(values[:, None, :], self.weights)[:, 0, :]
+        new_values = apply_activation_groups(z, self.groups)
+        new_values[:, :self.num_inputs] = inputs
+        return new_values
+
+    def activate(self, inputs):
+        """Computes network outputs for every row.
+
+        Args:
+            inputs: Array of shape (rows, num_inputs).
+
+        Returns:
+            np.ndarray: Array of shape (rows, num_outputs).
+        """
+        if self.population.recurrent:
+            self.state = self._step(self.state, inputs)
+            return self.state[:, self.output_slice]
+
+        values = np.zeros(self.biases.shape)
+        for _ in range(self.population.depth):
+            values = self._step(values, inputs)
+        return values[:, self.output_slice]
+
+    def actions(self, inputs):
+        """Returns the action code (index of the max output) for every row."""
+        return self.activate(inputs).argmax(axis=1)
+
+
+def play_first_point_matches(population, pairings, ball_speed=None, max_frames=3000,
+                             seed=None, simulator=None, decision_interval=1):
+    """Plays many matches to the first point (or the frame cap) at once.
+
+    This is the batched counterpart of the match loop in
+    ``ai_module.eval_genomes_competitive``: the left paddle is the genome
+    being evaluated and the first point decides the match.
+
+    Args:
+        population: PopulationNetworks holding every participating network.
+        pairings: List of ``(left_key, right_key)`` tuples.
+        ball_speed: Optional ball speed for curriculum learning.
+        max_frames: Frame cap after which a match is a draw.
+        seed: Optional seed for the serve directions.
+        simulator: Optional pre-built BatchGameSimulator with one game per
+            pairing (mainly for tests).
+        decision_interval: Frames between network activations; actions are
+            repeated in between.
+
+    Returns:
+        list: One dict per pairing with keys "match_result" (1.0 left win,
+            0.0 right win, 0.5 draw), "frames", "contact_ys" (ball Y of
+            every paddle contact, in order) and "behavior" (the left
+            paddle's counts, see core.behavior).
+    """
+    num_matches = len(pairings)
+    if simulator is None:
+        simulator = BatchGameSimulator(num_matches, ball_speed=ball_speed, seed=seed)
+    behavior = simulator.behavior = BatchBehaviorAccumulator(num_matches)
+
+    policy = population.policy([left for left, _ in pairings] + [right for _, right in pairings])
+    rows = np.arange(num_matches)  # games still handled by the policy
+
+    match_result = np.full(num_matches, 0.5)
+    frames = np.full(num_matches, max_frames, dtype=np.int64)
+    contact_ys = [[] for _ in range(num_matches)]
+    active = np.ones(num_matches, dtype=bool)
+    left_actions = np.full(num_matches, ACTION_STAY, dtype=np.int64)
+    right_actions = np.full(num_matches, ACTION_STAY, dtype=np.int64)
+
+    for frame in range(1, max_frames + 1):
+        if (frame - 1) % decision_interval == 0:
+            left_inputs = simulator.network_inputs("left")[rows]
+            right_inputs = simulator.network_inputs("right")[rows]
+            actions = policy.actions(np.concatenate((left_inputs, right_inputs)))
+            left_actions[rows] = actions[:len(rows)]
+            right_actions[rows] = actions[len(rows):]
+
+        hit_left, hit_right, scored_left, scored_right = simulator.update(
+            left_actions, right_actions, active=active)
+
+        for game in np.flatnonzero(hit_left | hit_right):
+            contact_ys[game].append(float(simulator.contact_y[game]))
+
+        finished = scored_left | scored_right
+        if finished.any():
+            match_result[scored_left] = 1.0
+            match_result[scored_right] = 0.0
+            frames[finished] = frame
+            active &= ~finished
+            if not active.any():
+                break
+            # Drop finished games from the policy once enough have ended
+            if active.sum() * 2 <= len(rows):
+                keep = active[rows]
+                policy = policy.select(np.concatenate((keep, keep)))
+                rows = rows[keep]
+                left_actions[~active] = ACTION_STAY
+                right_actions[~active] = ACTION_STAY
+
+    return [
+        {"match_result": float(match_result[i]), "frames": int(frames[i]), "contact_ys": contact_ys[i],
+         "behavior": behavior.counts(i, LEFT)}
+        for i in range(num_matches)
+    ]
+
+
+def play_against_opponent(population, keys, opponent, ball_speed=None, max_frames=3000,
+                          seed=None, simulator=None, decision_interval=1):
+    """Plays every listed network against a scripted opponent to the first point.
+
+    The networks play the left paddle; ``opponent`` (see
+    ``ai.opponents.ScriptedOpponent``) chooses the right paddle's actions for
+    all games at once.
+
+    Args:
+        population: PopulationNetworks holding every participating network.
+        keys: Network key per game (repeat a key to play several games).
+        opponent: Vectorized scripted opponent.
+        ball_speed: Optional ball speed for curriculum learning.
+        max_frames: Frame cap after which a game is a draw.
+        seed: Optional seed for the serve directions.
+        simulator: Optional pre-built BatchGameSimulator with one game per key.
+        decision_interval: Frames between network activations; actions are
+            repeated in between.
+
+    Returns:
+        list: One dict per game with keys "match_result" (1.0 network won the
+            point, 0.0 lost, 0.5 draw), "frames", "hits" (network paddle
+            hits) and "contact_ys".
+    """
+    num_games = len(keys)
+    if simulator is None:
+        simulator = BatchGameSimulator(num_games, ball_speed=ball_speed, seed=seed)
+    opponent.reset()
+
+    policy = population.policy(keys)
+    rows = np.arange(num_games)
+
+    match_result = np.full(num_games, 0.5)
+    frames = np.full(num_games, max_frames, dtype=np.int64)
+    hits = np.zeros(num_games, dtype=np.int64)
+    opponent_hits = np.zeros(num_games, dtype=np.int64)
+    contact_ys = [[] for _ in range(num_games)]
+    active = np.ones(num_games, dtype=bool)
+    left_actions = np.full(num_games, ACTION_STAY, dtype=np.int64)
+
+    for frame in range(1, max_frames + 1):
+        if (frame - 1) % decision_interval == 0:
+            left_actions[rows] = policy.actions(simulator.network_inputs("left")[rows])
+        right_actions = opponent.actions(simulator, "right")
+
+        hit_left, hit_right, scored_left, scored_right = simulator.update(
+            left_actions, right_actions, active=active)
+
+        hits += hit_left
+        opponent_hits += hit_right
+        for game in np.flatnonzero(hit_left):
+            contact_ys[game].append(float(simulator.contact_y[game]))
+
+        finished = scored_left | scored_right
+        if finished.any():
+            match_result[scored_left] = 1.0
+            match_result[scored_right] = 0.0
+            frames[finished] = frame
+            active &= ~finished
+            if not active.any():
+                break
+            if active.sum() * 2 <= len(rows):
+                keep = active[rows]
+                policy = policy.select(keep)
+                rows = rows[keep]
+                left_actions[~active] = ACTION_STAY
+
+    return [
+        {"match_result": float(match_result[i]), "frames": int(frames[i]), "hits": int(hits[i]),
+         "opponent_hits": int(opponent_hits[i]), "contact_ys": contact_ys[i]}
+        for i in range(num_games)
+    ]
@@ -0,0 +1,269 @@
+"""NumPy compilation of NEAT genomes for batched activation.
+
+neat-python evaluates a network node by node in pure Python, which makes
+``activate`` the hottest call in training and tournaments. This module turns a
+``DefaultGenome`` into dense weight matrices, bias/response vectors and
+per-node activation ids so that many input rows can be pushed through the
+network with a few matrix products.
+
+Both phenotypes used in the project are supported:
+
+- Recurrent (the training default): every expressed node is updated
+  synchronously from the previous step's values, exactly like
+  ``neat.nn.RecurrentNetwork.activate``.
+- Feed-forward: nodes are evaluated layer by layer in the order chosen by
+  ``neat.nn.FeedForwardNetwork``.
+"""
+
+import neat
+import numpy as np
+
+
+def _sigmoid(z):
+    z = np.clip(5.0 * z, -60.0, 60.0)
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _tanh(z):
+    return np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+
+def _relu(z):
+    return np.where(z > 0.0, z, 0.0)
+
+
+def _identity(z):
+    return z
+
+
+def _clamped(z):
+    return np.clip(z, -1.0, 1.0)
+
+
+# Activation ids are indices into this table; they mirror neat.activations
+ACTIVATION_NAMES = ("sigmoid", "tanh", "relu", "identity", "clamped")
+ACTIVATION_FUNCTIONS = (_sigmoid, _tanh, _relu, _identity, _clamped)
+NO_ACTIVATION = -1
+
+
+def apply_activations(z, activation_ids):
+    """Applies per-node activation functions to pre-activation values.
+
+    Args:
+        z: Array of pre-activation values, shape (..., K).
+        activation_ids: Integer array broadcastable to ``z`` holding an index
+            into ACTIVATION_FUNCTIONS for every node (NO_ACTIVATION for nodes
+            that are not evaluated).
+
+    Returns:
+        np.ndarray: Activated values with the same shape as ``z``. Entries
+            with NO_ACTIVATION are zero.
+    """
+    activation_ids = np.broadcast_to(activation_ids, z.shape)
+    out = np.zeros_like(z)
+    for act_id, fn in enumerate(ACTIVATION_FUNCTIONS):
+        mask = activation_ids == act_id
+        if mask.any():
+            out[mask] = fn(z[mask])
+    return out
+
+
+def activation_groups(activation_ids):
+    """Precomputes flat index groups for repeated apply_activation_groups calls.
+
+    Args:
+        activation_ids: Integer array of activation ids.
+
+    Returns:
+        list: ``(function, flat_indices)`` pairs, one per activation in use.
+    """
+    flat_ids = np.ravel(activation_ids)
+    groups = []
+    for act_id, fn in enumerate(ACTIVATION_FUNCTIONS):
+        indices = np.flatnonzero(flat_ids == act_id)
+        if len(indices):
+            groups.append((fn, indices))
+    return groups
+
+
+def apply_activation_groups(z, groups):
+    """Same as apply_activations, using groups from activation_groups.
+
+    Args:
+        z: Pre-activation values with the shape the groups were built for.
+        groups: Output of activation_groups.
+
+    Returns:
+        np.ndarray: Activated values with the same shape as ``z``.
+    """
+    flat_z = z.ravel()
+    out = np.zeros_like(flat_z)
+    for fn, indices in groups:
+        out[indices] = fn(flat_z[indices])
+    return out.reshape(z.shape)
+
+
+class CompiledNetwork:
+    """Matrix form of a NEAT network that activates many input rows at once.
+
+    Node values are stored in a vector ordered as inputs, outputs, then hidden
+    nodes. ``weights[i, j]`` is the weight of the connection from node ``i`` to
+    node ``j``.
+
+    Attributes:
+        recurrent: True for RecurrentNetwork semantics, False for feed-forward.
+        num_inputs: Number of network inputs.
+        num_outputs: Number of network outputs.
+        node_keys: Genome node key for every column of the value vector.
+        weights: Dense (K, K) connection weight matrix.
+        biases: Per-node bias vector.
+        responses: Per-node response multipliers.
+        activation_ids: Per-node activation ids (NO_ACTIVATION when the node
+            is not evaluated by neat-python).
+        depth: Number of synchronous steps needed to compute the outputs
+            (1 for recurrent networks, the number of layers otherwise).
+        state: Current node values for recurrent activation, shape (N, K).
+    """
+
+    def __init__(self, num_inputs, num_outputs, node_keys, weights, biases, responses,
+                 activation_ids, recurrent=True, layers=None):
+        self.recurrent = recurrent
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+        self.node_keys = list(node_keys)
+        self.weights = weights
+        self.biases = biases
+        self.responses = responses
+        self.activation_ids = activation_ids
+        self.layers = layers or []
+        self.depth = 1 if recurrent else max(1, len(self.layers))
+        self.output_slice = slice(num_inputs, num_inputs + num_outputs)
+        self.state = None
+
+    @property
+    def num_nodes(self):
+        return len(self.node_keys)
+
+    @staticmethod
+    def create(genome, config_neat, recurrent=True):
+        """Compiles a genome the same way neat-python builds its phenotype.
+
+        Args:
+            genome: A NEAT DefaultGenome.
+            config_neat: NEAT configuration object.
+            recurrent: If True, mirrors ``neat.nn.RecurrentNetwork.create``;
+                otherwise ``neat.nn.FeedForwardNetwork.create``.
+
+        Returns:
+            CompiledNetwork: The compiled network.
+
+        Raises:
+            ValueError: If a node uses an activation or aggregation that has
+                no vectorized implementation.
+        """
+        genome_config = config_neat.genome_config
+        input_keys = list(genome_config.input_keys)
+        output_keys = list(genome_config.output_keys)
+
+        # Let neat-python decide which nodes and links are expressed so the
+        # compiled phenotype follows the installed version exactly.
+        network_type = neat.nn.RecurrentNetwork if recurrent else neat.nn.FeedForwardNetwork
+        node_evals = network_type.create(genome, config_neat).node_evals
+
+        # Column order: inputs, outputs, then every other referenced node
+        hidden = set()
+        for node_key, _, _, _, _, links in node_evals:
+            hidden.add(node_key)
+            hidden.update(i for i, _ in links)
+        hidden.difference_update(input_keys)
+        hidden.difference_update(output_keys)
+        node_keys = input_keys + output_keys + sorted(hidden)
+        index = {key: col for col, key in enumerate(node_keys)}
+
+        size = len(node_keys)
+        weights = np.zeros((size, size))
+        biases = np.zeros(size)
+        responses = np.ones(size)
+        activation_ids = np.full(size, NO_ACTIVATION, dtype=np.int64)
+
+        for node_key, _, _, bias, response, links in node_evals:
+            node = genome.nodes[node_key]
+            if node.aggregation != "sum":
+                raise ValueError(f"Unsupported aggregation for compiled network: {node.aggregation}")
+            if node.activation not in ACTIVATION_NAMES:
+                raise ValueError(f"Unsupported activation for compiled network: {node.activation}")
+            col = index[node_key]
+            for i, w in links:
+                weights[index[i], col] = w
+            biases[col] = bias
+            responses[col] = response
+            activation_ids[col] = ACTIVATION_NAMES.index(node.activation)
+
+        compiled_layers = None
+        if not recurrent:
+            # node_evals are already in evaluation order; recover the layers
+            # so that independent nodes are computed in one matrix product.
+            depth = {}
+            for node_key, _, _, _, _, links in node_evals:
+                depth[node_key] = 1 + max((depth.get(i, 0) for i, _ in links), default=0)
+            compiled_layers = []
+            for level in sorted(set(depth.values())):
+                cols = np.array(sorted(index[k] for k, d in depth.items() if d == level), dtype=np.int64)
+                compiled_layers.append((cols, weights[:, cols]))
+
+        return CompiledNetwork(len(input_keys), len(output_keys), node_keys, weights, biases,
+                               responses, activation_ids, recurrent=recurrent,
+                               layers=compiled_layers)
+
+    def reset(self, batch_size=None):
+        """Clears recurrent state.
+
+        Args:
+            batch_size: Number of independent rows to keep state for. If None,
+                state is re-created lazily on the next activation.
+        """
+        self.state = None if batch_size is None else np.zeros((batch_size, self.num_nodes))
+
+    def activate_batch(self, inputs):
+        """Activates the network for every row of ``inputs``.
+
+        For recurrent networks each row keeps its own hidden state between
+        calls, so row ``i`` behaves like its own ``RecurrentNetwork``.
+
+        Args:
+            inputs: Array of shape (N, num_inputs).
+
+        Returns:
+            np.ndarray: Output array of shape (N, num_outputs).
+        """
+        inputs = np.asarray(inputs, dtype=np.float64)
+        batch_size = inputs.shape[0]
+
+        if self.recurrent:
+            if self.state is None or self.state.shape[0] != batch_size:
+                self.reset(batch_size)
+            values = self.state
+            values[:, :self.num_inputs] = inputs
+            z = self.biases + self.responses * (values @ self.weights)
+            new_values = apply_activations(z, self.activation_ids)
+            new_values[:, :self.num_inputs] = inputs
+            self.state = new_values
+            return new_values[:, self.output_slice]
+
+        values = np.zeros((batch_size, self.num_nodes))
+        values[:, :self.num_inputs] = inputs
+        for cols, layer_weights in self.layers:
+            z = self.biases[cols] + self.responses[cols] * (values @ layer_weights)
+            values[:, cols] = apply_activations(z, self.activation_ids[cols])
+        return values[:, self.output_slice]
+
+    def activate(self, inputs):
+        """Single-row activation with the ``neat.nn`` calling convention.
+
+        Args:
+            inputs: Sequence of ``num_inputs`` values.
+
+        Returns:
+            list: Output values.
+        """
+        return self.activate_batch(np.asarray(inputs, dtype=np.float64)[None, :])[0].tolist()
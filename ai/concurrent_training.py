@@ -5,9 +5,10 @@ significantly speeding up competitive and self-play training modes.
 """
 
 import multiprocessing
+import random
 import sys
 import os
-from functools import partial
+import time
 
 # Prevent importing main.py in worker processes
 if __name__ == "__main__" or "__mp_main__" in sys.modules:
@@ -28,162 +29,446 @@ except ImportError:
     config = None
     game_simulator = None
 
+from .telemetry import DEFAULT_TELEMETRY, timed_match
 
-def _run_training_match(match_data):
-    """Worker function to run a single training match.
-    
-    Args:
-        match_data: Dict with:
-            - genome_left_pickle: Pickled genome for left player
-            - genome_right_pickle: Pickled genome for right player
-            - config_path: Path to NEAT config file
-            - ball_speed: Optional ball speed
-    
-    Returns:
-        Dict with match results and contact metrics
-    """
-    # Import here to avoid issues in worker processes
-    import pickle
+
+# Per-worker state. Pool workers load the NEAT config once in their
+# initializer and keep the population of the current generation (and the
+# networks built from it) until the next broadcast arrives.
+_worker_configs = {}
+_worker_generation = {"name": None, "config_path": None, "genomes": {}, "networks": {},
+                      "ball_speed": None, "decision_interval": None, "hall_of_fame": None}
+# The Hall of Fame is broadcast separately and only when it changes, so its
+# networks outlive the generation that first built them.
+_worker_hall_of_fame = {"name": None, "genomes": [], "networks": {}}
+
+# Bytes reserved in front of a broadcast blob for its length
+_HEADER_SIZE = 8
+
+
+def _load_config(config_path):
+    """Returns the NEAT config for ``config_path``, parsing it once per process."""
     import neat
-    
-    try:
-        from core import config
-        from core import simulator as game_simulator
-    except ImportError:
-        return {
-            "match_result": 0.5,
-            "contact_metrics": [],
-            "score_left": 0,
-            "score_right": 0,
-            "error": "Failed to import required modules in worker process"
-        }
-    
-    genome_left_pickle = match_data["genome_left_pickle"]
-    genome_right_pickle = match_data["genome_right_pickle"]
-    config_path = match_data["config_path"]
-    ball_speed = match_data.get("ball_speed")
-    
-    try:
-        # Unpickle genomes
-        genome_left = pickle.loads(genome_left_pickle)
-        genome_right = pickle.loads(genome_right_pickle)
-        
-        # Load config
+
+    config_neat = _worker_configs.get(config_path)
+    if config_neat is None:
         config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
                                   neat.DefaultSpeciesSet, neat.DefaultStagnation,
                                   config_path)
-        
-        # Create networks (use RecurrentNetwork for RNN support)
-        try:
-            net_left = neat.nn.RecurrentNetwork.create(genome_left, config_neat)
-            net_left.reset()
-        except:
-            net_left = neat.nn.FeedForwardNetwork.create(genome_left, config_neat)
-        
-        try:
-            net_right = neat.nn.RecurrentNetwork.create(genome_right, config_neat)
-            net_right.reset()
-        except:
-            net_right = neat.nn.FeedForwardNetwork.create(genome_right, config_neat)
-        
-        # Play match
-        game = game_simulator.GameSimulator(ball_speed=ball_speed)
-        frame_count = 0
-        max_frames = 3000
-        contact_metrics = []
-        match_result = 0.5  # Draw by default
-        
-        while frame_count < max_frames:
-            frame_count += 1
-            state = game.get_state()
-            
+        _worker_configs[config_path] = config_neat
+    return config_neat
+
+
+def _init_worker(config_path, profile_args=None):
+    """Pool initializer: loads the NEAT config once per worker process.
+
+    With ``profile_args`` (see utils.profiling.Profiler.worker_args) the
+    worker is profiled too.
+    """
+    if profile_args is not None:
+        from utils.profiling import init_worker
+        init_worker(*profile_args)
+    if config_path:
+        _load_config(config_path)
+
+
+def _create_network(genome, config_neat):
+    """Creates a network for a genome (RecurrentNetwork for RNN support)."""
+    import neat
+
+    try:
+        net = neat.nn.RecurrentNetwork.create(genome, config_neat)
+        net.reset()
+    except:
+        net = neat.nn.FeedForwardNetwork.create(genome, config_neat)
+    return net
+
+
+def _play_training_match(net_left, net_right, ball_speed=None, seed=None, decision_interval=None,
+                         early_stop=None):
+    """Plays one training match to the first point between two networks.
+
+    The match stops as soon as its rally is decided (see
+    core.early_stop.RallyWatch); the result is the same as playing on.
+
+    Args:
+        early_stop: Optional EarlyStopPolicy (defaults to
+            core.early_stop.DEFAULT_POLICY).
+
+    Returns:
+        Dict with match results, the left paddle's behavior counts (see
+        core.behavior), the match length in frames and the frames saved by
+        stopping early
+    """
+    from core.behavior import BehaviorAccumulator, LEFT
+    from core.early_stop import DEFAULT_POLICY
+    from core.simulator import network_inputs, EVENT_SCORE_LEFT, EVENT_SCORE_RIGHT
+
+    game = game_simulator.GameSimulator(ball_speed=ball_speed, seed=seed)
+    game.behavior = behavior = BehaviorAccumulator()
+    state = game.state  # Flat state buffer, updated in place
+    frame_count = 0
+    max_frames = 3000
+    interval = decision_interval or config.DECISION_INTERVAL
+    match_result = 0.5  # Draw by default
+    frames_saved = 0
+    watch = (early_stop or DEFAULT_POLICY).rally_watch(game, max_frames)
+    events = 0
+
+    while frame_count < max_frames:
+        if watch is not None:
+            decided = watch.check(frame_count, events)
+            if decided is not None:
+                frames_saved, scored = decided
+                if scored:
+                    watch.play_out(frames_saved)
+                if scored & EVENT_SCORE_LEFT:
+                    match_result = 1.0
+                elif scored & EVENT_SCORE_RIGHT:
+                    match_result = 0.0
+                break
+
+        frame_count += 1
+
+        # Networks decide every `interval` frames; moves repeat in between
+        if (frame_count - 1) % interval == 0:
             # Left paddle (genome being evaluated)
-            inputs_left = (
-                state["paddle_left_y"] / config.SCREEN_HEIGHT,
-                state["ball_x"] / config.SCREEN_WIDTH,
-                state["ball_y"] / config.SCREEN_HEIGHT,
-                state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                (state["paddle_left_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                1.0 if state["ball_vel_x"] < 0 else 0.0,
-                state["paddle_right_y"] / config.SCREEN_HEIGHT
-            )
-            output_left = net_left.activate(inputs_left)
+            output_left = net_left.activate(network_inputs(state, "left"))
             action_idx_left = output_left.index(max(output_left))
-            
+
             left_move = None
             if action_idx_left == 0:
                 left_move = "UP"
             elif action_idx_left == 1:
                 left_move = "DOWN"
-            
+
             # Right paddle (opponent)
-            inputs_right = (
-                state["paddle_right_y"] / config.SCREEN_HEIGHT,
-                state["ball_x"] / config.SCREEN_WIDTH,
-                state["ball_y"] / config.SCREEN_HEIGHT,
-                state["ball_vel_x"] / config.BALL_MAX_SPEED,
-                state["ball_vel_y"] / config.BALL_MAX_SPEED,
-                (state["paddle_right_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
-                1.0 if state["ball_vel_x"] > 0 else 0.0,
-                state["paddle_left_y"] / config.SCREEN_HEIGHT
-            )
-            output_right = net_right.activate(inputs_right)
+            output_right = net_right.activate(network_inputs(state, "right"))
             action_idx_right = output_right.index(max(output_right))
-            
+
             right_move = None
             if action_idx_right == 0:
                 right_move = "UP"
             elif action_idx_right == 1:
                 right_move = "DOWN"
-            
-            # Update game
-            score_data = game.update(left_move, right_move)
-            
-            # Collect contact metrics
-            if score_data and (score_data.get("hit_left") or score_data.get("hit_right")):
-                contact_metrics.append(score_data)
-            
-            # Check for scoring
-            if score_data:
-                if score_data.get("scored") == "left":
-                    match_result = 1.0
-                    break
-                elif score_data.get("scored") == "right":
-                    match_result = 0.0
+
+        # Update game
+        events = game.step(left_move, right_move)
+
+        # Check for scoring
+        if events & EVENT_SCORE_LEFT:
+            match_result = 1.0
+            break
+        elif events & EVENT_SCORE_RIGHT:
+            match_result = 0.0
+            break
+
+    return {
+        "match_result": match_result,
+        "behavior": behavior.counts(LEFT),
+        "score_left": game.score_left,
+        "score_right": game.score_right,
+        "frames": frame_count + frames_saved,
+        "frames_saved": frames_saved,
+    }
+
+
+def _play_self_play_match(net_left, net_right, ball_speed=None, seed=None, decision_interval=None,
+                          max_frames=10000, target_score=5):
+    """Plays one self-play match and returns both players' fitness deltas.
+
+    Each player earns 0.01 per frame, 1.0 per hit, 5.0 per point scored and
+    loses 2.0 per point conceded. The match ends at ``target_score`` points
+    or after ``max_frames`` frames.
+
+    Returns:
+        Dict with "left_delta", "right_delta", "score_left", "score_right"
+        and "frames"
+    """
+    from core.simulator import (
+        network_inputs, EVENT_HIT_LEFT, EVENT_HIT_RIGHT, EVENT_SCORE_LEFT, EVENT_SCORE_RIGHT,
+    )
+
+    game = game_simulator.GameSimulator(ball_speed=ball_speed, seed=seed)
+    state = game.state  # Flat state buffer, updated in place
+    interval = decision_interval or config.DECISION_INTERVAL
+    frame_count = 0
+    hits_left = hits_right = 0
+
+    while frame_count < max_frames:
+        frame_count += 1
+
+        if (frame_count - 1) % interval == 0:
+            out_left = net_left.activate(network_inputs(state, "left"))
+            act_left = out_left.index(max(out_left))
+            move_left = "UP" if act_left == 0 else "DOWN" if act_left == 1 else None
+
+            out_right = net_right.activate(network_inputs(state, "right"))
+            act_right = out_right.index(max(out_right))
+            move_right = "UP" if act_right == 0 else "DOWN" if act_right == 1 else None
+
+        events = game.step(move_left, move_right)
+        if events:
+            if events & EVENT_HIT_LEFT:
+                hits_left += 1
+            if events & EVENT_HIT_RIGHT:
+                hits_right += 1
+            if events & (EVENT_SCORE_LEFT | EVENT_SCORE_RIGHT):
+                if game.score_left >= target_score or game.score_right >= target_score:
                     break
+
+    score_left, score_right = game.score_left, game.score_right
+    return {
+        "left_delta": 0.01 * frame_count + hits_left + 5.0 * score_left - 2.0 * score_right,
+        "right_delta": 0.01 * frame_count + hits_right + 5.0 * score_right - 2.0 * score_left,
+        "score_left": score_left,
+        "score_right": score_right,
+        "frames": frame_count,
+    }
+
+
+def _error_result(message):
+    return {
+        "match_result": 0.5,
+        "behavior": None,
+        "score_left": 0,
+        "score_right": 0,
+        "frames": 0,
+        "frames_saved": 0,
+        "error": message
+    }
+
+
+def _run_training_match(match_data):
+    """Worker function to run a single training match.
+    
+    Args:
+        match_data: Dict with:
+            - genome_left_pickle: Pickled genome for left player
+            - genome_right_pickle: Pickled genome for right player
+            - config_path: Path to NEAT config file
+            - ball_speed: Optional ball speed
+            - seed: Optional seed for a reproducible match
+            - decision_interval: Optional frames between network activations
+              (defaults to config.DECISION_INTERVAL)
+    
+    Returns:
+        Dict with match results and contact metrics
+    """
+    # Import here to avoid issues in worker processes
+    import pickle
+    
+    if game_simulator is None:
+        return _error_result("Failed to import required modules in worker process")
+    
+    try:
+        # Unpickle genomes
+        genome_left = pickle.loads(match_data["genome_left_pickle"])
+        genome_right = pickle.loads(match_data["genome_right_pickle"])
         
-        return {
-            "match_result": match_result,
-            "contact_metrics": contact_metrics,
-            "score_left": game.score_left,
-            "score_right": game.score_right
-        }
+        config_neat = _load_config(match_data["config_path"])
+        return _play_training_match(
+            _create_network(genome_left, config_neat),
+            _create_network(genome_right, config_neat),
+            ball_speed=match_data.get("ball_speed"),
+            seed=match_data.get("seed"),
+            decision_interval=match_data.get("decision_interval"),
+        )
         
     except Exception as e:
         import traceback
         traceback.print_exc()
-        return {
-            "match_result": 0.5,
-            "contact_metrics": [],
-            "score_left": 0,
-            "score_right": 0,
-            "error": str(e)
-        }
+        return _error_result(str(e))
+
+
+def _read_shared(shm_name):
+    """Unpickles a blob written to shared memory by the executor."""
+    import pickle
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        if os.name == "posix":
+            # The parent owns the block; keep this process's tracker from
+            # unlinking it (or warning about it) when the worker exits.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        size = int.from_bytes(shm.buf[:_HEADER_SIZE], "little")
+        return pickle.loads(shm.buf[_HEADER_SIZE:_HEADER_SIZE + size])
+    finally:
+        shm.close()
+
+
+def _attach_generation(shm_name):
+    """Loads the broadcast population from shared memory, once per generation."""
+    generation = _worker_generation
+    if generation["name"] == shm_name:
+        return generation
+
+    generation.update(_read_shared(shm_name))
+    generation["name"] = shm_name
+    generation["networks"] = {}
+
+    hall_of_fame = _worker_hall_of_fame
+    if generation["hall_of_fame"] != hall_of_fame["name"]:
+        hall_of_fame["name"] = generation["hall_of_fame"]
+        hall_of_fame["genomes"] = _read_shared(hall_of_fame["name"]) if hall_of_fame["name"] else []
+        hall_of_fame["networks"] = {}
+    return generation
+
+
+def _broadcast_genome(generation, genome_id):
+    """Returns a broadcast genome; ``("hof", index)`` ids name Hall of Fame members."""
+    if genome_id in generation["genomes"]:
+        return generation["genomes"][genome_id]
+    return _worker_hall_of_fame["genomes"][genome_id[1]]
+
+
+def _broadcast_networks(generation, genome_id):
+    """Returns the network cache of a broadcast genome.
+
+    Hall of Fame networks are cached apart from the generation's, so they
+    outlive it.
+    """
+    if genome_id in generation["genomes"]:
+        return generation["networks"]
+    return _worker_hall_of_fame["networks"]
+
+
+def _cached_pairing_networks(left_id, right_id, genome_of, networks_of, config_neat):
+    """Returns reset networks for a pairing, building each genome's network once.
+
+    Shared by the pool workers and the distributed workers (ai.distributed).
+
+    Args:
+        left_id, right_id: Genome ids of the two sides.
+        genome_of: Callable returning the genome of an id.
+        networks_of: Callable returning the dict that caches an id's network.
+        config_neat: NEAT configuration object.
+
+    Returns:
+        tuple: ``(net_left, net_right)``
+    """
+    def network(genome_id):
+        networks = networks_of(genome_id)
+        if genome_id not in networks:
+            networks[genome_id] = _create_network(genome_of(genome_id), config_neat)
+        return networks[genome_id]
+
+    net_left = network(left_id)
+    if right_id == left_id:
+        # A self-match needs two independent hidden states
+        net_right = _create_network(genome_of(right_id), config_neat)
+    else:
+        net_right = network(right_id)
+    for net in (net_left, net_right):
+        if hasattr(net, "reset"):
+            net.reset()
+    return net_left, net_right
+
+
+def _pairing_networks(generation, left_id, right_id):
+    """Returns reset networks for a pairing, reusing the generation's networks."""
+    return _cached_pairing_networks(left_id, right_id,
+                                    lambda genome_id: _broadcast_genome(generation, genome_id),
+                                    lambda genome_id: _broadcast_networks(generation, genome_id),
+                                    _load_config(generation["config_path"]))
+
+
+def _run_pairing(task):
+    """Worker function to run a match between two broadcast genomes.
+
+    Args:
+        task: Tuple ``(shm_name, left_id, right_id, seed)``; the genomes are
+            looked up in the population broadcast under ``shm_name``.
+
+    Returns:
+        tuple: ``(result, telemetry)`` (see ai.telemetry.timed_match); the
+            telemetry is None if the match failed
+    """
+    shm_name, left_id, right_id, seed = task
+    try:
+        generation = _attach_generation(shm_name)
+        net_left, net_right = _pairing_networks(generation, left_id, right_id)
+        return timed_match(_play_training_match, net_left, net_right,
+                           ball_speed=generation["ball_speed"], seed=seed,
+                           decision_interval=generation["decision_interval"])
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return _error_result(str(e)), None
+
+
+def _run_self_play_pairing(task):
+    """Worker function to run a self-play match between two broadcast genomes.
+
+    Args:
+        task: Tuple ``(shm_name, left_id, right_id, seed)``.
+
+    Returns:
+        tuple: ``(result, telemetry)`` with both players' fitness deltas in
+            the result (see _play_self_play_match); a failed match returns
+            an error result and None telemetry
+    """
+    shm_name, left_id, right_id, seed = task
+    try:
+        generation = _attach_generation(shm_name)
+        net_left, net_right = _pairing_networks(generation, left_id, right_id)
+        return timed_match(_play_self_play_match, net_left, net_right,
+                           ball_speed=generation["ball_speed"], seed=seed,
+                           decision_interval=generation["decision_interval"])
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return _error_result(str(e)), None
+
+
+def _share(blob):
+    """Copies a pickled blob, prefixed with its length, into a new shared memory block."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + len(blob))
+    shm.buf[:_HEADER_SIZE] = len(blob).to_bytes(_HEADER_SIZE, "little")
+    shm.buf[_HEADER_SIZE:_HEADER_SIZE + len(blob)] = blob
+    return shm
+
+
+# Worker functions by match type (see ConcurrentTrainingExecutor.execute_pairings)
+_PAIRING_RUNNERS = {
+    "first_point": _run_pairing,
+    "self_play": _run_self_play_pairing,
+}
 
 
 class ConcurrentTrainingExecutor:
-    """Executes training matches concurrently."""
+    """Executes training matches concurrently.
+
+    The worker pool is created once and reused for the whole run: each worker
+    parses the NEAT config in its initializer, and each generation's genomes
+    are broadcast once through shared memory (``broadcast_population``), so
+    every match only ships a ``(left_id, right_id, seed)`` task.
+    """
     
-    def __init__(self, max_workers=None, config_path=None):
+    def __init__(self, max_workers=None, config_path=None, seed=None, profiler=None):
         """Initialize with worker pool.
         
         Args:
             max_workers: Number of worker processes
-            config_path: Path to NEAT config file
+            config_path: Path to NEAT config file (loaded once per worker)
+            seed: Optional base seed; matches without an explicit seed get one
+                derived from it, so results do not depend on scheduling
+            profiler: Optional utils.profiling.Profiler that profiles the
+                workers and collects their profiles on every dump
         """
         self.config_path = config_path
+        self.profiler = profiler
+        self._seed_rng = random.Random(seed) if seed is not None else None
         self.max_workers = max_workers or max(1, multiprocessing.cpu_count() - 1)
+        self._shm = None
+        self._hall_of_fame_shm = None
+        self._hall_of_fame_version = None
         # Only set start method if not already set
         try:
             if sys.platform == 'win32':
@@ -193,42 +478,146 @@ class ConcurrentTrainingExecutor:
         except RuntimeError:
             # Start method already set, ignore
             pass
-        self.pool = multiprocessing.Pool(processes=self.max_workers)
+        profile_args = profiler.worker_args(self.max_workers) if profiler else None
+        self.pool = multiprocessing.Pool(processes=self.max_workers,
+                                         initializer=_init_worker,
+                                         initargs=(config_path, profile_args))
+        if profiler:
+            profiler.attach(self.pool, profile_args)
     
-    def execute_matches(self, genome_pairs, config_path=None):
-        """Execute multiple training matches concurrently.
-        
+    def broadcast_population(self, genomes, config_path=None, ball_speed=None, decision_interval=None,
+                             hall_of_fame=None):
+        """Shares a generation's genomes with every worker.
+
+        The population is pickled once into a shared memory block that
+        replaces the previous generation's block. Workers unpickle it the
+        first time they run a pairing from it.
+
+        A Hall of Fame gets a block of its own that is only replaced when
+        its version changes; workers keep its genomes and networks until
+        then. Pairings name its members ``("hof", index)``.
+
         Args:
-            genome_pairs: List of (genome_left, genome_right) tuples
+            genomes: Dict of {genome_id: genome} or list of (genome_id, genome)
             config_path: Path to NEAT config (uses self.config_path if not provided)
-        
+            ball_speed: Optional ball speed for every match of the generation
+            decision_interval: Optional frames between network activations
+            hall_of_fame: Optional ai.hall_of_fame.HallOfFame of extra opponents
+
         Returns:
-            List of match results
+            str: Name of the shared memory block holding the population
         """
         import pickle
-        
+
         config_path = config_path or self.config_path
         if not config_path:
             raise ValueError("config_path must be provided")
+
+        payload = pickle.dumps({
+            "genomes": dict(genomes),
+            "config_path": config_path,
+            "ball_speed": ball_speed,
+            "decision_interval": decision_interval,
+            "hall_of_fame": self._broadcast_hall_of_fame(hall_of_fame),
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._release_population()
+        self._shm = _share(payload)
+        return self._shm.name
+
+    def _broadcast_hall_of_fame(self, hall_of_fame):
+        """Returns the name of the block holding the Hall of Fame (None if empty)."""
+        if not hall_of_fame:
+            return None
+        if hall_of_fame.version != self._hall_of_fame_version:
+            self._release_hall_of_fame()
+            self._hall_of_fame_shm = _share(hall_of_fame.serialized())
+            self._hall_of_fame_version = hall_of_fame.version
+        return self._hall_of_fame_shm.name
+
+    def execute_pairings(self, pairings, seeds=None, match_type="first_point"):
+        """Plays matches between genomes of the last broadcast population.
+
+        Args:
+            pairings: List of (left_id, right_id) tuples
+            seeds: Optional list of per-match seeds (same length as pairings)
+            match_type: "first_point" for training matches decided by the
+                first point, or "self_play" for matches to five points that
+                return fitness deltas
+
+        The matches and the pool's utilization are counted in
+        ai.telemetry.DEFAULT_TELEMETRY.
+
+        Returns:
+            List of match results, in pairing order
+        """
+        if self._shm is None:
+            raise RuntimeError("broadcast_population must be called before execute_pairings")
+
+        tasks = []
+        for i, (left_id, right_id) in enumerate(pairings):
+            seed = seeds[i] if seeds is not None else None
+            if seed is None and self._seed_rng is not None:
+                seed = self._seed_rng.getrandbits(32)
+            tasks.append((self._shm.name, left_id, right_id, seed))
+
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        start = time.perf_counter()
+        played = self.pool.map(_PAIRING_RUNNERS[match_type], tasks, chunksize=chunksize)
+        DEFAULT_TELEMETRY.record_matches([telemetry for _, telemetry in played],
+                                         time.perf_counter() - start, self.max_workers)
+        return [result for result, _ in played]
+
+    def execute_matches(self, genome_pairs, config_path=None, seeds=None, decision_interval=None):
+        """Execute multiple training matches concurrently.
         
-        # Prepare match data with pickled genomes
-        match_data_list = []
-        for genome_left, genome_right in genome_pairs:
-            match_data_list.append({
-                "genome_left_pickle": pickle.dumps(genome_left),
-                "genome_right_pickle": pickle.dumps(genome_right),
-                "config_path": config_path,
-                "ball_speed": None  # Can be added later if needed
-            })
+        Genomes appearing in several pairs are broadcast only once.
+
+        Args:
+            genome_pairs: List of (genome_left, genome_right) tuples
+            config_path: Path to NEAT config (uses self.config_path if not provided)
+            seeds: Optional list of per-match seeds (same length as genome_pairs)
+            decision_interval: Optional frames between network activations
         
-        return self.pool.map(_run_training_match, match_data_list)
+        Returns:
+            List of match results
+        """
+        genomes = {}
+        pairings = []
+        for genome_left, genome_right in genome_pairs:
+            genomes.setdefault(id(genome_left), genome_left)
+            genomes.setdefault(id(genome_right), genome_right)
+            pairings.append((id(genome_left), id(genome_right)))
+
+        self.broadcast_population(genomes, config_path=config_path,
+                                  decision_interval=decision_interval)
+        return self.execute_pairings(pairings, seeds=seeds)
+
+    def _release_population(self):
+        """Frees the shared memory block of the previous broadcast."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _release_hall_of_fame(self):
+        """Frees the shared memory block of the broadcast Hall of Fame."""
+        if self._hall_of_fame_shm is not None:
+            self._hall_of_fame_shm.close()
+            self._hall_of_fame_shm.unlink()
+            self._hall_of_fame_shm = None
+            self._hall_of_fame_version = None
     
     def close(self):
-        """Close the process pool."""
+        """Close the process pool and free the broadcast population and Hall of Fame."""
         if self.pool:
+            if self.profiler:
+                self.profiler.detach(self.pool)
             self.pool.close()
             self.pool.join()
             self.pool = None
+        self._release_population()
+        self._release_hall_of_fame()
     
     def __enter__(self):
         return self
@@ -236,4 +625,3 @@ class ConcurrentTrainingExecutor:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
         return False
-
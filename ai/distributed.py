@@ -0,0 +1,490 @@
+"""Distributed generation evaluation over a TCP coordinator/worker protocol.
+
+A ``DistributedCoordinator`` serves a work queue through
+``multiprocessing.managers``. Workers (``run_worker``, on this or other
+machines) connect over TCP, fetch each generation's population once, pull
+``(left_id, right_id, seed)`` matches, stream results back one by one and
+send heartbeats from a background thread. Matches held by a worker whose
+heartbeats stop are handed to another worker.
+
+``DistributedCoordinator.eval_genomes`` has the same signature as
+``ai_module.eval_genomes_competitive``, so it can be passed to
+``Population.run``::
+
+    with DistributedCoordinator(address=("0.0.0.0", 50000), authkey=b"secret") as coordinator:
+        population.run(coordinator.eval_genomes, 50)
+
+and on each worker machine::
+
+    python -m ai.distributed --host coordinator-host --port 50000 --authkey secret
+
+Workers unpickle what the coordinator sends, so anyone holding the authkey
+can run code on them: pick a secret one, or leave it out and hand the
+coordinator's generated ``authkey`` to the workers.
+"""
+
+import argparse
+import itertools
+import os
+import pickle
+import random
+import secrets
+import socket
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from multiprocessing.managers import BaseManager
+
+# Add root to path
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root_dir not in sys.path:
+    sys.path.insert(0, _root_dir)
+
+from ai.concurrent_training import _cached_pairing_networks, _error_result, _play_training_match
+from core.behavior import COUNT_FIELDS, add_counts
+
+
+
+class WorkBroker:
+    """Work queue for one coordinator; lives in the manager's server process.
+
+    Tasks are indices into the current generation's match list. A task is
+    pending, assigned to a worker, or done. Whenever workers or the
+    coordinator call in, assigned tasks of workers that have not sent a
+    heartbeat within ``heartbeat_timeout`` seconds go back to the front of
+    the pending queue.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.heartbeat_timeout = 10.0
+        self.generation_id = None
+        self.payload = None
+        self.tasks = []
+        self.pending = deque()
+        self.assigned = {}
+        self.results = {}
+        self.new_results = {}
+        self.last_seen = {}
+        self.stopped = False
+
+    def configure(self, heartbeat_timeout):
+        self.heartbeat_timeout = heartbeat_timeout
+
+    def start_generation(self, generation_id, payload, tasks):
+        """Replaces the work queue with a new generation's matches."""
+        with self._lock:
+            self.generation_id = generation_id
+            self.payload = payload
+            self.tasks = list(tasks)
+            self.pending = deque(range(len(self.tasks)))
+            self.assigned = {}
+            self.results = {}
+            self.new_results = {}
+
+    def get_payload(self, generation_id):
+        """Returns the pickled population of a generation (None if it is gone)."""
+        with self._lock:
+            return self.payload if generation_id == self.generation_id else None
+
+    def heartbeat(self, worker_id):
+        with self._lock:
+            self.last_seen[worker_id] = time.monotonic()
+
+    def get_task(self, worker_id):
+        """Hands out the next match.
+
+        Returns:
+            "stop" once the coordinator shuts down, None if no match is
+            pending, else ``(generation_id, index, left_id, right_id, seed)``.
+        """
+        with self._lock:
+            if self.stopped:
+                return "stop"
+            self.last_seen[worker_id] = time.monotonic()
+            self._reclaim_lost_tasks()
+            if not self.pending:
+                return None
+            index = self.pending.popleft()
+            self.assigned[index] = worker_id
+            return (self.generation_id, index) + tuple(self.tasks[index])
+
+    def submit(self, worker_id, generation_id, index, result):
+        """Records a match result; duplicates and stale generations are ignored."""
+        with self._lock:
+            self.last_seen[worker_id] = time.monotonic()
+            if generation_id != self.generation_id or index in self.results:
+                return
+            self.assigned.pop(index, None)
+            if index in self.pending:
+                self.pending.remove(index)
+            self.results[index] = result
+            self.new_results[index] = result
+
+    def collect(self):
+        """Returns ``(new_results, remaining)`` and reclaims lost tasks."""
+        with self._lock:
+            self._reclaim_lost_tasks()
+            new_results, self.new_results = self.new_results, {}
+            return new_results, len(self.tasks) - len(self.results)
+
+    def live_workers(self):
+        """Returns ids of workers seen within the heartbeat timeout."""
+        with self._lock:
+            now = time.monotonic()
+            return [worker_id for worker_id, seen in self.last_seen.items()
+                    if now - seen <= self.heartbeat_timeout]
+
+    def stop(self):
+        with self._lock:
+            self.stopped = True
+
+    def _reclaim_lost_tasks(self):
+        now = time.monotonic()
+        lost = [index for index, worker_id in self.assigned.items()
+                if now - self.last_seen.get(worker_id, 0.0) > self.heartbeat_timeout]
+        for index in sorted(lost, reverse=True):
+            del self.assigned[index]
+            self.pending.appendleft(index)
+
+
+_broker = None
+
+
+def _get_broker():
+    """Returns the server process's WorkBroker (module-level so it pickles)."""
+    global _broker
+    if _broker is None:
+        _broker = WorkBroker()
+    return _broker
+
+
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+class _WorkerManager(BaseManager):
+    pass
+
+
+_CoordinatorManager.register("broker", callable=_get_broker)
+_WorkerManager.register("broker")
+
+
+class DistributedCoordinator:
+    """Serves generations of matches to remote workers.
+
+    Attributes:
+        address: (host, port) workers connect to.
+        authkey: Shared secret of the manager connection (bytes); workers
+            must be started with it.
+        heartbeat_timeout: Seconds without a heartbeat after which a
+            worker's matches are reassigned.
+    """
+
+    def __init__(self, address=("127.0.0.1", 0), authkey=None, heartbeat_timeout=10.0,
+                 poll_interval=0.05):
+        """Starts the manager server.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port.
+            authkey: Shared secret for workers. Defaults to a random key
+                (hex digits, so it can be passed to ``--authkey``).
+            heartbeat_timeout: Seconds without a heartbeat before a worker is
+                considered lost.
+            poll_interval: Seconds between result polls while waiting.
+        """
+        self.authkey = authkey or secrets.token_hex(16).encode()
+        self.heartbeat_timeout = heartbeat_timeout
+        self.poll_interval = poll_interval
+        self._generation_ids = itertools.count()
+        self._manager = _CoordinatorManager(address=address, authkey=self.authkey)
+        self._manager.start()
+        self.address = self._manager.address
+        self.broker = self._manager.broker()
+        self.broker.configure(heartbeat_timeout)
+
+    def submit_generation(self, genomes, config_neat, pairings, seeds, ball_speed=None,
+                          decision_interval=None):
+        """Publishes a generation's population and match list to the workers.
+
+        Args:
+            genomes: Dict of {genome_id: genome}.
+            config_neat: NEAT configuration object (sent to the workers).
+            pairings: List of (left_id, right_id) tuples.
+            seeds: Per-match seeds (same length as pairings).
+            ball_speed: Optional ball speed for every match.
+            decision_interval: Optional frames between network activations.
+        """
+        payload = pickle.dumps({
+            "config": config_neat,
+            "genomes": dict(genomes),
+            "ball_speed": ball_speed,
+            "decision_interval": decision_interval,
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+        tasks = [(left_id, right_id, seed) for (left_id, right_id), seed in zip(pairings, seeds)]
+        self.broker.start_generation(next(self._generation_ids), payload, tasks)
+        self._num_tasks = len(tasks)
+
+    def wait_results(self, timeout=None):
+        """Blocks until every match of the current generation has a result.
+
+        Args:
+            timeout: Optional seconds to wait before giving up.
+
+        Returns:
+            list: Match results in pairing order (see _play_training_match).
+
+        Raises:
+            TimeoutError: If the timeout expires first.
+            RuntimeError: If no worker has sent a heartbeat for
+                heartbeat_timeout seconds while matches are left.
+        """
+        results = {}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        workers_lost = None
+        while True:
+            new_results, remaining = self.broker.collect()
+            results.update(new_results)
+            if remaining == 0:
+                return [results[index] for index in range(self._num_tasks)]
+            now = time.monotonic()
+            if deadline is not None and now > deadline:
+                raise TimeoutError(f"{remaining} matches still running")
+            if not new_results:
+                if self.live_workers():
+                    workers_lost = None
+                elif workers_lost is None:
+                    workers_lost = now
+                elif now - workers_lost > self.heartbeat_timeout:
+                    raise RuntimeError(f"No live workers left with {remaining} matches still running")
+            time.sleep(self.poll_interval)
+
+    def wait_for_workers(self, timeout=None):
+        """Blocks until at least one worker is live.
+
+        Args:
+            timeout: Seconds to wait. Defaults to heartbeat_timeout, so
+                workers started just before have time to check in.
+
+        Returns:
+            list: Ids of the live workers.
+
+        Raises:
+            RuntimeError: If no worker sends a heartbeat in time.
+        """
+        deadline = time.monotonic() + (self.heartbeat_timeout if timeout is None else timeout)
+        while True:
+            workers = self.live_workers()
+            if workers:
+                return workers
+            if time.monotonic() > deadline:
+                host, port = self.address
+                raise RuntimeError(f"No live workers connected to {host}:{port}; start some with "
+                                   f"python -m ai.distributed --host {host} --port {port} --authkey KEY")
+            time.sleep(self.poll_interval)
+
+    def eval_genomes(self, genomes, config_neat, ball_speed=None, decision_interval=None, seed=None,
+                     timeout=None):
+        """Distributed variant of ai_module.eval_genomes_competitive.
+
+        Uses the matchmaking of eval_genomes_competitive_batched (each genome
+        plays up to five random opponents), plays every match on the workers
+        and applies the ELO updates in the serial evaluation order once all
+        results are in.
+
+        Args:
+            genomes: List of (genome_id, genome) tuples from NEAT population.
+            config_neat: NEAT configuration object.
+            ball_speed: Optional ball speed for curriculum learning.
+            decision_interval: Frames between network activations. Defaults
+                to config.DECISION_INTERVAL.
+            seed: Optional seed for matchmaking and match serves.
+            timeout: Optional seconds to wait for the generation's results.
+
+        Raises:
+            RuntimeError: If no worker is live, or all of them are lost
+                before the generation is done.
+            TimeoutError: If the timeout expires first.
+        """
+        from ai import ai_module
+
+        genome_list = list(genomes)
+        ai_module._init_elo_ratings(genome_list)
+        rng = random.Random(seed) if seed is not None else random
+
+        matches_per_genome = min(5, len(genome_list) - 1)
+        match_indices = []
+        for idx in range(len(genome_list)):
+            opponent_indices = [i for i in range(len(genome_list)) if i != idx]
+            selected_opponents = rng.sample(opponent_indices, min(matches_per_genome, len(opponent_indices)))
+            match_indices.extend((idx, opp_idx) for opp_idx in selected_opponents)
+
+        pairings = [(genome_list[a][0], genome_list[b][0]) for a, b in match_indices]
+        seeds = [rng.getrandbits(32) for _ in pairings]
+        self.wait_for_workers()
+        self.submit_generation(dict(genome_list), config_neat, pairings, seeds,
+                               ball_speed=ball_speed or ai_module.get_curriculum_ball_speed(),
+                               decision_interval=decision_interval)
+        results = self.wait_results(timeout=timeout)
+
+        genome_behavior = {genome_id: [0.0] * COUNT_FIELDS for genome_id, _ in genome_list}
+        for (idx, opp_idx), result in zip(match_indices, results):
+            genome_id, genome = genome_list[idx]
+            if result["behavior"] is not None:
+                add_counts(genome_behavior[genome_id], result["behavior"])
+            ai_module.DEFAULT_EARLY_STOP.record(result.get("frames_saved", 0))
+            ai_module._update_elo_ratings(genome, genome_list[opp_idx][1], result["match_result"])
+
+        ai_module._assign_competitive_fitness(genome_list, genome_behavior)
+
+    def live_workers(self):
+        """Returns ids of workers that sent a heartbeat recently."""
+        return self.broker.live_workers()
+
+    def shutdown(self):
+        """Tells workers to exit and stops the manager server."""
+        if self._manager is not None:
+            try:
+                self.broker.stop()
+                # Give polling workers a moment to see the stop signal
+                time.sleep(min(1.0, self.heartbeat_timeout))
+            finally:
+                self._manager.shutdown()
+                self._manager = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
+
+
+def _connect(address, authkey):
+    manager = _WorkerManager(address=tuple(address), authkey=authkey)
+    manager.connect()
+    return manager.broker()
+
+
+def _heartbeat_loop(address, authkey, worker_id, interval, stop_event):
+    """Sends heartbeats on a separate connection until stop_event is set."""
+    try:
+        broker = _connect(address, authkey)
+        while not stop_event.wait(interval):
+            broker.heartbeat(worker_id)
+    except (EOFError, OSError):
+        # The coordinator went away
+        pass
+
+
+def run_worker(address, authkey, heartbeat_interval=1.0, poll_interval=0.05,
+               worker_id=None):
+    """Plays matches for a coordinator until it shuts down.
+
+    Args:
+        address: (host, port) of the coordinator.
+        authkey: Shared secret of the coordinator.
+        heartbeat_interval: Seconds between heartbeats (keep well below the
+            coordinator's heartbeat_timeout).
+        poll_interval: Seconds to wait when no match is pending.
+        worker_id: Optional identifier (defaults to host name, pid and a
+            random suffix).
+
+    Returns:
+        int: Number of matches played.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    broker = _connect(address, authkey)
+    broker.heartbeat(worker_id)
+
+    stop_event = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat_loop,
+                                 args=(address, authkey, worker_id, heartbeat_interval, stop_event),
+                                 daemon=True)
+    heartbeat.start()
+
+    generation_id = None
+    generation = None
+    played = 0
+    try:
+        while True:
+            try:
+                task = broker.get_task(worker_id)
+            except (EOFError, OSError):
+                break
+            if task == "stop":
+                break
+            if task is None:
+                time.sleep(poll_interval)
+                continue
+
+            task_generation, index, left_id, right_id, seed = task
+            if task_generation != generation_id:
+                payload = broker.get_payload(task_generation)
+                if payload is None:
+                    continue
+                generation = pickle.loads(payload)
+                generation["networks"] = {}
+                generation_id = task_generation
+
+            try:
+                result = _play_pairing(generation, left_id, right_id, seed)
+            except Exception as e:
+                result = _error_result(str(e))
+            broker.submit(worker_id, task_generation, index, result)
+            played += 1
+    finally:
+        stop_event.set()
+    return played
+
+
+def _play_pairing(generation, left_id, right_id, seed):
+    """Plays one match from a worker's cached generation."""
+    genomes = generation["genomes"]
+    networks = generation["networks"]
+    net_left, net_right = _cached_pairing_networks(left_id, right_id, genomes.__getitem__,
+                                                   lambda genome_id: networks, generation["config"])
+    return _play_training_match(net_left, net_right, ball_speed=generation["ball_speed"], seed=seed,
+                                decision_interval=generation["decision_interval"])
+
+
+def start_local_workers(address, count, authkey, **kwargs):
+    """Starts ``count`` worker processes on this machine.
+
+    Args:
+        address: (host, port) of the coordinator.
+        count: Number of worker processes.
+        authkey: The coordinator's ``authkey``.
+        **kwargs: Further ``run_worker`` arguments.
+
+    Returns:
+        list: The started multiprocessing.Process objects.
+    """
+    import multiprocessing
+
+    workers = []
+    for _ in range(count):
+        process = multiprocessing.Process(target=run_worker, args=(tuple(address), authkey),
+                                          kwargs=kwargs, daemon=True)
+        process.start()
+        workers.append(process)
+    return workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a distributed training worker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50000)
+    parser.add_argument("--authkey", required=True, help="The coordinator's shared secret")
+    parser.add_argument("--heartbeat", type=float, default=1.0, help="Seconds between heartbeats")
+    args = parser.parse_args()
+
+    played = run_worker((args.host, args.port), args.authkey.encode(), heartbeat_interval=args.heartbeat)
+    print(f"Coordinator closed; played {played} matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Content hashing of genomes and an LRU cache of their evaluations.
+
+Elitism and seeded populations bring identical genomes back generation after
+generation. Deterministic evaluators (fixed serve seeds, fixed opponent) can
+look them up here by ``genome_hash`` instead of replaying their matches.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+
+_MISSING = object()
+
+
+def genome_hash(genome):
+    """Returns a canonical hash of a genome's network.
+
+    Covers node genes (bias, response, activation, aggregation) and
+    connection genes (weight, enabled), sorted by key. The genome key and
+    fitness are ignored, so clones and unchanged elites hash alike.
+
+    Args:
+        genome: A neat.DefaultGenome (or compatible) instance.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for key in sorted(genome.nodes):
+        node = genome.nodes[key]
+        digest.update(repr((key, node.bias, node.response, node.activation,
+                            node.aggregation)).encode())
+    digest.update(b"|")
+    for key in sorted(genome.connections):
+        conn = genome.connections[key]
+        digest.update(repr((key, conn.weight, conn.enabled)).encode())
+    return digest.hexdigest()
+
+
+class FitnessCache:
+    """Least-recently-used cache of evaluation results.
+
+    Besides the cached values it counts hits and misses per generation and
+    the time spent on misses, from which the time saved by hits is
+    estimated.
+
+    Attributes:
+        max_size: Maximum number of cached results.
+        history: List of per-generation stats dicts (see ``stats``).
+    """
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.history = []
+        self.generation = None
+        self._reset_counters()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+
+    def get(self, key, default=None):
+        """Returns the cached value for ``key`` and counts a hit or miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used one if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value or computes, times and stores it.
+
+        Args:
+            key: Cache key.
+            compute: Zero-argument callable producing the value on a miss.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            start = time.perf_counter()
+            value = compute()
+            self.miss_seconds += time.perf_counter() - start
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drops all entries (counters and history are kept)."""
+        self._entries.clear()
+
+    def start_generation(self, generation):
+        """Closes the previous generation's stats and starts counting anew."""
+        if self.generation is not None and (self.hits or self.misses):
+            self.history.append(self.stats())
+        self.generation = generation
+        self._reset_counters()
+
+    def stats(self):
+        """Returns the current generation's stats.
+
+        Returns:
+            dict: "generation", "hits", "misses", "hit_rate" and
+                "saved_seconds" (hits times the average miss time).
+        """
+        lookups = self.hits + self.misses
+        average_miss = self.miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_seconds": self.hits * average_miss,
+        }
+
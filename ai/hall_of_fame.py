@@ -0,0 +1,188 @@
+"""Bounded Hall of Fame of past champions used as self-play opponents.
+
+The training loop adds the best genome every few generations. Kept in a plain
+list, the Hall of Fame grew without bound, every self-play match rebuilt a
+network from its opponent genome, and the parallel evaluator pickled every
+member into each generation's broadcast. ``HallOfFame`` is still a list (so
+existing code and checkpoints keep working) but:
+
+- It holds at most ``max_size`` genomes, evicting the oldest, the
+  lowest-rated or the most redundant member when full.
+- It caches one network per member, dropped together with the member.
+- It pickles its members once per ``version``; the version changes whenever
+  the contents change, so pool workers can keep the members (and the
+  networks they built from them) until it does.
+"""
+
+import itertools
+import pickle
+
+from core import config
+
+
+EVICTION_POLICIES = ("oldest", "lowest_elo", "diversity")
+
+# Versions are unique across instances, so a version names one list of members
+_versions = itertools.count(1)
+
+
+class HallOfFame(list):
+    """List of Hall of Fame genomes with a size cap and a network cache.
+
+    The newest member is never evicted, so the latest champion always
+    enters. The "diversity" policy measures NEAT genome distance and needs
+    ``config_neat``; until one is known it evicts the oldest member.
+
+    Attributes:
+        max_size: Maximum number of members (None for no limit).
+        eviction: "oldest", "lowest_elo" or "diversity".
+        config_neat: NEAT config used for genome distances, or None.
+        version: Identifier of the current contents.
+    """
+
+    def __init__(self, genomes=(), max_size=config.HALL_OF_FAME_SIZE,
+                 eviction=config.HALL_OF_FAME_EVICTION, config_neat=None):
+        """Creates a Hall of Fame.
+
+        Args:
+            genomes: Initial members, oldest first.
+            max_size: Maximum number of members (None for no limit).
+            eviction: Eviction policy.
+            config_neat: Optional NEAT config for the "diversity" policy.
+
+        Raises:
+            ValueError: If the eviction policy is unknown.
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{eviction}'. "
+                             f"Choose from: {', '.join(EVICTION_POLICIES)}")
+        super().__init__()
+        self.max_size = max_size
+        self.eviction = eviction
+        self.config_neat = config_neat
+        self._networks = {}
+        self._distances = {}
+        self._serialized = (None, None)
+        self.extend(genomes)
+
+    @classmethod
+    def of(cls, hall_of_fame, config_neat=None):
+        """Returns ``hall_of_fame`` as a HallOfFame, without copying one.
+
+        A plain list is wrapped without a size limit. ``config_neat`` is
+        recorded for the "diversity" policy if none is known yet.
+        """
+        if not isinstance(hall_of_fame, cls):
+            hall_of_fame = cls(hall_of_fame, max_size=None)
+        if hall_of_fame.config_neat is None:
+            hall_of_fame.config_neat = config_neat
+        return hall_of_fame
+
+    def __reduce__(self):
+        # Pickle the members and settings only, not the network cache
+        return (self.__class__, (list(self), self.max_size, self.eviction))
+
+    # List mutators: every change gets a new version and may evict
+
+    def append(self, genome):
+        super().append(genome)
+        self._changed()
+
+    def extend(self, genomes):
+        super().extend(genomes)
+        self._changed()
+
+    def insert(self, index, genome):
+        super().insert(index, genome)
+        self._changed()
+
+    def __iadd__(self, genomes):
+        self.extend(genomes)
+        return self
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def pop(self, index=-1):
+        genome = super().pop(index)
+        self._changed()
+        return genome
+
+    def remove(self, genome):
+        super().remove(genome)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def add(self, genome, config_neat=None):
+        """Adds a genome, evicting a member if the Hall of Fame is full.
+
+        Args:
+            genome: Genome to add (stored as is; callers pass a copy).
+            config_neat: Optional NEAT config for the "diversity" policy.
+        """
+        if config_neat is not None:
+            self.config_neat = config_neat
+        self.append(genome)
+
+    def network(self, index, config_neat):
+        """Returns the reset network of a member, building it once.
+
+        Args:
+            index: Position of the member.
+            config_neat: NEAT config to build the network with.
+        """
+        from .concurrent_training import _create_network
+
+        genome = self[index]
+        net = self._networks.get(id(genome))
+        if net is None:
+            net = self._networks[id(genome)] = _create_network(genome, config_neat)
+        elif hasattr(net, "reset"):
+            net.reset()
+        return net
+
+    def serialized(self):
+        """Returns the pickled member list, pickling it once per version."""
+        version, blob = self._serialized
+        if version != self.version:
+            blob = pickle.dumps(list(self), protocol=pickle.HIGHEST_PROTOCOL)
+            self._serialized = (self.version, blob)
+        return blob
+
+    def _changed(self):
+        if self.max_size is not None:
+            while len(self) > max(self.max_size, 1):
+                super().__delitem__(self._eviction_index())
+        self.version = next(_versions)
+
+        # Drop evicted members' entries before their ids can be reused
+        members = {id(genome) for genome in self}
+        self._networks = {key: net for key, net in self._networks.items() if key in members}
+        self._distances = {key: distance for key, distance in self._distances.items()
+                           if members.issuperset(key)}
+
+    def _eviction_index(self):
+        """Returns the position of the member to evict (never the newest)."""
+        candidates = range(len(self) - 1)
+        if self.eviction == "lowest_elo":
+            return min(candidates, key=lambda i: (getattr(self[i], "elo_rating", config.ELO_INITIAL_RATING), i))
+        if self.eviction == "diversity" and self.config_neat is not None:
+            # Evict the member closest to another one: it adds the least variety
+            return min(candidates, key=lambda i: (min(self._distance(self[i], other)
+                                                      for j, other in enumerate(self) if j != i), i))
+        return 0
+
+    def _distance(self, genome, other):
+        key = (id(genome), id(other)) if id(genome) < id(other) else (id(other), id(genome))
+        distance = self._distances.get(key)
+        if distance is None:
+            distance = self._distances[key] = genome.distance(other, self.config_neat.genome_config)
+        return distance
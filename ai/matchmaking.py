@@ -0,0 +1,126 @@
+"""Swiss-system pairing for round-based competitive evaluation.
+
+Random rounds (ai_module.schedule_competitive_rounds) spend most matches on
+pairings whose result is a foregone conclusion once ratings spread out. A
+Swiss round instead pairs genomes of adjacent current rating, so each match
+separates neighbours in the ranking and fewer rounds reach a stable order.
+Ratings are read again before every round, which is why the Swiss schedule
+is built round by round rather than up front.
+"""
+
+import math
+
+
+# Backtracking steps allowed per genome before pairing falls back to greedy
+_BACKTRACK_STEPS_PER_GENOME = 20
+
+
+def swiss_rounds(population_size):
+    """Returns the default number of Swiss rounds for a population.
+
+    About log2(n) rounds separate n players in a Swiss tournament; one more
+    round steadies the middle of the ranking.
+    """
+    if population_size < 2:
+        return 0
+    return math.ceil(math.log2(population_size)) + 1
+
+
+class SwissScheduler:
+    """Builds Swiss rounds from the current ratings.
+
+    Within a generation no pair meets twice unless no rematch-free pairing
+    is found, and with an odd population each genome sits out at most once
+    before anyone sits out again.
+
+    Attributes:
+        genome_ids: Identifiers of the scheduled genomes.
+        played: Set of ``frozenset`` pairs that already met.
+        sat_out: Identifiers that already sat a round out.
+    """
+
+    def __init__(self, genome_ids, rng):
+        """Creates a scheduler.
+
+        Args:
+            genome_ids: Identifiers of the genomes to schedule.
+            rng: random.Random instance breaking rating ties and picking sides.
+        """
+        self.genome_ids = list(genome_ids)
+        self.rng = rng
+        self.played = set()
+        self.sat_out = set()
+
+    def next_round(self, ratings):
+        """Pairs the genomes for the next round.
+
+        Genomes are ordered by rating (ties in random order); each one, from
+        the top, meets the next-rated genome it has not played yet, going
+        further down only as far as needed to avoid rematches further on.
+
+        Args:
+            ratings: Dict mapping genome id to its current rating.
+
+        Returns:
+            list: ``(left_id, right_id)`` tuples; no genome appears twice.
+        """
+        order = self.genome_ids[:]
+        self.rng.shuffle(order)
+        order.sort(key=lambda genome_id: ratings[genome_id], reverse=True)
+
+        if len(order) % 2:
+            if self.sat_out.issuperset(order):
+                self.sat_out.clear()
+            bye = next(genome_id for genome_id in reversed(order) if genome_id not in self.sat_out)
+            self.sat_out.add(bye)
+            order.remove(bye)
+
+        pairs = self._pair_without_rematches(order) or self._pair_greedily(order)
+        pairings = []
+        for first, second in pairs:
+            self.played.add(frozenset((first, second)))
+            pairings.append((first, second) if self.rng.random() < 0.5 else (second, first))
+        return pairings
+
+    def _pair_without_rematches(self, order):
+        """Pairs each genome, from the top, with the closest-rated new opponent.
+
+        Backtracks when the bottom of the order would be left with a rematch,
+        giving up after a bounded number of steps.
+
+        Returns:
+            list or None: ``(higher, lower)`` pairs, or None if no rematch-free
+                pairing was found within the step budget.
+        """
+        budget = [_BACKTRACK_STEPS_PER_GENOME * len(order)]
+
+        def pair(remaining):
+            if not remaining:
+                return []
+            budget[0] -= 1
+            if budget[0] < 0:
+                return None
+            first = remaining[0]
+            for index in range(1, len(remaining)):
+                second = remaining[index]
+                if frozenset((first, second)) in self.played:
+                    continue
+                rest = pair(remaining[1:index] + remaining[index + 1:])
+                if rest is not None:
+                    return [(first, second)] + rest
+                if budget[0] < 0:
+                    return None
+            return None
+
+        return pair(order)
+
+    def _pair_greedily(self, order):
+        """Pairs each genome, from the top, with the next new opponent left (or the next one)."""
+        order = order[:]
+        pairs = []
+        while order:
+            first = order.pop(0)
+            index = next((i for i, genome_id in enumerate(order)
+                          if frozenset((first, genome_id)) not in self.played), 0)
+            pairs.append((first, order.pop(index)))
+        return pairs
@@ -2,9 +2,23 @@
 
 This module provides simple rule-based opponent implementations that can be used
 for training and testing NEAT-evolved AI agents.
+
+Besides the per-state functions, it contains a zoo of vectorized scripted
+opponents that choose actions for every game of a
+``core.batch_simulator.BatchGameSimulator`` at once, so batched evaluation
+against them costs a few array operations per frame.
 """
 
+import numpy as np
+
 from core import config
+from core.simulator import STATE_BALL_Y, STATE_PADDLE_LEFT_Y, STATE_PADDLE_RIGHT_Y
+from core.batch_simulator import (
+    ACTION_UP, ACTION_DOWN, ACTION_STAY, LEFT_PADDLE_X, RIGHT_PADDLE_X, BALL_SIZE,
+)
+
+# Half-height of the band around the target where the paddle stays still
+DEADZONE = 10
 
 
 def get_rule_based_move(game_state, paddle="right"):
@@ -29,7 +43,32 @@ def get_rule_based_move(game_state, paddle="right"):
     paddle_center = paddle_y + config.PADDLE_HEIGHT / 2
     
     # Deadzone to prevent jitter
-    if abs(paddle_center - ball_y) < 10:
+    if abs(paddle_center - ball_y) < DEADZONE:
+        return None
+        
+    if paddle_center < ball_y:
+        return "DOWN"
+    elif paddle_center > ball_y:
+        return "UP"
+    return None
+
+
+def get_rule_based_move_from_buffer(state, paddle="right"):
+    """Same as get_rule_based_move, reading a flat simulator state buffer.
+    
+    Args:
+        state: Flat state buffer (GameSimulator.state).
+        paddle: Which paddle to control ("left" or "right"). Defaults to "right".
+    
+    Returns:
+        str or None: "UP", "DOWN", or None to stay in place.
+    """
+    paddle_y = state[STATE_PADDLE_LEFT_Y] if paddle == "left" else state[STATE_PADDLE_RIGHT_Y]
+    ball_y = state[STATE_BALL_Y]
+    paddle_center = paddle_y + config.PADDLE_HEIGHT / 2
+    
+    # Deadzone to prevent jitter
+    if abs(paddle_center - ball_y) < DEADZONE:
         return None
         
     if paddle_center < ball_y:
@@ -37,3 +76,180 @@ def get_rule_based_move(game_state, paddle="right"):
     elif paddle_center > ball_y:
         return "UP"
     return None
+
+
+class RuleBasedAgent:
+    """GameRunner agent wrapping the rule-based opponent.
+    
+    Attributes:
+        decision_interval: Frames between decisions. Overrides the runner's
+            interval so the opponent keeps reacting every frame by default.
+    """
+    
+    def __init__(self, decision_interval=None):
+        """Initializes the agent.
+        
+        Args:
+            decision_interval: Optional decision interval. If None, uses
+                config.RULE_BASED_DECISION_INTERVAL.
+        """
+        self.decision_interval = (decision_interval if decision_interval is not None
+                                  else config.RULE_BASED_DECISION_INTERVAL)
+    
+    def get_move(self, state, side):
+        return get_rule_based_move(state, side)
+    
+    def get_move_from_buffer(self, state, side):
+        return get_rule_based_move_from_buffer(state, side)
+
+
+def rule_based_actions(paddle_y, target_y):
+    """Vectorized get_rule_based_move for many games.
+    
+    Args:
+        paddle_y: Array of paddle top Y positions.
+        target_y: Array of Y positions to track (the ball Y for the classic
+            rule-based opponent).
+    
+    Returns:
+        np.ndarray: Action codes (ACTION_UP, ACTION_DOWN or ACTION_STAY).
+    """
+    offset = np.asarray(paddle_y) + config.PADDLE_HEIGHT / 2 - np.asarray(target_y)
+    return np.where(np.abs(offset) < DEADZONE, ACTION_STAY,
+                    np.where(offset < 0, ACTION_DOWN, ACTION_UP))
+
+
+def predict_intercept_y(ball_x, ball_y, ball_vel_x, ball_vel_y, side):
+    """Predicts the ball Y when it reaches a paddle face, folding wall bounces.
+    
+    Args:
+        ball_x, ball_y, ball_vel_x, ball_vel_y: Arrays of ball state.
+        side: Which paddle face to predict for ("left" or "right").
+    
+    Returns:
+        np.ndarray: Predicted ball top Y at the paddle face. Games where the
+            ball moves away (or stands still) return NaN.
+    """
+    if side == "left":
+        distance = LEFT_PADDLE_X + config.PADDLE_WIDTH - ball_x
+    else:
+        distance = RIGHT_PADDLE_X - BALL_SIZE - ball_x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frames = distance / ball_vel_x
+    frames = np.where(frames >= 0, frames, np.nan)
+    # The ball's free Y range unfolds into a sawtooth of period 2 * span
+    span = config.SCREEN_HEIGHT - BALL_SIZE
+    folded = np.mod(ball_y + ball_vel_y * frames, 2 * span)
+    return np.where(folded > span, 2 * span - folded, folded)
+
+
+class ScriptedOpponent:
+    """Base class for vectorized scripted opponents.
+    
+    Subclasses implement ``actions(simulator, side)``, returning one action
+    code per game of a BatchGameSimulator. Stateful opponents keep per-game
+    arrays and reinitialize them when ``reset()`` is called or the number of
+    games changes.
+    """
+    
+    name = "scripted"
+    
+    def reset(self):
+        """Forgets any per-game state."""
+    
+    def actions(self, simulator, side="right"):
+        """Returns the action code for the ``side`` paddle of every game."""
+        raise NotImplementedError
+    
+    @staticmethod
+    def _paddle_y(simulator, side):
+        return simulator.paddle_left_y if side == "left" else simulator.paddle_right_y
+
+
+class TrackerOpponent(ScriptedOpponent):
+    """The classic rule-based opponent: follows the ball's current Y."""
+    
+    name = "tracker"
+    
+    def actions(self, simulator, side="right"):
+        return rule_based_actions(self._paddle_y(simulator, side), simulator.ball_y)
+
+
+class InterceptorOpponent(ScriptedOpponent):
+    """Moves to where the ball will cross its paddle, including wall bounces.
+    
+    While the ball travels away it returns to the vertical center.
+    """
+    
+    name = "interceptor"
+    
+    def actions(self, simulator, side="right"):
+        predicted = predict_intercept_y(simulator.ball_x, simulator.ball_y,
+                                        simulator.ball_vel_x, simulator.ball_vel_y, side)
+        # Aim the paddle center at the ball center
+        target = np.where(np.isnan(predicted), config.SCREEN_HEIGHT / 2,
+                          predicted + BALL_SIZE / 2)
+        return rule_based_actions(self._paddle_y(simulator, side), target)
+
+
+class DelayedTrackerOpponent(ScriptedOpponent):
+    """Tracks where the ball was ``delay`` frames ago (human-like reaction time)."""
+    
+    name = "delayed_tracker"
+    
+    def __init__(self, delay=8):
+        self.delay = delay
+        self._history = None
+        self._frame = 0
+    
+    def reset(self):
+        self._history = None
+        self._frame = 0
+    
+    def actions(self, simulator, side="right"):
+        ball_y = simulator.ball_y
+        if self._history is None or self._history.shape[1] != len(ball_y):
+            self._history = np.tile(ball_y, (self.delay + 1, 1))
+            self._frame = 0
+        # Ring buffer of the last delay + 1 ball positions
+        size = self.delay + 1
+        self._history[self._frame % size] = ball_y
+        seen_y = self._history[(self._frame + 1) % size]
+        self._frame += 1
+        return rule_based_actions(self._paddle_y(simulator, side), seen_y)
+
+
+class NoisyTrackerOpponent(ScriptedOpponent):
+    """Tracks the ball with Gaussian noise on the perceived ball Y."""
+    
+    name = "noisy_tracker"
+    
+    def __init__(self, noise_std=40.0, seed=None):
+        self.noise_std = noise_std
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+    
+    def reset(self):
+        self.rng = np.random.default_rng(self.seed)
+    
+    def actions(self, simulator, side="right"):
+        noise = self.rng.normal(0.0, self.noise_std, size=len(simulator.ball_y))
+        return rule_based_actions(self._paddle_y(simulator, side), simulator.ball_y + noise)
+
+
+# Registry of scripted opponents by name
+OPPONENT_ZOO = {
+    cls.name: cls
+    for cls in (TrackerOpponent, InterceptorOpponent, DelayedTrackerOpponent, NoisyTrackerOpponent)
+}
+
+
+def create_opponent(name, **kwargs):
+    """Creates a scripted opponent from OPPONENT_ZOO by name.
+    
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if name not in OPPONENT_ZOO:
+        raise ValueError(f"Unknown opponent '{name}', expected one of {sorted(OPPONENT_ZOO)}")
+    return OPPONENT_ZOO[name](**kwargs)
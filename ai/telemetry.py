@@ -0,0 +1,228 @@
+"""Per-generation throughput telemetry for training.
+
+A slow generation can come from the simulation, the network activations,
+moving work to and from the worker pool, validation or checkpoint I/O.
+``Telemetry`` collects per generation:
+
+- Wall time per phase: "evaluation" (the fitness function, timed by
+  ``training.reporters.TelemetryReporter``), "validation" and "checkpoint"
+  (timed with ``phase`` where they run) and the remainder (reproduction,
+  speciation and reporting).
+- Match time split into activation and simulation, summed over the
+  processes that played the matches. Matches played through ``timed_match``
+  report it next to the match result, so results stay reproducible. Timing
+  every activation would slow small networks down by a fifth, so only every
+  SAMPLE_EVERY-th match wraps its networks in an ``ActivationTimer``; the
+  activation share measured on those is applied to all match time.
+- "ipc": the part of a worker pool's wall time its workers spent outside
+  matches (shipping tasks and results, scheduling, waiting on stragglers),
+  and the pool's utilization.
+- Matches, frames played by the agents and network activations, and from
+  them frames and activations per second of evaluation.
+
+Like ``ai.fitness_cache.FitnessCache`` and ``core.early_stop.EarlyStopPolicy``
+it keeps the current generation's counters and a history of earlier ones.
+"""
+
+import itertools
+import time
+from contextlib import contextmanager
+
+from core import config
+
+
+PHASES = ("evaluation", "validation", "checkpoint")
+
+# One match in SAMPLE_EVERY (per process) times its activations
+SAMPLE_EVERY = 8
+_matches = itertools.count()
+
+
+class ActivationTimer:
+    """Network proxy counting activations and the time spent in them."""
+
+    __slots__ = ("net", "activations", "seconds")
+
+    def __init__(self, net):
+        self.net = net
+        self.activations = 0
+        self.seconds = 0.0
+
+    def activate(self, inputs):
+        start = time.perf_counter()
+        output = self.net.activate(inputs)
+        self.seconds += time.perf_counter() - start
+        self.activations += 1
+        return output
+
+    def reset(self):
+        if hasattr(self.net, "reset"):
+            self.net.reset()
+
+
+def activation_timers(net_left, net_right):
+    """Returns ActivationTimers for a sampled match's networks, else None."""
+    if next(_matches) % SAMPLE_EVERY:
+        return None
+    return ActivationTimer(net_left), ActivationTimer(net_right)
+
+
+def match_telemetry(frames, decision_interval, seconds, timers=None):
+    """Builds the telemetry of one match.
+
+    Args:
+        frames: Frames played by the agents.
+        decision_interval: Frames between activations (None for
+            config.DECISION_INTERVAL); both networks activate on the first
+            frame of every interval.
+        seconds: Wall time of the match.
+        timers: The match's ActivationTimers if it was sampled.
+
+    Returns:
+        dict: "frames", "activations", "seconds" and "activation_seconds"
+            (None unless sampled).
+    """
+    interval = decision_interval or config.DECISION_INTERVAL
+    return {
+        "frames": frames,
+        "activations": 2 * -(-frames // interval),
+        "seconds": seconds,
+        "activation_seconds": sum(timer.seconds for timer in timers) if timers else None,
+    }
+
+
+def timed_match(play, net_left, net_right, **kwargs):
+    """Plays a match and measures it.
+
+    Args:
+        play: Match function taking ``(net_left, net_right, **kwargs)`` and
+            returning a result dict with "frames" (and optionally
+            "frames_saved"), e.g. ``_play_training_match``.
+        net_left, net_right: Networks of the two paddles.
+        **kwargs: Passed on to ``play``.
+
+    Returns:
+        tuple: ``(result, telemetry)``, the match result and its telemetry
+            (see match_telemetry).
+    """
+    timers = activation_timers(net_left, net_right)
+    if timers is not None:
+        net_left, net_right = timers
+    start = time.perf_counter()
+    result = play(net_left, net_right, **kwargs)
+    seconds = time.perf_counter() - start
+    return result, match_telemetry(result["frames"] - result.get("frames_saved", 0),
+                                   kwargs.get("decision_interval"), seconds, timers)
+
+
+class Telemetry:
+    """Per-generation wall time by phase and training throughput.
+
+    Attributes:
+        history: List of per-generation stats dicts (see ``stats``).
+    """
+
+    def __init__(self):
+        self.history = []
+        self.generation = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.started = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.matches = 0
+        self.frames = 0
+        self.activations = 0
+        self.match_seconds = 0.0
+        self.sampled_seconds = 0.0
+        self.sampled_activation_seconds = 0.0
+        self.pool_seconds = 0.0
+        self.pool_capacity = 0.0  # Worker-seconds available while pools ran
+        self.pool_busy = 0.0
+
+    def start_generation(self, generation):
+        """Closes the previous generation's stats and starts counting anew."""
+        if self.generation is not None:
+            self.history.append(self.stats())
+        self.generation = generation
+        self._reset_counters()
+
+    @contextmanager
+    def phase(self, name):
+        """Adds the wall time of the ``with`` block to phase ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name, seconds):
+        """Adds ``seconds`` of wall time to phase ``name``."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def record_match(self, telemetry):
+        """Counts one match from its telemetry (see timed_match)."""
+        self.matches += 1
+        self.frames += telemetry["frames"]
+        self.activations += telemetry["activations"]
+        self.match_seconds += telemetry["seconds"]
+        if telemetry["activation_seconds"] is not None:
+            self.sampled_seconds += telemetry["seconds"]
+            self.sampled_activation_seconds += telemetry["activation_seconds"]
+
+    def record_matches(self, telemetries, wall_seconds=None, workers=1):
+        """Counts matches played together, optionally by a worker pool.
+
+        Args:
+            telemetries: Telemetry of each match (see timed_match); None
+                entries (e.g. failed matches) are skipped.
+            wall_seconds: Wall time the pool took for all of them, if they
+                were played by one.
+            workers: Number of processes in the pool.
+        """
+        busy = 0.0
+        for telemetry in telemetries:
+            if telemetry is not None:
+                self.record_match(telemetry)
+                busy += telemetry["seconds"]
+        if wall_seconds is not None:
+            self.pool_seconds += wall_seconds
+            self.pool_capacity += wall_seconds * workers
+            self.pool_busy += busy
+
+    def stats(self):
+        """Returns the current generation's stats.
+
+        Returns:
+            dict: "generation", "wall_seconds", "<phase>_seconds" for every
+                phase, "other_seconds", "simulation_seconds" and
+                "activation_seconds" (match time summed over processes, split
+                by the share measured on sampled matches),
+                "ipc_seconds", "matches", "frames", "activations",
+                "frames_per_second", "activations_per_second" (per second of
+                evaluation wall time) and "worker_utilization" (None if no
+                worker pool was used).
+        """
+        wall = time.perf_counter() - self.started
+        evaluation = self.phases["evaluation"]
+        stats = {"generation": self.generation, "wall_seconds": wall}
+        for name, seconds in self.phases.items():
+            stats[f"{name}_seconds"] = seconds
+        stats["other_seconds"] = max(0.0, wall - sum(self.phases.values()))
+        utilization = self.pool_busy / self.pool_capacity if self.pool_capacity else None
+        share = self.sampled_activation_seconds / self.sampled_seconds if self.sampled_seconds else 0.0
+        stats.update({
+            "simulation_seconds": self.match_seconds * (1.0 - share),
+            "activation_seconds": self.match_seconds * share,
+            "ipc_seconds": max(0.0, self.pool_seconds * (1.0 - utilization)) if utilization is not None else 0.0,
+            "matches": self.matches,
+            "frames": self.frames,
+            "activations": self.activations,
+            "frames_per_second": self.frames / evaluation if evaluation else 0.0,
+            "activations_per_second": self.activations / evaluation if evaluation else 0.0,
+            "worker_utilization": utilization,
+        })
+        return stats
+
+
+DEFAULT_TELEMETRY = Telemetry()
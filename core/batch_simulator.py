@@ -0,0 +1,258 @@
+"""Vectorized batch simulation for PyPongAI.
+
+This module steps many independent Pong games at once by keeping ball and
+paddle state for every game in NumPy arrays. The physics mirror
+``core.simulator.GameSimulator.update`` operation for operation (dynamic paddle
+speed, wall bounce, paddle collisions with the speed increment, speed cap,
+scoring and ball reset), so fitness computed on the batch path matches the
+per-object simulator while a single frame for thousands of games costs only a
+handful of array operations.
+"""
+
+import numpy as np
+from . import config
+
+
+# Action codes shared with network outputs (index of the max output)
+ACTION_UP = 0
+ACTION_DOWN = 1
+ACTION_STAY = 2
+
+LEFT_PADDLE_X = 10
+RIGHT_PADDLE_X = config.SCREEN_WIDTH - 10 - config.PADDLE_WIDTH
+BALL_SIZE = config.BALL_RADIUS * 2
+
+
+class BatchGameSimulator:
+    """Headless Pong simulator that advances N games with one call.
+
+    All per-game state lives in 1-D arrays of length ``num_games``. Games are
+    fully independent; the only shared parameters are the screen geometry and
+    the initial ball speed.
+
+    Attributes:
+        num_games: Number of games being simulated.
+        ball_x: Ball top-left X coordinate per game.
+        ball_y: Ball top-left Y coordinate per game.
+        ball_vel_x: Ball horizontal velocity per game.
+        ball_vel_y: Ball vertical velocity per game.
+        paddle_left_y: Left paddle top Y coordinate per game.
+        paddle_right_y: Right paddle top Y coordinate per game.
+        score_left: Left player score per game.
+        score_right: Right player score per game.
+        contact_y: Ball Y at the moment of a paddle hit during the last
+            update, NaN for games without a hit.
+        behavior: Optional core.behavior.BatchBehaviorAccumulator fed on
+            every hit and point (None by default).
+    """
+
+    def __init__(self, num_games, ball_speed=None, seed=None):
+        """Initializes ``num_games`` fresh games.
+
+        Args:
+            num_games: Number of games to simulate in parallel.
+            ball_speed: Optional custom ball speed for curriculum learning.
+                If None, uses default config values.
+            seed: Optional seed for the serve direction generator.
+        """
+        self.num_games = int(num_games)
+        self.initial_speed_x = ball_speed if ball_speed is not None else config.BALL_SPEED_X
+        self.initial_speed_y = ball_speed if ball_speed is not None else config.BALL_SPEED_Y
+        self.rng = np.random.default_rng(seed)
+        self.behavior = None
+        self.reset()
+
+    def reset(self):
+        """Resets every game to its starting position with a random serve."""
+        n = self.num_games
+        self.ball_x = np.full(n, config.SCREEN_WIDTH // 2 - config.BALL_RADIUS, dtype=np.float64)
+        self.ball_y = np.full(n, config.SCREEN_HEIGHT // 2 - config.BALL_RADIUS, dtype=np.float64)
+        self.ball_vel_x = self.initial_speed_x * self._random_signs(n)
+        self.ball_vel_y = self.initial_speed_y * self._random_signs(n)
+        paddle_y = config.SCREEN_HEIGHT // 2 - config.PADDLE_HEIGHT // 2
+        self.paddle_left_y = np.full(n, paddle_y, dtype=np.float64)
+        self.paddle_right_y = np.full(n, paddle_y, dtype=np.float64)
+        self.score_left = np.zeros(n, dtype=np.int64)
+        self.score_right = np.zeros(n, dtype=np.int64)
+        self.contact_y = np.full(n, np.nan)
+
+    def _random_signs(self, count):
+        """Returns ``count`` values drawn uniformly from (1, -1)."""
+        return np.where(self.rng.integers(0, 2, size=count) == 0, 1.0, -1.0)
+
+    @staticmethod
+    def _move_paddles(paddle_y, actions, speed):
+        """Applies UP/DOWN actions and clamps moved paddles to the screen."""
+        up = actions == ACTION_UP
+        down = actions == ACTION_DOWN
+        moved = np.where(up, paddle_y - speed, np.where(down, paddle_y + speed, paddle_y))
+        moved = np.where(moved < 0, 0.0, moved)
+        moved = np.where(moved + config.PADDLE_HEIGHT > config.SCREEN_HEIGHT,
+                         config.SCREEN_HEIGHT - config.PADDLE_HEIGHT, moved)
+        # Paddles are only clamped when they move, exactly like PaddleView.move
+        return np.where(up | down, moved, paddle_y)
+
+    def update(self, left_actions, right_actions, active=None):
+        """Advances every game by one frame.
+
+        Args:
+            left_actions: Array (or scalar) of left paddle action codes
+                (ACTION_UP, ACTION_DOWN or ACTION_STAY).
+            right_actions: Array (or scalar) of right paddle action codes.
+            active: Optional boolean mask. Games where it is False are left
+                untouched and report no events.
+
+        Returns:
+            tuple: Four boolean arrays ``(hit_left, hit_right, scored_left,
+                scored_right)``. ``scored_left`` is True where the left player
+                won the point this frame.
+        """
+        left_actions = np.asarray(left_actions)
+        right_actions = np.asarray(right_actions)
+
+        # Dynamic Paddle Speed
+        paddle_speed = np.minimum(config.PADDLE_SPEED * (np.abs(self.ball_vel_x) / config.BALL_SPEED_X),
+                                  config.PADDLE_MAX_SPEED)
+        paddle_left_y = self._move_paddles(self.paddle_left_y, left_actions, paddle_speed)
+        paddle_right_y = self._move_paddles(self.paddle_right_y, right_actions, paddle_speed)
+
+        # Move ball
+        ball_x = self.ball_x + self.ball_vel_x
+        ball_y = self.ball_y + self.ball_vel_y
+        vel_x = self.ball_vel_x
+        vel_y = self.ball_vel_y
+
+        # Wall Collision (Top/Bottom)
+        wall = (ball_y <= 0) | (ball_y + BALL_SIZE >= config.SCREEN_HEIGHT)
+        vel_y = np.where(wall, -vel_y, vel_y)
+
+        contact_y = np.full(self.num_games, np.nan)
+
+        # Paddle Collision - Left Paddle
+        hit_left = ((ball_x < LEFT_PADDLE_X + config.PADDLE_WIDTH) &
+                    (ball_x + BALL_SIZE > LEFT_PADDLE_X) &
+                    (ball_y < paddle_left_y + config.PADDLE_HEIGHT) &
+                    (ball_y + BALL_SIZE > paddle_left_y))
+        contact_y = np.where(hit_left, ball_y, contact_y)
+        vel_x = np.where(hit_left, vel_x * -config.BALL_SPEED_INCREMENT, vel_x)
+        vel_y = np.where(hit_left, vel_y * config.BALL_SPEED_INCREMENT, vel_y)
+        ball_x = np.where(hit_left, LEFT_PADDLE_X + config.PADDLE_WIDTH, ball_x)
+
+        # Paddle Collision - Right Paddle
+        hit_right = ((ball_x < RIGHT_PADDLE_X + config.PADDLE_WIDTH) &
+                     (ball_x + BALL_SIZE > RIGHT_PADDLE_X) &
+                     (ball_y < paddle_right_y + config.PADDLE_HEIGHT) &
+                     (ball_y + BALL_SIZE > paddle_right_y))
+        contact_y = np.where(hit_right, ball_y, contact_y)
+        vel_x = np.where(hit_right, vel_x * -config.BALL_SPEED_INCREMENT, vel_x)
+        vel_y = np.where(hit_right, vel_y * config.BALL_SPEED_INCREMENT, vel_y)
+        ball_x = np.where(hit_right, RIGHT_PADDLE_X - BALL_SIZE, ball_x)
+
+        # Cap Speed
+        vel_x = np.maximum(np.minimum(vel_x, config.BALL_MAX_SPEED), -config.BALL_MAX_SPEED)
+        vel_y = np.maximum(np.minimum(vel_y, config.BALL_MAX_SPEED), -config.BALL_MAX_SPEED)
+
+        # Scoring
+        scored_right = ball_x <= 0
+        scored_left = ~scored_right & (ball_x + BALL_SIZE >= config.SCREEN_WIDTH)
+
+        if active is not None:
+            active = np.asarray(active, dtype=bool)
+            hit_left &= active
+            hit_right &= active
+            scored_left &= active
+            scored_right &= active
+            contact_y = np.where(active, contact_y, np.nan)
+            paddle_left_y = np.where(active, paddle_left_y, self.paddle_left_y)
+            paddle_right_y = np.where(active, paddle_right_y, self.paddle_right_y)
+            ball_x = np.where(active, ball_x, self.ball_x)
+            ball_y = np.where(active, ball_y, self.ball_y)
+            vel_x = np.where(active, vel_x, self.ball_vel_x)
+            vel_y = np.where(active, vel_y, self.ball_vel_y)
+
+        self.paddle_left_y = paddle_left_y
+        self.paddle_right_y = paddle_right_y
+        self.ball_x = ball_x
+        self.ball_y = ball_y
+        self.ball_vel_x = vel_x
+        self.ball_vel_y = vel_y
+        self.contact_y = contact_y
+
+        if self.behavior is not None:
+            self.behavior.hits(hit_left, 0, ball_y, paddle_left_y, paddle_right_y)
+            self.behavior.hits(hit_right, 1, ball_y, paddle_right_y, paddle_left_y)
+
+        scored = scored_left | scored_right
+        if scored.any():
+            if self.behavior is not None:
+                self.behavior.points(scored)
+            self.score_left += scored_left
+            self.score_right += scored_right
+            self._reset_balls(np.flatnonzero(scored))
+
+        return hit_left, hit_right, scored_left, scored_right
+
+    def _reset_balls(self, indices):
+        """Serves the ball from the center for the given games."""
+        count = len(indices)
+        self.ball_x[indices] = config.SCREEN_WIDTH // 2 - BALL_SIZE / 2
+        self.ball_y[indices] = config.SCREEN_HEIGHT // 2 - BALL_SIZE / 2
+        self.ball_vel_x[indices] = self.initial_speed_x * self._random_signs(count)
+        self.ball_vel_y[indices] = self.initial_speed_y * self._random_signs(count)
+
+    def game_over(self):
+        """Returns a boolean mask of games where a player reached MAX_SCORE."""
+        return (self.score_left >= config.MAX_SCORE) | (self.score_right >= config.MAX_SCORE)
+
+    def network_inputs(self, side="left"):
+        """Builds the normalized network inputs for every game.
+
+        The columns match the input tuple used by the training loops and
+        ``NeatAgent.get_move``.
+
+        Args:
+            side: Which paddle the inputs are for ("left" or "right").
+
+        Returns:
+            np.ndarray: Array of shape (num_games, 8).
+        """
+        if side == "left":
+            my_y = self.paddle_left_y
+            op_y = self.paddle_right_y
+            incoming = self.ball_vel_x < 0
+        else:
+            my_y = self.paddle_right_y
+            op_y = self.paddle_left_y
+            incoming = self.ball_vel_x > 0
+
+        inputs = np.empty((self.num_games, 8))
+        inputs[:, 0] = my_y / config.SCREEN_HEIGHT
+        inputs[:, 1] = self.ball_x / config.SCREEN_WIDTH
+        inputs[:, 2] = self.ball_y / config.SCREEN_HEIGHT
+        inputs[:, 3] = self.ball_vel_x / config.BALL_MAX_SPEED
+        inputs[:, 4] = self.ball_vel_y / config.BALL_MAX_SPEED
+        inputs[:, 5] = (my_y - self.ball_y) / config.SCREEN_HEIGHT
+        inputs[:, 6] = incoming
+        inputs[:, 7] = op_y / config.SCREEN_HEIGHT
+        return inputs
+
+    def get_state(self, index):
+        """Returns the state of a single game in ``GameSimulator.get_state`` format.
+
+        Args:
+            index: Index of the game.
+
+        Returns:
+            dict: Game state dictionary.
+        """
+        return {
+            "ball_x": float(self.ball_x[index]),
+            "ball_y": float(self.ball_y[index]),
+            "ball_vel_x": float(self.ball_vel_x[index]),
+            "ball_vel_y": float(self.ball_vel_y[index]),
+            "paddle_left_y": float(self.paddle_left_y[index]),
+            "paddle_right_y": float(self.paddle_right_y[index]),
+            "score_left": int(self.score_left[index]),
+            "score_right": int(self.score_right[index]),
+            "game_over": False
+        }
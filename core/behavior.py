@@ -0,0 +1,224 @@
+"""Fixed-size behavior descriptors accumulated inside the simulators.
+
+Novelty search used to collect a dict per paddle hit and reduce it to the
+mean contact Y. A ``BehaviorAccumulator`` attached to a game
+(``PongPhysics.behavior``) instead updates running sums and histograms in a
+flat ``array('d')`` on hit and point events, so an evaluation needs the same
+small buffer however long its rallies are, and frames without events cost
+nothing. ``BatchBehaviorAccumulator`` does the same for every game of a
+``BatchGameSimulator``.
+
+Per side, the counts (COUNT_FIELDS floats, which add up across matches) are:
+
+- a histogram of the ball Y at the side's contacts (CONTACT_BINS bins) and
+  the sum of those Y values,
+- the number of hits,
+- the paddle travel between consecutive own hits of a rally, and the number
+  of such moves,
+- a histogram of where the paddle's center waits (READY_ZONES zones) when
+  the opponent hits the ball,
+- the rallies played and the hits they contained (shared by both sides).
+
+Only events feed the counts, so a match stopped once its point is decided
+(see core.early_stop) yields the same counts as playing it out.
+``behavior_vector`` turns the counts into the fixed-length BC vector.
+"""
+
+from array import array
+
+import numpy as np
+
+from . import config
+
+
+CONTACT_BINS = 6
+READY_ZONES = 3
+
+# Offsets of one side's counts (see BehaviorAccumulator.counts)
+COUNT_CONTACT_HIST = 0
+COUNT_CONTACT_SUM = COUNT_CONTACT_HIST + CONTACT_BINS
+COUNT_HITS = COUNT_CONTACT_SUM + 1
+COUNT_TRAVEL_SUM = COUNT_HITS + 1
+COUNT_TRAVEL_MOVES = COUNT_TRAVEL_SUM + 1
+COUNT_READY_ZONES = COUNT_TRAVEL_MOVES + 1
+COUNT_RALLIES = COUNT_READY_ZONES + READY_ZONES
+COUNT_RALLY_HITS = COUNT_RALLIES + 1
+COUNT_FIELDS = COUNT_RALLY_HITS + 1
+
+# Length of behavior_vector's output
+BC_SIZE = CONTACT_BINS + 3 + READY_ZONES
+
+# Sides (offset of their counts in the accumulator buffer is side * COUNT_FIELDS)
+LEFT = 0
+RIGHT = 1
+
+# Accumulator buffer: both sides' counts, then the rally in progress
+_RALLY_HITS = 2 * COUNT_FIELDS
+_LAST_HIT_Y = _RALLY_HITS + 1  # Paddle Y at each side's last hit of the rally (-1 for none)
+_BUFFER_SIZE = _LAST_HIT_Y + 2
+
+_BALL_SIZE = config.BALL_RADIUS * 2
+
+
+def _contact_bin(ball_y):
+    center = ball_y + _BALL_SIZE / 2
+    return min(max(int(center * CONTACT_BINS / config.SCREEN_HEIGHT), 0), CONTACT_BINS - 1)
+
+
+def _ready_zone(paddle_y):
+    center = paddle_y + config.PADDLE_HEIGHT / 2
+    return min(max(int(center * READY_ZONES / config.SCREEN_HEIGHT), 0), READY_ZONES - 1)
+
+
+class BehaviorAccumulator:
+    """Accumulates both players' behavior counts for one game."""
+
+    __slots__ = ("buffer",)
+
+    def __init__(self):
+        self.buffer = array('d', bytes(8 * _BUFFER_SIZE))
+        self.buffer[_LAST_HIT_Y] = self.buffer[_LAST_HIT_Y + 1] = -1.0
+
+    def hit(self, side, ball_y, own_y, other_y):
+        """Records a paddle hit.
+
+        Args:
+            side: LEFT or RIGHT, the side that hit the ball.
+            ball_y: Ball top Y at the contact.
+            own_y: Top Y of the hitting paddle.
+            other_y: Top Y of the other paddle.
+        """
+        buffer = self.buffer
+        base = side * COUNT_FIELDS
+        buffer[base + COUNT_CONTACT_HIST + _contact_bin(ball_y)] += 1
+        buffer[base + COUNT_CONTACT_SUM] += ball_y
+        buffer[base + COUNT_HITS] += 1
+        last_y = buffer[_LAST_HIT_Y + side]
+        if last_y >= 0:
+            buffer[base + COUNT_TRAVEL_SUM] += abs(own_y - last_y)
+            buffer[base + COUNT_TRAVEL_MOVES] += 1
+        buffer[_LAST_HIT_Y + side] = own_y
+        other_base = (1 - side) * COUNT_FIELDS
+        buffer[other_base + COUNT_READY_ZONES + _ready_zone(other_y)] += 1
+        buffer[_RALLY_HITS] += 1
+
+    def point(self):
+        """Closes the rally in progress when a point is scored."""
+        buffer = self.buffer
+        for base in (0, COUNT_FIELDS):
+            buffer[base + COUNT_RALLIES] += 1
+            buffer[base + COUNT_RALLY_HITS] += buffer[_RALLY_HITS]
+        buffer[_RALLY_HITS] = 0.0
+        buffer[_LAST_HIT_Y] = buffer[_LAST_HIT_Y + 1] = -1.0
+
+    def counts(self, side):
+        """Returns one side's counts, with a rally in progress counted if it had hits.
+
+        Returns:
+            list: COUNT_FIELDS floats; counts of several matches add up.
+        """
+        base = side * COUNT_FIELDS
+        counts = self.buffer[base:base + COUNT_FIELDS].tolist()
+        if self.buffer[_RALLY_HITS]:
+            counts[COUNT_RALLIES] += 1
+            counts[COUNT_RALLY_HITS] += self.buffer[_RALLY_HITS]
+        return counts
+
+
+class BatchBehaviorAccumulator:
+    """Accumulates behavior counts for every game of a BatchGameSimulator."""
+
+    def __init__(self, num_games):
+        self.buffer = np.zeros((num_games, _BUFFER_SIZE))
+        self.buffer[:, _LAST_HIT_Y:] = -1.0
+
+    def hits(self, mask, side, ball_y, own_y, other_y):
+        """Records the hits of one side in the games selected by ``mask``.
+
+        Args:
+            mask: Boolean array, True for games where ``side`` hit the ball.
+            side: LEFT or RIGHT.
+            ball_y, own_y, other_y: Per-game arrays as in BehaviorAccumulator.hit.
+        """
+        games = np.flatnonzero(mask)
+        if not len(games):
+            return
+        buffer = self.buffer
+        ball_y, own_y, other_y = ball_y[games], own_y[games], other_y[games]
+        base = side * COUNT_FIELDS
+        center = ball_y + _BALL_SIZE / 2
+        bins = np.clip((center * CONTACT_BINS / config.SCREEN_HEIGHT).astype(int), 0, CONTACT_BINS - 1)
+        buffer[games, base + COUNT_CONTACT_HIST + bins] += 1
+        buffer[games, base + COUNT_CONTACT_SUM] += ball_y
+        buffer[games, base + COUNT_HITS] += 1
+        last_y = buffer[games, _LAST_HIT_Y + side]
+        moved = last_y >= 0
+        buffer[games, base + COUNT_TRAVEL_SUM] += np.where(moved, np.abs(own_y - last_y), 0.0)
+        buffer[games, base + COUNT_TRAVEL_MOVES] += moved
+        buffer[games, _LAST_HIT_Y + side] = own_y
+        zones = np.clip(((other_y + config.PADDLE_HEIGHT / 2) * READY_ZONES / config.SCREEN_HEIGHT).astype(int),
+                        0, READY_ZONES - 1)
+        buffer[games, (1 - side) * COUNT_FIELDS + COUNT_READY_ZONES + zones] += 1
+        buffer[games, _RALLY_HITS] += 1
+
+    def points(self, mask):
+        """Closes the rallies of the games selected by ``mask``."""
+        games = np.flatnonzero(mask)
+        if not len(games):
+            return
+        buffer = self.buffer
+        for base in (0, COUNT_FIELDS):
+            buffer[games, base + COUNT_RALLIES] += 1
+            buffer[games, base + COUNT_RALLY_HITS] += buffer[games, _RALLY_HITS]
+        buffer[games, _RALLY_HITS] = 0.0
+        buffer[games, _LAST_HIT_Y:] = -1.0
+
+    def counts(self, game, side):
+        """Returns one side's counts in one game (see BehaviorAccumulator.counts)."""
+        base = side * COUNT_FIELDS
+        counts = self.buffer[game, base:base + COUNT_FIELDS].tolist()
+        rally_hits = self.buffer[game, _RALLY_HITS]
+        if rally_hits:
+            counts[COUNT_RALLIES] += 1
+            counts[COUNT_RALLY_HITS] += float(rally_hits)
+        return counts
+
+
+def behavior_vector(counts):
+    """Turns summed counts into a fixed-length behavior characteristic.
+
+    The vector holds the contact-Y histogram (fractions of hits), the mean
+    contact Y and the mean travel between own hits (in pixels), the mean
+    hits per rally mapped to [0, 1), and the ready-zone histogram
+    (fractions). Fractions are scaled by the screen height, so every
+    component spans pixels like the mean-contact-Y BC it extends and
+    NOVELTY_WEIGHT keeps its meaning.
+
+    Args:
+        counts: COUNT_FIELDS floats (one side's counts, possibly summed over
+            matches).
+
+    Returns:
+        list or None: BC_SIZE floats, or None if the side never hit the ball.
+    """
+    hits = counts[COUNT_HITS]
+    if not hits:
+        return None
+    height = config.SCREEN_HEIGHT
+    vector = [count / hits * height for count in counts[COUNT_CONTACT_HIST:COUNT_CONTACT_HIST + CONTACT_BINS]]
+    vector.append(counts[COUNT_CONTACT_SUM] / hits)
+    moves = counts[COUNT_TRAVEL_MOVES]
+    vector.append(counts[COUNT_TRAVEL_SUM] / moves if moves else 0.0)
+    rally_hits = counts[COUNT_RALLY_HITS] / counts[COUNT_RALLIES] if counts[COUNT_RALLIES] else 0.0
+    vector.append(rally_hits / (rally_hits + 1) * height)
+    ready = sum(counts[COUNT_READY_ZONES:COUNT_READY_ZONES + READY_ZONES])
+    vector.extend(count / ready * height if ready else 0.0
+                  for count in counts[COUNT_READY_ZONES:COUNT_READY_ZONES + READY_ZONES])
+    return vector
+
+
+def add_counts(total, counts):
+    """Adds ``counts`` into ``total`` in place and returns ``total``."""
+    for i, count in enumerate(counts):
+        total[i] += count
+    return total
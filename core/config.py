@@ -19,6 +19,10 @@ MAX_SCORE = 99  # Training/AI match cap (effectively no hard limit during normal
 VISUAL_MAX_SCORE = 5  # Human-facing matches end at 5 points
 PADDLE_MAX_SPEED = 1500
 
+# Agent Decision Settings
+DECISION_INTERVAL = 1  # Frames between network decisions; the last move repeats in between
+RULE_BASED_DECISION_INTERVAL = 1  # Rule-based opponents are cheap, so they react every frame
+
 # Curriculum Learning Settings
 INITIAL_BALL_SPEED = 2  # Starting ball speed for generation 0
 SPEED_INCREASE_PER_GEN = 0.05  # Speed increase per generation
@@ -44,6 +48,8 @@ LOG_DIR = os.path.join(DATA_DIR, "logs")
 LOGS_TRAINING_DIR = os.path.join(LOG_DIR, "training")
 LOGS_MATCHES_DIR = os.path.join(LOG_DIR, "matches")
 LOGS_HUMAN_DIR = os.path.join(LOG_DIR, "human")
+LOGS_PROFILES_DIR = os.path.join(LOG_DIR, "profiles")
+POPULATION_CHECKPOINT_DIR = os.path.join(MODEL_DIR, "population_checkpoints")
 
 # Tournament Settings
 TOURNAMENT_MIN_FITNESS_DEFAULT = 200
@@ -64,6 +70,21 @@ PLATINUM_ELO_THRESHOLD = 1800
 # Novelty Search Settings
 NOVELTY_WEIGHT = 0.1  # Weight of novelty score in final fitness
 NOVELTY_K_NEAREST = 15  # Number of nearest neighbors for novelty calculation
+NOVELTY_ARCHIVE_PERSIST = False  # Keep the archive on disk so new runs warm-start from it
+NOVELTY_ARCHIVE_PATH = os.path.join(DATA_DIR, "novelty_archive.npy")
+
+# Hall of Fame Settings
+HALL_OF_FAME_SIZE = 50  # Past champions kept as self-play opponents
+HALL_OF_FAME_EVICTION = "oldest"  # "oldest", "lowest_elo" or "diversity" (closest genome distance)
+
+# Fitness Cache Settings
+FITNESS_CACHE_SIZE = 4096  # Evaluations kept by the LRU fitness cache
+FIXED_EVAL_SEEDS = (0, 1, 2, 3, 4)  # Serve seeds of the deterministic rule-based evaluation
+
+# Early Stop Settings
+EARLY_STOP_RALLIES = True  # End first-point matches once the point (or draw) is decided
+EARLY_STOP_DECIDED_MATCHES = True  # End multi-point matches once the trailer cannot catch up
+EARLY_STOP_CONFIDENCE = None  # e.g. 0.99: also end them once the lead is that safe
 
 # Create directories if they don't exist
 for d in [DATA_DIR, MODEL_DIR, LOG_DIR, LOGS_TRAINING_DIR, LOGS_MATCHES_DIR, LOGS_HUMAN_DIR]:
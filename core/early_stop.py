@@ -0,0 +1,220 @@
+"""Early stopping of matches whose outcome is already decided.
+
+Training matches run until a point is scored or a fixed frame cap is hit,
+even when the result can no longer change. ``EarlyStopPolicy`` decides when
+a match may stop:
+
+- Rallies: once the defending paddle cannot reach the ball anywhere on its
+  way to the goal line, even moving at full speed, the point is decided (as
+  is a draw when the ball cannot reach a goal line before the frame cap).
+  Used by matches that end with the first point, so results are exact.
+- Decided matches: a multi-point match stops once the trailing player cannot
+  catch up within the remaining frame budget, however fast points come.
+- Confidence (optional): a multi-point match also stops once the leader's
+  lead is safe with the given probability, estimating each side's point
+  rate from the points played so far.
+
+The policy also counts the matches it stopped and the frames it saved per
+generation, like ``ai.fitness_cache.FitnessCache`` does for cache hits.
+"""
+
+from . import config
+from .physics import BALL_SIZE, EVENT_HIT, EVENT_SCORED
+
+
+# Slack added to the paddle reach to absorb float rounding
+_REACH_MARGIN = 1e-6
+
+
+class RallyWatch:
+    """Tells, frame by frame, whether the current rally of a match is decided.
+
+    The ball flight is traced once per rally leg (after every hit or serve);
+    each check then only compares the remaining crossings with how far the
+    defending paddle can still move.
+    """
+
+    def __init__(self, game, max_frames):
+        """Watches a game.
+
+        Args:
+            game: The PongPhysics game being played.
+            max_frames: Frame cap of the match.
+        """
+        self.game = game
+        self.max_frames = max_frames
+        self._flight = None
+        self._start = 0
+        self._speed = 0.0
+        self._left = True
+
+    def check(self, frame, events):
+        """Checks the rally before the next frame is played.
+
+        Args:
+            frame: Frames played so far.
+            events: EVENT_* flags of the last frame (0 before the first).
+
+        Returns:
+            tuple or None: ``(frames, events)`` if the rally is decided: the
+                frames left until its point (or until the frame cap) and the
+                EVENT_SCORE_* flag of the point (0 for none before the cap).
+                None while a paddle can still change the outcome.
+        """
+        game = self.game
+        if self._flight is None or events & (EVENT_HIT | EVENT_SCORED):
+            self._start = frame
+            self._flight = game.ball_flight(self.max_frames - frame) or False
+            vel_x = game.ball_vel_x
+            self._speed = min(config.PADDLE_SPEED * (abs(vel_x) / config.BALL_SPEED_X),
+                              config.PADDLE_MAX_SPEED)
+            self._left = vel_x < 0
+        if not self._flight:
+            return None
+
+        frames, scored, crossings = self._flight
+        elapsed = frame - self._start
+        paddle_y = game.paddle_left_y if self._left else game.paddle_right_y
+        paddle_height = config.PADDLE_HEIGHT
+        for crossing_frame, ball_y in crossings:
+            moves = crossing_frame - elapsed
+            if moves <= 0:
+                continue
+            reach = moves * self._speed + _REACH_MARGIN
+            if paddle_y - reach < ball_y + BALL_SIZE and paddle_y + reach > ball_y - paddle_height:
+                return None
+        return frames - elapsed, scored
+
+    def play_out(self, frames):
+        """Plays a decided point out with both paddles still.
+
+        The ball-only fast-forward is cheap next to the agents' decisions,
+        and it leaves the score and the serve RNG exactly where playing on
+        would have (no paddle can touch the ball any more).
+
+        Args:
+            frames: Frames to the point, as returned by check().
+
+        Returns:
+            int: The EVENT_* flags of the played frames.
+        """
+        return self.game.fast_forward(None, None, frames)[1]
+
+
+class EarlyStopPolicy:
+    """Decides when matches may stop early and counts the frames saved.
+
+    Frames saved are the frames the agents no longer had to play; for a
+    multi-point match, whose remaining length is unknown, the unused frame
+    budget is counted.
+
+    Attributes:
+        rallies: Stop first-point matches once the rally is decided.
+        decided_matches: Stop multi-point matches once the trailing player
+            cannot catch up within the frame budget.
+        confidence: If set, also stop multi-point matches once the leader
+            keeps the lead with at least this probability.
+        history: List of per-generation stats dicts (see ``stats``).
+    """
+
+    def __init__(self, rallies=True, decided_matches=True, confidence=None):
+        self.rallies = rallies
+        self.decided_matches = decided_matches
+        self.confidence = confidence
+        self.history = []
+        self.generation = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.matches = 0
+        self.stopped = 0
+        self.frames_saved = 0
+
+    def rally_watch(self, game, max_frames):
+        """Returns a RallyWatch for a first-point match, or None if disabled."""
+        if not self.rallies:
+            return None
+        return RallyWatch(game, max_frames)
+
+    def match_decided(self, game, frames_left, target_score):
+        """Tells whether a multi-point match can stop now.
+
+        Args:
+            game: The PongPhysics game being played.
+            frames_left: Frames left in the match's budget.
+            target_score: Score that ends the match.
+
+        Returns:
+            bool: True if the leader can no longer lose (or, with a
+                confidence set, is sufficiently unlikely to).
+        """
+        leader = max(game.score_left, game.score_right)
+        trailer = min(game.score_left, game.score_right)
+        lead = leader - trailer
+        if lead == 0 or leader >= target_score:
+            return False
+
+        if self.decided_matches:
+            # The rally in play may end at once; every later point needs a serve
+            max_points = 1 + (frames_left - 1) // game.min_point_frames() if frames_left > 0 else 0
+            if max_points < lead:
+                return True
+
+        if self.confidence is not None:
+            # Gambler's ruin: with point-win probability p < 1/2 the trailer
+            # ever draws level with probability at most (p / (1 - p)) ** lead
+            p = (trailer + 1) / (leader + trailer + 2)
+            if (p / (1 - p)) ** lead < 1 - self.confidence:
+                return True
+        return False
+
+    def decision_frame(self, game, max_frames):
+        """Returns the frame from which the frame budget decides the current score.
+
+        Scores only change on points, so callers that skip frames (stopping
+        at points) may skip up to this frame without missing the stop.
+
+        Args:
+            game: The PongPhysics game being played.
+            max_frames: Frame budget of the match.
+
+        Returns:
+            int or None: Frame count at which match_decided starts to hold,
+                or None if the budget cannot decide the current score.
+        """
+        lead = abs(game.score_left - game.score_right)
+        if not self.decided_matches or lead == 0:
+            return None
+        return max_frames - (lead - 1) * game.min_point_frames()
+
+    def record(self, frames_saved):
+        """Counts one finished match and the frames stopping it saved."""
+        self.matches += 1
+        if frames_saved:
+            self.stopped += 1
+            self.frames_saved += frames_saved
+
+    def start_generation(self, generation):
+        """Closes the previous generation's stats and starts counting anew."""
+        if self.generation is not None and self.matches:
+            self.history.append(self.stats())
+        self.generation = generation
+        self._reset_counters()
+
+    def stats(self):
+        """Returns the current generation's stats.
+
+        Returns:
+            dict: "generation", "matches", "stopped" and "frames_saved".
+        """
+        return {
+            "generation": self.generation,
+            "matches": self.matches,
+            "stopped": self.stopped,
+            "frames_saved": self.frames_saved,
+        }
+
+
+DEFAULT_POLICY = EarlyStopPolicy(rallies=config.EARLY_STOP_RALLIES,
+                                 decided_matches=config.EARLY_STOP_DECIDED_MATCHES,
+                                 confidence=config.EARLY_STOP_CONFIDENCE)
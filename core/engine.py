@@ -1,154 +1,26 @@
 # game_engine.py
 import pygame
-import random
 from . import config
+from .physics import PongPhysics, PaddleView, BallView
 
-class Paddle:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, config.PADDLE_WIDTH, config.PADDLE_HEIGHT)
-        self.speed = config.PADDLE_SPEED
+class Game(PongPhysics):
+    """Visual Pong game: the shared physics kernel plus pygame drawing.
 
-    def move(self, up=True):
-        if up:
-            self.rect.y -= self.speed
-        else:
-            self.rect.y += self.speed
-        
-        # Keep paddle on screen
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > config.SCREEN_HEIGHT:
-            self.rect.bottom = config.SCREEN_HEIGHT
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, config.WHITE, self.rect)
-
-class Ball:
-    def __init__(self):
-        self.rect = pygame.Rect(config.SCREEN_WIDTH // 2 - config.BALL_RADIUS,
-                                config.SCREEN_HEIGHT // 2 - config.BALL_RADIUS,
-                                config.BALL_RADIUS * 2, config.BALL_RADIUS * 2)
-        self.vel_x = config.BALL_SPEED_X * random.choice((1, -1))
-        self.vel_y = config.BALL_SPEED_Y * random.choice((1, -1))
-
-    def move(self):
-        self.rect.x += self.vel_x
-        self.rect.y += self.vel_y
-
-    def reset(self):
-        self.rect.center = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
-        self.vel_x = config.BALL_SPEED_X * random.choice((1, -1))
-        self.vel_y = config.BALL_SPEED_Y * random.choice((1, -1))
-
-    def draw(self, screen):
-        pygame.draw.ellipse(screen, config.WHITE, self.rect)
-
-class Game:
-    def __init__(self):
-        self.left_paddle = Paddle(10, config.SCREEN_HEIGHT // 2 - config.PADDLE_HEIGHT // 2)
-        self.right_paddle = Paddle(config.SCREEN_WIDTH - 10 - config.PADDLE_WIDTH, config.SCREEN_HEIGHT // 2 - config.PADDLE_HEIGHT // 2)
-        self.ball = Ball()
-        self.score_left = 0
-        self.score_right = 0
+    Plays exactly like core.simulator.GameSimulator but ends at
+    config.VISUAL_MAX_SCORE unless max_score is given.
+    """
 
-    def update(self, left_move=None, right_move=None):
-        """
-        Updates the game state.
-        left_move, right_move: 'UP', 'DOWN', or None
-        Returns: score_data (dict) if a score occurred, else None
-        """
-        # Move paddles
-        # Dynamic Paddle Speed
-        current_speed_ratio = abs(self.ball.vel_x) / config.BALL_SPEED_X
-        new_paddle_speed = config.PADDLE_SPEED * current_speed_ratio
-        new_paddle_speed = min(new_paddle_speed, config.PADDLE_MAX_SPEED)
-        self.left_paddle.speed = new_paddle_speed
-        self.right_paddle.speed = new_paddle_speed
+    MAX_SCORE_SETTING = "VISUAL_MAX_SCORE"
 
-        if left_move == "UP":
-            self.left_paddle.move(up=True)
-        elif left_move == "DOWN":
-            self.left_paddle.move(up=False)
-        
-        if right_move == "UP":
-            self.right_paddle.move(up=True)
-        elif right_move == "DOWN":
-            self.right_paddle.move(up=False)
-
-        # Move ball
-        self.ball.move()
-
-        # Wall Collision (Top/Bottom)
-        if self.ball.rect.top <= 0 or self.ball.rect.bottom >= config.SCREEN_HEIGHT:
-            self.ball.vel_y *= -1
-
-        # Track paddle hits
-        hit_left = False
-        hit_right = False
-
-        # Paddle Collision
-        # Left Paddle
-        if self.ball.rect.colliderect(self.left_paddle.rect):
-            self.ball.vel_x *= -config.BALL_SPEED_INCREMENT
-            self.ball.vel_y *= config.BALL_SPEED_INCREMENT
-            self.ball.rect.left = self.left_paddle.rect.right # Prevent sticking
-            hit_left = True
-        
-        # Right Paddle
-        if self.ball.rect.colliderect(self.right_paddle.rect):
-            self.ball.vel_x *= -config.BALL_SPEED_INCREMENT
-            self.ball.vel_y *= config.BALL_SPEED_INCREMENT
-            self.ball.rect.right = self.right_paddle.rect.left # Prevent sticking
-            hit_right = True
-            
-        # Cap Speed
-        self.ball.vel_x = max(min(self.ball.vel_x, config.BALL_MAX_SPEED), -config.BALL_MAX_SPEED)
-        self.ball.vel_y = max(min(self.ball.vel_y, config.BALL_MAX_SPEED), -config.BALL_MAX_SPEED)
-
-        # Scoring
-        score_data = None
-        if self.ball.rect.left <= 0:
-            # Right scores
-            self.score_right += 1
-            score_data = self.get_state()
-            score_data["scored"] = "right"
-            self.ball.reset()
-        elif self.ball.rect.right >= config.SCREEN_WIDTH:
-            # Left scores
-            self.score_left += 1
-            score_data = self.get_state()
-            score_data["scored"] = "left"
-            self.ball.reset()
-            
-        # Check for Game Over
-        if (self.score_left >= config.VISUAL_MAX_SCORE or
-                self.score_right >= config.VISUAL_MAX_SCORE):
-            if score_data is None:
-                 score_data = self.get_state()
-            score_data["game_over"] = True
-        
-        # Return hit events even if no score
-        if score_data is None and (hit_left or hit_right):
-            score_data = {}
-        
-        if score_data is not None:
-            score_data["hit_left"] = hit_left
-            score_data["hit_right"] = hit_right
-            
-        return score_data
+    def __init__(self, ball_speed=None, seed=None, rng=None, max_score=None):
+        # seed/rng make serve directions independent of global random state
+        super().__init__(ball_speed=ball_speed, seed=seed, rng=rng, max_score=max_score)
+        self._init_views()
 
-    def get_state(self):
-        return {
-            "ball_x": self.ball.rect.x,
-            "ball_y": self.ball.rect.y,
-            "ball_vel_x": self.ball.vel_x,
-            "ball_vel_y": self.ball.vel_y,
-            "paddle_left_y": self.left_paddle.rect.y,
-            "paddle_right_y": self.right_paddle.rect.y,
-            "score_left": self.score_left,
-            "score_right": self.score_right,
-            "game_over": False
-        }
+    def _init_views(self):
+        self.left_paddle = PaddleView(self, "left")
+        self.right_paddle = PaddleView(self, "right")
+        self.ball = BallView(self)
 
     def draw(self, screen):
         screen.fill(config.BLACK)
@@ -166,6 +38,8 @@ class Game:
                 text_right = font.render(str(self.score_right), 1, config.WHITE)
                 screen.blit(text_right, (config.SCREEN_WIDTH * 3 // 4, 10))
         
-        self.left_paddle.draw(screen)
-        self.right_paddle.draw(screen)
-        self.ball.draw(screen)
+        for paddle in (self.left_paddle, self.right_paddle):
+            rect = paddle.rect
+            pygame.draw.rect(screen, config.WHITE, pygame.Rect(rect.x, rect.y, rect.width, rect.height))
+        rect = self.ball.rect
+        pygame.draw.ellipse(screen, config.WHITE, pygame.Rect(rect.x, rect.y, rect.width, rect.height))
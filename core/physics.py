@@ -0,0 +1,839 @@
+"""Shared Pong physics kernel for PyPongAI.
+
+Every front-end (``core.simulator.GameSimulator``, the legacy
+``core.simulator_optimized`` module and the pygame ``core.engine.Game``)
+delegates to ``PongPhysics``, so training, validation and the visual game run
+exactly the same code path. The kernel keeps the whole game state in a few
+scalar slots, writes it into a flat ``array('d')`` buffer after every frame
+and reports events as an integer bitmask. It never imports pygame.
+
+For code written against the older object model, ``PaddleView`` and
+``BallView`` expose the kernel state through ``rect``/``vel_x``/``move()``
+attributes that read and write the kernel directly.
+"""
+
+import math
+import random
+from array import array
+from . import config
+
+
+# Field offsets of the flat state buffer (PongPhysics.state)
+STATE_BALL_X = 0
+STATE_BALL_Y = 1
+STATE_BALL_VEL_X = 2
+STATE_BALL_VEL_Y = 3
+STATE_PADDLE_LEFT_Y = 4
+STATE_PADDLE_RIGHT_Y = 5
+STATE_SCORE_LEFT = 6
+STATE_SCORE_RIGHT = 7
+# Contact metrics, only meaningful on frames with a HIT event
+STATE_CONTACT_Y = 8
+STATE_CONTACT_VEL_X = 9
+STATE_CONTACT_VEL_Y = 10
+STATE_SIZE = 11
+
+# Event bitflags returned by PongPhysics.step
+EVENT_HIT_LEFT = 1
+EVENT_HIT_RIGHT = 2
+EVENT_SCORE_LEFT = 4
+EVENT_SCORE_RIGHT = 8
+EVENT_WALL = 16
+EVENT_GAME_OVER = 32
+EVENT_SCORED = EVENT_SCORE_LEFT | EVENT_SCORE_RIGHT
+EVENT_HIT = EVENT_HIT_LEFT | EVENT_HIT_RIGHT
+
+# Fixed geometry
+LEFT_PADDLE_X = 10
+RIGHT_PADDLE_X = config.SCREEN_WIDTH - 10 - config.PADDLE_WIDTH
+BALL_SIZE = config.BALL_RADIUS * 2
+PADDLE_START_Y = config.SCREEN_HEIGHT // 2 - config.PADDLE_HEIGHT // 2
+
+
+def make_rng(seed=None, rng=None):
+    """Returns the random source a simulator should use.
+
+    Args:
+        seed: Optional seed for a private ``random.Random`` instance.
+        rng: Optional ``random.Random`` (or any object with ``choice``) to use
+            directly. Takes precedence over ``seed``.
+
+    Returns:
+        The given ``rng``, a new ``random.Random(seed)``, or the global
+        ``random`` module when neither is provided.
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
+
+
+def network_inputs(state, side):
+    """Builds the normalized network inputs from a flat state buffer.
+
+    The tuple matches the inputs used by the training loops and
+    ``NeatAgent.get_move``.
+
+    Args:
+        state: Flat state buffer (see the STATE_* offsets).
+        side: Which paddle the inputs are for ("left" or "right").
+
+    Returns:
+        tuple: Eight normalized input values.
+    """
+    ball_y = state[STATE_BALL_Y]
+    ball_vel_x = state[STATE_BALL_VEL_X]
+    if side == "left":
+        my_y = state[STATE_PADDLE_LEFT_Y]
+        op_y = state[STATE_PADDLE_RIGHT_Y]
+        ball_incoming = 1.0 if ball_vel_x < 0 else 0.0
+    else:
+        my_y = state[STATE_PADDLE_RIGHT_Y]
+        op_y = state[STATE_PADDLE_LEFT_Y]
+        ball_incoming = 1.0 if ball_vel_x > 0 else 0.0
+    return (
+        my_y / config.SCREEN_HEIGHT,
+        state[STATE_BALL_X] / config.SCREEN_WIDTH,
+        ball_y / config.SCREEN_HEIGHT,
+        ball_vel_x / config.BALL_MAX_SPEED,
+        state[STATE_BALL_VEL_Y] / config.BALL_MAX_SPEED,
+        (my_y - ball_y) / config.SCREEN_HEIGHT,
+        ball_incoming,
+        op_y / config.SCREEN_HEIGHT
+    )
+
+
+class Rect:
+    """A simple rectangle class mimicking pygame.Rect for collision detection.
+
+    Provides properties for accessing and manipulating rectangle boundaries,
+    enabling collision detection without Pygame dependencies.
+
+    Attributes:
+        x: X-coordinate of the rectangle's top-left corner.
+        y: Y-coordinate of the rectangle's top-left corner.
+        width: Width of the rectangle.
+        height: Height of the rectangle.
+    """
+
+    def __init__(self, x, y, width, height):
+        """Initializes a rectangle with position and dimensions.
+
+        Args:
+            x: X-coordinate of top-left corner.
+            y: Y-coordinate of top-left corner.
+            width: Rectangle width in pixels.
+            height: Rectangle height in pixels.
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def left(self):
+        return self.x
+
+    @left.setter
+    def left(self, value):
+        self.x = value
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @right.setter
+    def right(self, value):
+        self.x = value - self.width
+
+    @property
+    def top(self):
+        return self.y
+
+    @top.setter
+    def top(self, value):
+        self.y = value
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @bottom.setter
+    def bottom(self, value):
+        self.y = value - self.height
+
+    @property
+    def centerx(self):
+        return self.x + self.width / 2
+
+    @centerx.setter
+    def centerx(self, value):
+        self.x = value - self.width / 2
+
+    @property
+    def centery(self):
+        return self.y + self.height / 2
+
+    @centery.setter
+    def centery(self, value):
+        self.y = value - self.height / 2
+
+    @property
+    def center(self):
+        return (self.centerx, self.centery)
+
+    @center.setter
+    def center(self, value):
+        self.centerx = value[0]
+        self.centery = value[1]
+
+    def colliderect(self, other):
+        """Checks for collision with another rectangle.
+
+        Args:
+            other: Another Rect instance to check collision with.
+
+        Returns:
+            bool: True if rectangles overlap, False otherwise.
+        """
+        return (self.x < other.x + other.width and
+                self.x + self.width > other.x and
+                self.y < other.y + other.height and
+                self.y + self.height > other.y)
+
+
+class _KernelRect(Rect):
+    """Rect whose position lives in PongPhysics slots.
+
+    Writes go straight to the kernel (and refresh its state buffer). A
+    paddle's X is fixed in the kernel; ``x_name`` is None for paddles.
+    """
+
+    def __init__(self, physics, x_name, y_name, x, width, height):
+        self._physics = physics
+        self._x_name = x_name
+        self._y_name = y_name
+        self._x = x
+        self.width = width
+        self.height = height
+
+    @property
+    def x(self):
+        if self._x_name is None:
+            return self._x
+        return getattr(self._physics, self._x_name)
+
+    @x.setter
+    def x(self, value):
+        if self._x_name is None:
+            self._x = value
+        else:
+            setattr(self._physics, self._x_name, value)
+            self._physics.sync_state()
+
+    @property
+    def y(self):
+        return getattr(self._physics, self._y_name)
+
+    @y.setter
+    def y(self, value):
+        setattr(self._physics, self._y_name, value)
+        self._physics.sync_state()
+
+
+class PaddleView:
+    """Paddle-shaped view of one side of a PongPhysics kernel.
+
+    Attributes:
+        rect: Rect view of the paddle position.
+        side: "left" or "right".
+    """
+
+    def __init__(self, physics, side):
+        self._physics = physics
+        self.side = side
+        x = LEFT_PADDLE_X if side == "left" else RIGHT_PADDLE_X
+        self.rect = _KernelRect(physics, None, "paddle_%s_y" % side, x,
+                                config.PADDLE_WIDTH, config.PADDLE_HEIGHT)
+
+    @property
+    def speed(self):
+        return self._physics.paddle_speed
+
+    @speed.setter
+    def speed(self, value):
+        self._physics.paddle_speed = value
+
+    def move(self, up=True):
+        """Moves the paddle vertically within screen bounds."""
+        self._physics.move_paddle(self.side, up)
+
+
+class BallView:
+    """Ball-shaped view of a PongPhysics kernel.
+
+    Attributes:
+        rect: Rect view of the ball position.
+    """
+
+    def __init__(self, physics):
+        self._physics = physics
+        self.rect = _KernelRect(physics, "ball_x", "ball_y", None, BALL_SIZE, BALL_SIZE)
+
+    @property
+    def vel_x(self):
+        return self._physics.ball_vel_x
+
+    @vel_x.setter
+    def vel_x(self, value):
+        self._physics.ball_vel_x = value
+        self._physics.sync_state()
+
+    @property
+    def vel_y(self):
+        return self._physics.ball_vel_y
+
+    @vel_y.setter
+    def vel_y(self, value):
+        self._physics.ball_vel_y = value
+        self._physics.sync_state()
+
+    @property
+    def initial_speed_x(self):
+        return self._physics.initial_speed_x
+
+    @property
+    def initial_speed_y(self):
+        return self._physics.initial_speed_y
+
+    @property
+    def rng(self):
+        return self._physics.rng
+
+    def move(self):
+        """Updates ball position based on current velocity."""
+        physics = self._physics
+        physics.ball_x += physics.ball_vel_x
+        physics.ball_y += physics.ball_vel_y
+        physics.sync_state()
+
+    def reset(self):
+        """Resets ball to center with random velocity direction."""
+        self._physics.serve()
+        self._physics.sync_state()
+
+
+class PongPhysics:
+    """Rendering-free Pong rules shared by every game front-end.
+
+    Physics per frame, in order: dynamic paddle speed, paddle moves (clamped
+    to the screen), ball move, wall bounce, left then right paddle collision
+    (speed increment and un-sticking), speed cap, scoring with a new serve,
+    and the game-over check.
+
+    Attributes:
+        ball_x: Ball top-left X.
+        ball_y: Ball top-left Y.
+        ball_vel_x: Ball horizontal velocity.
+        ball_vel_y: Ball vertical velocity.
+        paddle_left_y: Left paddle top Y.
+        paddle_right_y: Right paddle top Y.
+        paddle_speed: Paddle speed used for the last frame.
+        score_left: Left player score.
+        score_right: Right player score.
+        initial_speed_x: Serve speed on X.
+        initial_speed_y: Serve speed on Y.
+        max_score: Score that ends the game; None follows the config setting
+            named by MAX_SCORE_SETTING at every frame.
+        rng: Random source for serve directions.
+        state: Flat ``array('d')`` of STATE_SIZE floats holding the current
+            state at the STATE_* offsets; rewritten in place by step().
+        behavior: Optional core.behavior.BehaviorAccumulator fed on every
+            hit and point (None by default).
+    """
+
+    __slots__ = ('ball_x', 'ball_y', 'ball_vel_x', 'ball_vel_y', 'paddle_left_y', 'paddle_right_y',
+                 'paddle_speed', 'score_left', 'score_right', 'initial_speed_x', 'initial_speed_y',
+                 'max_score', 'rng', 'state', 'behavior', '_scored_ball')
+
+    # Config attribute holding the default game-over score
+    MAX_SCORE_SETTING = "MAX_SCORE"
+
+    def __init__(self, ball_speed=None, seed=None, rng=None, max_score=None):
+        """Initializes a new game with paddles and ball at starting positions.
+
+        Args:
+            ball_speed: Optional custom ball speed for curriculum learning.
+                If None, uses default config values.
+            seed: Optional seed for a private serve-direction RNG, making the
+                match reproducible regardless of global random state.
+            rng: Optional ``random.Random`` instance to use instead of seed.
+            max_score: Optional score that ends the game.
+        """
+        self.rng = make_rng(seed, rng)
+        self.initial_speed_x = ball_speed if ball_speed is not None else config.BALL_SPEED_X
+        self.initial_speed_y = ball_speed if ball_speed is not None else config.BALL_SPEED_Y
+        self.max_score = max_score
+        self.paddle_left_y = PADDLE_START_Y
+        self.paddle_right_y = PADDLE_START_Y
+        self.paddle_speed = config.PADDLE_SPEED
+        self.ball_x = config.SCREEN_WIDTH // 2 - config.BALL_RADIUS
+        self.ball_y = config.SCREEN_HEIGHT // 2 - config.BALL_RADIUS
+        self.ball_vel_x = self.initial_speed_x * self.rng.choice((1, -1))
+        self.ball_vel_y = self.initial_speed_y * self.rng.choice((1, -1))
+        self.score_left = 0
+        self.score_right = 0
+        self._scored_ball = None
+        self.state = array('d', bytes(8 * STATE_SIZE))
+        self.behavior = None
+        self.sync_state()
+
+    def serve(self):
+        """Puts the ball back in the center with a random direction."""
+        self.ball_x = config.SCREEN_WIDTH // 2 - BALL_SIZE / 2
+        self.ball_y = config.SCREEN_HEIGHT // 2 - BALL_SIZE / 2
+        self.ball_vel_x = self.initial_speed_x * self.rng.choice((1, -1))
+        self.ball_vel_y = self.initial_speed_y * self.rng.choice((1, -1))
+
+    def move_paddle(self, side, up=True):
+        """Moves one paddle by the current paddle speed, clamped to the screen."""
+        y = self.paddle_left_y if side == "left" else self.paddle_right_y
+        y = y - self.paddle_speed if up else y + self.paddle_speed
+        if y < 0:
+            y = 0
+        if y + config.PADDLE_HEIGHT > config.SCREEN_HEIGHT:
+            y = config.SCREEN_HEIGHT - config.PADDLE_HEIGHT
+        if side == "left":
+            self.paddle_left_y = y
+        else:
+            self.paddle_right_y = y
+        self.sync_state()
+
+    def game_over_score(self):
+        """Returns the score that currently ends the game."""
+        if self.max_score is not None:
+            return self.max_score
+        return getattr(config, self.MAX_SCORE_SETTING)
+
+    def step(self, left_move=None, right_move=None):
+        """Advances the game by one frame without allocating event data.
+
+        Args:
+            left_move: Movement command for left paddle ("UP", "DOWN", or None).
+            right_move: Movement command for right paddle ("UP", "DOWN", or None).
+
+        Returns:
+            int: Bitwise OR of the EVENT_* flags that occurred this frame.
+        """
+        state = self.state
+        events = 0
+        vel_x = self.ball_vel_x
+        vel_y = self.ball_vel_y
+
+        # Dynamic Paddle Speed
+        speed = min(config.PADDLE_SPEED * (abs(vel_x) / config.BALL_SPEED_X), config.PADDLE_MAX_SPEED)
+        self.paddle_speed = speed
+        paddle_height = config.PADDLE_HEIGHT
+        paddle_floor = config.SCREEN_HEIGHT - paddle_height
+
+        # Move paddles (clamped only when they move)
+        left_y = self.paddle_left_y
+        if left_move == "UP" or left_move == "DOWN":
+            left_y = left_y - speed if left_move == "UP" else left_y + speed
+            if left_y < 0:
+                left_y = 0
+            if left_y > paddle_floor:
+                left_y = paddle_floor
+            self.paddle_left_y = left_y
+        right_y = self.paddle_right_y
+        if right_move == "UP" or right_move == "DOWN":
+            right_y = right_y - speed if right_move == "UP" else right_y + speed
+            if right_y < 0:
+                right_y = 0
+            if right_y > paddle_floor:
+                right_y = paddle_floor
+            self.paddle_right_y = right_y
+
+        # Move ball
+        x = self.ball_x + vel_x
+        y = self.ball_y + vel_y
+
+        # Wall Collision (Top/Bottom)
+        if y <= 0 or y + BALL_SIZE >= config.SCREEN_HEIGHT:
+            vel_y *= -1
+            events |= EVENT_WALL
+
+        # Paddle Collision - Left Paddle
+        if (x < LEFT_PADDLE_X + config.PADDLE_WIDTH and x + BALL_SIZE > LEFT_PADDLE_X and
+                y < left_y + paddle_height and y + BALL_SIZE > left_y):
+            # Store contact metrics BEFORE modifying velocities
+            state[STATE_CONTACT_Y] = y
+            state[STATE_CONTACT_VEL_X] = vel_x
+            state[STATE_CONTACT_VEL_Y] = vel_y
+            vel_x *= -config.BALL_SPEED_INCREMENT
+            vel_y *= config.BALL_SPEED_INCREMENT
+            x = LEFT_PADDLE_X + config.PADDLE_WIDTH  # Prevent sticking
+            events |= EVENT_HIT_LEFT
+            if self.behavior is not None:
+                self.behavior.hit(0, y, left_y, right_y)
+
+        # Paddle Collision - Right Paddle
+        if (x < RIGHT_PADDLE_X + config.PADDLE_WIDTH and x + BALL_SIZE > RIGHT_PADDLE_X and
+                y < right_y + paddle_height and y + BALL_SIZE > right_y):
+            state[STATE_CONTACT_Y] = y
+            state[STATE_CONTACT_VEL_X] = vel_x
+            state[STATE_CONTACT_VEL_Y] = vel_y
+            vel_x *= -config.BALL_SPEED_INCREMENT
+            vel_y *= config.BALL_SPEED_INCREMENT
+            x = RIGHT_PADDLE_X - BALL_SIZE  # Prevent sticking
+            events |= EVENT_HIT_RIGHT
+            if self.behavior is not None:
+                self.behavior.hit(1, y, right_y, left_y)
+
+        # Cap Speed
+        max_speed = config.BALL_MAX_SPEED
+        vel_x = max(min(vel_x, max_speed), -max_speed)
+        vel_y = max(min(vel_y, max_speed), -max_speed)
+
+        self.ball_x = x
+        self.ball_y = y
+        self.ball_vel_x = vel_x
+        self.ball_vel_y = vel_y
+
+        # Scoring
+        if x <= 0:
+            self.score_right += 1
+            events |= EVENT_SCORE_RIGHT
+        elif x + BALL_SIZE >= config.SCREEN_WIDTH:
+            self.score_left += 1
+            events |= EVENT_SCORE_LEFT
+        if events & EVENT_SCORED:
+            # Keep where the point was won for the dict API
+            self._scored_ball = (x, y, vel_x, vel_y)
+            if self.behavior is not None:
+                self.behavior.point()
+            self.serve()
+
+        # Check for Game Over
+        max_score = self.game_over_score()
+        if self.score_left >= max_score or self.score_right >= max_score:
+            events |= EVENT_GAME_OVER
+
+        state[STATE_BALL_X] = self.ball_x
+        state[STATE_BALL_Y] = self.ball_y
+        state[STATE_BALL_VEL_X] = self.ball_vel_x
+        state[STATE_BALL_VEL_Y] = self.ball_vel_y
+        state[STATE_PADDLE_LEFT_Y] = self.paddle_left_y
+        state[STATE_PADDLE_RIGHT_Y] = self.paddle_right_y
+        state[STATE_SCORE_LEFT] = self.score_left
+        state[STATE_SCORE_RIGHT] = self.score_right
+        return events
+
+    def fast_forward(self, left_move=None, right_move=None, max_frames=1,
+                     x_min=float("-inf"), x_max=float("inf")):
+        """Advances several frames at once while both moves are held fixed.
+
+        Between paddle hits the ball only travels in a straight line and
+        bounces off the walls, so those frames are advanced in a tight loop
+        with no per-frame method calls. Frames where a paddle hit or a point
+        happens are run through step(), so scores, contact metrics and the
+        final state are identical to calling step() frame by frame with the
+        same moves.
+
+        Fast-forwarding stops after the first frame with a hit or a point,
+        after ``max_frames`` frames, or before a frame that would start with
+        the ball's X outside the open interval (``x_min``, ``x_max``). The
+        window lets callers stop where an agent wants to decide again.
+
+        Args:
+            left_move: Held movement command for the left paddle.
+            right_move: Held movement command for the right paddle.
+            max_frames: Maximum number of frames to advance.
+            x_min: Stop before a frame starting with ball X <= x_min.
+            x_max: Stop before a frame starting with ball X >= x_max.
+
+        Returns:
+            tuple: ``(frames, events)`` with the number of frames advanced and
+                the OR of all EVENT_* flags raised during them.
+        """
+        x, y = self.ball_x, self.ball_y
+        vel_x, vel_y = self.ball_vel_x, self.ball_vel_y
+        left_y, right_y = self.paddle_left_y, self.paddle_right_y
+
+        # Paddle speed only changes on hits, which end the fast-forward
+        paddle_speed = min(config.PADDLE_SPEED * (abs(vel_x) / config.BALL_SPEED_X),
+                           config.PADDLE_MAX_SPEED)
+        paddle_height = config.PADDLE_HEIGHT
+        paddle_floor = config.SCREEN_HEIGHT - paddle_height
+        left_face = LEFT_PADDLE_X + config.PADDLE_WIDTH
+        right_back = RIGHT_PADDLE_X + config.PADDLE_WIDTH
+        screen_height = config.SCREEN_HEIGHT
+        screen_width = config.SCREEN_WIDTH
+        # step() only needs to cap velocities that start above the limit
+        needs_cap = abs(vel_x) > config.BALL_MAX_SPEED or abs(vel_y) > config.BALL_MAX_SPEED
+        left_delta = -paddle_speed if left_move == "UP" else paddle_speed if left_move == "DOWN" else None
+        right_delta = -paddle_speed if right_move == "UP" else paddle_speed if right_move == "DOWN" else None
+
+        frames = 0
+        events = 0
+        while frames < max_frames and x_min < x < x_max:
+            new_left_y = left_y
+            if left_delta is not None:
+                new_left_y = left_y + left_delta
+                if new_left_y < 0:
+                    new_left_y = 0
+                if new_left_y > paddle_floor:
+                    new_left_y = paddle_floor
+            new_right_y = right_y
+            if right_delta is not None:
+                new_right_y = right_y + right_delta
+                if new_right_y < 0:
+                    new_right_y = 0
+                if new_right_y > paddle_floor:
+                    new_right_y = paddle_floor
+
+            new_x = x + vel_x
+            new_y = y + vel_y
+            if ((new_x < left_face and new_x + BALL_SIZE > LEFT_PADDLE_X and
+                 new_y < new_left_y + paddle_height and new_y + BALL_SIZE > new_left_y) or
+                    (new_x < right_back and new_x + BALL_SIZE > RIGHT_PADDLE_X and
+                     new_y < new_right_y + paddle_height and new_y + BALL_SIZE > new_right_y) or
+                    new_x <= 0 or new_x + BALL_SIZE >= screen_width or needs_cap):
+                # Hit or point: let step() run this frame exactly
+                self.ball_x, self.ball_y, self.ball_vel_y = x, y, vel_y
+                self.paddle_left_y, self.paddle_right_y = left_y, right_y
+                events |= self.step(left_move, right_move)
+                return frames + 1, events
+
+            left_y, right_y = new_left_y, new_right_y
+            x, y = new_x, new_y
+            if y <= 0 or y + BALL_SIZE >= screen_height:
+                vel_y *= -1
+                events |= EVENT_WALL
+            frames += 1
+
+        if frames:
+            self.ball_x, self.ball_y, self.ball_vel_y = x, y, vel_y
+            self.paddle_left_y, self.paddle_right_y = left_y, right_y
+            self.paddle_speed = paddle_speed
+            self.sync_state()
+        return frames, events
+
+    def ball_flight(self, max_frames):
+        """Traces the ball to the next goal line as if no paddle touched it.
+
+        Until a paddle hit, the ball only moves in a straight line and
+        bounces off the walls, so its path does not depend on the agents.
+        Callers compare the returned crossings with how far the defending
+        paddle can still move to tell whether a rally is already decided.
+
+        Args:
+            max_frames: Maximum number of frames to trace.
+
+        Returns:
+            tuple or None: ``(frames, events, crossings)`` with the frames
+                until the ball reaches a goal line (``max_frames`` if it does
+                not), the EVENT_SCORE_* flag of that point (0 if not reached)
+                and ``(frame, ball_y)`` for every frame in which the ball
+                overlaps the column of the paddle it is heading to. None if
+                the ball does not move horizontally, is above the speed cap or
+                would pass the column of the paddle it moves away from.
+        """
+        x, y = self.ball_x, self.ball_y
+        vel_x, vel_y = self.ball_vel_x, self.ball_vel_y
+        max_speed = config.BALL_MAX_SPEED
+        if vel_x == 0 or abs(vel_x) > max_speed or abs(vel_y) > max_speed:
+            return None
+
+        left_face = LEFT_PADDLE_X + config.PADDLE_WIDTH
+        right_back = RIGHT_PADDLE_X + config.PADDLE_WIDTH
+        screen_height = config.SCREEN_HEIGHT
+        screen_width = config.SCREEN_WIDTH
+        heading_left = vel_x < 0
+
+        crossings = []
+        for frame in range(1, max_frames + 1):
+            x += vel_x
+            y += vel_y
+            if y <= 0 or y + BALL_SIZE >= screen_height:
+                vel_y *= -1
+            in_left = x < left_face and x + BALL_SIZE > LEFT_PADDLE_X
+            in_right = x < right_back and x + BALL_SIZE > RIGHT_PADDLE_X
+            if in_left or in_right:
+                if in_left != heading_left or in_right == heading_left:
+                    return None
+                crossings.append((frame, y))
+            if x <= 0:
+                return frame, EVENT_SCORE_RIGHT, crossings
+            if x + BALL_SIZE >= screen_width:
+                return frame, EVENT_SCORE_LEFT, crossings
+        return max_frames, 0, crossings
+
+    def min_point_frames(self):
+        """Returns the fewest frames a point can take after a serve.
+
+        A served ball starts in the center at the serve speed, and every
+        paddle hit only lengthens its way to a goal line.
+        """
+        distance = config.SCREEN_WIDTH // 2 - BALL_SIZE / 2
+        return max(1, math.ceil(distance / abs(self.initial_speed_x)))
+
+    def sync_state(self):
+        """Rewrites the state buffer from the kernel fields.
+
+        step() keeps the buffer current; call this after assigning kernel
+        fields directly.
+        """
+        state = self.state
+        state[STATE_BALL_X] = self.ball_x
+        state[STATE_BALL_Y] = self.ball_y
+        state[STATE_BALL_VEL_X] = self.ball_vel_x
+        state[STATE_BALL_VEL_Y] = self.ball_vel_y
+        state[STATE_PADDLE_LEFT_Y] = self.paddle_left_y
+        state[STATE_PADDLE_RIGHT_Y] = self.paddle_right_y
+        state[STATE_SCORE_LEFT] = self.score_left
+        state[STATE_SCORE_RIGHT] = self.score_right
+
+    def update(self, left_move=None, right_move=None):
+        """Updates game state for one frame based on player moves.
+
+        This is the dictionary interface on top of step().
+
+        Args:
+            left_move: Movement command for left paddle ("UP", "DOWN", or None).
+            right_move: Movement command for right paddle ("UP", "DOWN", or None).
+
+        Returns:
+            dict or None: Dictionary containing game state and event data if an
+                event occurred (scoring, paddle hit, game over), None otherwise.
+                Event dict may contain keys: "scored", "hit_left", "hit_right",
+                "game_over", contact metrics, plus all state keys from
+                get_state().
+        """
+        return self.event_data(self.step(left_move, right_move))
+
+    def event_data(self, events):
+        """Builds the update() event dictionary for the last step().
+
+        Args:
+            events: Bitmask returned by the last call to step().
+
+        Returns:
+            dict or None: Event dictionary in the update() format, or None if
+                no hit, score or game over occurred.
+        """
+        score_data = None
+        if events & EVENT_SCORED:
+            score_data = self.get_state()
+            # The dict reports the ball where the point was won
+            (score_data["ball_x"], score_data["ball_y"],
+             score_data["ball_vel_x"], score_data["ball_vel_y"]) = self._scored_ball
+            score_data["scored"] = "left" if events & EVENT_SCORE_LEFT else "right"
+
+        if events & EVENT_GAME_OVER:
+            if score_data is None:
+                score_data = self.get_state()
+            score_data["game_over"] = True
+
+        # Return hit events even if no score
+        if score_data is None and events & EVENT_HIT:
+            score_data = {}
+
+        if score_data is not None:
+            score_data["hit_left"] = bool(events & EVENT_HIT_LEFT)
+            score_data["hit_right"] = bool(events & EVENT_HIT_RIGHT)
+            # Add advanced contact metrics if a hit occurred
+            if events & EVENT_HIT:
+                state = self.state
+                score_data["contact_y"] = state[STATE_CONTACT_Y]
+                score_data["ball_vel_x_before"] = state[STATE_CONTACT_VEL_X]
+                score_data["ball_vel_y_before"] = state[STATE_CONTACT_VEL_Y]
+
+        return score_data
+
+    def get_state(self):
+        """Returns the current game state as a dictionary.
+
+        Returns:
+            dict: Dictionary containing ball position/velocity, paddle positions,
+                scores, and game_over flag. Keys: "ball_x", "ball_y", "ball_vel_x",
+                "ball_vel_y", "paddle_left_y", "paddle_right_y", "score_left",
+                "score_right", "game_over".
+        """
+        return {
+            "ball_x": self.ball_x,
+            "ball_y": self.ball_y,
+            "ball_vel_x": self.ball_vel_x,
+            "ball_vel_y": self.ball_vel_y,
+            "paddle_left_y": self.paddle_left_y,
+            "paddle_right_y": self.paddle_right_y,
+            "score_left": self.score_left,
+            "score_right": self.score_right,
+            "game_over": False
+        }
+
+    def snapshot(self, include_rng=False):
+        """Captures the dynamic game state as a compact tuple.
+
+        Args:
+            include_rng: If True, the serve RNG state is appended so that a
+                restored game also replays the same future serves.
+
+        Returns:
+            tuple: ``(ball_x, ball_y, ball_vel_x, ball_vel_y, paddle_left_y,
+                paddle_right_y, score_left, score_right[, rng_state])``.
+        """
+        snap = (self.ball_x, self.ball_y, self.ball_vel_x, self.ball_vel_y,
+                self.paddle_left_y, self.paddle_right_y,
+                self.score_left, self.score_right)
+        if include_rng:
+            snap += (self.rng.getstate(),)
+        return snap
+
+    def restore(self, snap):
+        """Restores a state captured by snapshot().
+
+        Args:
+            snap: Tuple returned by snapshot(). If it carries an RNG state, the
+                serve RNG is rewound too.
+        """
+        (self.ball_x, self.ball_y, self.ball_vel_x, self.ball_vel_y,
+         self.paddle_left_y, self.paddle_right_y,
+         self.score_left, self.score_right) = snap[:8]
+        if len(snap) > 8:
+            self.rng.setstate(snap[8])
+        self.sync_state()
+
+    def clone(self, rng=None):
+        """Returns an independent copy of this game without deep-copying.
+
+        Args:
+            rng: Optional random source for the copy. By default a private
+                ``random.Random`` is copied so both games serve identically
+                but independently; games on the global ``random`` module keep
+                sharing it.
+
+        Returns:
+            PongPhysics: A copy of the same front-end class, without a
+                behavior accumulator.
+        """
+        if rng is None:
+            rng = self.rng
+            if isinstance(rng, random.Random):
+                rng_state = rng.getstate()
+                rng = random.Random()
+                rng.setstate(rng_state)
+
+        cls = type(self)
+        other = cls.__new__(cls)
+        for name in PongPhysics.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.rng = rng
+        other.state = array('d', self.state)
+        other.behavior = None
+        other._init_views()
+        return other
+
+    def _init_views(self):
+        """Hook for front-ends that expose object views of the kernel."""
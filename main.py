@@ -1,6 +1,12 @@
 import patch_neat
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile league tournaments into one pstats file each")
+    args = parser.parse_args()
+
     # Import pygame and other modules only when actually running main
     # This prevents issues when main.py is imported by multiprocessing workers
     import pygame
@@ -29,7 +35,7 @@ def main():
     manager.register_state("train", TrainState(manager))
     manager.register_state("models", ModelState(manager))
     manager.register_state("analytics", AnalyticsState(manager))
-    manager.register_state("league", LeagueState(manager))
+    manager.register_state("league", LeagueState(manager, profile=args.profile))
     manager.register_state("replay", ReplayState(manager))
     manager.register_state("settings", SettingsState(manager))
     
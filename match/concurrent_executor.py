@@ -7,6 +7,7 @@ tournaments and training.
 
 import multiprocessing
 import os
+import random
 import sys
 from functools import partial
 
@@ -40,6 +41,7 @@ def _run_single_match(match_config):
             - neat_config_path: Path to NEAT config
             - record_match: Whether to record the match
             - metadata: Optional match metadata
+            - seed: Optional seed for a reproducible match
     
     Returns:
         Dict with match results (score_left, score_right, stats, match_metadata, error)
@@ -84,7 +86,8 @@ def _run_single_match(match_config):
             p1_name=os.path.basename(p1_path),
             p2_name=os.path.basename(p2_path),
             record_match=record_match,
-            metadata=metadata
+            metadata=metadata,
+            seed=match_config.get("seed")
         )
         
         result = simulator.run()
@@ -123,14 +126,22 @@ class ConcurrentMatchExecutor:
     Only used when visual_mode is False for maximum performance.
     """
     
-    def __init__(self, max_workers=None, visual_mode=False):
+    def __init__(self, max_workers=None, visual_mode=False, seed=None, profiler=None):
         """Initialize the concurrent executor.
         
         Args:
             max_workers: Maximum number of worker processes. If None, uses CPU count.
             visual_mode: If True, disables concurrent execution (must be sequential for visuals).
+            seed: Optional base seed. When set, every match config without a
+                "seed" gets one drawn from a generator seeded with it, so a
+                batch of matches is reproducible however it is scheduled.
+            profiler: Optional utils.profiling.Profiler. Matches are profiled
+                in this process or in the workers, whose profiles are
+                collected on every dump (or written when the pool closes).
         """
         self.visual_mode = visual_mode
+        self.profiler = profiler
+        self._seed_rng = random.Random(seed) if seed is not None else None
         if visual_mode:
             self.pool = None
             self.max_workers = 0
@@ -146,7 +157,14 @@ class ConcurrentMatchExecutor:
             except RuntimeError:
                 # Start method already set, ignore
                 pass
-            self.pool = multiprocessing.Pool(processes=self.max_workers)
+            if profiler:
+                from utils.profiling import init_worker
+                profile_args = profiler.worker_args(self.max_workers)
+                self.pool = multiprocessing.Pool(processes=self.max_workers, initializer=init_worker,
+                                                 initargs=profile_args)
+                profiler.attach(self.pool, profile_args)
+            else:
+                self.pool = multiprocessing.Pool(processes=self.max_workers)
     
     def execute_matches(self, match_configs):
         """Execute multiple matches concurrently.
@@ -157,6 +175,13 @@ class ConcurrentMatchExecutor:
         Returns:
             List of match results in the same order as match_configs
         """
+        match_configs = [self._with_seed(config) for config in match_configs]
+        if self.profiler:
+            with self.profiler.profiling():
+                return self._execute(match_configs)
+        return self._execute(match_configs)
+
+    def _execute(self, match_configs):
         if self.visual_mode or not self.pool:
             # Sequential execution for visual mode
             return [_run_single_match(config) for config in match_configs]
@@ -174,11 +199,19 @@ class ConcurrentMatchExecutor:
         Returns:
             Match result dict
         """
-        return _run_single_match(match_config)
+        return _run_single_match(self._with_seed(match_config))
+    
+    def _with_seed(self, match_config):
+        """Returns match_config with a derived seed if the executor is seeded."""
+        if self._seed_rng is None or match_config.get("seed") is not None:
+            return match_config
+        return dict(match_config, seed=self._seed_rng.getrandbits(32))
     
     def close(self):
         """Close the process pool."""
         if self.pool:
+            if self.profiler:
+                self.profiler.detach(self.pool)
             self.pool.close()
             self.pool.join()
             self.pool = None
@@ -6,25 +6,104 @@ match orchestration (MatchSimulator) and analysis (MatchAnalyzer).
 
 from core import config
 from core import simulator as game_simulator
+from core.early_stop import DEFAULT_POLICY
 
 
 class GameRunner:
     """Runs a game loop between two agents. Single responsibility: game execution."""
     
-    def __init__(self, agent1, agent2, game=None):
-        """Initialize with two agents and optional game instance."""
+    def __init__(self, agent1, agent2, game=None, fast_forward=False, decision_interval=None,
+                 early_stop=None):
+        """Initialize with two agents and optional game instance.
+        
+        With ``fast_forward`` enabled and two frame-skippable agents (see
+        NeatAgent.reaction_distance), stretches where both agents stay still
+        are advanced with GameSimulator.fast_forward instead of frame by
+        frame. Scores and hits are identical; callbacks disable skipping
+        because they need every frame.
+        
+        Agents are asked for a move every ``decision_interval`` frames (default
+        config.DECISION_INTERVAL) and their last move is repeated in between.
+        An agent with its own ``decision_interval`` attribute (e.g.
+        RuleBasedAgent) overrides the runner's interval. Fast-forwarding is
+        only used when both agents decide every frame.
+        
+        ``early_stop`` (default core.early_stop.DEFAULT_POLICY) ends
+        run_to_completion once the match is decided; ``frames_saved`` holds
+        the frame budget it left unused.
+        """
         self.agent1 = agent1
         self.agent2 = agent2
         self.game = game if game is not None else game_simulator.GameSimulator()
         self.frame_count = 0
         self.max_frames = config.MAX_SCORE * 1000  # Safety limit
+        self.early_stop = early_stop or DEFAULT_POLICY
+        self.frames_saved = 0
+        
+        default_interval = decision_interval or config.DECISION_INTERVAL
+        self.decision_intervals = (getattr(agent1, "decision_interval", None) or default_interval,
+                                   getattr(agent2, "decision_interval", None) or default_interval)
+        self.decisions = 0  # Number of agent move queries
+        self._left_move = None
+        self._right_move = None
+        
+        # Agents that can read the flat state buffer skip the per-frame dict
+        self.use_buffer = hasattr(self.game, "step")
+        self.agents_use_buffer = (self.use_buffer and
+                                  hasattr(agent1, "get_move_from_buffer") and
+                                  hasattr(agent2, "get_move_from_buffer"))
+        self.fast_forward = (fast_forward and self.agents_use_buffer and
+                             hasattr(self.game, "fast_forward") and
+                             getattr(agent1, "frame_skippable", False) and
+                             getattr(agent2, "frame_skippable", False) and
+                             self.decision_intervals == (1, 1))
     
-    def run_frame(self, state_callback=None, analyzer_callback=None, recorder_callback=None):
-        """Run a single frame. Returns (score_left, score_right, game_over, event_data)."""
+    def _idle_window(self):
+        """Returns the ball X interval in which both agents stay still, or None."""
+        buffer = self.game.state
+        ball_x = buffer[game_simulator.STATE_BALL_X]
+        ball_vel_x = buffer[game_simulator.STATE_BALL_VEL_X]
+        left = self.agent1.idle_window(ball_x, ball_vel_x, "left")
+        right = self.agent2.idle_window(ball_x, ball_vel_x, "right")
+        if left is None or right is None:
+            return None
+        x_min = max(left[0], right[0])
+        x_max = min(left[1], right[1])
+        if not x_min < ball_x < x_max:
+            return None
+        return (x_min, x_max)
+    
+    def run_frame(self, state_callback=None, analyzer_callback=None, recorder_callback=None,
+                  frame_limit=None):
+        """Run a single frame. Returns (score_left, score_right, game_over, event_data).
+        
+        When fast-forwarding, one call may advance several idle frames (never
+        past ``frame_limit`` or max_frames); event_data then describes the
+        last of them.
+        """
         self.frame_count += 1
         
-        # Get current state
-        state = self.game.get_state()
+        if self.fast_forward and not (state_callback or analyzer_callback or recorder_callback):
+            window = self._idle_window()
+            if window is not None:
+                limit = min(frame_limit or self.max_frames, self.max_frames)
+                frames, events = self.game.fast_forward(None, None, limit - self.frame_count + 1, *window)
+                if frames:
+                    self.frame_count += frames - 1
+                    event_data = self.game.event_data(events) if events else None
+                    return self._frame_result(event_data)
+        
+        # Agents only decide on their decision frames
+        frame = self.frame_count - 1
+        left_interval, right_interval = self.decision_intervals
+        left_decides = frame % left_interval == 0
+        right_decides = frame % right_interval == 0
+        
+        # The state dict is only built when something consumes it
+        state = None
+        if (state_callback or analyzer_callback or recorder_callback or
+                (not self.agents_use_buffer and (left_decides or right_decides))):
+            state = self.game.get_state()
         
         # Callbacks for analysis/recording (batched)
         if state_callback:
@@ -34,13 +113,31 @@ class GameRunner:
         if recorder_callback:
             recorder_callback(state)
         
-        # Get agent moves
-        left_move = self.agent1.get_move(state, "left")
-        right_move = self.agent2.get_move(state, "right")
+        # Get agent moves (repeating the last move between decisions)
+        if self.agents_use_buffer:
+            buffer = self.game.state
+            if left_decides:
+                self._left_move = self.agent1.get_move_from_buffer(buffer, "left")
+            if right_decides:
+                self._right_move = self.agent2.get_move_from_buffer(buffer, "right")
+        else:
+            if left_decides:
+                self._left_move = self.agent1.get_move(state, "left")
+            if right_decides:
+                self._right_move = self.agent2.get_move(state, "right")
+        self.decisions += left_decides + right_decides
+        left_move, right_move = self._left_move, self._right_move
         
         # Update game
-        event_data = self.game.update(left_move, right_move)
+        if self.use_buffer:
+            events = self.game.step(left_move, right_move)
+            event_data = self.game.event_data(events) if events else None
+        else:
+            event_data = self.game.update(left_move, right_move)
         
+        return self._frame_result(event_data)
+    
+    def _frame_result(self, event_data):
         # Check end conditions
         game_over = (self.game.score_left >= config.MAX_SCORE or 
                     self.game.score_right >= config.MAX_SCORE or
@@ -52,25 +149,29 @@ class GameRunner:
         """Run game until completion. Returns final scores.
         
         Optimizations:
-        - Early termination for obvious outcomes
+        - Early termination once the early-stop policy finds the match decided
         - Batched callbacks to reduce overhead
         """
         target_score = config.MAX_SCORE
         max_frames = target_score * 1000  # Safety limit
+        early_stop = self.early_stop
         
         while self.frame_count < max_frames:
+            if early_stop.match_decided(self.game, max_frames - self.frame_count, target_score):
+                self.frames_saved = max_frames - self.frame_count
+                break
+            # Fast-forward must not skip past the frame the budget decides the match
+            frame_limit = max_frames
+            decision_frame = early_stop.decision_frame(self.game, max_frames)
+            if decision_frame is not None:
+                frame_limit = max(self.frame_count + 1, decision_frame)
             score_left, score_right, game_over, event_data = self.run_frame(
-                state_callback, analyzer_callback, recorder_callback
+                state_callback, analyzer_callback, recorder_callback, frame_limit
             )
             
             if game_over:
                 break
-            
-            # Early termination: if one player is far ahead with little time left
-            score_diff = abs(score_left - score_right)
-            if score_diff >= target_score - 1 and self.frame_count > target_score * 500:
-                # One player needs 1 more point and we're past halfway
-                break
         
+        early_stop.record(self.frames_saved)
         return (self.game.score_left, self.game.score_right)
 
@@ -67,7 +67,8 @@ def _run_fast_match(match_config, record_match=False):
             p1_name=os.path.basename(p1_path), 
             p2_name=os.path.basename(p2_path),
             record_match=record_match,
-            metadata=metadata
+            metadata=metadata,
+            seed=match_config.get("seed")
         )
         
         return simulator.run()
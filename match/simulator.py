@@ -8,7 +8,9 @@ import os
 class MatchSimulator:
     """Orchestrates a match between two agents. Single responsibility: match coordination."""
     
-    def __init__(self, agent1, agent2, p1_name="Player 1", p2_name="Player 2", record_match=False, metadata=None):
+    def __init__(self, agent1, agent2, p1_name="Player 1", p2_name="Player 2", record_match=False, metadata=None,
+                 seed=None):
+        """seed makes the match reproducible (serve directions use a private RNG)."""
         self.agent1 = agent1
         self.agent2 = agent2
         self.analyzer = MatchAnalyzer()
@@ -20,7 +22,7 @@ class MatchSimulator:
         ) if record_match else None
         
         # Use GameRunner for execution (SRP: separated concerns)
-        self.runner = GameRunner(agent1, agent2)
+        self.runner = GameRunner(agent1, agent2, game=game_simulator.GameSimulator(seed=seed))
             
     def run(self):
         """
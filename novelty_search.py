@@ -1,47 +1,236 @@
 """Novelty Search implementation for PyPongAI.
 
 This module implements behavioral novelty tracking to encourage diverse AI strategies.
-The behavioral characteristic (BC) used is the average Y-coordinate of ball-paddle contacts.
+The behavioral characteristic (BC) of a genome is the fixed-length vector built
+by ``core.behavior.behavior_vector``: contact-Y and ready-zone histograms, mean
+contact Y, mean travel between hits and rally length.
 """
 
+import bisect
+import os
+
 import numpy as np
 
 
+# Header fields of a persistent archive: next slot, entries, BC dimensions
+# (0 for scalar BCs) and a version bumped by every write
+_HEADER_FIELDS = 4
+
+
+def _header_path(path):
+    return os.path.splitext(path)[0] + "_header.npy"
+
+
 class NoveltyArchive:
     """Stores and analyzes behavioral characteristics of successful genomes.
     
     The archive maintains a collection of behavioral characteristics (BCs) from
     past genomes to calculate novelty scores. This encourages exploration of
     diverse strategies rather than converging to a single optimal approach.
+
+    BCs are kept in a NumPy ring buffer, so the oldest entry is overwritten
+    in place once the archive is full. Vector BCs (training stores
+    ``core.behavior.behavior_vector`` outputs) use Euclidean distances and
+    ``np.partition``. Scalar BCs are also kept in a sorted index: the k
+    nearest neighbours of a query lie within k positions of its insertion
+    point, found by bisection.
+
+    With a ``path`` the ring buffer is a memory-mapped ``.npy`` file, next
+    to a small ``<name>_header.npy`` file, so a new run starts from the
+    behaviors of earlier runs. One process (the training coordinator)
+    writes; any number of others may open the same file with
+    ``readonly=True`` and see each write on their next query. Readers must
+    reopen the archive if the writer replaces it with BCs of another
+    dimensionality.
     
     Attributes:
-        archive: List of behavioral characteristics (average contact Y positions).
+        archive: List of behavioral characteristics, oldest first (floats
+            for scalar BCs, lists for vector BCs). Assigning a list replaces
+            the contents.
         max_size: Maximum number of BCs to store (FIFO when exceeded).
         k_nearest: Number of nearest neighbors to use for novelty calculation.
+        path: File of a persistent archive, or None.
+        readonly: Whether this process only reads the persistent archive.
     """
     
-    def __init__(self, max_size=500, k_nearest=15):
+    def __init__(self, max_size=500, k_nearest=15, path=None, readonly=False, dims=None):
         """Initializes the novelty archive.
         
         Args:
             max_size: Maximum archive size. Oldest entries removed when exceeded.
+                An existing persistent archive keeps its own size.
             k_nearest: Number of nearest neighbors for novelty calculation.
+            path: Optional ``.npy`` file to keep the archive in. Its BCs are
+                loaded if it exists.
+            readonly: Map an existing archive file without writing to it.
+            dims: Expected length of vector BCs, or None to accept whatever
+                is stored first. Stored or restored BCs of another
+                dimensionality (e.g. scalar BCs saved by an older version)
+                are discarded with a warning, so the archive starts empty.
+
+        Raises:
+            ValueError: If a read-only archive file holds BCs of another
+                dimensionality than ``dims``.
         """
-        self.archive = []
         self.max_size = max_size
+        self.dims = dims
         self.k_nearest = k_nearest
+        self.path = path
+        self.readonly = readonly
+        self._values = None  # (max_size, dims) ring buffer, allocated on the first BC
+        self._header = None
+        self._version = 0
+        self._clear()
+        if path is not None and os.path.exists(path):
+            self._map()
+
+    def _clear(self):
+        self._dims = None  # None for scalar BCs
+        self._next = 0
+        self._count = 0
+        self._sorted = []  # Scalar BCs in ascending order
+        self._sorted_array = None
+
+    def _allocate(self, dims):
+        """Creates the ring buffer (and its files, for a persistent archive)."""
+        shape = (self.max_size, dims or 1)
+        if self.path is None:
+            self._values = np.empty(shape)
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._values = np.lib.format.open_memmap(self.path, mode="w+", dtype=np.float64, shape=shape)
+        self._header = np.lib.format.open_memmap(_header_path(self.path), mode="w+", dtype=np.int64,
+                                                 shape=(_HEADER_FIELDS,))
+
+    def _map(self):
+        """Maps an existing archive file and loads its header."""
+        mode = "r" if self.readonly else "r+"
+        self._header = np.lib.format.open_memmap(_header_path(self.path), mode=mode)
+        self._values = np.lib.format.open_memmap(self.path, mode=mode)
+        self.max_size = len(self._values)
+        self._load_header()
+        if not self._accepts(self._dims, self._count):
+            if self.readonly:
+                raise ValueError(f"Novelty archive {self.path} holds {self._dims or 'scalar'} behavior "
+                                 f"characteristics, expected {self.dims}")
+            self._discard(self._count, self._dims)
+            self._clear()
+            self._write_header()
+
+    def _accepts(self, dims, count):
+        """Returns whether ``count`` BCs of ``dims`` dimensions fit the expected ``dims``."""
+        return self.dims is None or count == 0 or dims == self.dims
+
+    def _discard(self, count, dims):
+        """Warns that ``count`` stored BCs of ``dims`` dimensions are dropped."""
+        where = f" in {self.path}" if self.path else ""
+        print(f"[Novelty] Discarding {count} {dims or 'scalar'} behavior characteristics{where} "
+              f"(expected {self.dims}); the archive starts empty")
+
+    def _load_header(self):
+        next_slot, count, dims, self._version = (int(field) for field in self._header)
+        self._next, self._count, self._dims = next_slot, count, dims or None
+        self._sorted = sorted(self._values[:count, 0].tolist()) if self._dims is None else []
+        self._sorted_array = None
+
+    def _refresh(self):
+        """Picks up the writer's changes in a read-only archive."""
+        if not self.readonly or self.path is None:
+            return
+        if self._header is None:
+            if os.path.exists(_header_path(self.path)):
+                self._map()
+        elif int(self._header[-1]) != self._version:
+            self._load_header()
+
+    @property
+    def archive(self):
+        self._refresh()
+        if self._count == 0:
+            return []
+        if self._count < self.max_size:
+            values = self._values[:self._count]
+        else:
+            values = np.concatenate((self._values[self._next:], self._values[:self._next]))
+        if self._dims is None:
+            return values[:, 0].tolist()
+        return values.tolist()
+
+    @archive.setter
+    def archive(self, bcs):
+        self._check_writable()
+        self._clear()
+        self._write_header()
+        dims = len(bcs[0]) if len(bcs) and np.ndim(bcs[0]) else None
+        if not self._accepts(dims, len(bcs)):
+            self._discard(len(bcs), dims)
+            return
+        self.add_many(bcs)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise RuntimeError(f"Novelty archive {self.path} is open read-only")
+
+    def _write_header(self):
+        if self._header is not None:
+            self._version += 1
+            self._values.flush()
+            self._header[:] = (self._next, self._count, self._dims or 0, self._version)
+            self._header.flush()
+
+    def _as_rows(self, bcs, store=False):
+        """Returns BCs as a (n, dims) float array.
+
+        The first BCs stored fix the archive's dimensionality.
+
+        Raises:
+            ValueError: If the BCs do not match the archive's dimensionality.
+        """
+        rows = np.asarray(bcs, dtype=float)
+        dims = None if rows.ndim == 1 else rows.shape[1]
+        if self._count == 0:
+            if not store:
+                return rows.reshape(len(rows), -1)
+            if self._values is None or dims != self._dims:
+                self._allocate(dims)
+            self._dims = dims
+        elif dims != self._dims:
+            raise ValueError(f"Expected {self._dims or 'scalar'} behavior characteristics, "
+                             f"got {dims or 'scalar'}")
+        return rows.reshape(len(rows), -1)
     
     def add_bc(self, bc_value):
         """Adds a behavioral characteristic to the archive.
         
         Args:
-            bc_value: The BC value to add (average contact Y-coordinate).
+            bc_value: The BC to add: a ``core.behavior.behavior_vector``
+                (or any sequence of floats), or a scalar.
         """
-        self.archive.append(bc_value)
-        
-        # Maintain max size (FIFO)
-        if len(self.archive) > self.max_size:
-            self.archive.pop(0)
+        self.add_many([bc_value])
+
+    def add_many(self, bcs):
+        """Adds several behavioral characteristics, in order.
+
+        Args:
+            bcs: Sequence of BC values (all scalars or all same-length vectors).
+        """
+        self._check_writable()
+        if len(bcs) == 0:
+            return
+        rows = self._as_rows(bcs, store=True)
+        for row in rows[-self.max_size:] if self.max_size else ():
+            if self._dims is None:
+                value = float(row[0])
+                if self._count == self.max_size:
+                    # Maintain max size (FIFO)
+                    oldest = float(self._values[self._next, 0])
+                    del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+                bisect.insort(self._sorted, value)
+            self._values[self._next] = row
+            self._next = (self._next + 1) % self.max_size
+            self._count = min(self._count + 1, self.max_size)
+        self._sorted_array = None
+        self._write_header()
     
     def calculate_novelty(self, bc_value):
         """Calculates the novelty score for a given BC.
@@ -56,19 +245,48 @@ class NoveltyArchive:
             float: Novelty score (average distance to k-nearest neighbors).
                 Returns 0.0 if archive is too small.
         """
-        if len(self.archive) < self.k_nearest:
+        return self.calculate_novelty_many([bc_value])[0]
+
+    def calculate_novelty_many(self, bcs):
+        """Calculates the novelty scores of several BCs against the archive.
+
+        Every BC is scored against the archive as it is; none of them is
+        added (see add_many).
+
+        Args:
+            bcs: Sequence of BC values.
+
+        Returns:
+            list: One novelty score per BC (all 0.0 if the archive is too small).
+        """
+        self._refresh()
+        k = self.k_nearest
+        if len(bcs) == 0:
+            return []
+        rows = self._as_rows(bcs)
+        if self._count < k or k <= 0:
             # Not enough archive data yet, return default novelty
-            return 0.0
-        
-        # Calculate distances to all archive entries
-        distances = [abs(bc_value - archive_bc) for archive_bc in self.archive]
-        
-        # Sort and get k-nearest distances
-        distances.sort()
-        k_nearest_distances = distances[:self.k_nearest]
-        
-        # Return average distance (novelty score)
-        return np.mean(k_nearest_distances)
+            return [0.0] * len(bcs)
+
+        if self._dims is None:
+            if self._sorted_array is None:
+                self._sorted_array = np.array(self._sorted)
+            archive = self._sorted_array
+            queries = rows[:, 0]
+            # The k nearest lie among the k entries on either side of the insertion point
+            offsets = np.arange(-k, k)
+            window = np.searchsorted(archive, queries)[:, None] + offsets
+            inside = (window >= 0) & (window < len(archive))
+            distances = np.abs(archive[np.clip(window, 0, len(archive) - 1)] - queries[:, None])
+            distances[~inside] = np.inf
+        else:
+            archive = self._values[:self._count]
+            distances = np.sqrt(((rows[:, None, :] - archive[None, :, :]) ** 2).sum(axis=2))
+
+        if distances.shape[1] > k:
+            distances = np.partition(distances, k - 1, axis=1)[:, :k]
+        # Sorted, so the mean sums the neighbours in the same order for every path
+        return np.mean(np.sort(distances, axis=1), axis=1).tolist()
     
     def get_archive_size(self):
         """Returns the current size of the archive.
@@ -76,28 +294,5 @@ class NoveltyArchive:
         Returns:
             int: Number of BCs currently stored.
         """
-        return len(self.archive)
-
-
-def calculate_bc_from_contacts(contact_metrics_list):
-    """Calculates behavioral characteristic from contact data.
-    
-    The BC is defined as the average Y-coordinate of all ball-paddle contacts.
-    This represents where the genome tends to make contact with the ball.
-    
-    Args:
-        contact_metrics_list: List of dictionaries containing contact_y values.
-    
-    Returns:
-        float: Average contact Y-coordinate, or None if no contacts occurred.
-    """
-    contact_y_values = []
-    
-    for metrics in contact_metrics_list:
-        if "contact_y" in metrics:
-            contact_y_values.append(metrics["contact_y"])
-    
-    if len(contact_y_values) == 0:
-        return None  # No contacts, can't calculate BC
-    
-    return np.mean(contact_y_values)
+        self._refresh()
+        return self._count
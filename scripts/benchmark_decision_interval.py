@@ -0,0 +1,111 @@
+"""Benchmark agent decision intervals against the rule-based opponent.
+
+Plays seeded points between NEAT agents and the rule-based AI with the
+network deciding every k frames, and reports win rate, network activations
+per frame and wall time for each k.
+
+Usage:
+    python scripts/benchmark_decision_interval.py [model.pkl ...]
+        [--intervals 1 2 4] [--points 200] [--generations 10]
+
+Without model paths, a population is first evolved against the rule-based AI
+(eval_genomes, decision interval 1) and its best genome is benchmarked.
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import config
+from core import simulator as game_simulator
+from ai import ai_module
+from ai.agent_factory import NeatAgent
+from ai.opponents import RuleBasedAgent
+from match.game_runner import GameRunner
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           config.NEAT_CONFIG_PATH)
+
+
+def load_config():
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                       CONFIG_PATH)
+
+
+def evolve_genome(config_neat, generations):
+    """Evolves a population against the rule-based AI and returns the best genome."""
+    population = neat.Population(config_neat)
+    return population.run(ai_module.eval_genomes, generations)
+
+
+def play_points(genome, config_neat, interval, points, max_frames=5000):
+    """Plays seeded first-to-one-point games with the genome on the left.
+
+    Returns:
+        dict: "win_rate", "hits_per_point" (left paddle returns),
+            "activations_per_frame", "frames" and "seconds".
+    """
+    wins = 0
+    hits = 0
+    frames = 0
+    decisions = 0
+    start = time.perf_counter()
+    for seed in range(points):
+        agent = NeatAgent(neat.nn.FeedForwardNetwork.create(genome, config_neat))
+        runner = GameRunner(agent, RuleBasedAgent(), game=game_simulator.GameSimulator(seed=seed),
+                            decision_interval=interval)
+        while runner.frame_count < max_frames:
+            event_data = runner.run_frame()[3]
+            if event_data and event_data["hit_left"]:
+                hits += 1
+            if runner.game.score_left or runner.game.score_right:
+                break
+        wins += runner.game.score_left
+        frames += runner.frame_count
+        # The rule-based side decides every frame; count network activations only
+        decisions += runner.decisions - runner.frame_count
+    seconds = time.perf_counter() - start
+    return {
+        "win_rate": wins / points,
+        "hits_per_point": hits / points,
+        "activations_per_frame": decisions / frames if frames else 0.0,
+        "frames": frames,
+        "seconds": seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("models", nargs="*", help="Pickled genomes to benchmark")
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--generations", type=int, default=10)
+    args = parser.parse_args()
+
+    config_neat = load_config()
+    genomes = []
+    for path in args.models:
+        with open(path, "rb") as f:
+            genomes.append((os.path.basename(path), pickle.load(f)))
+    if not genomes:
+        print(f"No models given, evolving for {args.generations} generations...")
+        genomes.append(("evolved", evolve_genome(config_neat, args.generations)))
+
+    print(f"{'model':<24}{'k':>4}{'win rate':>10}{'hits/pt':>9}{'act/frame':>11}{'frames':>9}{'sec':>8}")
+    for name, genome in genomes:
+        for interval in args.intervals:
+            result = play_points(genome, config_neat, interval, args.points)
+            print(f"{name[:23]:<24}{interval:>4}{result['win_rate']:>10.3f}{result['hits_per_point']:>9.2f}"
+                  f"{result['activations_per_frame']:>11.3f}{result['frames']:>9}"
+                  f"{result['seconds']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
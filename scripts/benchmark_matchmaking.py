@@ -0,0 +1,171 @@
+"""Benchmark random versus Swiss pairing for competitive evaluation.
+
+Plays a double round robin between random genomes to get a reference
+ranking (match points), or with --outcomes synthetic draws match results
+from hidden ELO strengths (the reference ranking), then runs random rounds
+(ai_module.schedule_competitive_rounds) and Swiss rounds
+(ai.matchmaking.SwissScheduler) from fresh ELO ratings and reports, after
+each round, the matches played so far and the Spearman rank correlation of
+the ELO ratings with the reference ranking, averaged over several trials.
+
+Usage:
+    python scripts/benchmark_matchmaking.py [--size 32] [--rounds 10]
+        [--trials 5] [--seed 0] [--outcomes genomes|synthetic] [--spread 200]
+
+Freshly initialized genomes differ little in skill, so their first-point
+matches are mostly decided by the serve and every schedule correlates weakly
+with the reference; the synthetic outcomes show the schedules' difference on
+a population with a known spread of strengths.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import config
+from ai import ai_module
+from ai.concurrent_training import _create_network, _play_training_match
+from ai.matchmaking import SwissScheduler, swiss_rounds
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           config.NEAT_CONFIG_PATH)
+
+
+def rank(values):
+    """Returns the ranks of values, averaging ties."""
+    values = np.asarray(values, dtype=float)
+    order = values.argsort(kind="stable")
+    ranks = np.empty(len(values))
+    ranks[order] = np.arange(len(values))
+    for value in np.unique(values):
+        tied = values == value
+        ranks[tied] = ranks[tied].mean()
+    return ranks
+
+
+def spearman(a, b):
+    """Returns the Spearman rank correlation of two sequences."""
+    ra, rb = rank(a), rank(b)
+    if ra.std() == 0 or rb.std() == 0:
+        return 0.0
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+class Arena:
+    """Plays matches between fixed networks."""
+
+    def __init__(self, genomes, config_neat):
+        self.networks = {genome_id: _create_network(genome, config_neat) for genome_id, genome in genomes}
+
+    def play(self, left_id, right_id, seed):
+        net_left, net_right = self.networks[left_id], self.networks[right_id]
+        if left_id == right_id:
+            return 0.5
+        net_left.reset()
+        net_right.reset()
+        return _play_training_match(net_left, net_right, seed=seed)["match_result"]
+
+
+class SyntheticArena:
+    """Draws match results from hidden ELO strengths."""
+
+    def __init__(self, strengths):
+        self.strengths = strengths
+
+    def play(self, left_id, right_id, seed):
+        expected = ai_module.calculate_expected_score(self.strengths[left_id], self.strengths[right_id])
+        return 1.0 if random.Random(seed).random() < expected else 0.0
+
+
+def reference_ranking(arena, genome_ids, seed):
+    """Match points of a double round robin (each pair plays both sides)."""
+    rng = random.Random(seed)
+    points = dict.fromkeys(genome_ids, 0.0)
+    for left_id in genome_ids:
+        for right_id in genome_ids:
+            if left_id != right_id:
+                result = arena.play(left_id, right_id, rng.getrandbits(32))
+                points[left_id] += result
+                points[right_id] += 1.0 - result
+    return [points[genome_id] for genome_id in genome_ids]
+
+
+def run_schedule(arena, genome_ids, scheduler, num_rounds, reference, seed):
+    """Returns [(matches, correlation)] after each round of one trial."""
+    rng = random.Random(seed)
+    ratings = dict.fromkeys(genome_ids, float(config.ELO_INITIAL_RATING))
+    if scheduler == "swiss":
+        swiss = SwissScheduler(genome_ids, rng)
+        next_round = lambda: swiss.next_round(ratings)
+    else:
+        rounds = iter(ai_module.schedule_competitive_rounds(genome_ids, num_rounds, rng))
+        next_round = lambda: next(rounds)
+
+    matches = 0
+    curve = []
+    for _ in range(num_rounds):
+        for left_id, right_id in next_round():
+            result = arena.play(left_id, right_id, rng.getrandbits(32))
+            expected = ai_module.calculate_expected_score(ratings[left_id], ratings[right_id])
+            ratings[left_id] = ai_module.calculate_new_rating(ratings[left_id], expected, result,
+                                                              config.ELO_K_FACTOR)
+            ratings[right_id] = ai_module.calculate_new_rating(ratings[right_id], 1.0 - expected,
+                                                               1.0 - result, config.ELO_K_FACTOR)
+            matches += 1
+        curve.append((matches, spearman([ratings[genome_id] for genome_id in genome_ids], reference)))
+    return curve
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--outcomes", choices=("genomes", "synthetic"), default="genomes")
+    parser.add_argument("--spread", type=float, default=200,
+                        help="Standard deviation of the synthetic strengths (ELO points)")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if args.outcomes == "synthetic":
+        genome_ids = list(range(args.size))
+        reference = [random.gauss(0.0, args.spread) for _ in genome_ids]
+        arena = SyntheticArena(reference)
+        print(f"Reference: hidden strengths of {args.size} players, spread {args.spread:g}")
+    else:
+        config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                  neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                  CONFIG_PATH)
+        config_neat.pop_size = args.size
+        genomes = list(neat.Population(config_neat).population.items())
+        genome_ids = [genome_id for genome_id, _ in genomes]
+        arena = Arena(genomes, config_neat)
+        reference = reference_ranking(arena, genome_ids, args.seed)
+        print(f"Reference: double round robin of {args.size} genomes, "
+              f"{args.size * (args.size - 1)} matches")
+
+    curves = {}
+    for scheduler in ("random", "swiss"):
+        trials = [run_schedule(arena, genome_ids, scheduler, args.rounds, reference, args.seed + trial)
+                  for trial in range(args.trials)]
+        curves[scheduler] = [(trials[0][i][0], np.mean([curve[i][1] for curve in trials]))
+                             for i in range(args.rounds)]
+
+    print(f"Spearman correlation with the reference, mean of {args.trials} trials "
+          f"(default Swiss rounds: {swiss_rounds(args.size)})")
+    print(f"{'round':>6}{'random matches':>16}{'random rho':>12}{'swiss matches':>15}{'swiss rho':>11}")
+    for i in range(args.rounds):
+        (random_matches, random_rho), (swiss_matches, swiss_rho) = curves["random"][i], curves["swiss"][i]
+        print(f"{i + 1:>6}{random_matches:>16}{random_rho:>12.3f}{swiss_matches:>15}{swiss_rho:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark parallel training evaluators against their serial loops.
+
+Evaluates one generation of random genomes with the serial evaluator and
+its parallel counterpart for each population size, and reports matches
+played, wall time and speedup:
+
+    competitive: eval_genomes_competitive vs eval_genomes_competitive_parallel
+    self_play:   eval_genomes_self_play vs eval_genomes_self_play_parallel
+
+Usage:
+    python scripts/benchmark_parallel_competitive.py [--evaluator competitive]
+        [--sizes 50 150 500] [--workers N] [--seed 0]
+"""
+
+import argparse
+import copy
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import config
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           config.NEAT_CONFIG_PATH)
+
+
+def load_config(pop_size):
+    config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                              neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                              CONFIG_PATH)
+    config_neat.pop_size = pop_size
+    return config_neat
+
+
+def time_serial(evaluator, genomes, config_neat, seed):
+    start = time.perf_counter()
+    if evaluator == "competitive":
+        random.seed(seed)
+        ai_module.eval_genomes_competitive(genomes, config_neat)
+    else:
+        ai_module.eval_genomes_self_play(genomes, config_neat, seed=seed)
+    return time.perf_counter() - start
+
+
+def time_parallel(evaluator, genomes, config_neat, executor, seed):
+    start = time.perf_counter()
+    if evaluator == "competitive":
+        ai_module.eval_genomes_competitive_parallel(genomes, config_neat, seed=seed, executor=executor)
+    else:
+        ai_module.eval_genomes_self_play_parallel(genomes, config_neat, seed=seed, executor=executor)
+    return time.perf_counter() - start
+
+
+def match_counts(evaluator, size):
+    """Returns the (serial, parallel) number of matches for a population size."""
+    if evaluator == "competitive":
+        return size * min(5, size - 1), 2 * min(5, size - 1) * (size // 2)
+    return 2 * (size // 2), 2 * (size // 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--evaluator", choices=["competitive", "self_play"], default="competitive")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 150, 500])
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.evaluator}, {args.workers} worker(s)")
+    print(f"{'pop':>6}{'serial matches':>16}{'serial s':>10}{'parallel matches':>18}"
+          f"{'parallel s':>12}{'speedup':>9}")
+    with ConcurrentTrainingExecutor(max_workers=args.workers, config_path=CONFIG_PATH) as executor:
+        # Warm up the pool so worker start-up is not billed to the first size
+        executor.execute_matches([])
+        for size in args.sizes:
+            config_neat = load_config(size)
+            genomes = list(neat.Population(config_neat).population.items())
+            serial = time_serial(args.evaluator, copy.deepcopy(genomes), config_neat, args.seed)
+            parallel = time_parallel(args.evaluator, copy.deepcopy(genomes), config_neat, executor, args.seed)
+            serial_matches, parallel_matches = match_counts(args.evaluator, size)
+            print(f"{size:>6}{serial_matches:>16}{serial:>10.2f}{parallel_matches:>18}"
+                  f"{parallel:>12.2f}{serial / parallel:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
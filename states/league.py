@@ -16,9 +16,10 @@ from match.parallel_engine import ParallelGameEngine
 from match.analyzer import MatchAnalyzer
 from match.concurrent_executor import ConcurrentMatchExecutor
 from ai.agent_factory import AgentFactory
+from utils.profiling import Profiler
 
 class LeagueState(BaseState):
-    def __init__(self, manager):
+    def __init__(self, manager, profile=False):
         super().__init__(manager)
         self.font = pygame.font.Font(None, 50)
         self.small_font = pygame.font.Font(None, 30)
@@ -47,6 +48,10 @@ class LeagueState(BaseState):
         self.use_concurrent = True  # Use concurrent execution when visual mode is off
         self.concurrent_executor = None
         self.batch_size = 10  # Process matches in batches
+
+        # Profile concurrent tournaments into one pstats file each
+        self.profile = profile
+        self.profiler = None
         
         # Dashboard Button
         self.dashboard_button = pygame.Rect(config.SCREEN_WIDTH - 220, config.SCREEN_HEIGHT - 60, 200, 40)
@@ -146,7 +151,8 @@ class LeagueState(BaseState):
         # Initialize concurrent executor if enabled
         if self.use_concurrent and not self.show_visuals:
             try:
-                self.concurrent_executor = ConcurrentMatchExecutor(visual_mode=False)
+                self.profiler = Profiler("tournament") if self.profile else None
+                self.concurrent_executor = ConcurrentMatchExecutor(visual_mode=False, profiler=self.profiler)
                 print(f"Using concurrent execution with {self.concurrent_executor.max_workers} workers")
             except Exception as e:
                 print(f"Failed to initialize concurrent executor: {e}")
@@ -557,6 +563,12 @@ class LeagueState(BaseState):
             self.current_match = None
         
         print(f"Tournament complete! {self.completed_matches} matches played.")
+        if self.profiler:
+            # The workers wrote their profiles when the executor closed
+            path = self.profiler.dump("tournament")
+            self.profiler = None
+            if path:
+                print(f"Tournament profile saved to {path}")
         self.prune_similar_models()
         
         # Final Ranking
@@ -9,7 +9,8 @@ import itertools
 from states.base import BaseState
 from ai.model_manager import get_best_model, get_fitness_from_filename
 import training_logger
-from training.reporters import UIProgressReporter, VisualReporter
+from training.reporters import UIProgressReporter, VisualReporter, TelemetryReporter, telemetry_path
+from training.checkpoint import CheckpointReporter, latest_checkpoint, restore_checkpoint
 
 class TrainState(BaseState):
     def __init__(self, manager):
@@ -23,6 +24,8 @@ class TrainState(BaseState):
         self.mode = "SELECTION" # SELECTION or TRAINING
         self.visual_mode = True # Default to visual
         self.use_best_seed = True # Default to using best model as seed
+        self.fitness = "competitive" # Key in ai_module.FITNESS_FUNCTIONS
+        self.resume = False # Resume from the latest population checkpoint
 
     def enter(self, **kwargs):
         self.mode = "SELECTION"
@@ -52,8 +55,10 @@ class TrainState(BaseState):
         """Get the best model path using the utility function"""
         return get_best_model()
 
-    def start_training(self, seed_genome=None):
+    def start_training(self, seed_genome=None, fitness=None, resume=None):
         self.mode = "TRAINING"
+        resume = self.resume if resume is None else resume
+        fitness_function = ai_module.get_fitness_function(fitness or self.fitness)
         # Render initial loading screen
         self.manager.screen.fill(config.BLACK)
         
@@ -87,19 +92,29 @@ class TrainState(BaseState):
                                   neat.DefaultSpeciesSet, neat.DefaultStagnation,
                                   config_path)
                                   
-        p = neat.Population(config_neat)
-        
-        if seed_genome:
-            print("Seeding population...")
-            target_id = list(p.population.keys())[0]
-            seed_genome.key = target_id
-            p.population[target_id] = seed_genome
-            p.species.speciate(config_neat, p.population, p.generation)
+        if config.NOVELTY_ARCHIVE_PERSIST:
+            ai_module.open_novelty_archive()
+
+        checkpoint_dir = config.POPULATION_CHECKPOINT_DIR
+        generations = 50
+        if resume and latest_checkpoint(checkpoint_dir) is not None:
+            p = restore_checkpoint(checkpoint_dir, config_neat)
+            generations -= p.generation
+            print(f"Resumed from checkpoint at generation {p.generation}")
+        else:
+            p = neat.Population(config_neat)
+            
+            if seed_genome:
+                print("Seeding population...")
+                target_id = list(p.population.keys())[0]
+                seed_genome.key = target_id
+                p.population[target_id] = seed_genome
+                p.species.speciate(config_neat, p.population, p.generation)
             
-            # Fix for node ID collision
-            max_node_id = max(seed_genome.nodes.keys()) if seed_genome.nodes else 0
-            print(f"Updating node indexer to start from {max_node_id + 1}")
-            config_neat.genome_config.node_indexer = itertools.count(max_node_id + 1)
+                # Fix for node ID collision
+                max_node_id = max(seed_genome.nodes.keys()) if seed_genome.nodes else 0
+                print(f"Updating node indexer to start from {max_node_id + 1}")
+                config_neat.genome_config.node_indexer = itertools.count(max_node_id + 1)
             
         p.add_reporter(neat.StdOutReporter(True))
         p.add_reporter(neat.StatisticsReporter())
@@ -109,7 +124,13 @@ class TrainState(BaseState):
         else:
             p.add_reporter(UIProgressReporter(self.manager.screen, logger=logger))
         
-        winner = p.run(ai_module.eval_genomes_competitive, 50)
+        checkpointer = CheckpointReporter(p, checkpoint_dir)
+        p.add_reporter(checkpointer)
+        p.add_reporter(TelemetryReporter(ai_module.TELEMETRY, telemetry_path(logger.log_file)))
+        try:
+            winner = p.run(fitness_function, max(0, generations))
+        finally:
+            checkpointer.close()
         
         with open(os.path.join(config.MODEL_DIR, "visual_winner.pkl"), "wb") as f:
             pickle.dump(winner, f)
@@ -0,0 +1,167 @@
+"""Unit tests for background validation during training.
+
+Tests verify that headless validation matches the pygame-backed game, that
+BackgroundValidator returns results per generation, and that the reporters
+attach late results to the right CSV rows without blocking.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from training.reporters import CSVReporter, ValidationReporter
+from validation import BackgroundValidator, validate_genome
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class FakeValidator:
+    """Validator stand-in whose results are released by the test."""
+
+    def __init__(self):
+        self.results = {}
+        self.submitted = []
+        self.finished = {}
+
+    def submit(self, generation, genome):
+        self.submitted.append(generation)
+
+    def finish(self, generation, result):
+        self.finished[generation] = result
+
+    def poll(self):
+        self.results.update(self.finished)
+        return dict(self.finished)
+
+    drain = poll
+
+
+class DummyGenome:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+class TestHeadlessValidation(unittest.TestCase):
+    """Tests for validate_genome(headless=True) and BackgroundValidator."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.values())[:3]
+
+    def test_headless_matches_engine(self):
+        """Test the headless simulator validates exactly like core.engine.Game."""
+        for genome in self.genomes:
+            random.seed(1)
+            engine = validate_genome(genome, self.config_neat, record_matches=False)
+            random.seed(1)
+            headless = validate_genome(genome, self.config_neat, record_matches=False, headless=True)
+            self.assertEqual(engine, headless)
+
+    def test_background_validator(self):
+        """Test results come back per generation and resubmission is ignored."""
+        validator = BackgroundValidator(self.config_neat, record_matches=False)
+        try:
+            for generation, genome in enumerate(self.genomes):
+                validator.submit(generation, genome)
+            validator.submit(0, self.genomes[1])
+            finished = validator.drain()
+            self.assertEqual(set(finished), {0, 1, 2})
+            for avg_rally, win_rate in finished.values():
+                self.assertGreaterEqual(avg_rally, 0)
+                self.assertTrue(0.0 <= win_rate <= 1.0)
+            self.assertEqual(validator.poll(), {})
+        finally:
+            validator.close()
+
+    def test_submit_snapshots_genome(self):
+        """Test changes to a submitted genome do not reach the queued validation."""
+        validator = BackgroundValidator(self.config_neat, record_matches=False)
+        try:
+            genome = DummyGenome(10.0)
+            with mock.patch.object(validator._pool, "apply_async") as apply_async:
+                validator.submit(0, genome)
+            genome.fitness = 99.0
+            queued = apply_async.call_args[0][1][0]
+            self.assertIsNot(queued, genome)
+            self.assertEqual(queued.fitness, 10.0)
+        finally:
+            validator.close()
+
+    def test_failed_validation(self):
+        """Test a validation raising in the worker yields (0, 0) and later ones still arrive."""
+        validator = BackgroundValidator(self.config_neat, record_matches=False)
+        try:
+            # Not a NEAT genome, so building its network fails in the worker
+            validator.submit(0, DummyGenome(10.0))
+            validator.submit(1, self.genomes[0])
+            with mock.patch("builtins.print"):
+                finished = validator.drain()
+            self.assertEqual(finished[0], (0, 0))
+            self.assertIn(1, finished)
+            self.assertEqual(validator._pending, {})
+        finally:
+            validator.close()
+
+
+class TestBackgroundReporters(unittest.TestCase):
+    """Tests for reporters sharing a background validator."""
+
+    def setUp(self):
+        handle, self.csv_path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.csv_path)
+
+    def rows(self):
+        with open(self.csv_path) as fh:
+            return [line.strip().split(",") for line in fh if line.strip()]
+
+    def run_generation(self, reporters, generation, population):
+        for reporter in reporters:
+            reporter.start_generation(generation)
+            reporter.end_generation(object(), population, types.SimpleNamespace())
+
+    def test_rows_wait_for_their_validation(self):
+        """Test CSV rows are written in order once their validation arrives."""
+        validator = FakeValidator()
+        reporter = CSVReporter(self.csv_path, validator)
+        self.run_generation([reporter], 0, {1: DummyGenome(2.0)})
+        validator.finish(1, (3.0, 1.0))
+        self.run_generation([reporter], 1, {1: DummyGenome(4.0)})
+        self.assertEqual(self.rows(), [])  # Generation 0 is still validating
+
+        validator.finish(0, (1.0, 0.5))
+        self.run_generation([reporter], 2, {1: DummyGenome(None)})  # Nothing to validate
+        self.assertEqual([row[0] for row in self.rows()], ["0", "1", "2"])
+        self.assertEqual([row[-2:] for row in self.rows()], [["1.0", "0.5"], ["3.0", "1.0"], ["0", "0"]])
+        self.assertEqual(validator.submitted, [0, 1])
+
+    def test_close_writes_remaining_rows(self):
+        """Test close() drains validation and writes the last rows."""
+        validator = FakeValidator()
+        csv_reporter = CSVReporter(self.csv_path, validator)
+        validation_reporter = ValidationReporter(validator)
+        self.run_generation([validation_reporter, csv_reporter], 1, {1: DummyGenome(2.0)})
+        self.assertEqual(self.rows(), [])
+        validator.finish(1, (2.0, 0.0))
+        validation_reporter.close()
+        csv_reporter.close()
+        self.assertEqual(self.rows(), [["1", "2.0", "2.0", "0", "2.0", "0.0"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
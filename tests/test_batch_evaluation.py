@@ -0,0 +1,146 @@
+"""Unit tests for ai/batch_evaluation.py.
+
+Tests verify that stacked population networks act like individual
+neat-python networks and that batched matches reproduce serial matches.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import config
+from core import simulator as game_simulator
+from core.batch_simulator import BatchGameSimulator
+from ai import ai_module
+from ai.batch_evaluation import PopulationNetworks, play_first_point_matches
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def make_genomes(count=10, mutations=15, seed=7):
+    """Creates genomes of different sizes via structural mutation."""
+    random.seed(seed)
+    config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                              neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                              CONFIG_PATH)
+    population = neat.Population(config_neat)
+    genomes = list(population.population.items())[:count]
+    for i, (_, genome) in enumerate(genomes):
+        for _ in range(mutations + i):
+            genome.mutate(config_neat.genome_config)
+    return genomes, config_neat
+
+
+def network_inputs(state, side):
+    """Builds the input tuple used by eval_genomes_competitive."""
+    my_y = state["paddle_left_y"] if side == "left" else state["paddle_right_y"]
+    op_y = state["paddle_right_y"] if side == "left" else state["paddle_left_y"]
+    incoming = state["ball_vel_x"] < 0 if side == "left" else state["ball_vel_x"] > 0
+    return (
+        my_y / config.SCREEN_HEIGHT,
+        state["ball_x"] / config.SCREEN_WIDTH,
+        state["ball_y"] / config.SCREEN_HEIGHT,
+        state["ball_vel_x"] / config.BALL_MAX_SPEED,
+        state["ball_vel_y"] / config.BALL_MAX_SPEED,
+        (my_y - state["ball_y"]) / config.SCREEN_HEIGHT,
+        1.0 if incoming else 0.0,
+        op_y / config.SCREEN_HEIGHT
+    )
+
+
+def to_move(output):
+    action = output.index(max(output))
+    return "UP" if action == 0 else "DOWN" if action == 1 else None
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    """Tests for PopulationNetworks, BatchedPolicy and batched matches."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.genomes, cls.config_neat = make_genomes()
+        cls.inputs = np.random.default_rng(1).uniform(-1, 1, size=(30, 8))
+
+    def test_policy_rows_match_recurrent_networks(self):
+        """Test every policy row matches its own RecurrentNetwork instance."""
+        population = PopulationNetworks.from_genomes(self.genomes, self.config_neat)
+        keys = [key for key, _ in self.genomes] + [self.genomes[0][0]]
+        policy = population.policy(keys)
+        genome_map = dict(self.genomes)
+        references = [neat.nn.RecurrentNetwork.create(genome_map[key], self.config_neat) for key in keys]
+
+        for row in self.inputs:
+            batch = np.tile(row, (len(keys), 1))
+            actual = policy.activate(batch)
+            expected = [net.activate(tuple(row)) for net in references]
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_policy_matches_feed_forward_networks(self):
+        """Test feed-forward stacks reproduce FeedForwardNetwork outputs."""
+        population = PopulationNetworks.from_genomes(self.genomes, self.config_neat, recurrent=False)
+        policy = population.policy([key for key, _ in self.genomes])
+        references = [neat.nn.FeedForwardNetwork.create(genome, self.config_neat) for _, genome in self.genomes]
+
+        for row in self.inputs[:5]:
+            actual = policy.activate(np.tile(row, (len(references), 1)))
+            expected = [net.activate(tuple(row)) for net in references]
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_batched_matches_replay_serial_matches(self):
+        """Test batched matches give the same results as one-by-one play."""
+        population = PopulationNetworks.from_genomes(self.genomes, self.config_neat)
+        keys = [key for key, _ in self.genomes]
+        pairings = [(keys[i], keys[(i + j) % len(keys)]) for i in range(len(keys)) for j in (1, 3)]
+        simulator = BatchGameSimulator(len(pairings), seed=11)
+        serves = list(zip(simulator.ball_vel_x.tolist(), simulator.ball_vel_y.tolist()))
+
+        results = play_first_point_matches(population, pairings, max_frames=1500, simulator=simulator)
+
+        genome_map = dict(self.genomes)
+        for (left_key, right_key), (vel_x, vel_y), result in zip(pairings, serves, results):
+            net_left = neat.nn.RecurrentNetwork.create(genome_map[left_key], self.config_neat)
+            net_right = neat.nn.RecurrentNetwork.create(genome_map[right_key], self.config_neat)
+            game = game_simulator.GameSimulator()
+            game.ball.vel_x, game.ball.vel_y = vel_x, vel_y
+
+            match_result, frames, contact_ys = 0.5, 1500, []
+            for frame in range(1, 1501):
+                state = game.get_state()
+                left_move = to_move(net_left.activate(network_inputs(state, "left")))
+                right_move = to_move(net_right.activate(network_inputs(state, "right")))
+                score_data = game.update(left_move, right_move) or {}
+                if "contact_y" in score_data:
+                    contact_ys.append(score_data["contact_y"])
+                if score_data.get("scored"):
+                    match_result = 1.0 if score_data["scored"] == "left" else 0.0
+                    frames = frame
+                    break
+
+            self.assertEqual(result["match_result"], match_result)
+            self.assertEqual(result["frames"], frames)
+            self.assertEqual(result["contact_ys"], contact_ys)
+
+    def test_batched_fitness_sets_elo_and_fitness(self):
+        """Test the batched fitness function rates every genome."""
+        genomes, config_neat = make_genomes(count=6, seed=3)
+        ai_module.eval_genomes_competitive_batched(genomes, config_neat, seed=5)
+        for _, genome in genomes:
+            self.assertTrue(hasattr(genome, "elo_rating"))
+            self.assertIsNotNone(genome.fitness)
+            self.assertGreaterEqual(genome.fitness, 0)
+        # ELO is zero-sum
+        total = sum(genome.elo_rating for _, genome in genomes)
+        self.assertAlmostEqual(total, config.ELO_INITIAL_RATING * len(genomes))
+
+
+if __name__ == '__main__':
+    unittest.main()
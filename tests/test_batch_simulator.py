@@ -0,0 +1,108 @@
+"""Unit tests for core/batch_simulator.py.
+
+Tests verify that the vectorized batch simulator reproduces the per-object
+GameSimulator physics frame for frame.
+"""
+
+import random
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import config
+from core import simulator as game_simulator
+from core.batch_simulator import BatchGameSimulator, ACTION_UP, ACTION_DOWN, ACTION_STAY
+
+
+MOVES = {ACTION_UP: "UP", ACTION_DOWN: "DOWN", ACTION_STAY: None}
+
+
+class TestBatchGameSimulator(unittest.TestCase):
+    """Tests for the BatchGameSimulator class."""
+
+    def test_initial_state_matches_scalar(self):
+        """Test fresh batch games start where GameSimulator starts."""
+        batch = BatchGameSimulator(4, seed=1)
+        game = game_simulator.GameSimulator()
+        state = game.get_state()
+        for i in range(4):
+            batch_state = batch.get_state(i)
+            for key in ("ball_x", "ball_y", "paddle_left_y", "paddle_right_y", "score_left"):
+                self.assertEqual(batch_state[key], state[key])
+            self.assertEqual(abs(batch_state["ball_vel_x"]), config.BALL_SPEED_X)
+
+    def test_parity_with_game_simulator(self):
+        """Test random play produces identical trajectories and events."""
+        num_games = 32
+        random.seed(1234)
+        rng = np.random.default_rng(99)
+        games = [game_simulator.GameSimulator(ball_speed=5) for _ in range(num_games)]
+        batch = BatchGameSimulator(num_games, ball_speed=5, seed=7)
+        batch.ball_vel_x = np.array([g.ball.vel_x for g in games], dtype=float)
+        batch.ball_vel_y = np.array([g.ball.vel_y for g in games], dtype=float)
+
+        total_hits = 0
+        total_scores = 0
+        for _ in range(3000):
+            left = rng.integers(0, 3, size=num_games)
+            right = rng.integers(0, 3, size=num_games)
+            hit_left, hit_right, scored_left, scored_right = batch.update(left, right)
+
+            for i, game in enumerate(games):
+                score_data = game.update(MOVES[left[i]], MOVES[right[i]]) or {}
+                self.assertEqual(bool(hit_left[i]), bool(score_data.get("hit_left", False)))
+                self.assertEqual(bool(hit_right[i]), bool(score_data.get("hit_right", False)))
+                self.assertEqual(bool(scored_left[i]), score_data.get("scored") == "left")
+                self.assertEqual(bool(scored_right[i]), score_data.get("scored") == "right")
+                if "contact_y" in score_data:
+                    self.assertEqual(batch.contact_y[i], score_data["contact_y"])
+                if score_data.get("scored"):
+                    # Serve directions come from different generators; sync them
+                    batch.ball_vel_x[i] = game.ball.vel_x
+                    batch.ball_vel_y[i] = game.ball.vel_y
+
+                state = game.get_state()
+                batch_state = batch.get_state(i)
+                for key in ("ball_x", "ball_y", "ball_vel_x", "ball_vel_y",
+                            "paddle_left_y", "paddle_right_y", "score_left", "score_right"):
+                    self.assertEqual(batch_state[key], state[key], key)
+
+            total_hits += int(hit_left.sum() + hit_right.sum())
+            total_scores += int(scored_left.sum() + scored_right.sum())
+
+        self.assertGreater(total_hits, 0)
+        self.assertGreater(total_scores, 0)
+
+    def test_inactive_games_are_frozen(self):
+        """Test games masked out by ``active`` do not change."""
+        batch = BatchGameSimulator(2, seed=3)
+        before = batch.get_state(1)
+        batch.update(ACTION_UP, ACTION_DOWN, active=np.array([True, False]))
+        self.assertEqual(batch.get_state(1), before)
+        self.assertNotEqual(batch.get_state(0)["ball_x"], before["ball_x"])
+
+    def test_network_inputs_match_training_inputs(self):
+        """Test network inputs mirror the tuple built by the training loops."""
+        batch = BatchGameSimulator(3, seed=5)
+        batch.update([ACTION_UP, ACTION_DOWN, ACTION_STAY], ACTION_DOWN)
+        state = batch.get_state(1)
+        expected = (
+            state["paddle_right_y"] / config.SCREEN_HEIGHT,
+            state["ball_x"] / config.SCREEN_WIDTH,
+            state["ball_y"] / config.SCREEN_HEIGHT,
+            state["ball_vel_x"] / config.BALL_MAX_SPEED,
+            state["ball_vel_y"] / config.BALL_MAX_SPEED,
+            (state["paddle_right_y"] - state["ball_y"]) / config.SCREEN_HEIGHT,
+            1.0 if state["ball_vel_x"] > 0 else 0.0,
+            state["paddle_left_y"] / config.SCREEN_HEIGHT
+        )
+        self.assertEqual(tuple(batch.network_inputs("right")[1]), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
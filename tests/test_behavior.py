@@ -0,0 +1,198 @@
+"""Unit tests for behavior descriptors accumulated in the simulators.
+
+Tests verify that the counts follow the hit and point events, that the
+batched accumulator agrees with the per-game one, that the buffer does not
+grow with the number of hits, and that competitive evaluation feeds
+fixed-length behavior vectors to the novelty archive.
+"""
+
+import copy
+import random
+import unittest
+import sys
+import os
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from core import config
+from core import simulator as game_simulator
+from core.batch_simulator import BatchGameSimulator, ACTION_DOWN, ACTION_UP
+from core.behavior import (
+    BehaviorAccumulator, BatchBehaviorAccumulator, BC_SIZE, COUNT_CONTACT_HIST, COUNT_CONTACT_SUM,
+    COUNT_FIELDS, COUNT_HITS, COUNT_RALLIES, COUNT_RALLY_HITS, COUNT_READY_ZONES, COUNT_TRAVEL_MOVES,
+    CONTACT_BINS, LEFT, READY_ZONES, RIGHT, add_counts, behavior_vector,
+)
+from core.simulator import EVENT_HIT_LEFT, EVENT_HIT_RIGHT, EVENT_SCORED, STATE_CONTACT_Y
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def tracking_move(ball_y, paddle_y, noise):
+    """Follows the ball with some randomness, so rallies last a while."""
+    target = ball_y - config.PADDLE_HEIGHT / 2 + noise.uniform(-60, 60)
+    if target < paddle_y - 5:
+        return "UP"
+    if target > paddle_y + 5:
+        return "DOWN"
+    return None
+
+
+class TestBehaviorAccumulator(unittest.TestCase):
+    """Tests for the per-game accumulator."""
+
+    def play(self, seed, frames=3000):
+        game = game_simulator.GameSimulator(seed=seed)
+        game.behavior = BehaviorAccumulator()
+        noise = random.Random(seed)
+        events_log = []
+        for _ in range(frames):
+            events = game.step(tracking_move(game.ball_y, game.paddle_left_y, noise),
+                               tracking_move(game.ball_y, game.paddle_right_y, noise))
+            if events:
+                events_log.append((events, game.state[STATE_CONTACT_Y]))
+        return game, events_log
+
+    def test_counts_follow_events(self):
+        """Test hits, contact Y, rallies and ready zones match the event log."""
+        game, events_log = self.play(seed=4)
+        left, right = game.behavior.counts(LEFT), game.behavior.counts(RIGHT)
+        left_hits = [contact_y for events, contact_y in events_log if events & EVENT_HIT_LEFT]
+        right_hits = [contact_y for events, contact_y in events_log if events & EVENT_HIT_RIGHT]
+        self.assertGreater(len(left_hits), 5)
+        self.assertEqual(left[COUNT_HITS], len(left_hits))
+        self.assertEqual(right[COUNT_HITS], len(right_hits))
+        self.assertAlmostEqual(left[COUNT_CONTACT_SUM], sum(left_hits))
+        self.assertEqual(sum(left[COUNT_CONTACT_HIST:COUNT_CONTACT_HIST + CONTACT_BINS]), len(left_hits))
+        # The left paddle waits somewhere whenever the right paddle hits
+        self.assertEqual(sum(left[COUNT_READY_ZONES:COUNT_READY_ZONES + READY_ZONES]), len(right_hits))
+        points = sum(1 for events, _ in events_log if events & EVENT_SCORED)
+        self.assertGreaterEqual(left[COUNT_RALLIES], points)
+        self.assertEqual(left[COUNT_RALLY_HITS], len(left_hits) + len(right_hits))
+        self.assertEqual(left[COUNT_RALLIES], right[COUNT_RALLIES])
+
+    def test_buffer_size_is_constant(self):
+        """Test the buffer does not grow with the number of hits."""
+        accumulator = BehaviorAccumulator()
+        size = len(accumulator.buffer)
+        for i in range(10000):
+            accumulator.hit(i % 2, 300.0, 250.0 + i % 7, 250.0)
+            if i % 50 == 49:
+                accumulator.point()
+        self.assertEqual(len(accumulator.buffer), size)
+        self.assertEqual(accumulator.counts(LEFT)[COUNT_HITS], 5000)
+        self.assertEqual(accumulator.counts(LEFT)[COUNT_RALLIES], 200)
+
+    def test_travel_between_own_hits(self):
+        """Test travel is measured between own hits of one rally only."""
+        accumulator = BehaviorAccumulator()
+        accumulator.hit(LEFT, 100.0, 50.0, 300.0)
+        accumulator.hit(RIGHT, 200.0, 300.0, 80.0)
+        accumulator.hit(LEFT, 150.0, 130.0, 300.0)
+        accumulator.point()
+        accumulator.hit(LEFT, 150.0, 400.0, 300.0)
+        counts = accumulator.counts(LEFT)
+        self.assertEqual(counts[COUNT_TRAVEL_MOVES], 1)
+        self.assertEqual(behavior_vector(counts)[CONTACT_BINS + 1], 80.0)
+        # The rally in progress counts once it has a hit
+        self.assertEqual((counts[COUNT_RALLIES], counts[COUNT_RALLY_HITS]), (2, 4))
+
+    def test_clone_drops_accumulator(self):
+        """Test rollouts on a clone do not feed the original's counts."""
+        game = game_simulator.GameSimulator(seed=1)
+        game.behavior = BehaviorAccumulator()
+        self.assertIsNone(game.clone().behavior)
+
+
+class TestBatchBehaviorAccumulator(unittest.TestCase):
+    """Tests for the batched accumulator."""
+
+    def test_matches_per_game_accumulator(self):
+        """Test batched counts equal per-game counts for the same events."""
+        rng = np.random.default_rng(0)
+        num_games = 6
+        batch = BatchBehaviorAccumulator(num_games)
+        games = [BehaviorAccumulator() for _ in range(num_games)]
+        for _ in range(400):
+            ball_y, own_y, other_y = (rng.uniform(0, config.SCREEN_HEIGHT, num_games) for _ in range(3))
+            side = int(rng.integers(2))
+            mask = rng.random(num_games) < 0.4
+            points = rng.random(num_games) < 0.05
+            batch.hits(mask, side, ball_y, own_y, other_y)
+            batch.points(points)
+            for game in range(num_games):
+                if mask[game]:
+                    games[game].hit(side, ball_y[game], own_y[game], other_y[game])
+                if points[game]:
+                    games[game].point()
+        for game in range(num_games):
+            for side in (LEFT, RIGHT):
+                np.testing.assert_allclose(batch.counts(game, side), games[game].counts(side))
+
+    def test_batch_simulator_feeds_counts(self):
+        """Test the batch simulator reports hits and points to its accumulator."""
+        simulator = BatchGameSimulator(8, seed=2)
+        simulator.behavior = BatchBehaviorAccumulator(8)
+        hits = np.zeros(8)
+        for _ in range(2000):
+            target = simulator.ball_y - config.PADDLE_HEIGHT / 2
+            left = np.where(target < simulator.paddle_left_y, ACTION_UP, ACTION_DOWN)
+            right = np.where(target < simulator.paddle_right_y, ACTION_UP, ACTION_DOWN)
+            hit_left, hit_right, _, _ = simulator.update(left, right)
+            hits += hit_left
+        self.assertGreater(hits.sum(), 0)
+        self.assertEqual([simulator.behavior.counts(game, LEFT)[COUNT_HITS] for game in range(8)],
+                         hits.tolist())
+
+
+class TestBehaviorVector(unittest.TestCase):
+    """Tests for behavior_vector and add_counts."""
+
+    def test_no_hits(self):
+        """Test a side that never hit the ball has no behavior vector."""
+        self.assertIsNone(behavior_vector([0.0] * COUNT_FIELDS))
+
+    def test_fixed_length(self):
+        """Test counts summed over matches give a BC_SIZE vector of pixels."""
+        first, second = BehaviorAccumulator(), BehaviorAccumulator()
+        first.hit(LEFT, 10.0, 0.0, 500.0)
+        second.hit(LEFT, 590.0, 500.0, 0.0)
+        second.hit(RIGHT, 300.0, 0.0, 500.0)
+        total = add_counts(add_counts([0.0] * COUNT_FIELDS, first.counts(LEFT)), second.counts(LEFT))
+        vector = behavior_vector(total)
+        self.assertEqual(len(vector), BC_SIZE)
+        self.assertEqual(vector[0], vector[CONTACT_BINS - 1])
+        self.assertEqual(sum(vector[:CONTACT_BINS]), config.SCREEN_HEIGHT)
+        self.assertEqual(vector[CONTACT_BINS], 300.0)
+
+
+class TestCompetitiveNovelty(unittest.TestCase):
+    """Tests for behavior vectors in competitive evaluation."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:8]
+
+    def test_archive_gets_behavior_vectors(self):
+        """Test serial and batched evaluation archive BC_SIZE vectors."""
+        for evaluator in (ai_module.eval_genomes_competitive, ai_module.eval_genomes_competitive_batched):
+            archive = ai_module.NoveltyArchive()
+            random.seed(3)
+            with mock.patch.object(ai_module, "NOVELTY_ARCHIVE", archive):
+                evaluator(copy.deepcopy(self.genomes), self.config_neat)
+            self.assertGreater(archive.get_archive_size(), 0)
+            self.assertTrue(all(len(bc) == BC_SIZE for bc in archive.archive))
+
+
+if __name__ == '__main__':
+    unittest.main()
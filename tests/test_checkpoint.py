@@ -0,0 +1,174 @@
+"""Unit tests for population checkpoints.
+
+Tests verify that a chain of one full snapshot and compressed deltas restores
+an identical population (genomes, species, indexers, Hall of Fame and
+novelty archive), that a resumed run continues exactly like an
+uninterrupted one, and that old chains are pruned.
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.fitness_cache import genome_hash
+from ai.hall_of_fame import HallOfFame
+from training.checkpoint import (CheckpointReporter, latest_checkpoint, list_checkpoints,
+                                 restore_checkpoint)
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def load_config():
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                       CONFIG_PATH)
+
+
+def eval_connection_count(genomes, config_neat):
+    """Cheap deterministic fitness that still drives selection."""
+    for _, genome in genomes:
+        genome.fitness = sum(conn.weight for conn in genome.connections.values() if conn.enabled)
+
+
+def snapshot(population):
+    """Returns a comparable summary of a population."""
+    return {
+        "genomes": {key: genome_hash(genome) for key, genome in population.population.items()},
+        "species": {key: sorted(spec.members) for key, spec in population.species.species.items()},
+        "generation": population.generation,
+    }
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Tests for CheckpointReporter and restore_checkpoint."""
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.archive = ai_module.NoveltyArchive()
+        self.hall_of_fame = []
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir)
+
+    def run_with_checkpoints(self, config_neat, generations, **kwargs):
+        random.seed(3)
+        population = neat.Population(config_neat)
+        reporter = CheckpointReporter(population, self.checkpoint_dir, hall_of_fame=self.hall_of_fame,
+                                      novelty_archive=self.archive, **kwargs)
+        population.add_reporter(reporter)
+        try:
+            population.run(eval_connection_count, generations)
+        finally:
+            reporter.close()
+        return population
+
+    def test_full_then_deltas(self):
+        """Test the first checkpoint is full and the deltas are smaller."""
+        self.run_with_checkpoints(load_config(), 4)
+        checkpoints = list_checkpoints(self.checkpoint_dir)
+        self.assertEqual([(generation, kind) for generation, kind, _ in checkpoints],
+                         [(1, "full"), (2, "delta"), (3, "delta"), (4, "delta")])
+        full_size = os.path.getsize(checkpoints[0][2])
+        for _, _, path in checkpoints[1:]:
+            self.assertLess(os.path.getsize(path), full_size)
+        self.assertEqual(latest_checkpoint(self.checkpoint_dir), 4)
+
+    def test_restore_is_identical(self):
+        """Test genomes, species, indexers and globals survive a round trip."""
+        config_neat = load_config()
+        population = self.run_with_checkpoints(config_neat, 3)
+        best = max(population.population.values(), key=lambda genome: genome.key)
+        self.hall_of_fame.append(best)
+        self.archive.add_bc(0.25)
+        reporter = CheckpointReporter(population, self.checkpoint_dir, hall_of_fame=self.hall_of_fame,
+                                      novelty_archive=self.archive)
+        reporter.save(population.generation)
+        reporter.close()
+        expected_genome_key = next(population.reproduction.genome_indexer)
+        population.reproduction.genome_indexer = iter([expected_genome_key])
+
+        with mock.patch.object(ai_module, "HALL_OF_FAME", []), \
+                mock.patch.object(ai_module, "NOVELTY_ARCHIVE", ai_module.NoveltyArchive()):
+            restored = restore_checkpoint(self.checkpoint_dir, load_config())
+            self.assertEqual([genome_hash(genome) for genome in ai_module.HALL_OF_FAME],
+                             [genome_hash(best)])
+            self.assertEqual(ai_module.NOVELTY_ARCHIVE.archive, [0.25])
+
+        self.assertEqual(snapshot(restored), snapshot(population))
+        for key, spec in restored.species.species.items():
+            original = population.species.species[key]
+            self.assertEqual(genome_hash(spec.representative), genome_hash(original.representative))
+            self.assertEqual(spec.fitness_history, original.fitness_history)
+        self.assertEqual(next(restored.reproduction.genome_indexer), expected_genome_key)
+        self.assertEqual(restored.config.genome_config.innovation_tracker.global_counter,
+                         config_neat.genome_config.innovation_tracker.global_counter)
+
+    def test_restore_into_capped_hall_of_fame(self):
+        """Test restoring into a full HallOfFame keeps its cap and network cache."""
+        config_neat = load_config()
+        population = self.run_with_checkpoints(config_neat, 2)
+        genomes = sorted(population.population.values(), key=lambda genome: genome.key)
+        self.hall_of_fame = HallOfFame(genomes[:3], max_size=3)
+        reporter = CheckpointReporter(population, self.checkpoint_dir, hall_of_fame=self.hall_of_fame,
+                                      novelty_archive=self.archive)
+        reporter.save(population.generation)
+        reporter.close()
+
+        hall_of_fame = HallOfFame(genomes[3:6], max_size=3)
+        stale = [hall_of_fame.network(index, config_neat) for index in range(3)]
+        with mock.patch.object(ai_module, "HALL_OF_FAME", hall_of_fame), \
+                mock.patch.object(ai_module, "NOVELTY_ARCHIVE", ai_module.NoveltyArchive()):
+            restore_checkpoint(self.checkpoint_dir, load_config())
+            self.assertIs(ai_module.HALL_OF_FAME, hall_of_fame)
+
+        self.assertEqual(hall_of_fame.max_size, 3)
+        self.assertEqual([genome_hash(genome) for genome in hall_of_fame],
+                         [genome_hash(genome) for genome in genomes[:3]])
+        # The replaced members' networks are gone; the restored ones are built once
+        self.assertEqual(hall_of_fame._networks, {})
+        networks = [hall_of_fame.network(index, config_neat) for index in range(3)]
+        self.assertFalse(any(net in stale for net in networks))
+        self.assertEqual([hall_of_fame.network(index, config_neat) for index in range(3)], networks)
+
+        hall_of_fame.append(genomes[6])
+        self.assertEqual(len(hall_of_fame), 3)
+        self.assertLessEqual(len(hall_of_fame._networks), 3)
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        """Test resuming from a checkpoint reproduces the uninterrupted run."""
+        uninterrupted = snapshot(self.run_with_checkpoints(load_config(), 5))
+        shutil.rmtree(self.checkpoint_dir)
+        os.makedirs(self.checkpoint_dir)
+
+        self.run_with_checkpoints(load_config(), 3)
+        random.seed(99)  # Restoring must bring back the run's random state
+        with mock.patch.object(ai_module, "HALL_OF_FAME", []):
+            resumed = restore_checkpoint(self.checkpoint_dir, load_config())
+        self.assertEqual(resumed.generation, 3)
+        resumed.run(eval_connection_count, 2)
+        self.assertEqual(snapshot(resumed), uninterrupted)
+
+    def test_old_chains_are_pruned(self):
+        """Test only the newest keep_chains chains stay on disk."""
+        self.run_with_checkpoints(load_config(), 7, full_every=2, keep_chains=2)
+        checkpoints = list_checkpoints(self.checkpoint_dir)
+        self.assertEqual([(generation, kind) for generation, kind, _ in checkpoints],
+                         [(5, "full"), (6, "delta"), (7, "full")])
+        with mock.patch.object(ai_module, "HALL_OF_FAME", []):
+            restored = restore_checkpoint(self.checkpoint_dir, load_config(), generation=6)
+        self.assertEqual(restored.generation, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Unit tests for ai/compiled_network.py.
+
+Tests verify that compiled NumPy networks produce the same outputs as
+neat-python's FeedForwardNetwork and RecurrentNetwork.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai.compiled_network import CompiledNetwork
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def make_genomes(count=12, mutations=15, seed=42):
+    """Creates genomes with hidden nodes and recurrent links via mutation."""
+    random.seed(seed)
+    config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                              neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                              CONFIG_PATH)
+    # Population sets up innovation tracking needed by structural mutations
+    population = neat.Population(config_neat)
+    genomes = list(population.population.values())[:count]
+    for genome in genomes:
+        for _ in range(mutations):
+            genome.mutate(config_neat.genome_config)
+    return genomes, config_neat
+
+
+class TestCompiledNetwork(unittest.TestCase):
+    """Tests for CompiledNetwork."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.genomes, cls.config_neat = make_genomes()
+        cls.inputs = np.random.default_rng(0).uniform(-1, 1, size=(40, 8))
+
+    def test_recurrent_matches_neat(self):
+        """Test recurrent activation matches RecurrentNetwork over a sequence."""
+        for genome in self.genomes:
+            reference = neat.nn.RecurrentNetwork.create(genome, self.config_neat)
+            reference.reset()
+            compiled = CompiledNetwork.create(genome, self.config_neat, recurrent=True)
+            compiled.reset(1)
+            for row in self.inputs:
+                expected = reference.activate(tuple(row))
+                actual = compiled.activate_batch(row[None, :])[0]
+                np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_feed_forward_matches_neat(self):
+        """Test feed-forward activation matches FeedForwardNetwork."""
+        for genome in self.genomes:
+            reference = neat.nn.FeedForwardNetwork.create(genome, self.config_neat)
+            compiled = CompiledNetwork.create(genome, self.config_neat, recurrent=False)
+            expected = [reference.activate(tuple(row)) for row in self.inputs]
+            actual = compiled.activate_batch(self.inputs)
+            self.assertEqual(actual.shape, (len(self.inputs), 3))
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_batch_rows_keep_independent_state(self):
+        """Test each batch row behaves like its own recurrent network."""
+        genome = self.genomes[0]
+        compiled = CompiledNetwork.create(genome, self.config_neat)
+        references = [neat.nn.RecurrentNetwork.create(genome, self.config_neat) for _ in range(4)]
+        batches = self.inputs.reshape(10, 4, 8)
+        for batch in batches:
+            actual = compiled.activate_batch(batch)
+            expected = [net.activate(tuple(row)) for net, row in zip(references, batch)]
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_single_row_activate_returns_list(self):
+        """Test activate() keeps the neat.nn calling convention."""
+        compiled = CompiledNetwork.create(self.genomes[1], self.config_neat, recurrent=False)
+        output = compiled.activate(tuple(self.inputs[0]))
+        self.assertIsInstance(output, list)
+        self.assertEqual(len(output), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Unit tests for the agent decision interval (action repeat).
+
+Tests verify that GameRunner and the training loops only query networks
+every k frames, repeat the last move in between, and honour per-agent
+overrides.
+"""
+
+import pickle
+import random
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import simulator as game_simulator
+from ai import ai_module
+from ai.agent_factory import NeatAgent
+from ai.concurrent_training import _run_training_match
+from ai.opponents import RuleBasedAgent
+from match.game_runner import GameRunner
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class CountingNet:
+    """Tracking stand-in network that counts its activations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def activate(self, inputs):
+        self.calls += 1
+        return [inputs[5], -inputs[5], 0.0]
+
+
+class RecordingAgent:
+    """Dict-only agent recording the frames it was asked to move on."""
+
+    def __init__(self, moves):
+        self.moves = moves
+        self.queries = 0
+
+    def get_move(self, state, side):
+        self.queries += 1
+        return self.moves[(self.queries - 1) % len(self.moves)]
+
+
+class TestGameRunnerDecisionInterval(unittest.TestCase):
+    """Tests for GameRunner's decision_interval."""
+
+    def test_networks_activate_every_k_frames(self):
+        """Test a k-frame interval divides network activations by k."""
+        for interval in (1, 2, 4):
+            net = CountingNet()
+            runner = GameRunner(NeatAgent(net), RuleBasedAgent(),
+                                game=game_simulator.GameSimulator(seed=1), decision_interval=interval)
+            for _ in range(400):
+                runner.run_frame()
+            self.assertEqual(net.calls, 400 // interval)
+            self.assertEqual(runner.decisions, 400 // interval + 400)
+
+    def test_last_move_is_repeated(self):
+        """Test the move chosen on a decision frame holds until the next one."""
+        agent = RecordingAgent(["UP", "DOWN"])
+        runner = GameRunner(agent, RecordingAgent([None]),
+                            game=game_simulator.GameSimulator(seed=2), decision_interval=3)
+        positions = []
+        for _ in range(12):
+            runner.run_frame()
+            positions.append(runner.game.paddle_left_y)
+        self.assertEqual(agent.queries, 4)
+        deltas = [b - a for a, b in zip([250] + positions, positions)]
+        self.assertTrue(all(d < 0 for d in deltas[0:3]))
+        self.assertTrue(all(d > 0 for d in deltas[3:6]))
+
+    def test_agent_override(self):
+        """Test an agent's own decision_interval overrides the runner's."""
+        net = CountingNet()
+        runner = GameRunner(NeatAgent(net, decision_interval=1), RuleBasedAgent(decision_interval=5),
+                            game=game_simulator.GameSimulator(seed=3), decision_interval=4)
+        self.assertEqual(runner.decision_intervals, (1, 5))
+        for _ in range(100):
+            runner.run_frame()
+        self.assertEqual(net.calls, 100)
+        self.assertEqual(runner.decisions, 100 + 20)
+
+    def test_interval_one_is_unchanged(self):
+        """Test the default interval plays exactly as every-frame decisions."""
+        scores = []
+        for interval in (None, 1):
+            random.seed(4)
+            runner = GameRunner(NeatAgent(CountingNet()), NeatAgent(CountingNet()),
+                                decision_interval=interval)
+            for _ in range(3000):
+                runner.run_frame()
+            scores.append((runner.game.score_left, runner.game.score_right, list(runner.game.state)))
+        self.assertEqual(scores[0], scores[1])
+
+
+class TestTrainingDecisionInterval(unittest.TestCase):
+    """Tests for decision_interval in the training loops."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:6]
+
+    def test_eval_genomes_accepts_interval(self):
+        """Test every evaluator runs with a decision interval."""
+        for evaluator in (ai_module.eval_genomes, ai_module.eval_genomes_competitive,
+                          ai_module.eval_genomes_competitive_batched,
+                          ai_module.eval_genomes_self_play):
+            for _, genome in self.genomes:
+                genome.fitness = None
+            # Self-play must not pick up Hall of Fame entries from other tests
+            with mock.patch.object(ai_module, "HALL_OF_FAME", []):
+                evaluator(self.genomes, self.config_neat, decision_interval=3)
+            for _, genome in self.genomes:
+                self.assertIsNotNone(genome.fitness, evaluator.__name__)
+
+    def test_training_match_interval(self):
+        """Test _run_training_match plays with the requested interval."""
+        match_data = {
+            "genome_left_pickle": pickle.dumps(self.genomes[0][1]),
+            "genome_right_pickle": pickle.dumps(self.genomes[1][1]),
+            "config_path": CONFIG_PATH,
+            "ball_speed": None,
+            "seed": 5,
+            "decision_interval": 4,
+        }
+        result = _run_training_match(match_data)
+        self.assertNotIn("error", result)
+        self.assertIn(result["match_result"], (0.0, 0.5, 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
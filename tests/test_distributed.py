@@ -0,0 +1,137 @@
+"""Unit tests for distributed generation evaluation.
+
+Tests run a coordinator and several worker processes on localhost and verify
+that results match local matches, that work held by a silent worker is
+reassigned, that the coordinator works as a NEAT fitness function, and that
+it fails instead of waiting forever without workers.
+"""
+
+import copy
+import multiprocessing
+import pickle
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai.concurrent_training import _run_training_match
+from ai.distributed import DistributedCoordinator, start_local_workers, _connect
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TestDistributedEvaluation(unittest.TestCase):
+    """Tests for DistributedCoordinator with local worker processes."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = dict(list(neat.Population(cls.config_neat).population.items())[:8])
+
+    def setUp(self):
+        self.coordinator = DistributedCoordinator(heartbeat_timeout=0.5, poll_interval=0.01)
+        self.workers = []
+
+    def tearDown(self):
+        self.coordinator.shutdown()
+        for process in self.workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def start_workers(self, count):
+        self.workers += start_local_workers(self.coordinator.address, count, self.coordinator.authkey,
+                                            heartbeat_interval=0.1, poll_interval=0.01)
+
+    def local_result(self, left_id, right_id, seed):
+        return _run_training_match({
+            "genome_left_pickle": pickle.dumps(self.genomes[left_id]),
+            "genome_right_pickle": pickle.dumps(self.genomes[right_id]),
+            "config_path": CONFIG_PATH,
+            "ball_speed": None,
+            "seed": seed,
+        })
+
+    def test_results_match_local_matches(self):
+        """Test results streamed back by workers equal local matches."""
+        ids = list(self.genomes)
+        pairings = [(ids[i], ids[(i + 3) % len(ids)]) for i in range(len(ids))]
+        seeds = list(range(10, 10 + len(pairings)))
+        self.start_workers(3)
+        for _ in range(2):  # Two generations through the same workers
+            self.coordinator.submit_generation(self.genomes, self.config_neat, pairings, seeds)
+            results = self.coordinator.wait_results(timeout=60)
+            for (left_id, right_id), seed, result in zip(pairings, seeds, results):
+                self.assertEqual(result, self.local_result(left_id, right_id, seed))
+
+    def test_lost_work_is_reassigned(self):
+        """Test a match taken by a worker that stops heartbeating is replayed elsewhere."""
+        ids = list(self.genomes)
+        pairings = [(ids[0], ids[1]), (ids[2], ids[3])]
+        self.coordinator.submit_generation(self.genomes, self.config_neat, pairings, [1, 2])
+        ghost = _connect(self.coordinator.address, self.coordinator.authkey)
+        taken = ghost.get_task("ghost")
+        self.assertEqual(taken[1], 0)
+
+        self.start_workers(2)
+        results = self.coordinator.wait_results(timeout=60)
+        self.assertEqual(results[0], self.local_result(ids[0], ids[1], 1))
+        self.assertNotIn("ghost", self.coordinator.live_workers())
+
+        # A late result from the lost worker is ignored
+        ghost.submit("ghost", taken[0], taken[1], {"match_result": -1})
+        self.assertEqual(self.coordinator.broker.collect(), ({}, 0))
+
+    def test_eval_genomes_fitness_function(self):
+        """Test eval_genomes assigns ELO-based fitness like the local evaluator."""
+        self.start_workers(2)
+        genomes = copy.deepcopy(list(self.genomes.items()))
+        self.coordinator.eval_genomes(genomes, self.config_neat, seed=7)
+        ratings = [genome.elo_rating for _, genome in genomes]
+        self.assertAlmostEqual(sum(ratings), 1200 * len(genomes))
+        self.assertNotEqual(set(ratings), {1200})
+        for _, genome in genomes:
+            self.assertIsNotNone(genome.fitness)
+
+    def test_generated_authkey(self):
+        """Test each coordinator gets its own key and rejects workers without it."""
+        other = DistributedCoordinator()
+        try:
+            self.assertNotEqual(other.authkey, self.coordinator.authkey)
+        finally:
+            other.shutdown()
+        with self.assertRaises(multiprocessing.AuthenticationError):
+            _connect(self.coordinator.address, b"pypongai")
+
+    def test_eval_genomes_without_workers(self):
+        """Test eval_genomes raises when no worker is connected."""
+        genomes = copy.deepcopy(list(self.genomes.items()))
+        with self.assertRaisesRegex(RuntimeError, "No live workers"):
+            self.coordinator.eval_genomes(genomes, self.config_neat, seed=7)
+
+    def test_all_workers_lost(self):
+        """Test waiting stops once the only worker stops heartbeating."""
+        ids = list(self.genomes)
+        self.coordinator.submit_generation(self.genomes, self.config_neat, [(ids[0], ids[1])], [1])
+        _connect(self.coordinator.address, self.coordinator.authkey).get_task("ghost")
+        with self.assertRaisesRegex(RuntimeError, "No live workers"):
+            self.coordinator.wait_results()
+
+    def test_eval_genomes_timeout(self):
+        """Test eval_genomes passes its timeout on to wait_results."""
+        genomes = copy.deepcopy(list(self.genomes.items()))
+        with mock.patch.object(DistributedCoordinator, "live_workers", return_value=["ghost"]):
+            with self.assertRaises(TimeoutError):
+                self.coordinator.eval_genomes(genomes, self.config_neat, seed=7, timeout=0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""Unit tests for early stopping of decided matches.
+
+Tests verify that a rally is only called decided when no paddle movement can
+change its point, that first-point training matches give the same results
+with and without early stopping, and that multi-point matches stop on the
+frame budget and confidence rules while the saved frames are counted.
+"""
+
+import copy
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import _create_network, _play_training_match
+from core import simulator as game_simulator
+from core.early_stop import EarlyStopPolicy
+from core.simulator import EVENT_SCORED, EVENT_SCORE_RIGHT
+from match.game_runner import GameRunner
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+NO_EARLY_STOP = EarlyStopPolicy(rallies=False, decided_matches=False)
+
+
+class StillAgent:
+    """Agent that never moves."""
+
+    def get_move(self, state, side):
+        return None
+
+
+class TestRallyWatch(unittest.TestCase):
+    """Tests for RallyWatch decisions against random paddle play."""
+
+    def test_decided_points_happen(self):
+        """Test every decided rally ends as predicted whatever the paddles do."""
+        decisions = 0
+        for seed in range(60):
+            moves = random.Random(seed)
+            game = game_simulator.GameSimulator(ball_speed=moves.choice((None, 5, 9)), seed=seed)
+            max_frames = 3000
+            watch = EarlyStopPolicy().rally_watch(game, max_frames)
+            frame, events, prediction = 0, 0, None
+            while frame < max_frames:
+                decided = watch.check(frame, events)
+                if prediction is None and decided is not None:
+                    prediction = (frame + decided[0], decided[1])
+                    decisions += 1
+                frame += 1
+                events = game.step(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+                if events & EVENT_SCORED:
+                    break
+            if prediction is not None:
+                self.assertEqual(prediction, (frame, events & EVENT_SCORED))
+        self.assertGreater(decisions, 30)
+
+    def test_play_out_reaches_the_point(self):
+        """Test playing a decided point out gives the predicted score and frames."""
+        game = game_simulator.GameSimulator(seed=3)
+        watch = EarlyStopPolicy().rally_watch(game, 3000)
+        # A low ball close to the left goal line, far below the left paddle
+        game.paddle_left_y = 0.0
+        game.ball_x, game.ball_y, game.ball_vel_x, game.ball_vel_y = 45.0, 500.0, -3.0, 3.0
+        game.sync_state()
+        frames, scored = watch.check(0, 0)
+        self.assertEqual((frames, scored), (15, EVENT_SCORE_RIGHT))
+        self.assertEqual(watch.play_out(frames), EVENT_SCORE_RIGHT)
+        self.assertEqual((game.score_left, game.score_right), (0, 1))
+
+
+class TestTrainingMatches(unittest.TestCase):
+    """Tests for early stopping in first-point training matches."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:8]
+
+    def play(self, left, right, seed, early_stop):
+        return _play_training_match(_create_network(left, self.config_neat),
+                                    _create_network(right, self.config_neat),
+                                    ball_speed=4, seed=seed, early_stop=early_stop)
+
+    def test_results_unchanged(self):
+        """Test early-stopped matches return exactly the full matches' results."""
+        saved = 0
+        for i, (_, left) in enumerate(self.genomes):
+            right = self.genomes[(i + 1) % len(self.genomes)][1]
+            for seed in range(3):
+                stopped = self.play(left, right, seed, EarlyStopPolicy())
+                full = self.play(left, right, seed, NO_EARLY_STOP)
+                saved += stopped.pop("frames_saved")
+                self.assertEqual(full.pop("frames_saved"), 0)
+                self.assertEqual(stopped, full)
+        self.assertGreater(saved, 0)
+
+    def test_competitive_evaluation_unchanged(self):
+        """Test ratings and fitness match an evaluation without early stopping."""
+        policy = EarlyStopPolicy()
+        policy.start_generation(0)
+        outcomes = []
+        for early_stop in (policy, NO_EARLY_STOP):
+            genomes = copy.deepcopy(self.genomes)
+            random.seed(11)
+            with mock.patch.object(ai_module, "NOVELTY_ARCHIVE", ai_module.NoveltyArchive()):
+                ai_module.eval_genomes_competitive(genomes, self.config_neat, early_stop=early_stop)
+            outcomes.append([(genome.elo_rating, genome.fitness) for _, genome in genomes])
+        self.assertEqual(outcomes[0], outcomes[1])
+        stats = policy.stats()
+        self.assertEqual(stats["matches"], len(self.genomes) * 5)
+        self.assertGreater(stats["frames_saved"], 0)
+
+
+class TestMatchDecisions(unittest.TestCase):
+    """Tests for the multi-point match rules."""
+
+    def game(self, score_left, score_right):
+        game = game_simulator.GameSimulator(seed=1)
+        game.score_left, game.score_right = score_left, score_right
+        return game
+
+    def test_budget_rule(self):
+        """Test a match stops only once the trailer cannot draw level in time."""
+        policy = EarlyStopPolicy()
+        game = self.game(3, 1)
+        point = game.min_point_frames()
+        self.assertEqual(point, 131)  # (400 - 7) / 3 rounded up
+        self.assertFalse(policy.match_decided(game, point + 1, 99))  # Two more points fit
+        self.assertTrue(policy.match_decided(game, point, 99))
+        self.assertEqual(policy.decision_frame(game, 1000), 1000 - point)
+        self.assertFalse(policy.match_decided(self.game(2, 2), 1, 99))
+        self.assertFalse(NO_EARLY_STOP.match_decided(game, point, 99))
+
+    def test_confidence_rule(self):
+        """Test the optional confidence bound stops lopsided matches only."""
+        policy = EarlyStopPolicy(confidence=0.99)
+        self.assertTrue(policy.match_decided(self.game(10, 0), 10 ** 6, 99))
+        self.assertFalse(policy.match_decided(self.game(3, 2), 10 ** 6, 99))
+        self.assertFalse(EarlyStopPolicy().match_decided(self.game(10, 0), 10 ** 6, 99))
+
+    def test_runner_counts_saved_frames(self):
+        """Test GameRunner stops a hopeless match and the policy records it."""
+        policy = EarlyStopPolicy(confidence=0.9)
+        policy.start_generation(4)
+        runner = GameRunner(StillAgent(), StillAgent(), game=game_simulator.GameSimulator(seed=2),
+                            early_stop=policy)
+        score_left, score_right = runner.run_to_completion()
+        self.assertLess(max(score_left, score_right), 99)
+        self.assertEqual(runner.frames_saved, runner.max_frames - runner.frame_count)
+        self.assertEqual(policy.stats(), {"generation": 4, "matches": 1, "stopped": 1,
+                                          "frames_saved": runner.frames_saved})
+        policy.start_generation(5)
+        self.assertEqual(policy.history[-1]["generation"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Unit tests for genome hashing and the LRU fitness cache.
+
+Tests verify that genome_hash tracks exactly the network-defining genes,
+that FitnessCache evicts and counts correctly, and that the fixed-seed
+rule-based evaluator reuses cached fitness for unchanged genomes.
+"""
+
+import copy
+import os
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.fitness_cache import FitnessCache, genome_hash
+from training.reporters import FitnessCacheReporter
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def load_config():
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                       CONFIG_PATH)
+
+
+class TestGenomeHash(unittest.TestCase):
+    """Tests for genome_hash."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.genome = next(iter(neat.Population(load_config()).population.values()))
+
+    def test_ignores_identity_and_fitness(self):
+        """Test clones with another key and fitness hash alike."""
+        clone = copy.deepcopy(self.genome)
+        clone.key = 999
+        clone.fitness = 12.5
+        self.assertEqual(genome_hash(clone), genome_hash(self.genome))
+
+    def test_tracks_network_genes(self):
+        """Test weights, biases, activations and enabled flags change the hash."""
+        original = genome_hash(self.genome)
+        conn_key = sorted(self.genome.connections)[0]
+        node_key = sorted(self.genome.nodes)[0]
+        edits = [
+            lambda g: setattr(g.connections[conn_key], "weight", g.connections[conn_key].weight + 1e-9),
+            lambda g: setattr(g.connections[conn_key], "enabled", not g.connections[conn_key].enabled),
+            lambda g: setattr(g.nodes[node_key], "bias", g.nodes[node_key].bias + 0.5),
+            lambda g: setattr(g.nodes[node_key], "activation",
+                              "relu" if g.nodes[node_key].activation != "relu" else "sigmoid"),
+        ]
+        for edit in edits:
+            mutated = copy.deepcopy(self.genome)
+            edit(mutated)
+            self.assertNotEqual(genome_hash(mutated), original)
+
+
+class TestFitnessCache(unittest.TestCase):
+    """Tests for FitnessCache."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = FitnessCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recent
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_stats_per_generation(self):
+        """Test hit rate is counted per generation and archived."""
+        cache = FitnessCache()
+        calls = []
+        cache.start_generation(0)
+        for key in ("x", "y", "x", "x"):
+            cache.get_or_compute(key, lambda: calls.append(1) or len(calls))
+        self.assertEqual(len(calls), 2)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (2, 2, 0.5))
+        cache.start_generation(1)
+        self.assertEqual(cache.history[-1]["generation"], 0)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+
+class TestFixedSeedEvaluation(unittest.TestCase):
+    """Tests for eval_genomes_fixed_seeds."""
+
+    def test_cached_fitness_equals_replay(self):
+        """Test a cache hit returns exactly the replayed fitness."""
+        config_neat = load_config()
+        genomes = list(neat.Population(config_neat).population.items())[:8]
+        cache = FitnessCache()
+        ai_module.eval_genomes_fixed_seeds(genomes, config_neat, seeds=(1, 2), cache=cache)
+        first = [genome.fitness for _, genome in genomes]
+        self.assertEqual(cache.misses, 8)
+
+        ai_module.eval_genomes_fixed_seeds(genomes, config_neat, seeds=(1, 2), cache=FitnessCache())
+        self.assertEqual([genome.fitness for _, genome in genomes], first)
+
+        ai_module.eval_genomes_fixed_seeds(genomes, config_neat, seeds=(1, 2), cache=cache)
+        self.assertEqual([genome.fitness for _, genome in genomes], first)
+        self.assertEqual(cache.hits, 8)
+
+        # Other settings are different cache entries
+        ai_module.eval_genomes_fixed_seeds(genomes[:1], config_neat, seeds=(3,), cache=cache)
+        self.assertEqual(cache.misses, 9)
+
+    def test_elites_hit_cache_during_evolution(self):
+        """Test elites carried into the next generation are not re-evaluated."""
+        config_neat = load_config()
+        population = neat.Population(config_neat)
+        cache = FitnessCache()
+        population.add_reporter(FitnessCacheReporter(cache))
+        population.run(lambda genomes, cfg: ai_module.eval_genomes_fixed_seeds(
+            genomes, cfg, seeds=(0,), cache=cache), 2)
+        cache.start_generation(2)
+        self.assertEqual(cache.history[0]["hits"], 0)
+        self.assertGreaterEqual(cache.history[1]["hits"], config_neat.reproduction_config.elitism)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Unit tests for the bounded Hall of Fame.
+
+Tests verify the size cap and eviction policies, that cached networks and
+serialized members follow the contents, and that self-play against a
+HallOfFame gives the same fitness serially, in parallel and across
+generations that reuse its networks.
+"""
+
+import copy
+import pickle
+import random
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+from ai.hall_of_fame import HallOfFame
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class Member:
+    """Genome stand-in with an ELO rating."""
+
+    def __init__(self, name, elo_rating=1200):
+        self.name = name
+        self.elo_rating = elo_rating
+
+
+def names(hall_of_fame):
+    return [member.name for member in hall_of_fame]
+
+
+class TestEviction(unittest.TestCase):
+    """Tests for the size cap and the eviction policies."""
+
+    def test_oldest(self):
+        """Test a full Hall of Fame drops its oldest member and changes version."""
+        hall_of_fame = HallOfFame(max_size=3, eviction="oldest")
+        versions = set()
+        for name in "abcde":
+            hall_of_fame.append(Member(name))
+            versions.add(hall_of_fame.version)
+        self.assertEqual(names(hall_of_fame), ["c", "d", "e"])
+        self.assertEqual(len(versions), 5)
+
+    def test_lowest_elo_keeps_newest(self):
+        """Test the lowest-rated member is evicted, but never the newcomer."""
+        hall_of_fame = HallOfFame([Member("a", 1500), Member("b", 1100), Member("c", 1300)],
+                                  max_size=3, eviction="lowest_elo")
+        hall_of_fame.append(Member("d", 900))
+        self.assertEqual(names(hall_of_fame), ["a", "c", "d"])
+        hall_of_fame.append(Member("e", 1400))
+        self.assertEqual(names(hall_of_fame), ["a", "c", "e"])
+
+    def test_diversity_drops_near_duplicate(self):
+        """Test the diversity policy evicts a member of the closest pair."""
+        config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                  neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                  CONFIG_PATH)
+        genomes = [genome for _, genome in list(neat.Population(config_neat).population.items())[:4]]
+        hall_of_fame = HallOfFame(max_size=4, eviction="diversity", config_neat=config_neat)
+        hall_of_fame.extend(genomes[:2])
+        hall_of_fame.append(copy.deepcopy(genomes[0]))
+        hall_of_fame.append(genomes[2])
+        hall_of_fame.append(genomes[3])
+        self.assertEqual(len(hall_of_fame), 4)
+        self.assertIn(genomes[1], hall_of_fame)
+        self.assertIn(genomes[3], hall_of_fame)
+        self.assertEqual(sum(genome.key == genomes[0].key for genome in hall_of_fame), 1)
+
+    def test_unknown_policy(self):
+        """Test an unknown eviction policy raises ValueError."""
+        with self.assertRaises(ValueError):
+            HallOfFame(eviction="random")
+
+    def test_list_compatible(self):
+        """Test slice assignment, pickling and copying keep the cap and settings."""
+        hall_of_fame = HallOfFame(max_size=2, eviction="lowest_elo")
+        hall_of_fame[:] = [Member("a"), Member("b"), Member("c")]
+        self.assertEqual(names(hall_of_fame), ["b", "c"])
+        for restored in (pickle.loads(pickle.dumps(hall_of_fame)), copy.deepcopy(hall_of_fame)):
+            self.assertIsInstance(restored, HallOfFame)
+            self.assertEqual((names(restored), restored.max_size, restored.eviction),
+                             (["b", "c"], 2, "lowest_elo"))
+
+
+class TestCaches(unittest.TestCase):
+    """Tests for cached networks and serialized members."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = [genome for _, genome in neat.Population(cls.config_neat).population.items()]
+
+    def test_networks_follow_members(self):
+        """Test networks are built once and memory stays flat over many additions."""
+        hall_of_fame = HallOfFame(max_size=5)
+        for generation in range(500):
+            hall_of_fame.append(copy.deepcopy(self.genomes[generation % len(self.genomes)]))
+            first = hall_of_fame.network(0, self.config_neat)
+            self.assertIs(hall_of_fame.network(0, self.config_neat), first)
+            self.assertLessEqual(len(hall_of_fame._networks), 5)
+        self.assertEqual(len(hall_of_fame), 5)
+
+    def test_serialized_once_per_version(self):
+        """Test the pickled members are reused until the contents change."""
+        hall_of_fame = HallOfFame(self.genomes[:3])
+        blob = hall_of_fame.serialized()
+        self.assertIs(hall_of_fame.serialized(), blob)
+        self.assertEqual([genome.key for genome in pickle.loads(blob)],
+                         [genome.key for genome in self.genomes[:3]])
+        hall_of_fame.append(self.genomes[3])
+        self.assertIsNot(hall_of_fame.serialized(), blob)
+
+
+class TestSelfPlayWithHallOfFame(unittest.TestCase):
+    """Tests for self-play against a HallOfFame."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        population = list(neat.Population(cls.config_neat).population.items())
+        cls.genomes = population[:9]
+        cls.hall_of_fame = HallOfFame([genome for _, genome in population[9:12]])
+
+    def fitness(self, evaluator, seed, **kwargs):
+        genomes = copy.deepcopy(self.genomes)
+        with mock.patch.object(ai_module, "HALL_OF_FAME", self.hall_of_fame):
+            evaluator(genomes, self.config_neat, seed=seed, **kwargs)
+        return {genome_id: genome.fitness for genome_id, genome in genomes}
+
+    def test_cached_networks_match_fresh_ones(self):
+        """Test reused Hall of Fame networks give the fitness of fresh networks."""
+        cached = [self.fitness(ai_module.eval_genomes_self_play, seed) for seed in (2, 2)]
+        with mock.patch.object(HallOfFame, "network",
+                               lambda hall_of_fame, index, config_neat:
+                               ai_module._create_network(hall_of_fame[index], config_neat)):
+            fresh = self.fitness(ai_module.eval_genomes_self_play, 2)
+        self.assertEqual(cached, [fresh, fresh])
+
+    def test_parallel_reuses_broadcast(self):
+        """Test workers get the Hall of Fame once while it is unchanged."""
+        with ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH) as executor:
+            parallel = self.fitness(ai_module.eval_genomes_self_play_parallel, 3, executor=executor)
+            name = executor._hall_of_fame_shm.name
+            self.assertEqual(self.fitness(ai_module.eval_genomes_self_play_parallel, 3,
+                                          executor=executor), parallel)
+            self.assertEqual(executor._hall_of_fame_shm.name, name)
+        self.assertEqual(self.fitness(ai_module.eval_genomes_self_play, 3), parallel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for Swiss-system matchmaking.
+
+Tests verify that Swiss rounds are disjoint, pair rating neighbours, avoid
+rematches and rotate byes, and that the Swiss evaluator plays its shorter
+schedule with ratings independent of the number of workers.
+"""
+
+import copy
+import random
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+from ai.matchmaking import SwissScheduler, swiss_rounds
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TestSwissScheduler(unittest.TestCase):
+    """Tests for SwissScheduler."""
+
+    def test_round_count(self):
+        """Test the default number of rounds grows with log2 of the population."""
+        self.assertEqual(swiss_rounds(1), 0)
+        self.assertEqual(swiss_rounds(2), 2)
+        self.assertEqual(swiss_rounds(50), 7)
+        self.assertLess(swiss_rounds(50) * 25, 2 * 5 * 25)
+
+    def test_pairs_rating_neighbours(self):
+        """Test the first round pairs genomes of adjacent rating."""
+        ratings = {genome_id: 1000 + 10 * genome_id for genome_id in range(8)}
+        pairings = SwissScheduler(ratings, random.Random(0)).next_round(ratings)
+        self.assertEqual(sorted(tuple(sorted(pairing)) for pairing in pairings),
+                         [(0, 1), (2, 3), (4, 5), (6, 7)])
+
+    def test_rounds_are_disjoint_without_rematches(self):
+        """Test no genome plays twice in a round and no pair meets twice."""
+        ratings = dict.fromkeys(range(10), 1200)
+        scheduler = SwissScheduler(ratings, random.Random(1))
+        seen = set()
+        for _ in range(swiss_rounds(10)):
+            pairings = scheduler.next_round(ratings)
+            players = [genome_id for pairing in pairings for genome_id in pairing]
+            self.assertEqual(len(players), len(set(players)))
+            self.assertEqual(len(pairings), 5)
+            for pairing in pairings:
+                self.assertNotIn(frozenset(pairing), seen)
+                seen.add(frozenset(pairing))
+                # The winner climbs, so the next round meets new neighbours
+                ratings[pairing[0]] += 16
+                ratings[pairing[1]] -= 16
+
+    def test_byes_rotate(self):
+        """Test every genome sits out once before anyone sits out twice."""
+        ratings = {genome_id: 1200 - genome_id for genome_id in range(5)}
+        scheduler = SwissScheduler(ratings, random.Random(2))
+        byes = []
+        for _ in range(10):
+            players = {genome_id for pairing in scheduler.next_round(ratings) for genome_id in pairing}
+            byes.extend(set(ratings) - players)
+        self.assertEqual(sorted(byes[:5]), list(range(5)))
+        self.assertEqual(sorted(byes[5:]), list(range(5)))
+
+    def test_schedule_is_seeded(self):
+        """Test the same seed gives the same rounds."""
+        ratings = dict.fromkeys(range(12), 1200)
+        first = SwissScheduler(ratings, random.Random(3)).next_round(ratings)
+        second = SwissScheduler(ratings, random.Random(3)).next_round(ratings)
+        self.assertEqual(first, second)
+
+
+class TestSwissEvaluation(unittest.TestCase):
+    """Tests for competitive evaluation with Swiss pairing."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:12]
+
+    def evaluate(self, max_workers, seed):
+        genomes = copy.deepcopy(self.genomes)
+        with ConcurrentTrainingExecutor(max_workers=max_workers, config_path=CONFIG_PATH) as executor:
+            with mock.patch.object(executor, "execute_pairings",
+                                   wraps=executor.execute_pairings) as execute_pairings:
+                ai_module.eval_genomes_competitive_swiss(genomes, self.config_neat, seed=seed,
+                                                         executor=executor)
+        matches = sum(len(call.args[0]) for call in execute_pairings.call_args_list)
+        return {genome_id: genome.elo_rating for genome_id, genome in genomes}, matches
+
+    def test_ratings_independent_of_workers(self):
+        """Test ELO ratings are identical for one and two workers."""
+        one_worker, matches = self.evaluate(1, seed=5)
+        two_workers, _ = self.evaluate(2, seed=5)
+        self.assertEqual(one_worker, two_workers)
+        self.assertNotEqual(set(one_worker.values()), {1200})
+        self.assertEqual(matches, swiss_rounds(12) * 6)
+
+    def test_unknown_scheduler(self):
+        """Test an unknown scheduler name raises ValueError."""
+        with self.assertRaises(ValueError):
+            ai_module.eval_genomes_competitive_parallel(copy.deepcopy(self.genomes), self.config_neat,
+                                                        scheduler="knockout")
+
+    def test_lookup(self):
+        """Test the Swiss evaluator is selectable by name."""
+        self.assertIs(ai_module.get_fitness_function("competitive_swiss"),
+                      ai_module.eval_genomes_competitive_swiss)
+
+
+if __name__ == '__main__':
+    unittest.main()
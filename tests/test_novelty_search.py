@@ -0,0 +1,190 @@
+"""Unit tests for the novelty archive.
+
+Tests verify that novelty scores equal a brute-force k-nearest-neighbour
+mean for scalar and vector behaviors, through FIFO eviction, that the batch
+and single-BC APIs agree, and that a persistent archive warm-starts new
+instances and is seen by read-only readers in other processes.
+"""
+
+import multiprocessing
+import random
+import shutil
+import tempfile
+import unittest
+import sys
+import os
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from novelty_search import NoveltyArchive
+
+
+def brute_force_novelty(archive, bc, k):
+    """Mean distance to the k nearest archive entries, as a sorted full scan."""
+    if len(archive) < k:
+        return 0.0
+    distances = sorted(float(np.linalg.norm(np.subtract(bc, entry))) for entry in archive)
+    return float(np.mean(distances[:k]))
+
+
+class TestScalarArchive(unittest.TestCase):
+    """Tests for scalar behavior characteristics."""
+
+    def test_matches_brute_force_through_eviction(self):
+        """Test novelty equals a full scan while old entries are evicted."""
+        rng = random.Random(0)
+        archive = NoveltyArchive(max_size=40, k_nearest=5)
+        reference = []
+        for step in range(200):
+            # Rounded values give plenty of ties
+            bc = round(rng.uniform(0, 600), 0 if step % 2 else 3)
+            query = rng.uniform(-50, 650)
+            self.assertAlmostEqual(archive.calculate_novelty(query),
+                                   brute_force_novelty(reference, query, 5), places=9)
+            archive.add_bc(bc)
+            reference = (reference + [bc])[-40:]
+            self.assertEqual(archive.archive, reference)
+        self.assertEqual(archive.get_archive_size(), 40)
+
+    def test_too_small(self):
+        """Test novelty is 0.0 until the archive holds k entries."""
+        archive = NoveltyArchive(k_nearest=3)
+        archive.add_many([1.0, 2.0])
+        self.assertEqual(archive.calculate_novelty(5.0), 0.0)
+        archive.add_bc(3.0)
+        self.assertAlmostEqual(archive.calculate_novelty(5.0), 3.0)
+
+    def test_batch_equals_single(self):
+        """Test calculate_novelty_many and add_many match one-at-a-time calls."""
+        rng = random.Random(1)
+        bcs = [rng.uniform(0, 600) for _ in range(300)]
+        batched, single = NoveltyArchive(max_size=100), NoveltyArchive(max_size=100)
+        batched.add_many(bcs[:250])
+        for bc in bcs[:250]:
+            single.add_bc(bc)
+        self.assertEqual(batched.archive, single.archive)
+        self.assertEqual(batched.calculate_novelty_many(bcs[250:]),
+                         [single.calculate_novelty(bc) for bc in bcs[250:]])
+
+    def test_assign_archive(self):
+        """Test assigning a list replaces the contents (as checkpoints restore it)."""
+        archive = NoveltyArchive(max_size=3)
+        archive.add_many([9.0, 8.0])
+        archive.archive = [1.0, 2.0, 3.0, 4.0]
+        self.assertEqual(archive.archive, [2.0, 3.0, 4.0])
+
+
+class TestVectorArchive(unittest.TestCase):
+    """Tests for multi-dimensional behavior characteristics."""
+
+    def test_matches_brute_force(self):
+        """Test vector novelty uses Euclidean k-nearest distances."""
+        rng = random.Random(2)
+        archive = NoveltyArchive(max_size=50, k_nearest=4)
+        reference = []
+        for _ in range(80):
+            bc = [rng.uniform(0, 1), rng.uniform(0, 1), rng.uniform(0, 1)]
+            self.assertAlmostEqual(archive.calculate_novelty(bc),
+                                   brute_force_novelty(reference, bc, 4), places=9)
+            archive.add_bc(bc)
+            reference = (reference + [bc])[-50:]
+        self.assertEqual(archive.archive, reference)
+
+    def test_dimension_mismatch(self):
+        """Test mixing scalar and vector BCs raises ValueError."""
+        archive = NoveltyArchive()
+        archive.add_bc([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            archive.add_bc(1.0)
+        with self.assertRaises(ValueError):
+            archive.calculate_novelty_many([[1.0, 2.0, 3.0]])
+
+
+def _read_novelty(path, bcs):
+    """Scores BCs against a read-only mapping of a persistent archive."""
+    archive = NoveltyArchive(path=path, readonly=True)
+    return archive.get_archive_size(), archive.calculate_novelty_many(bcs)
+
+
+class TestPersistentArchive(unittest.TestCase):
+    """Tests for memory-mapped archives."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "novelty", "archive.npy")
+        self.bcs = [random.Random(3).uniform(0, 600) for _ in range(60)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_warm_start(self):
+        """Test a new archive on the same file continues where the last one stopped."""
+        first = NoveltyArchive(max_size=50, k_nearest=5, path=self.path)
+        first.add_many(self.bcs)
+        memory = NoveltyArchive(max_size=50, k_nearest=5)
+        memory.add_many(self.bcs)
+
+        second = NoveltyArchive(max_size=500, k_nearest=5, path=self.path)
+        self.assertEqual(second.max_size, 50)
+        self.assertEqual(second.archive, memory.archive)
+        self.assertEqual(second.calculate_novelty_many([0.0, 300.0]),
+                         memory.calculate_novelty_many([0.0, 300.0]))
+        second.add_bc(1.5)
+        memory.add_bc(1.5)
+        self.assertEqual(NoveltyArchive(path=self.path).archive, memory.archive)
+
+    def test_readers_follow_writer(self):
+        """Test read-only readers see later writes and cannot write."""
+        reader = NoveltyArchive(path=self.path, readonly=True, k_nearest=5)
+        self.assertEqual(reader.calculate_novelty(1.0), 0.0)
+        writer = NoveltyArchive(max_size=40, k_nearest=5, path=self.path)
+        writer.add_many(self.bcs[:30])
+        self.assertEqual(reader.archive, writer.archive)
+        writer.add_many(self.bcs[30:])
+        self.assertEqual(reader.calculate_novelty_many(self.bcs[:5]),
+                         writer.calculate_novelty_many(self.bcs[:5]))
+        writer.archive = [1.0, 2.0]
+        self.assertEqual(reader.archive, [1.0, 2.0])
+        with self.assertRaises(RuntimeError):
+            reader.add_bc(3.0)
+
+    def test_worker_process_reads_archive(self):
+        """Test another process scores novelty from the mapped file."""
+        writer = NoveltyArchive(k_nearest=5, path=self.path)
+        writer.add_many(self.bcs)
+        with multiprocessing.Pool(1) as pool:
+            size, scores = pool.apply(_read_novelty, (self.path, self.bcs[:5]))
+        self.assertEqual(size, 60)
+        self.assertEqual(scores, writer.calculate_novelty_many(self.bcs[:5]))
+
+    def test_reopen_scalar_archive(self):
+        """Test an archive of scalar BCs is discarded when vector BCs are expected."""
+        NoveltyArchive(k_nearest=5, path=self.path).add_many(self.bcs)
+        with self.assertRaises(ValueError):
+            NoveltyArchive(k_nearest=5, path=self.path, readonly=True, dims=3)
+
+        with mock.patch("builtins.print"):
+            archive = NoveltyArchive(k_nearest=5, path=self.path, dims=3)
+        self.assertEqual(archive.get_archive_size(), 0)
+        archive.add_bc([0.1, 0.2, 0.3])
+        self.assertEqual(archive.calculate_novelty_many([[0.1, 0.2, 0.3]]), [0.0])
+        reopened = NoveltyArchive(k_nearest=5, path=self.path, readonly=True, dims=3)
+        self.assertEqual(reopened.archive, [[0.1, 0.2, 0.3]])
+
+    def test_restore_scalar_archive(self):
+        """Test restoring scalar BCs into a vector archive leaves it empty."""
+        archive = NoveltyArchive(k_nearest=5, dims=3)
+        archive.add_bc([0.1, 0.2, 0.3])
+        with mock.patch("builtins.print"):
+            archive.archive = self.bcs
+        self.assertEqual(archive.get_archive_size(), 0)
+        archive.add_bc([0.1, 0.2, 0.3])
+        self.assertEqual(archive.get_archive_size(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Unit tests for the vectorized scripted opponents.
+
+Tests verify that the vectorized rule-based opponent matches the per-state
+function, that the opponent zoo plays sensibly on a BatchGameSimulator and
+that batched evaluation against scripted opponents fills in fitness.
+"""
+
+import os
+import sys
+import timeit
+import unittest
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import config
+from core.batch_simulator import BatchGameSimulator, ACTION_UP, ACTION_DOWN, ACTION_STAY, BALL_SIZE
+from ai import ai_module
+from ai.opponents import (
+    get_rule_based_move, rule_based_actions, predict_intercept_y, create_opponent,
+    TrackerOpponent, InterceptorOpponent, DelayedTrackerOpponent, NoisyTrackerOpponent,
+    OPPONENT_ZOO,
+)
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+ACTION_MOVES = {ACTION_UP: "UP", ACTION_DOWN: "DOWN", ACTION_STAY: None}
+
+
+def duel(left, right, num_games=200, frames=4000, seed=0):
+    """Plays two scripted opponents against each other and returns the simulator."""
+    simulator = BatchGameSimulator(num_games, seed=seed)
+    left.reset()
+    right.reset()
+    for _ in range(frames):
+        simulator.update(left.actions(simulator, "left"), right.actions(simulator, "right"))
+    return simulator
+
+
+class TestRuleBasedActions(unittest.TestCase):
+    """Tests for the vectorized rule-based opponent."""
+
+    def test_matches_per_state_function(self):
+        """Test rule_based_actions agrees with get_rule_based_move."""
+        rng = np.random.default_rng(0)
+        paddle_y = rng.uniform(0, config.SCREEN_HEIGHT - config.PADDLE_HEIGHT, 2000)
+        ball_y = rng.uniform(0, config.SCREEN_HEIGHT, 2000)
+        ball_y[:50] = paddle_y[:50] + config.PADDLE_HEIGHT / 2 + 10  # Deadzone edge
+        actions = rule_based_actions(paddle_y, ball_y)
+        for i in range(2000):
+            state = {"paddle_right_y": paddle_y[i], "ball_y": ball_y[i]}
+            self.assertEqual(ACTION_MOVES[int(actions[i])], get_rule_based_move(state, "right"))
+
+    def test_tracker_reads_simulator(self):
+        """Test TrackerOpponent plays the classic opponent for both sides."""
+        simulator = BatchGameSimulator(64, seed=1)
+        for _ in range(30):
+            simulator.update(ACTION_UP, ACTION_DOWN)
+        for side in ("left", "right"):
+            actions = TrackerOpponent().actions(simulator, side)
+            for i in range(64):
+                self.assertEqual(ACTION_MOVES[int(actions[i])],
+                                 get_rule_based_move(simulator.get_state(i), side))
+
+    def test_vectorized_is_faster(self):
+        """Test one vectorized call beats per-game calls for many games."""
+        simulator = BatchGameSimulator(2000, seed=2)
+        states = [simulator.get_state(i) for i in range(2000)]
+        opponent = TrackerOpponent()
+        vectorized = timeit.timeit(lambda: opponent.actions(simulator), number=20)
+        per_state = timeit.timeit(lambda: [get_rule_based_move(s) for s in states], number=20)
+        self.assertLess(vectorized, per_state)
+
+
+class TestOpponentZoo(unittest.TestCase):
+    """Tests for the scripted opponent zoo."""
+
+    def test_intercept_prediction(self):
+        """Test predicted intercepts match the simulated ball path."""
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            x, y = rng.uniform(100, 600), rng.uniform(20, 560)
+            vx, vy = rng.choice([-1, 1]) * rng.uniform(3, 9), rng.choice([-1, 1]) * rng.uniform(3, 9)
+            side = "right" if vx > 0 else "left"
+            predicted = predict_intercept_y(np.array([x]), np.array([y]), np.array([vx]),
+                                            np.array([vy]), side)[0]
+            # Follow the ball with the simulator's wall bounce rule
+            face = (config.SCREEN_WIDTH - 10 - config.PADDLE_WIDTH - BALL_SIZE if side == "right"
+                    else 10 + config.PADDLE_WIDTH)
+            while (x < face) if side == "right" else (x > face):
+                x, y = x + vx, y + vy
+                if y <= 0 or y + BALL_SIZE >= config.SCREEN_HEIGHT:
+                    vy = -vy
+            self.assertLess(abs(predicted - y), 2 * abs(vy) + 1)
+        self.assertTrue(np.isnan(predict_intercept_y(np.array([300.0]), np.array([300.0]),
+                                                     np.array([-3.0]), np.array([3.0]), "right")[0]))
+
+    def test_interceptor_outplays_tracker(self):
+        """Test the interceptor wins more points than the rule-based tracker."""
+        simulator = duel(InterceptorOpponent(), TrackerOpponent(), num_games=100, frames=6000)
+        self.assertGreater(simulator.score_left.sum(), simulator.score_right.sum())
+
+    def test_delayed_tracker(self):
+        """Test a zero-delay tracker is the classic tracker and delay weakens it."""
+        zero_delay = duel(DelayedTrackerOpponent(delay=0), TrackerOpponent(), num_games=50, frames=1500)
+        tracker = duel(TrackerOpponent(), TrackerOpponent(), num_games=50, frames=1500)
+        np.testing.assert_array_equal(zero_delay.paddle_left_y, tracker.paddle_left_y)
+        delayed = duel(DelayedTrackerOpponent(delay=12), TrackerOpponent())
+        self.assertGreater(delayed.score_right.sum(), delayed.score_left.sum())
+
+    def test_noisy_tracker_is_reproducible(self):
+        """Test a seeded noisy tracker replays identically after reset()."""
+        opponent = NoisyTrackerOpponent(noise_std=30, seed=4)
+        first = duel(opponent, TrackerOpponent(), num_games=20, frames=500)
+        second = duel(opponent, TrackerOpponent(), num_games=20, frames=500)
+        np.testing.assert_array_equal(first.paddle_left_y, second.paddle_left_y)
+
+    def test_create_opponent(self):
+        """Test the zoo registry builds opponents by name."""
+        self.assertEqual(set(OPPONENT_ZOO), {"tracker", "interceptor", "delayed_tracker", "noisy_tracker"})
+        self.assertEqual(create_opponent("delayed_tracker", delay=3).delay, 3)
+        with self.assertRaises(ValueError):
+            create_opponent("unknown")
+
+
+class TestBatchedScriptedEvaluation(unittest.TestCase):
+    """Tests for batched fitness and validation against scripted opponents."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:10]
+
+    def test_eval_genomes_batched(self):
+        """Test every genome gets a fitness in the eval_genomes range."""
+        for name in OPPONENT_ZOO:
+            for _, genome in self.genomes:
+                genome.fitness = None
+            ai_module.eval_genomes_batched(self.genomes, self.config_neat,
+                                           opponent=create_opponent(name), seed=5)
+            for _, genome in self.genomes:
+                self.assertIsNotNone(genome.fitness)
+                self.assertGreaterEqual(genome.fitness, -5)
+
+    def test_validate_genomes_batched(self):
+        """Test batched validation returns (avg_rally, win_rate) per genome."""
+        validation = ai_module.validate_genomes_batched(self.genomes, self.config_neat,
+                                                        opponent=InterceptorOpponent(), seed=6)
+        self.assertEqual(set(validation), {genome_id for genome_id, _ in self.genomes})
+        for avg_rally, win_rate in validation.values():
+            self.assertGreaterEqual(avg_rally, 0)
+            self.assertTrue(0.0 <= win_rate <= 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Unit tests for round-based parallel competitive evaluation.
+
+Tests verify that rounds hold disjoint pairings, that ELO ratings do not
+depend on the number of workers, and that the evaluator is selectable by
+name.
+"""
+
+import copy
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TestCompetitiveRounds(unittest.TestCase):
+    """Tests for schedule_competitive_rounds."""
+
+    def test_rounds_are_disjoint(self):
+        """Test no genome plays twice in a round."""
+        for size in (10, 11):
+            rounds = ai_module.schedule_competitive_rounds(range(size), 6, random.Random(0))
+            self.assertEqual(len(rounds), 6)
+            for pairings in rounds:
+                players = [genome_id for pairing in pairings for genome_id in pairing]
+                self.assertEqual(len(players), len(set(players)))
+                self.assertEqual(len(pairings), size // 2)
+
+    def test_schedule_is_seeded(self):
+        """Test the same seed gives the same schedule."""
+        first = ai_module.schedule_competitive_rounds(range(20), 4, random.Random(1))
+        second = ai_module.schedule_competitive_rounds(range(20), 4, random.Random(1))
+        self.assertEqual(first, second)
+
+
+class TestParallelCompetitiveEvaluation(unittest.TestCase):
+    """Tests for eval_genomes_competitive_parallel."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:12]
+
+    def evaluate(self, max_workers, seed):
+        genomes = copy.deepcopy(self.genomes)
+        with ConcurrentTrainingExecutor(max_workers=max_workers, config_path=CONFIG_PATH) as executor:
+            ai_module.eval_genomes_competitive_parallel(genomes, self.config_neat, seed=seed,
+                                                        executor=executor, num_rounds=4)
+        return {genome_id: genome.elo_rating for genome_id, genome in genomes}, genomes
+
+    def test_ratings_independent_of_workers(self):
+        """Test ELO ratings are identical for one and two workers."""
+        one_worker, genomes = self.evaluate(1, seed=3)
+        two_workers, _ = self.evaluate(2, seed=3)
+        self.assertEqual(one_worker, two_workers)
+        self.assertNotEqual(set(one_worker.values()), {1200})
+        for _, genome in genomes:
+            self.assertIsNotNone(genome.fitness)
+            self.assertGreaterEqual(genome.fitness, 0)
+
+    def test_rating_pool_is_conserved(self):
+        """Test every ELO update moves equal points between the two players."""
+        ratings, _ = self.evaluate(2, seed=4)
+        self.assertAlmostEqual(sum(ratings.values()), 1200 * len(ratings))
+
+
+class TestFitnessFunctionRegistry(unittest.TestCase):
+    """Tests for selecting fitness functions by name."""
+
+    def test_lookup(self):
+        """Test known names resolve and unknown names raise ValueError."""
+        self.assertIs(ai_module.get_fitness_function("competitive_parallel"),
+                      ai_module.eval_genomes_competitive_parallel)
+        self.assertIs(ai_module.get_fitness_function("self_play"), ai_module.eval_genomes_self_play)
+        with self.assertRaises(ValueError):
+            ai_module.get_fitness_function("unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Unit tests for parallel self-play evaluation.
+
+Tests verify that the self-play schedule is seeded, that Hall of Fame
+opponents keep their fitness, that parallel evaluation reproduces the
+serial fitness exactly, and that a failed match does not abort a generation.
+"""
+
+import copy
+import random
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TestSelfPlaySchedule(unittest.TestCase):
+    """Tests for schedule_self_play."""
+
+    def test_schedule(self):
+        """Test every genome plays once per round and HOF draws are tagged."""
+        genome_list = [(i, None) for i in range(10)]
+        pairings = ai_module.schedule_self_play(genome_list, [], random.Random(0))
+        self.assertEqual(len(pairings), 10)
+        for start in (0, 5):
+            players = [p for left, right, _ in pairings[start:start + 5] for p in (left, right)]
+            self.assertEqual(sorted(players), list(range(10)))
+
+        pairings = ai_module.schedule_self_play(genome_list, ["a", "b"], random.Random(1))
+        hof = [right for _, right, _ in pairings if isinstance(right, tuple)]
+        self.assertTrue(hof)
+        self.assertTrue(all(right[0] == "hof" and right[1] in (0, 1) for right in hof))
+        self.assertEqual(pairings, ai_module.schedule_self_play(genome_list, ["a", "b"], random.Random(1)))
+
+
+class TestParallelSelfPlay(unittest.TestCase):
+    """Tests for eval_genomes_self_play_parallel."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                      neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                      CONFIG_PATH)
+        population = list(neat.Population(cls.config_neat).population.items())
+        cls.genomes = population[:9]
+        cls.hall_of_fame = [genome for _, genome in population[9:12]]
+        cls.executor = ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def fitness(self, evaluator, seed, **kwargs):
+        genomes = copy.deepcopy(self.genomes)
+        hall_of_fame = copy.deepcopy(self.hall_of_fame)
+        for genome in hall_of_fame:
+            genome.fitness = 123.0
+        with mock.patch.object(ai_module, "HALL_OF_FAME", hall_of_fame):
+            evaluator(genomes, self.config_neat, seed=seed, **kwargs)
+        self.assertEqual({genome.fitness for genome in hall_of_fame}, {123.0})
+        return {genome_id: genome.fitness for genome_id, genome in genomes}
+
+    def test_parallel_equals_serial(self):
+        """Test merged parallel fitness equals serial fitness for a fixed seed."""
+        for seed, interval in ((0, None), (1, 2)):
+            serial = self.fitness(ai_module.eval_genomes_self_play, seed, decision_interval=interval)
+            parallel = self.fitness(ai_module.eval_genomes_self_play_parallel, seed,
+                                    decision_interval=interval, executor=self.executor)
+            self.assertEqual(serial, parallel)
+            self.assertTrue(all(fitness != 0 for fitness in serial.values()))
+
+    def test_serial_is_seeded(self):
+        """Test the serial evaluator is reproducible for a fixed seed."""
+        self.assertEqual(self.fitness(ai_module.eval_genomes_self_play, 5),
+                         self.fitness(ai_module.eval_genomes_self_play, 5))
+
+    def test_failed_match_is_skipped(self):
+        """Test a failing self-play match returns an error result that adds no fitness."""
+        genomes = copy.deepcopy(self.genomes)
+        ids = [genome_id for genome_id, _ in genomes]
+        pairings = [(ids[0], ids[1], 1), ("missing", ids[1], 2)]
+        self.executor.broadcast_population(dict(genomes))
+        results = self.executor.execute_pairings([pairing[:2] for pairing in pairings],
+                                                 seeds=[1, 2], match_type="self_play")
+        self.assertNotIn("error", results[0])
+        self.assertIn("error", results[1])
+
+        genome_dict = dict(genomes)
+        for genome in genome_dict.values():
+            genome.fitness = 0
+        ai_module._merge_self_play_results(genome_dict, pairings, results)
+        self.assertEqual(genome_dict[ids[1]].fitness, results[0]["right_delta"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Parity tests for the shared physics kernel.
+
+Tests verify that engine.Game, simulator.GameSimulator and
+simulator_optimized.GameSimulator all play identical seeded games, through
+both the step() and update() interfaces and the paddle/ball views.
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import config
+from core import engine as game_engine
+from core import simulator as game_simulator
+from core import simulator_optimized
+from core.physics import PongPhysics, STATE_SIZE, EVENT_GAME_OVER
+
+
+FRONT_ENDS = (PongPhysics, game_simulator.GameSimulator,
+              simulator_optimized.GameSimulator, game_engine.Game)
+
+
+def step_trajectory(game, frames=6000, move_seed=0):
+    """Steps the game with fixed pseudo-random moves and records every frame."""
+    moves = random.Random(move_seed)
+    trajectory = []
+    for _ in range(frames):
+        events = game.step(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+        trajectory.append((events & ~EVENT_GAME_OVER, tuple(game.state)))
+    return trajectory
+
+
+def update_trajectory(game, frames=6000, move_seed=0):
+    """Plays the game through update() and records events and view positions."""
+    moves = random.Random(move_seed)
+    trajectory = []
+    for _ in range(frames):
+        score_data = game.update(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+        trajectory.append((score_data, game.ball.rect.x, game.ball.rect.y, game.ball.vel_x,
+                           game.left_paddle.rect.y, game.right_paddle.rect.y,
+                           game.score_left, game.score_right))
+    return trajectory
+
+
+class TestPhysicsParity(unittest.TestCase):
+    """Tests that every front-end delegates to the same physics."""
+
+    def test_step_trajectories_identical(self):
+        """Test seeded games step identically through every front-end."""
+        for seed in range(8):
+            ball_speed = (None, 6, 12)[seed % 3]
+            expected = step_trajectory(PongPhysics(ball_speed=ball_speed, seed=seed), move_seed=seed)
+            for front_end in FRONT_ENDS[1:]:
+                trajectory = step_trajectory(front_end(ball_speed=ball_speed, seed=seed), move_seed=seed)
+                self.assertEqual(trajectory, expected, front_end)
+
+    def test_update_trajectories_identical(self):
+        """Test the dict API and object views agree across front-ends."""
+        for seed in range(4):
+            expected = update_trajectory(game_simulator.GameSimulator(seed=seed), move_seed=seed)
+            optimized = simulator_optimized.GameSimulator(seed=seed)
+            self.assertEqual(update_trajectory(optimized, move_seed=seed), expected)
+            # The visual game normally stops at VISUAL_MAX_SCORE
+            game = game_engine.Game(seed=seed, max_score=config.MAX_SCORE)
+            self.assertEqual(update_trajectory(game, move_seed=seed), expected)
+
+    def test_game_over_scores(self):
+        """Test the visual game ends at VISUAL_MAX_SCORE, training at MAX_SCORE."""
+        game = game_engine.Game(seed=1)
+        simulator = game_simulator.GameSimulator(seed=1)
+        game.score_left = simulator.score_left = config.VISUAL_MAX_SCORE
+        self.assertTrue(game.step() & EVENT_GAME_OVER)
+        self.assertEqual(bool(simulator.step() & EVENT_GAME_OVER),
+                         config.VISUAL_MAX_SCORE >= config.MAX_SCORE)
+        self.assertFalse(game_engine.Game(seed=1, max_score=50).step() & EVENT_GAME_OVER)
+
+    def test_views_write_through(self):
+        """Test assigning through the views updates the kernel and buffer."""
+        for front_end in FRONT_ENDS[1:]:
+            game = front_end(seed=2)
+            game.ball.rect.x = 100
+            game.ball.vel_x = -4
+            game.right_paddle.move(up=False)
+            self.assertEqual(game.ball_x, 100)
+            self.assertEqual(game.get_state()["ball_vel_x"], -4)
+            self.assertEqual(game.state[0], 100.0)
+            self.assertEqual(game.paddle_right_y, game.right_paddle.rect.y)
+            self.assertGreater(game.right_paddle.rect.y, game.left_paddle.rect.y)
+            self.assertEqual(len(game.state), STATE_SIZE)
+
+    def test_clone_keeps_front_end(self):
+        """Test clone() returns the same front-end type with live views."""
+        for front_end in FRONT_ENDS:
+            game = front_end(seed=4)
+            step_trajectory(game, frames=300)
+            clone = game.clone()
+            self.assertIs(type(clone), front_end)
+            self.assertEqual(step_trajectory(clone), step_trajectory(game))
+            if hasattr(clone, "ball"):
+                self.assertEqual(clone.ball.rect.x, clone.ball_x)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Unit tests for the cProfile hooks of training and tournaments.
+
+Tests verify that profiles of the coordinating process and of pool workers
+end up in one pstats file per generation or tournament, for both the
+training and the match executor.
+"""
+
+import copy
+import glob
+import os
+import pickle
+import pstats
+import sys
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor
+from ai.hall_of_fame import HallOfFame
+from match.concurrent_executor import ConcurrentMatchExecutor
+from training.reporters import ProfileReporter
+from utils.profiling import Profiler, flush_worker
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def load_config():
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                       CONFIG_PATH)
+
+
+def profiled_functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+class TestTrainingProfile(unittest.TestCase):
+    """Tests for profiling parallel training evaluation."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = load_config()
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:6]
+
+    def test_one_file_per_generation(self):
+        """Test each generation merges the coordinator's and workers' profiles."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = Profiler("train", directory=tmp)
+            reporter = ProfileReporter(profiler)
+            evaluate = profiler.wrap(ai_module.eval_genomes_competitive_parallel)
+            with ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH,
+                                            profiler=profiler) as executor, \
+                    mock.patch.object(ai_module, "HALL_OF_FAME", HallOfFame()), \
+                    mock.patch.object(ai_module, "NOVELTY_ARCHIVE", ai_module.NoveltyArchive()), \
+                    mock.patch("sys.stdout"):
+                for generation in range(2):
+                    reporter.start_generation(generation)
+                    evaluate(copy.deepcopy(self.genomes), self.config_neat, seed=1,
+                             executor=executor, num_rounds=1)
+                    reporter.end_generation(self.config_neat, {}, types.SimpleNamespace())
+            files = sorted(glob.glob(os.path.join(profiler.directory, "*.pstats")))
+            self.assertEqual([os.path.basename(path) for path in files], ["gen_0000.pstats", "gen_0001.pstats"])
+            for path in files:
+                functions = profiled_functions(path)
+                self.assertIn("eval_genomes_competitive_parallel", functions)
+                self.assertIn("_play_training_match", functions)
+
+    def test_flush_timeout_resets_barrier(self):
+        """Test a flush that times out leaves the next flush reaching every worker."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = Profiler("train", directory=tmp)
+            with mock.patch("utils.profiling.FLUSH_TIMEOUT", 0.2), \
+                    ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH,
+                                               profiler=profiler) as executor, \
+                    mock.patch("sys.stderr"):
+                busy = executor.pool.apply_async(time.sleep, (1.0,))
+                profiler.dump("gen_0000")
+                busy.get()
+                (_, barrier), = profiler._pools
+                self.assertFalse(barrier.broken)
+                paths = executor.pool.map(flush_worker, range(2), chunksize=1)
+            pids = {os.path.basename(path).split("_")[1] for path in paths}
+            self.assertEqual(len(pids), 2)
+
+    def test_nothing_profiled(self):
+        """Test a dump without profiled work writes no file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = Profiler("train", directory=tmp)
+            self.assertIsNone(profiler.dump("gen_0000"))
+            self.assertEqual(os.listdir(profiler.directory), [])
+
+
+class TestTournamentProfile(unittest.TestCase):
+    """Tests for profiling concurrent tournament matches."""
+
+    def test_workers_write_profiles_on_close(self):
+        """Test workers of a closed pool are merged into the tournament profile."""
+        genomes = [genome for _, genome in list(neat.Population(load_config()).population.items())[:2]]
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, genome in enumerate(genomes):
+                paths.append(os.path.join(tmp, f"model_{i}.pkl"))
+                with open(paths[-1], "wb") as fh:
+                    pickle.dump(genome, fh)
+            profiler = Profiler("tournament", directory=tmp)
+            configs = [{"p1_path": paths[0], "p2_path": paths[1], "neat_config_path": CONFIG_PATH,
+                        "seed": seed} for seed in range(2)]
+            with ConcurrentMatchExecutor(max_workers=2, profiler=profiler) as executor:
+                results = executor.execute_matches(configs)
+            self.assertFalse(any(result.get("error") for result in results))
+            self.assertTrue(glob.glob(os.path.join(profiler.directory, "worker_*.prof")))
+
+            path = profiler.dump("tournament")
+            self.assertEqual(os.listdir(profiler.directory), ["tournament.pstats"])
+            functions = profiled_functions(path)
+            # The coordinator's profile starts inside execute_matches
+            self.assertIn("_execute", functions)
+            self.assertIn("_run_single_match", functions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Unit tests for seeded simulators and seed threading.
+
+Tests verify that seeded games are reproducible, independent of the global
+random state, and that match runners pass seeds through to the simulator.
+"""
+
+import os
+import pickle
+import random
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from core import engine as game_engine
+from core import simulator as game_simulator
+from core import simulator_optimized
+from ai.agent_factory import NeatAgent
+from ai.concurrent_training import _run_training_match
+from match.concurrent_executor import ConcurrentMatchExecutor
+from match.simulator import MatchSimulator
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TrackingNet:
+    """Stand-in network that tracks the ball with its paddle."""
+
+    def activate(self, inputs):
+        return [inputs[5], -inputs[5], 0.0]
+
+
+def play(game, frames=4000):
+    """Plays random-looking but fixed moves and returns the trajectory."""
+    moves = random.Random(0)
+    trajectory = []
+    for _ in range(frames):
+        game.update(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+        state = game.get_state()
+        trajectory.append((state["ball_x"], state["ball_y"], state["ball_vel_x"],
+                           state["score_left"], state["score_right"]))
+    return trajectory
+
+
+class TestSeededSimulators(unittest.TestCase):
+    """Tests for the seed and rng arguments of every simulator."""
+
+    SIMULATORS = (game_simulator.GameSimulator, simulator_optimized.GameSimulator, game_engine.Game)
+
+    def test_same_seed_same_game(self):
+        """Test equal seeds give identical games despite global RNG use."""
+        for simulator_cls in self.SIMULATORS:
+            random.seed(1)
+            first = play(simulator_cls(seed=42))
+            random.seed(2)
+            second = play(simulator_cls(seed=42))
+            self.assertEqual(first, second, simulator_cls)
+
+    def test_seeded_game_leaves_global_rng_alone(self):
+        """Test seeded games never draw from the global random module."""
+        for simulator_cls in self.SIMULATORS:
+            random.seed(5)
+            expected = random.random()
+            random.seed(5)
+            play(simulator_cls(seed=3), frames=2000)
+            self.assertEqual(random.random(), expected, simulator_cls)
+
+    def test_rng_instance_is_used(self):
+        """Test an explicit random.Random instance drives the serves."""
+        game_a = game_simulator.GameSimulator(rng=random.Random(9))
+        game_b = game_simulator.GameSimulator(seed=9)
+        self.assertEqual(play(game_a), play(game_b))
+
+
+class TestSeedThreading(unittest.TestCase):
+    """Tests for seeds passed through match runners and executors."""
+
+    def test_match_simulator_seed(self):
+        """Test seeded MatchSimulator runs are reproducible."""
+        results = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            simulator = MatchSimulator(NeatAgent(TrackingNet()), NeatAgent(TrackingNet()), seed=123)
+            result = simulator.run()
+            results.append((result["score_left"], result["score_right"], result["stats"]))
+        self.assertEqual(results[0], results[1])
+
+    def test_training_match_seed(self):
+        """Test _run_training_match is reproducible for a given seed."""
+        config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                  neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                  CONFIG_PATH)
+        genomes = list(neat.Population(config_neat).population.values())
+        match_data = {
+            "genome_left_pickle": pickle.dumps(genomes[0]),
+            "genome_right_pickle": pickle.dumps(genomes[1]),
+            "config_path": CONFIG_PATH,
+            "ball_speed": None,
+            "seed": 77
+        }
+        random.seed(1)
+        first = _run_training_match(match_data)
+        random.seed(2)
+        second = _run_training_match(match_data)
+        self.assertNotIn("error", first)
+        self.assertEqual(first, second)
+
+    def test_match_executor_derives_seeds(self):
+        """Test a seeded executor assigns the same seeds on every run."""
+        configs = [{"p1_path": "a", "p2_path": "b", "neat_config_path": CONFIG_PATH},
+                   {"p1_path": "c", "p2_path": "d", "neat_config_path": CONFIG_PATH, "seed": 5}]
+        seeded = [[ConcurrentMatchExecutor(visual_mode=True, seed=11)._with_seed(c) for c in configs]
+                  for _ in range(2)]
+        self.assertEqual(seeded[0], seeded[1])
+        self.assertIsNotNone(seeded[0][0]["seed"])
+        self.assertEqual(seeded[0][1]["seed"], 5)
+        self.assertNotIn("seed", configs[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
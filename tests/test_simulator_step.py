@@ -0,0 +1,203 @@
+"""Unit tests for the flat-buffer step API of the headless simulators.
+
+Tests verify that GameSimulator.step keeps the state buffer in sync with the
+dictionary API, that update() still returns the same event dictionaries and
+that fast_forward() ends in exactly the state frame-by-frame stepping reaches.
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import config
+from core import simulator as game_simulator
+from core import simulator_optimized
+from core.simulator import (
+    STATE_BALL_X, STATE_BALL_Y, STATE_BALL_VEL_X, STATE_BALL_VEL_Y,
+    STATE_PADDLE_LEFT_Y, STATE_PADDLE_RIGHT_Y, STATE_SCORE_LEFT, STATE_SCORE_RIGHT,
+    STATE_CONTACT_Y, EVENT_HIT_LEFT, EVENT_HIT_RIGHT, EVENT_SCORE_LEFT, EVENT_SCORE_RIGHT,
+    EVENT_WALL, EVENT_GAME_OVER, EVENT_HIT, EVENT_SCORED, network_inputs,
+)
+from match.game_runner import GameRunner
+from ai.agent_factory import NeatAgent
+
+
+STATE_KEYS = (
+    (STATE_BALL_X, "ball_x"), (STATE_BALL_Y, "ball_y"),
+    (STATE_BALL_VEL_X, "ball_vel_x"), (STATE_BALL_VEL_Y, "ball_vel_y"),
+    (STATE_PADDLE_LEFT_Y, "paddle_left_y"), (STATE_PADDLE_RIGHT_Y, "paddle_right_y"),
+    (STATE_SCORE_LEFT, "score_left"), (STATE_SCORE_RIGHT, "score_right"),
+)
+
+
+class TrackingNet:
+    """Tiny stand-in network that tracks the ball with its paddle."""
+
+    def activate(self, inputs):
+        # inputs[5] is (my_y - ball_y) / height
+        return [inputs[5], -inputs[5], 0.0]
+
+
+class TestSimulatorStep(unittest.TestCase):
+    """Tests for GameSimulator.step and the state buffer."""
+
+    def _play(self, simulator_cls, frames=5000, seed=3):
+        random.seed(seed)
+        moves = random.Random(seed + 1)
+        game = simulator_cls(ball_speed=6)
+        all_events = 0
+        for _ in range(frames):
+            events = game.step(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+            all_events |= events
+            state = game.get_state()
+            for offset, key in STATE_KEYS:
+                self.assertEqual(game.state[offset], state[key], key)
+        return all_events
+
+    def test_buffer_matches_get_state(self):
+        """Test the flat buffer always mirrors get_state()."""
+        all_events = self._play(game_simulator.GameSimulator)
+        for flag in (EVENT_HIT_LEFT, EVENT_HIT_RIGHT, EVENT_WALL):
+            self.assertTrue(all_events & flag)
+        self.assertTrue(all_events & (EVENT_SCORE_LEFT | EVENT_SCORE_RIGHT))
+
+    def test_optimized_buffer_matches_get_state(self):
+        """Test the optimized simulator keeps its buffer in sync too."""
+        self._play(simulator_optimized.GameSimulator)
+
+    def test_update_reports_events_from_step(self):
+        """Test update() dicts agree with the step() bitmask of a twin game."""
+        random.seed(11)
+        game_a = game_simulator.GameSimulator()
+        random.seed(11)
+        game_b = game_simulator.GameSimulator()
+        moves = random.Random(5)
+        for _ in range(5000):
+            left, right = moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None))
+            rng_state = random.getstate()
+            score_data = game_a.update(left, right)
+            random.setstate(rng_state)
+            events = game_b.step(left, right)
+
+            self.assertEqual(score_data is None, not events & ~EVENT_WALL)
+            if score_data is None:
+                continue
+            self.assertEqual(score_data["hit_left"], bool(events & EVENT_HIT_LEFT))
+            self.assertEqual(score_data["hit_right"], bool(events & EVENT_HIT_RIGHT))
+            if events & EVENT_HIT:
+                self.assertEqual(score_data["contact_y"], game_b.state[STATE_CONTACT_Y])
+            if events & EVENT_SCORE_LEFT:
+                self.assertEqual(score_data["scored"], "left")
+            if events & EVENT_SCORE_RIGHT:
+                self.assertEqual(score_data["scored"], "right")
+            self.assertEqual(score_data.get("game_over", False), bool(events & EVENT_GAME_OVER))
+
+    def test_game_over_flag(self):
+        """Test EVENT_GAME_OVER is raised once a player reaches MAX_SCORE."""
+        game = game_simulator.GameSimulator()
+        game.score_left = config.MAX_SCORE
+        self.assertTrue(game.step() & EVENT_GAME_OVER)
+
+    def test_network_inputs_match_agent_inputs(self):
+        """Test network_inputs reproduces the NeatAgent input tuple."""
+        game = game_simulator.GameSimulator()
+        for _ in range(40):
+            game.step("UP", "DOWN")
+        captured = []
+
+        class CaptureNet:
+            def activate(self, inputs):
+                captured.append(tuple(inputs))
+                return [0.0, 0.0, 1.0]
+
+        agent = NeatAgent(CaptureNet())
+        for side in ("left", "right"):
+            agent.get_move(game.get_state(), side)
+            self.assertEqual(network_inputs(game.state, side), captured[-1])
+
+
+class TestGameRunnerBuffer(unittest.TestCase):
+    """Tests for GameRunner's flat-buffer path."""
+
+    def test_buffer_path_matches_dict_path(self):
+        """Test buffer-reading agents play the same game as dict agents."""
+
+        class DictOnlyAgent:
+            def __init__(self):
+                self.agent = NeatAgent(TrackingNet())
+
+            def get_move(self, state, side):
+                return self.agent.get_move(state, side)
+
+        random.seed(21)
+        fast = GameRunner(NeatAgent(TrackingNet()), NeatAgent(TrackingNet()))
+        self.assertTrue(fast.agents_use_buffer)
+        fast_scores = fast.run_to_completion()
+
+        random.seed(21)
+        slow = GameRunner(DictOnlyAgent(), DictOnlyAgent())
+        self.assertFalse(slow.agents_use_buffer)
+        slow_scores = slow.run_to_completion()
+
+        self.assertEqual(fast_scores, slow_scores)
+        self.assertEqual(fast.frame_count, slow.frame_count)
+
+
+class TestFastForward(unittest.TestCase):
+    """Tests for GameSimulator.fast_forward."""
+
+    def test_matches_frame_by_frame_stepping(self):
+        """Test fast-forwarding ends in exactly the state stepping reaches."""
+        inf = float("inf")
+        for seed in range(40):
+            moves = random.Random(seed)
+            random.seed(seed)
+            fast = game_simulator.GameSimulator(ball_speed=moves.choice((None, 6, 12)))
+            random.seed(seed)
+            slow = game_simulator.GameSimulator(ball_speed=fast.ball.initial_speed_x)
+            for _ in range(40):
+                left = moves.choice(("UP", "DOWN", None))
+                right = moves.choice(("UP", "DOWN", None))
+                max_frames = moves.randint(1, 300)
+                x_min = moves.choice((-inf, 120.0))
+                x_max = moves.choice((inf, 640.0))
+
+                rng_state = random.getstate()
+                frames, events = fast.fast_forward(left, right, max_frames, x_min, x_max)
+                random.setstate(rng_state)
+                expected_frames, expected_events = 0, 0
+                while expected_frames < max_frames and x_min < slow.state[STATE_BALL_X] < x_max:
+                    step_events = slow.step(left, right)
+                    expected_events |= step_events
+                    expected_frames += 1
+                    if step_events & (EVENT_HIT | EVENT_SCORED):
+                        break
+
+                self.assertEqual((frames, events), (expected_frames, expected_events))
+                self.assertEqual(list(fast.state), list(slow.state))
+                self.assertEqual(fast.get_state(), slow.get_state())
+
+    def test_runner_fast_forward_keeps_results(self):
+        """Test GameRunner gives identical games with and without skipping."""
+        for seed in (1, 2, 3):
+            runners = []
+            for fast_forward in (False, True):
+                random.seed(seed)
+                runner = GameRunner(NeatAgent(TrackingNet(), reaction_distance=150),
+                                    NeatAgent(TrackingNet(), reaction_distance=150),
+                                    fast_forward=fast_forward)
+                runners.append((runner.run_to_completion(), runner))
+            (slow_scores, slow), (fast_scores, fast) = runners
+            self.assertFalse(slow.fast_forward)
+            self.assertTrue(fast.fast_forward)
+            self.assertEqual(fast_scores, slow_scores)
+            self.assertEqual(fast.frame_count, slow.frame_count)
+            self.assertEqual(list(fast.game.state), list(slow.game.state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for GameSimulator snapshot, restore and clone.
+
+Tests verify that games branched from a mid-rally state replay exactly like
+the original continuation.
+"""
+
+import random
+import sys
+import os
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import simulator as game_simulator
+
+
+def continue_game(game, frames=3000, move_seed=0):
+    """Advances the game with fixed pseudo-random moves and returns its states."""
+    moves = random.Random(move_seed)
+    states = []
+    for _ in range(frames):
+        game.step(moves.choice(("UP", "DOWN", None)), moves.choice(("UP", "DOWN", None)))
+        states.append(tuple(game.state[:game_simulator.STATE_CONTACT_Y]))
+    return states
+
+
+class TestSnapshot(unittest.TestCase):
+    """Tests for snapshot(), restore() and clone()."""
+
+    def setUp(self):
+        self.game = game_simulator.GameSimulator(seed=8)
+        continue_game(self.game, frames=700, move_seed=1)
+
+    def test_restore_replays_continuation(self):
+        """Test restoring a snapshot with RNG state replays the same future."""
+        snap = self.game.snapshot(include_rng=True)
+        expected = continue_game(self.game)
+        self.game.restore(snap)
+        self.assertEqual(continue_game(self.game), expected)
+
+    def test_restore_without_rng_keeps_position(self):
+        """Test a plain snapshot restores the positions and scores."""
+        snap = self.game.snapshot()
+        self.assertEqual(len(snap), 8)
+        state_before = self.game.get_state()
+        continue_game(self.game, frames=50)
+        self.game.restore(snap)
+        self.assertEqual(self.game.get_state(), state_before)
+        self.assertEqual(list(self.game.state[:8]), list(map(float, snap)))
+
+    def test_clone_is_independent_and_identical(self):
+        """Test a clone plays the same future without affecting the original."""
+        clone = self.game.clone()
+        snap = self.game.snapshot(include_rng=True)
+        clone_states = continue_game(clone)
+        self.assertEqual(self.game.snapshot(include_rng=True), snap)
+        self.assertEqual(continue_game(self.game), clone_states)
+
+    def test_clone_shares_no_mutable_state(self):
+        """Test clone() copies every mutable attribute instead of sharing it."""
+        clone = self.game.clone()
+        immutable = (int, float, bool, str, tuple, type(None))
+        for name in list(game_simulator.PongPhysics.__slots__) + list(vars(self.game)):
+            value = getattr(clone, name)
+            if not isinstance(value, immutable):
+                self.assertIsNot(value, getattr(self.game, name), name)
+        paddle_y = self.game.left_paddle.rect.y
+        clone.left_paddle.move(up=paddle_y > 100)
+        self.assertEqual(self.game.left_paddle.rect.y, paddle_y)
+        self.assertNotEqual(clone.left_paddle.rect.y, paddle_y)
+
+if __name__ == '__main__':
+    unittest.main()
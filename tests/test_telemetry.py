@@ -0,0 +1,166 @@
+"""Unit tests for per-generation training telemetry.
+
+Tests verify that timed matches count frames and activations without
+changing results, that worker pools report their utilization, and that
+TelemetryReporter times the evaluation and writes one row per generation.
+"""
+
+import copy
+import csv
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import ai_module
+from ai.concurrent_training import ConcurrentTrainingExecutor, _create_network, _play_training_match
+from ai.hall_of_fame import HallOfFame
+from ai.telemetry import Telemetry, timed_match
+from training.reporters import TelemetryReporter, telemetry_path
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+def load_config():
+    return neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                       neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                       CONFIG_PATH)
+
+
+class ActivationCounter:
+    """Network wrapper counting activations."""
+
+    def __init__(self, net):
+        self.net = net
+        self.activations = 0
+
+    def activate(self, inputs):
+        self.activations += 1
+        return self.net.activate(inputs)
+
+
+class TestTimedMatch(unittest.TestCase):
+    """Tests for timed_match and Telemetry counters."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = load_config()
+        cls.genomes = [genome for _, genome in list(neat.Population(cls.config_neat).population.items())[:2]]
+
+    def networks(self):
+        return [_create_network(genome, self.config_neat) for genome in self.genomes]
+
+    def test_result_unchanged(self):
+        """Test timing a match leaves its result as is and counts its work."""
+        plain = _play_training_match(*self.networks(), seed=4, decision_interval=2)
+        for sample_every in (1, 10 ** 9):
+            with mock.patch("ai.telemetry.SAMPLE_EVERY", sample_every), \
+                    mock.patch("ai.telemetry._matches", itertools.count(1)):
+                nets = [ActivationCounter(net) for net in self.networks()]
+                result, telemetry = timed_match(_play_training_match, *nets, seed=4, decision_interval=2)
+            self.assertEqual(result, plain)
+            played = result["frames"] - result["frames_saved"]
+            self.assertEqual(telemetry["frames"], played)
+            self.assertEqual(telemetry["activations"], sum(net.activations for net in nets))
+            if sample_every == 1:
+                self.assertLessEqual(telemetry["activation_seconds"], telemetry["seconds"])
+            else:
+                self.assertIsNone(telemetry["activation_seconds"])
+
+    def test_generation_stats(self):
+        """Test counters add up per generation and earlier ones go to history."""
+        telemetry = Telemetry()
+        telemetry.start_generation(0)
+        match = {"frames": 100, "activations": 50, "seconds": 0.5, "activation_seconds": 0.2}
+        unsampled = dict(match, activation_seconds=None)
+        telemetry.record_matches([match, None, unsampled], wall_seconds=1.0, workers=2)
+        telemetry.add_phase("evaluation", 2.0)
+        with telemetry.phase("checkpoint"):
+            time.sleep(0.01)
+        stats = telemetry.stats()
+        self.assertEqual((stats["matches"], stats["frames"], stats["activations"]), (2, 200, 100))
+        self.assertAlmostEqual(stats["activation_seconds"], 0.4)
+        self.assertAlmostEqual(stats["simulation_seconds"], 0.6)
+        self.assertAlmostEqual(stats["worker_utilization"], 0.5)
+        self.assertAlmostEqual(stats["ipc_seconds"], 0.5)
+        self.assertEqual(stats["frames_per_second"], 100.0)
+        self.assertGreaterEqual(stats["checkpoint_seconds"], 0.01)
+
+        telemetry.start_generation(1)
+        self.assertEqual([entry["generation"] for entry in telemetry.history], [0])
+        self.assertEqual(telemetry.stats()["matches"], 0)
+        self.assertIsNone(telemetry.stats()["worker_utilization"])
+
+
+class TestTelemetryReporter(unittest.TestCase):
+    """Tests for TelemetryReporter around real evaluations."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config_neat = load_config()
+        cls.genomes = list(neat.Population(cls.config_neat).population.items())[:6]
+
+    def run_generations(self, path, evaluate, generations=2):
+        telemetry = Telemetry()
+        reporter = TelemetryReporter(telemetry, path)
+        with mock.patch.object(ai_module, "TELEMETRY", telemetry), \
+                mock.patch("ai.telemetry.SAMPLE_EVERY", 1), \
+                mock.patch.object(ai_module, "HALL_OF_FAME", HallOfFame()), \
+                mock.patch("ai.concurrent_training.DEFAULT_TELEMETRY", telemetry), \
+                mock.patch("sys.stdout"):
+            for generation in range(generations):
+                reporter.start_generation(generation)
+                evaluate(copy.deepcopy(self.genomes))
+                reporter.post_evaluate(self.config_neat, {}, None, None)
+                reporter.end_generation(self.config_neat, {}, types.SimpleNamespace())
+        return telemetry
+
+    def test_serial_jsonl(self):
+        """Test a serial evaluation writes one JSON line per generation."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = telemetry_path(os.path.join(tmp, "training_run.csv"))
+            self.assertEqual(os.path.basename(path), "training_run_telemetry.jsonl")
+            self.run_generations(path, lambda genomes: ai_module.eval_genomes_self_play(
+                genomes, self.config_neat, seed=1))
+            with open(path) as fh:
+                rows = [json.loads(line) for line in fh]
+        self.assertEqual([row["generation"] for row in rows], [0, 1])
+        for row in rows:
+            # Two rounds of pairs
+            self.assertEqual(row["matches"], len(self.genomes))
+            self.assertGreater(row["frames_per_second"], 0)
+            self.assertGreater(row["evaluation_seconds"], 0)
+            self.assertGreater(row["activation_seconds"], 0)
+            self.assertIsNone(row["worker_utilization"])
+
+    def test_parallel_csv(self):
+        """Test a worker pool reports utilization and IPC time to a CSV file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "telemetry.csv")
+            with ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH) as executor:
+                with mock.patch.object(ai_module, "NOVELTY_ARCHIVE", ai_module.NoveltyArchive()):
+                    self.run_generations(path, lambda genomes: ai_module.eval_genomes_competitive_parallel(
+                        genomes, self.config_neat, seed=2, executor=executor, num_rounds=2))
+            with open(path, newline="") as fh:
+                rows = list(csv.DictReader(fh))
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            self.assertEqual(int(row["matches"]), len(self.genomes))
+            self.assertGreater(float(row["frames"]), 0)
+            self.assertTrue(0 < float(row["worker_utilization"]) <= 1)
+            self.assertGreaterEqual(float(row["ipc_seconds"]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit tests for the persistent training worker pool.
+
+Tests verify that pairings played from a broadcast population give the same
+results as standalone matches, and that per-match tasks stay tiny.
+"""
+
+import pickle
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import patch_neat
+import neat
+from ai import concurrent_training
+from ai.concurrent_training import ConcurrentTrainingExecutor, _run_training_match
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neat_config.txt")
+
+
+class TestTrainingPool(unittest.TestCase):
+    """Tests for ConcurrentTrainingExecutor's population broadcast."""
+
+    @classmethod
+    def setUpClass(cls):
+        config_neat = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                  neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                  CONFIG_PATH)
+        cls.genomes = dict(list(neat.Population(config_neat).population.items())[:6])
+        cls.executor = ConcurrentTrainingExecutor(max_workers=2, config_path=CONFIG_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def standalone(self, left_id, right_id, seed, decision_interval=None):
+        return _run_training_match({
+            "genome_left_pickle": pickle.dumps(self.genomes[left_id]),
+            "genome_right_pickle": pickle.dumps(self.genomes[right_id]),
+            "config_path": CONFIG_PATH,
+            "ball_speed": None,
+            "seed": seed,
+            "decision_interval": decision_interval,
+        })
+
+    def test_pairings_match_standalone_matches(self):
+        """Test broadcast pairings replay standalone matches exactly."""
+        ids = list(self.genomes)
+        pairings = [(ids[i], ids[(i + 1) % len(ids)]) for i in range(len(ids))]
+        pairings += [(ids[0], ids[0])]  # Self-match
+        seeds = list(range(len(pairings)))
+        for decision_interval in (None, 2):
+            self.executor.broadcast_population(self.genomes, decision_interval=decision_interval)
+            # Run twice so cached networks are reused within a generation
+            for _ in range(2):
+                results = self.executor.execute_pairings(pairings, seeds=seeds)
+                for (left_id, right_id), seed, result in zip(pairings, seeds, results):
+                    self.assertNotIn("error", result)
+                    self.assertEqual(result, self.standalone(left_id, right_id, seed, decision_interval))
+
+    def test_execute_matches_keeps_result_format(self):
+        """Test execute_matches still accepts genome pairs."""
+        genomes = list(self.genomes.values())
+        results = self.executor.execute_matches([(genomes[0], genomes[1]), (genomes[1], genomes[0])],
+                                                seeds=[7, 8])
+        self.assertEqual(results[0], self.standalone(*list(self.genomes)[:2], 7))
+        self.assertEqual(len(results), 2)
+
+    def test_new_generation_replaces_broadcast(self):
+        """Test each broadcast gets its own block and frees the previous one."""
+        first = self.executor.broadcast_population(self.genomes)
+        second = self.executor.broadcast_population(self.genomes)
+        self.assertNotEqual(first, second)
+        from multiprocessing import shared_memory
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=first)
+
+    def test_task_payload_is_small(self):
+        """Test a pairing task is a few bytes, unlike a pickled genome pair."""
+        shm_name = self.executor.broadcast_population(self.genomes)
+        left_id, right_id = list(self.genomes)[:2]
+        task = pickle.dumps((shm_name, left_id, right_id, 12345))
+        genome_pair = pickle.dumps((self.genomes[left_id], self.genomes[right_id]))
+        self.assertLess(len(task), 64)
+        self.assertLess(len(task) * 10, len(genome_pair))
+
+    def test_config_loaded_once_per_process(self):
+        """Test the NEAT config is parsed once and then reused."""
+        concurrent_training._worker_configs.pop(CONFIG_PATH, None)
+        first = concurrent_training._load_config(CONFIG_PATH)
+        self.assertIs(concurrent_training._load_config(CONFIG_PATH), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,13 +11,45 @@ import neat
 import pickle
 from ai import ai_module
 from core import config
+import contextlib
+import csv
 import datetime
-from validation import validate_genome
+from validation import BackgroundValidator
+from training.reporters import (
+    ValidationReporter, CSVReporter, FitnessCacheReporter, EarlyStopReporter, TelemetryReporter,
+    ProfileReporter, telemetry_path,
+)
+from training.checkpoint import CheckpointReporter, latest_checkpoint, restore_checkpoint
+from utils.profiling import Profiler
 
-def run_training(seed_genomes=None):
+def run_training(seed_genomes=None, fitness="self_play", resume=False, checkpoint_dir=None,
+                 persist_novelty=None, profile=False):
     """
     Runs the NEAT training process.
+
+    Args:
+        seed_genomes: Optional genomes to seed the population with.
+        fitness: Name of the fitness function (see ai_module.FITNESS_FUNCTIONS).
+        resume: Continue from the latest population checkpoint if there is one
+            (seed genomes are then ignored).
+        checkpoint_dir: Directory for population checkpoints. Defaults to
+            config.POPULATION_CHECKPOINT_DIR.
+        persist_novelty: Keep the novelty archive in config.NOVELTY_ARCHIVE_PATH
+            and warm-start from it. Defaults to config.NOVELTY_ARCHIVE_PERSIST.
+        profile: Profile the fitness evaluation, including the workers of
+            parallel evaluation, into one pstats file per generation under
+            config.LOGS_PROFILES_DIR.
     """
+    checkpoint_dir = checkpoint_dir or config.POPULATION_CHECKPOINT_DIR
+    if config.NOVELTY_ARCHIVE_PERSIST if persist_novelty is None else persist_novelty:
+        archive = ai_module.open_novelty_archive()
+        print(f"Novelty archive: {archive.get_archive_size()} behaviors from earlier runs")
+    fitness_function = ai_module.get_fitness_function(fitness)
+    profiler = None
+    if profile:
+        profiler = Profiler("train")
+        ai_module.set_profiler(profiler)
+        fitness_function = profiler.wrap(fitness_function)
     # Load configuration
     local_dir = os.path.dirname(__file__)
     config_path = os.path.join(local_dir, 'neat_config.txt')
@@ -26,136 +58,87 @@ def run_training(seed_genomes=None):
                               neat.DefaultSpeciesSet, neat.DefaultStagnation,
                               config_path)
 
-    # Create the population
-    p = neat.Population(config_neat)
-    
-    # Seeding Logic
-    if seed_genomes:
-        print(f"Seeding population with {len(seed_genomes)} genomes...")
-        # Replace random genomes with seeded ones
-        # We need to ensure IDs are unique if we are merging multiple populations
-        # But for simplicity, we can just overwrite the first N genomes
+    generations = 50
+    if resume and latest_checkpoint(checkpoint_dir) is not None:
+        p = restore_checkpoint(checkpoint_dir, config_neat)
+        generations -= p.generation
+        print(f"Resumed from checkpoint at generation {p.generation}")
+    else:
+        # Create the population
+        p = neat.Population(config_neat)
         
-        # NEAT population is a dict {id: genome}
-        pop_ids = list(p.population.keys())
+        # Seeding Logic
+        if seed_genomes:
+            print(f"Seeding population with {len(seed_genomes)} genomes...")
+            # Replace random genomes with seeded ones
+            # We need to ensure IDs are unique if we are merging multiple populations
+            # But for simplicity, we can just overwrite the first N genomes
         
-        for i, seed_genome in enumerate(seed_genomes):
-            if i >= len(pop_ids):
-                break # Population full
+            # NEAT population is a dict {id: genome}
+            pop_ids = list(p.population.keys())
+        
+            for i, seed_genome in enumerate(seed_genomes):
+                if i >= len(pop_ids):
+                    break # Population full
             
-            target_id = pop_ids[i]
-            # Assign the seed genome to this ID
-            # We must copy it to avoid reference issues if using same object multiple times
-            # But here we just take the object.
-            # IMPORTANT: The seed genome might have a different ID. We should probably keep its ID 
-            # or reassign it to match the current population structure.
-            # Safest is to reassign ID.
-            seed_genome.key = target_id
-            p.population[target_id] = seed_genome
+                target_id = pop_ids[i]
+                # Assign the seed genome to this ID
+                # We must copy it to avoid reference issues if using same object multiple times
+                # But here we just take the object.
+                # IMPORTANT: The seed genome might have a different ID. We should probably keep its ID 
+                # or reassign it to match the current population structure.
+                # Safest is to reassign ID.
+                seed_genome.key = target_id
+                p.population[target_id] = seed_genome
             
-        # Re-speciate to ensure species set references the new genome objects
-        p.species.speciate(config_neat, p.population, p.generation)
+            # Re-speciate to ensure species set references the new genome objects
+            p.species.speciate(config_neat, p.population, p.generation)
             
-        print("Seeding complete.")
+            print("Seeding complete.")
 
     # Add reporters
     p.add_reporter(neat.StdOutReporter(True))
     stats = neat.StatisticsReporter()
     p.add_reporter(stats)
-    
-    # Custom Reporter for Validation
-    class ValidationReporter(neat.reporting.BaseReporter):
-        def start_generation(self, generation):
-            self.generation = generation
-
-        def end_generation(self, config, population, species_set):
-            # Find best genome
-            best_genome = None
-            best_fitness = -float('inf')
-            for g in population.values():
-                if g.fitness is not None and g.fitness > best_fitness:
-                    best_fitness = g.fitness
-                    best_genome = g
-            
-            if best_genome:
-                avg_rally, win_rate = validate_genome(best_genome, config, generation=self.generation)
-                print(f"   [Validation] Best Genome vs Rule-Based: Avg Rally={avg_rally:.2f}, Win Rate={win_rate:.2f}")
-                
-                # Update Hall of Fame every 5 generations
-                if self.generation % 5 == 0:
-                    # We need to clone it to ensure it doesn't get mutated later?
-                    # NEAT genomes are usually mutated in place or cloned during reproduction.
-                    # But the population object persists.
-                    # Safest is to pickle/unpickle or use copy.deepcopy
-                    import copy
-                    ai_module.HALL_OF_FAME.append(copy.deepcopy(best_genome))
-                    print(f"   [HOF] Added Best Genome to Hall of Fame. Size: {len(ai_module.HALL_OF_FAME)}")
-                
-                # Log to CSV
-                with open(os.path.join(config_neat.stats_path_csv), 'a', newline='') as f:
-                    writer = csv.writer(f)
-                    # We need generation number. BaseReporter doesn't store it easily unless we track it.
-                    # But we can append to the file created below.
-                    pass
-
-    p.add_reporter(ValidationReporter())
-    
-    # Run for 50 generations
-    # Run for 50 generations
-    print("Starting training (Self-Play Mode)...")
+    p.add_reporter(FitnessCacheReporter(ai_module.FITNESS_CACHE))
+    p.add_reporter(EarlyStopReporter(ai_module.DEFAULT_EARLY_STOP))
     
     # Setup CSV logging first
-    import csv
     stats_filename = f"training_stats_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     stats_path = os.path.join(config.LOGS_TRAINING_DIR, stats_filename)
-    config_neat.stats_path_csv = stats_path # Hack to pass path to reporter
     
     with open(stats_path, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(["generation", "max_fitness", "avg_fitness", "std_dev", "val_avg_rally", "val_win_rate"])
 
-    # We need to override the reporter to write to this CSV
-    class CSVReporter(neat.reporting.BaseReporter):
-        def __init__(self, csv_path):
-            self.csv_path = csv_path
-            self.generation = 0
-        
-        def start_generation(self, generation):
-            self.generation = generation
-            
-        def end_generation(self, config, population, species_set):
-            # Get stats from the stats reporter? 
-            # It's easier to just calculate here or grab from stats object if accessible.
-            # Let's just calculate simple stats
-            fitnesses = [g.fitness for g in population.values() if g.fitness is not None]
-            max_f = max(fitnesses) if fitnesses else 0
-            avg_f = sum(fitnesses) / len(fitnesses) if fitnesses else 0
-            import statistics
-            std = statistics.stdev(fitnesses) if len(fitnesses) > 1 else 0
-            
-            # Validation
-            best_genome = None
-            best_fitness = -float('inf')
-            for g in population.values():
-                if g.fitness is not None and g.fitness > best_fitness:
-                    best_fitness = g.fitness
-                    best_genome = g
-            
-            val_rally = 0
-            val_win = 0
-            if best_genome:
-                val_rally, val_win = validate_genome(best_genome, config, generation=self.generation)
-                print(f"   [Validation] Best Genome vs Rule-Based: Avg Rally={val_rally:.2f}, Win Rate={val_win:.2f}")
+    # Validate each generation's best genome in a background process; the
+    # results are attached to the generation's CSV row when they arrive
+    validator = BackgroundValidator(config_neat)
+    validation_reporter = ValidationReporter(validator)
+    csv_reporter = CSVReporter(stats_path, validator)
+    p.add_reporter(validation_reporter)
+    p.add_reporter(csv_reporter)
+    checkpointer = CheckpointReporter(p, checkpoint_dir)
+    p.add_reporter(checkpointer)
+    # Last, so the validation and checkpoint time above is included
+    p.add_reporter(TelemetryReporter(ai_module.TELEMETRY, telemetry_path(stats_path)))
+    if profiler:
+        # After the telemetry, so dumping the profile is not counted as training time
+        p.add_reporter(ProfileReporter(profiler))
 
-            with open(self.csv_path, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([self.generation, max_f, avg_f, std, val_rally, val_win])
-
-    p.add_reporter(CSVReporter(stats_path))
-
-    winner = p.run(ai_module.eval_genomes_self_play, 50)
+    print(f"Starting training ({fitness} fitness)...")
+    try:
+        winner = p.run(fitness_function, max(0, generations))
+    finally:
+        # Close each independently, so one failing does not leave the others open
+        with contextlib.ExitStack() as cleanup:
+            for closable in (validator, csv_reporter, validation_reporter, checkpointer):
+                cleanup.callback(closable.close)
 
     print(f"Training stats saved to {stats_path}")
+    print(f"Training telemetry saved to {telemetry_path(stats_path)}")
+    if profiler:
+        print(f"Training profiles saved to {profiler.directory}")
 
     # Save the winner
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -176,6 +159,15 @@ if __name__ == "__main__":
         parser = argparse.ArgumentParser()
         parser.add_argument("--seed", help="Path to a specific model file to seed with")
         parser.add_argument("--seed_dir", help="Directory containing models to seed with")
+        parser.add_argument("--fitness", default="self_play", choices=sorted(ai_module.FITNESS_FUNCTIONS),
+                            help="Fitness function to train with")
+        parser.add_argument("--resume", action="store_true",
+                            help="Resume from the latest population checkpoint")
+        parser.add_argument("--checkpoint_dir", help="Directory for population checkpoints")
+        parser.add_argument("--persist_novelty", action="store_true", default=None,
+                            help="Keep the novelty archive on disk and warm-start from it")
+        parser.add_argument("--profile", action="store_true",
+                            help="Profile the fitness evaluation into one pstats file per generation")
         args = parser.parse_args()
         
         seeds = []
@@ -194,7 +186,9 @@ if __name__ == "__main__":
                         except:
                             pass
 
-        run_training(seed_genomes=seeds if seeds else None)
+        run_training(seed_genomes=seeds if seeds else None, fitness=args.fitness,
+                     resume=args.resume, checkpoint_dir=args.checkpoint_dir,
+                     persist_novelty=args.persist_novelty, profile=args.profile)
     except KeyboardInterrupt:
         print("\n[!] Training interrupted by user.")
     except Exception as e:
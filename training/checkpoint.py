@@ -0,0 +1,347 @@
+"""Full-population checkpoints with compressed incremental snapshots.
+
+A checkpoint holds everything needed to continue a run: the population, the
+species set, the genome, node and innovation indexers, the Hall of Fame, the
+novelty archive and the random state. The first checkpoint (and every
+``full_every``-th after it) is a full snapshot; the others are deltas that
+only store the gene sets not already stored by the chain they extend.
+Genomes are matched by ``ai.fitness_cache.genome_hash``, so elites, Hall of
+Fame copies and clones are stored once.
+
+Snapshots are captured at the end of a generation on the training thread
+(pickling only) and compressed and written by a background thread.
+
+Files are named ``checkpoint-<generation>.full.gz`` or ``.delta.gz``, where
+``<generation>`` is the next generation to evaluate (as in
+``neat.Checkpointer``)::
+
+    population = restore_checkpoint(checkpoint_dir, config_neat)
+    population.add_reporter(CheckpointReporter(population, checkpoint_dir))
+    population.run(fitness_function, generations - population.generation)
+"""
+
+import copy
+import gzip
+import os
+import pickle
+import queue
+import random
+import re
+import threading
+from itertools import count
+
+import neat
+
+from ai.fitness_cache import genome_hash
+from ai.telemetry import DEFAULT_TELEMETRY
+
+
+_FILENAME = re.compile(r"^checkpoint-(\d+)\.(full|delta)\.gz$")
+_GENE_FIELDS = ("nodes", "connections")
+
+
+def _peek_counter(counter):
+    """Returns the next value of an itertools.count and a fresh equivalent counter."""
+    value = next(counter)
+    return value, count(value)
+
+
+def list_checkpoints(checkpoint_dir):
+    """Returns ``[(generation, kind, path)]`` sorted by generation."""
+    if not os.path.isdir(checkpoint_dir):
+        return []
+    found = []
+    for filename in os.listdir(checkpoint_dir):
+        match = _FILENAME.match(filename)
+        if match:
+            found.append((int(match.group(1)), match.group(2), os.path.join(checkpoint_dir, filename)))
+    return sorted(found)
+
+
+def latest_checkpoint(checkpoint_dir):
+    """Returns the generation of the newest checkpoint, or None."""
+    checkpoints = list_checkpoints(checkpoint_dir)
+    return checkpoints[-1][0] if checkpoints else None
+
+
+class CheckpointReporter(neat.reporting.BaseReporter):
+    """Reporter writing full and incremental population checkpoints.
+
+    Attributes:
+        population: The neat.Population being checkpointed.
+        checkpoint_dir: Directory holding the checkpoint files.
+        full_every: Number of checkpoints per chain (one full snapshot
+            followed by deltas).
+        generation_interval: Generations between checkpoints.
+    """
+
+    def __init__(self, population, checkpoint_dir, full_every=10, generation_interval=1,
+                 hall_of_fame=None, novelty_archive=None, compresslevel=6, keep_chains=2):
+        """Starts the background writer.
+
+        Args:
+            population: The neat.Population being checkpointed.
+            checkpoint_dir: Directory for checkpoint files (created if needed).
+            full_every: Checkpoints per chain.
+            generation_interval: Generations between checkpoints.
+            hall_of_fame: Hall of Fame list. Defaults to ai_module.HALL_OF_FAME
+                (looked up at save time).
+            novelty_archive: NoveltyArchive. Defaults to ai_module.NOVELTY_ARCHIVE.
+            compresslevel: gzip compression level.
+            keep_chains: Complete chains to keep on disk (older files are
+                deleted after a new full snapshot is written).
+        """
+        self.population = population
+        self.checkpoint_dir = checkpoint_dir
+        self.full_every = full_every
+        self.generation_interval = generation_interval
+        self.hall_of_fame = hall_of_fame
+        self.novelty_archive = novelty_archive
+        self.compresslevel = compresslevel
+        self.keep_chains = keep_chains
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+        self.generation = None
+        self.best_genome = None
+        self._stored_hashes = set()
+        self._chain_length = 0
+        self._queue = queue.Queue()
+        self._error = None
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if self.best_genome is None or best_genome.fitness > self.best_genome.fitness:
+            self.best_genome = best_genome
+
+    def end_generation(self, config, population, species_set):
+        next_generation = self.generation + 1
+        if next_generation % self.generation_interval == 0:
+            self.save(next_generation)
+
+    def save(self, generation):
+        """Captures the run state and queues it for writing.
+
+        The time spent here (the writes happen in the background) counts as
+        the "checkpoint" phase of ai.telemetry.DEFAULT_TELEMETRY.
+
+        Args:
+            generation: The next generation to evaluate.
+        """
+        if self._error is not None:
+            raise self._error
+        full = self._chain_length % self.full_every == 0
+        if full:
+            self._stored_hashes = set()
+        with DEFAULT_TELEMETRY.phase("checkpoint"):
+            record, genes = self._capture(generation, full)
+            data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        self._stored_hashes.update(genes)
+        self._chain_length += 1
+        kind = "full" if full else "delta"
+        self._queue.put((os.path.join(self.checkpoint_dir, f"checkpoint-{generation}.{kind}.gz"), data, full))
+
+    def flush(self):
+        """Waits until every queued checkpoint is on disk."""
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        """Flushes pending checkpoints and stops the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._error is not None:
+            raise self._error
+
+    def _capture(self, generation, full):
+        from ai import ai_module
+
+        population = self.population
+        genome_config = population.config.genome_config
+        genes = {}
+
+        def entry(genome):
+            digest = genome_hash(genome)
+            if digest not in self._stored_hashes and digest not in genes:
+                genes[digest] = (genome.nodes, genome.connections)
+            meta = {name: value for name, value in vars(genome).items() if name not in _GENE_FIELDS}
+            return digest, meta
+
+        species_set = population.species
+        species_indexer_next, species_set.indexer = _peek_counter(species_set.indexer)
+        species = {}
+        for key, spec in species_set.species.items():
+            state = {name: value for name, value in vars(spec).items()
+                     if name not in ("members", "representative")}
+            state["members"] = list(spec.members)
+            state["representative"] = entry(spec.representative) if spec.representative else None
+            species[key] = state
+
+        reproduction = population.reproduction
+        genome_indexer_next, reproduction.genome_indexer = _peek_counter(reproduction.genome_indexer)
+        node_indexer_next = None
+        if genome_config.node_indexer is not None:
+            node_indexer_next, genome_config.node_indexer = _peek_counter(genome_config.node_indexer)
+
+        hall_of_fame = self.hall_of_fame if self.hall_of_fame is not None else ai_module.HALL_OF_FAME
+        archive = self.novelty_archive if self.novelty_archive is not None else ai_module.NOVELTY_ARCHIVE
+        best_genome = self.best_genome or population.best_genome
+
+        record = {
+            "generation": generation,
+            "full": full,
+            "population": {key: entry(genome) for key, genome in population.population.items()},
+            "species": species,
+            "genome_to_species": dict(species_set.genome_to_species),
+            "species_indexer": species_indexer_next,
+            "genome_indexer": genome_indexer_next,
+            "node_indexer": node_indexer_next,
+            "innovation_tracker": copy.deepcopy(reproduction.innovation_tracker),
+            "ancestors": {key: reproduction.ancestors[key] for key in population.population
+                          if key in reproduction.ancestors},
+            "best_genome": entry(best_genome) if best_genome is not None else None,
+            "hall_of_fame": [entry(genome) for genome in hall_of_fame],
+            "novelty_archive": list(archive.archive),
+            "random_state": random.getstate(),
+            "genes": genes,
+        }
+        return record, genes
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data, full = item
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as fh:
+                    fh.write(gzip.compress(data, compresslevel=self.compresslevel))
+                os.replace(tmp_path, path)
+                if full:
+                    self._prune()
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _prune(self):
+        """Deletes chains older than the newest ``keep_chains`` ones."""
+        checkpoints = list_checkpoints(self.checkpoint_dir)
+        full_generations = [generation for generation, kind, _ in checkpoints if kind == "full"]
+        if len(full_generations) <= self.keep_chains:
+            return
+        oldest_kept = full_generations[-self.keep_chains]
+        for generation, _, path in checkpoints:
+            if generation < oldest_kept:
+                os.remove(path)
+
+
+def _load_record(path):
+    with gzip.open(path, "rb") as fh:
+        return pickle.load(fh)
+
+
+def load_checkpoint_chain(checkpoint_dir, generation=None):
+    """Loads the records needed to rebuild a checkpoint.
+
+    Args:
+        checkpoint_dir: Directory holding the checkpoint files.
+        generation: Generation to restore (defaults to the latest).
+
+    Returns:
+        tuple: (record of the requested checkpoint, gene pool of the chain).
+
+    Raises:
+        FileNotFoundError: If there is no such checkpoint or its full
+            snapshot is missing.
+    """
+    checkpoints = list_checkpoints(checkpoint_dir)
+    if generation is None:
+        if not checkpoints:
+            raise FileNotFoundError(f"No checkpoints in {checkpoint_dir}")
+        generation = checkpoints[-1][0]
+    chain = [item for item in checkpoints if item[0] <= generation]
+    if not chain or chain[-1][0] != generation:
+        raise FileNotFoundError(f"No checkpoint for generation {generation} in {checkpoint_dir}")
+    starts = [i for i, (_, kind, _) in enumerate(chain) if kind == "full"]
+    if not starts:
+        raise FileNotFoundError(f"No full snapshot before generation {generation} in {checkpoint_dir}")
+
+    gene_pool = {}
+    record = None
+    for _, _, path in chain[starts[-1]:]:
+        record = _load_record(path)
+        gene_pool.update(record["genes"])
+    return record, gene_pool
+
+
+def restore_checkpoint(checkpoint_dir, config_neat, generation=None, restore_globals=True):
+    """Rebuilds a neat.Population from a checkpoint.
+
+    Args:
+        checkpoint_dir: Directory holding the checkpoint files.
+        config_neat: NEAT configuration object for the resumed run.
+        generation: Generation to restore (defaults to the latest).
+        restore_globals: Also restore ai_module.HALL_OF_FAME, the novelty
+            archive and the random state.
+
+    Returns:
+        neat.Population: Ready to ``run`` from the checkpoint's generation.
+            The Hall of Fame is also available as ``population.hall_of_fame``.
+    """
+    record, gene_pool = load_checkpoint_chain(checkpoint_dir, generation)
+    used = set()
+    genome_type = config_neat.genome_type
+
+    def build(item):
+        digest, meta = item
+        genome = genome_type.__new__(genome_type)
+        genome.__dict__.update(meta)
+        nodes, connections = gene_pool[digest]
+        if digest in used:
+            nodes, connections = copy.deepcopy((nodes, connections))
+        used.add(digest)
+        genome.nodes, genome.connections = nodes, connections
+        return genome
+
+    population = {key: build(item) for key, item in record["population"].items()}
+
+    species_set = config_neat.species_set_type(config_neat.species_set_config, None)
+    species_set.indexer = count(record["species_indexer"])
+    species_set.genome_to_species = dict(record["genome_to_species"])
+    for key, state in record["species"].items():
+        spec = neat.species.Species(key, state["created"])
+        for name, value in state.items():
+            if name not in ("members", "representative"):
+                setattr(spec, name, value)
+        spec.members = {gid: population[gid] for gid in state["members"] if gid in population}
+        representative = state["representative"]
+        if representative is not None:
+            spec.representative = population.get(representative[1].get("key")) or build(representative)
+        species_set.species[key] = spec
+
+    restored = neat.Population(config_neat, (population, species_set, record["generation"]))
+    restored.reproduction.genome_indexer = count(record["genome_indexer"])
+    restored.reproduction.ancestors.update(record["ancestors"])
+    restored.reproduction.innovation_tracker = record["innovation_tracker"]
+    config_neat.genome_config.innovation_tracker = record["innovation_tracker"]
+    if record["node_indexer"] is not None:
+        config_neat.genome_config.node_indexer = count(record["node_indexer"])
+    if record["best_genome"] is not None:
+        restored.best_genome = build(record["best_genome"])
+    restored.hall_of_fame = [build(item) for item in record["hall_of_fame"]]
+
+    if restore_globals:
+        from ai import ai_module
+
+        ai_module.HALL_OF_FAME[:] = restored.hall_of_fame
+        ai_module.NOVELTY_ARCHIVE.archive = list(record["novelty_archive"])
+        random.setstate(record["random_state"])
+    return restored
+
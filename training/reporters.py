@@ -3,10 +3,12 @@
 import copy
 import csv
 import datetime
+import json
 import os
 import pickle
 import statistics
 import sys
+import time
 from typing import Optional
 
 import neat
@@ -226,10 +228,17 @@ class VisualReporter(neat.reporting.BaseReporter):
 
 
 class ValidationReporter(neat.reporting.BaseReporter):
-    """Reporter that validates top genomes against rule-based opponents."""
+    """Reporter that validates top genomes against rule-based opponents.
 
-    def __init__(self):
+    With a ``validator`` (validation.BackgroundValidator), validation runs in
+    the background and results are printed as they arrive; call ``close``
+    after training to print the remaining ones.
+    """
+
+    def __init__(self, validator=None):
         self.generation = 0
+        self.validator = validator
+        self._reported = set()
 
     def start_generation(self, generation: int) -> None:
         self.generation = generation
@@ -247,23 +256,90 @@ class ValidationReporter(neat.reporting.BaseReporter):
         if not best_genome:
             return
 
-        avg_rally, win_rate = validate_genome(best_genome, config_neat, generation=self.generation)
-        print(
-            f"   [Validation] Best Genome vs Rule-Based: Avg Rally={avg_rally:.2f}, "
-            f"Win Rate={win_rate:.2f}"
-        )
+        with ai_module.TELEMETRY.phase("validation"):
+            if self.validator is None:
+                avg_rally, win_rate = validate_genome(best_genome, config_neat, generation=self.generation)
+                self._print_result(avg_rally, win_rate)
+            else:
+                self.validator.submit(self.generation, best_genome)
+                self.validator.poll()
+                self._print_finished()
 
         if self.generation % 5 == 0:
             ai_module.HALL_OF_FAME.append(copy.deepcopy(best_genome))
             print(f"   [HOF] Added Best Genome to Hall of Fame. Size: {len(ai_module.HALL_OF_FAME)}")
 
+    def close(self) -> None:
+        """Waits for background validation and prints the remaining results."""
+        if self.validator is not None:
+            self.validator.drain()
+            self._print_finished()
+
+    def _print_finished(self) -> None:
+        for generation in sorted(set(self.validator.results) - self._reported):
+            self._reported.add(generation)
+            self._print_result(*self.validator.results[generation], generation=generation)
+
+    @staticmethod
+    def _print_result(avg_rally, win_rate, generation=None) -> None:
+        label = "" if generation is None else f" (gen {generation})"
+        print(
+            f"   [Validation{label}] Best Genome vs Rule-Based: Avg Rally={avg_rally:.2f}, "
+            f"Win Rate={win_rate:.2f}"
+        )
+
+
+class FitnessCacheReporter(neat.reporting.BaseReporter):
+    """Reporter that prints the fitness cache hit rate of each generation."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def start_generation(self, generation: int) -> None:
+        self.cache.start_generation(generation)
+
+    def end_generation(self, config_neat, population, species_set) -> None:
+        stats = self.cache.stats()
+        if stats["hits"] + stats["misses"] == 0:
+            return
+        print(
+            f"   [Cache] {stats['hits']}/{stats['hits'] + stats['misses']} evaluations cached "
+            f"({stats['hit_rate']:.0%}), ~{stats['saved_seconds']:.2f}s saved"
+        )
+
+
+class EarlyStopReporter(neat.reporting.BaseReporter):
+    """Reporter that prints the frames early stopping saved in each generation."""
+
+    def __init__(self, policy):
+        self.policy = policy
+
+    def start_generation(self, generation: int) -> None:
+        self.policy.start_generation(generation)
+
+    def end_generation(self, config_neat, population, species_set) -> None:
+        stats = self.policy.stats()
+        if stats["stopped"] == 0:
+            return
+        print(
+            f"   [Early stop] {stats['stopped']}/{stats['matches']} matches stopped early, "
+            f"{stats['frames_saved']} frames saved"
+        )
+
 
 class CSVReporter(neat.reporting.BaseReporter):
-    """Reporter that logs generation statistics to CSV."""
+    """Reporter that logs generation statistics to CSV.
 
-    def __init__(self, csv_path: str):
+    With a ``validator`` (validation.BackgroundValidator), rows are held back
+    until their generation's validation finishes and are then appended in
+    generation order; call ``close`` after training to write the rest.
+    """
+
+    def __init__(self, csv_path: str, validator=None):
         self.csv_path = csv_path
         self.generation = 0
+        self.validator = validator
+        self._pending_rows = []
 
     def start_generation(self, generation: int) -> None:
         self.generation = generation
@@ -283,10 +359,20 @@ class CSVReporter(neat.reporting.BaseReporter):
                 best_fitness = genome.fitness
                 best_genome = genome
 
+        if self.validator is not None:
+            with ai_module.TELEMETRY.phase("validation"):
+                if best_genome:
+                    self.validator.submit(self.generation, best_genome)
+                self._pending_rows.append(([self.generation, max_f, avg_f, std], best_genome is not None))
+                self.validator.poll()
+            self._write_finished_rows()
+            return
+
         val_rally = 0
         val_win = 0
         if best_genome:
-            val_rally, val_win = validate_genome(best_genome, config_neat, generation=self.generation)
+            with ai_module.TELEMETRY.phase("validation"):
+                val_rally, val_win = validate_genome(best_genome, config_neat, generation=self.generation)
             print(
                 f"   [Validation] Best Genome vs Rule-Based: Avg Rally={val_rally:.2f}, "
                 f"Win Rate={val_win:.2f}"
@@ -295,3 +381,103 @@ class CSVReporter(neat.reporting.BaseReporter):
         with open(self.csv_path, "a", newline="") as fh:
             writer = csv.writer(fh)
             writer.writerow([self.generation, max_f, avg_f, std, val_rally, val_win])
+
+    def close(self) -> None:
+        """Waits for background validation and writes the remaining rows."""
+        if self.validator is not None:
+            self.validator.drain()
+            self._write_finished_rows()
+
+    def _write_finished_rows(self) -> None:
+        rows = []
+        while self._pending_rows:
+            stats, validated = self._pending_rows[0]
+            if validated and stats[0] not in self.validator.results:
+                break
+            self._pending_rows.pop(0)
+            rows.append(stats + list(self.validator.results[stats[0]] if validated else (0, 0)))
+        if rows:
+            with open(self.csv_path, "a", newline="") as fh:
+                csv.writer(fh).writerows(rows)
+
+
+def telemetry_path(log_path: str) -> str:
+    """Returns the telemetry file kept next to a training log file."""
+    return os.path.splitext(log_path)[0] + "_telemetry.jsonl"
+
+
+class TelemetryReporter(neat.reporting.BaseReporter):
+    """Reporter that records where each generation's time went.
+
+    Times the fitness evaluation (from ``start_generation`` to
+    ``post_evaluate``) into an ``ai.telemetry.Telemetry``, and at the end of
+    each generation appends its stats to ``path`` (JSON lines, or CSV if the
+    path ends in ".csv") and prints a one-line summary. Add it after the
+    other reporters, so the validation and checkpoint time they spend in
+    ``end_generation`` counts towards the same generation.
+    """
+
+    def __init__(self, telemetry, path: Optional[str] = None):
+        self.telemetry = telemetry
+        self.path = path
+        self._evaluation_start = None
+
+    def start_generation(self, generation: int) -> None:
+        self.telemetry.start_generation(generation)
+        self._evaluation_start = time.perf_counter()
+
+    def post_evaluate(self, config_neat, population, species, best_genome) -> None:
+        if self._evaluation_start is not None:
+            self.telemetry.add_phase("evaluation", time.perf_counter() - self._evaluation_start)
+            self._evaluation_start = None
+
+    def end_generation(self, config_neat, population, species_set) -> None:
+        stats = self.telemetry.stats()
+        if self.path:
+            self._write(stats)
+        utilization = stats["worker_utilization"]
+        workers = "" if utilization is None else (
+            f", workers {utilization:.0%} busy, ipc {stats['ipc_seconds']:.2f}s")
+        print(
+            f"   [Telemetry] {stats['wall_seconds']:.2f}s: eval {stats['evaluation_seconds']:.2f}s, "
+            f"validation {stats['validation_seconds']:.2f}s, checkpoint {stats['checkpoint_seconds']:.2f}s, "
+            f"other {stats['other_seconds']:.2f}s | {stats['matches']} matches, "
+            f"{stats['frames_per_second']:,.0f} frames/s, "
+            f"{stats['activations_per_second']:,.0f} activations/s{workers}"
+        )
+
+    def _write(self, stats) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not self.path.endswith(".csv"):
+            with open(self.path, "a") as fh:
+                fh.write(json.dumps(stats) + "\n")
+            return
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, "a", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(stats))
+            if new_file:
+                writer.writeheader()
+            writer.writerow(stats)
+
+
+class ProfileReporter(neat.reporting.BaseReporter):
+    """Reporter that saves each generation's profile.
+
+    At the end of each generation merges what a ``utils.profiling.Profiler``
+    collected (the wrapped fitness function and the workers of attached
+    pools) into ``gen_<generation>.pstats`` in the profiler's directory.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.generation = None
+
+    def start_generation(self, generation: int) -> None:
+        self.generation = generation
+
+    def end_generation(self, config_neat, population, species_set) -> None:
+        path = self.profiler.dump(f"gen_{self.generation:04d}")
+        if path:
+            print(f"   [Profile] {path}")
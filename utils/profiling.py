@@ -0,0 +1,195 @@
+"""cProfile hooks for training runs and tournaments.
+
+A ``Profiler`` profiles the evaluation hot path of the coordinating process
+(``wrap`` or ``profiling``) and the workers of the process pools attached to
+it. Pool workers start their own ``cProfile.Profile`` in the pool
+initializer (``init_worker``) and write it to a per-worker file when asked
+(``flush_worker``) and, through a ``multiprocessing.util.Finalize`` hook,
+when they exit. ``Profiler.dump`` collects those files and the coordinator's
+profile into one pstats file per generation or tournament, by default under
+config.LOGS_PROFILES_DIR; inspect it with ``python -m pstats <file>`` or
+snakeviz.
+
+Profiling slows matches down noticeably, so it is off unless asked for
+(``train.py --profile``, ``main.py --profile``).
+"""
+
+import cProfile
+import datetime
+import glob
+import multiprocessing
+import multiprocessing.util
+import os
+import pstats
+import sys
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+from core import config
+
+
+# Seconds a flushing worker waits for the others before giving up
+FLUSH_TIMEOUT = 60.0
+
+# Per-worker state, set by init_worker
+_worker = {"profile": None, "directory": None, "barrier": None, "flushes": 0}
+# Coordinator profile active in this process (disabled in forked workers)
+_active_profile = None
+
+
+def init_worker(directory, barrier):
+    """Pool initializer: starts profiling the worker process.
+
+    Args:
+        directory: Directory the worker writes its profiles to.
+        barrier: multiprocessing.Barrier sized to the pool, so each of a
+            pool's flush tasks goes to a different worker.
+    """
+    if _active_profile is not None:
+        # Forked while the coordinator was profiling
+        _active_profile.disable()
+    _worker.update(profile=cProfile.Profile(), directory=directory, barrier=barrier, flushes=0)
+    multiprocessing.util.Finalize(None, _write_worker_profile, exitpriority=10)
+    _worker["profile"].enable()
+
+
+def _write_worker_profile():
+    """Writes the worker's profile since the last flush; returns its path (None if empty)."""
+    profile = _worker["profile"]
+    if profile is None:
+        return None
+    profile.disable()
+    profile.create_stats()
+    path = None
+    if profile.stats:
+        _worker["flushes"] += 1
+        path = os.path.join(_worker["directory"], f"worker_{os.getpid()}_{_worker['flushes']}.prof")
+        profile.dump_stats(path)
+    return path
+
+
+def flush_worker(_=None):
+    """Pool task: writes the worker's profile so far and starts a new one.
+
+    Waits on the pool's barrier afterwards, so a pool given one task per
+    worker flushes every worker exactly once.
+
+    Returns:
+        str or None: Path of the written profile.
+    """
+    path = _write_worker_profile()
+    _worker["profile"] = cProfile.Profile()
+    try:
+        _worker["barrier"].wait(FLUSH_TIMEOUT)
+    except threading.BrokenBarrierError:
+        print(f"[Profile] Worker {os.getpid()} gave up waiting for the other workers to flush "
+              f"after {FLUSH_TIMEOUT:.0f}s", file=sys.stderr)
+    _worker["profile"].enable()
+    return path
+
+
+class Profiler:
+    """Profiles a training run or tournament across processes.
+
+    Attributes:
+        directory: Directory of this run's pstats files.
+    """
+
+    def __init__(self, name, directory=None):
+        """
+        Args:
+            name: Run name ("train", "tournament"); the run's files go to
+                ``<directory>/<name>_<timestamp>``.
+            directory: Parent directory. Defaults to config.LOGS_PROFILES_DIR.
+        """
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.directory = os.path.join(directory or config.LOGS_PROFILES_DIR, f"{name}_{timestamp}")
+        os.makedirs(self.directory, exist_ok=True)
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._pools = []
+
+    def worker_args(self, workers):
+        """Returns ``init_worker``'s arguments for a pool of ``workers`` processes."""
+        return self.directory, multiprocessing.Barrier(workers)
+
+    def attach(self, pool, worker_args):
+        """Flushes ``pool``'s workers on every dump until it is detached.
+
+        Args:
+            pool: Pool created with ``init_worker`` as initializer.
+            worker_args: The ``worker_args`` the pool was created with.
+        """
+        _, barrier = worker_args
+        self._pools.append((pool, barrier))
+
+    def detach(self, pool):
+        """Stops flushing ``pool``; its workers still write their profiles on exit."""
+        self._pools = [(attached, barrier) for attached, barrier in self._pools if attached is not pool]
+
+    @contextmanager
+    def profiling(self):
+        """Profiles this process for the duration of the ``with`` block."""
+        global _active_profile
+        if not self._depth:
+            _active_profile = self._profile
+            self._profile.enable()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._profile.disable()
+                _active_profile = None
+
+    def wrap(self, function):
+        """Returns ``function`` profiled on every call (e.g. a fitness function)."""
+        @wraps(function)
+        def profiled(*args, **kwargs):
+            with self.profiling():
+                return function(*args, **kwargs)
+        return profiled
+
+    def dump(self, label):
+        """Merges the profiles collected so far into ``<label>.pstats``.
+
+        Flushes the workers of attached pools, then adds their profiles,
+        those workers of closed pools wrote on exit and this process's
+        profile into one file, and starts counting anew.
+
+        Args:
+            label: File name, e.g. "gen_0003" or "tournament".
+
+        Returns:
+            str or None: Path of the pstats file (None if nothing was profiled).
+        """
+        global _active_profile
+        for pool, barrier in self._pools:
+            pool.map(flush_worker, range(barrier.parties), chunksize=1)
+            if barrier.broken:
+                # A worker timed out, so some may have flushed twice and others
+                # not at all; their profiles go to the next dump
+                print(f"[Profile] Not every worker was flushed for {label}; "
+                      f"resetting the flush barrier", file=sys.stderr)
+                barrier.reset()
+        worker_files = sorted(glob.glob(os.path.join(self.directory, "worker_*.prof")))
+
+        profile, self._profile = self._profile, cProfile.Profile()
+        if self._depth:
+            profile.disable()
+            _active_profile = self._profile
+            self._profile.enable()
+        profile.create_stats()
+        sources = ([profile] if profile.stats else []) + worker_files
+        path = None
+        if sources:
+            stats = pstats.Stats(sources[0])
+            if len(sources) > 1:
+                stats.add(*sources[1:])
+            path = os.path.join(self.directory, f"{label}.pstats")
+            stats.dump_stats(path)
+        for worker_file in worker_files:
+            os.remove(worker_file)
+        return path
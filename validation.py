@@ -4,13 +4,17 @@ This module provides functions for validating trained genomes by testing them
 against opponents and recording match statistics.
 """
 
+import copy
+import multiprocessing
+
 import neat
 from core import config
 from core import engine as game_engine
+from core import simulator as game_simulator
 from ai.opponents import get_rule_based_move
 
 
-def validate_genome(genome, config_neat, generation=0, record_matches=True):
+def validate_genome(genome, config_neat, generation=0, record_matches=True, headless=False):
     """Validates a genome by playing matches against rule-based AI.
     
     The genome plays multiple validation games against a simple rule-based
@@ -22,6 +26,8 @@ def validate_genome(genome, config_neat, generation=0, record_matches=True):
         config_neat: NEAT configuration object.
         generation: Current generation number for metadata. Defaults to 0.
         record_matches: Whether to record matches to disk. Defaults to True.
+        headless: Play on core.simulator.GameSimulator instead of the
+            pygame-backed core.engine.Game. Both share the same physics.
     
     Returns:
         tuple: A 2-tuple containing:
@@ -39,7 +45,7 @@ def validate_genome(genome, config_neat, generation=0, record_matches=True):
     num_games = 5  # Play 5 validation games
     
     for game_idx in range(num_games):
-        game = game_engine.Game()
+        game = game_simulator.GameSimulator() if headless else game_engine.Game()
         run = True
         frame_count = 0
         max_frames = 5000
@@ -109,3 +115,100 @@ def validate_genome(genome, config_neat, generation=0, record_matches=True):
     avg_rally = total_hits / num_games
     win_rate = wins / num_games
     return avg_rally, win_rate
+
+
+# Per-process config of BackgroundValidator workers
+_worker_config = None
+
+
+def _init_validation_worker(config_neat):
+    global _worker_config
+    _worker_config = config_neat
+
+
+def _validate_in_background(genome, generation, record_matches):
+    return validate_genome(genome, _worker_config, generation=generation,
+                           record_matches=record_matches, headless=True)
+
+
+class BackgroundValidator:
+    """Runs validate_genome in a background process.
+
+    Each generation's best genome is submitted once; validation (and match
+    recording) then runs headless in a worker process while the next
+    generation is evaluated. Results are picked up without blocking by
+    ``poll`` and all remaining ones are awaited by ``drain``. Several
+    reporters can share one validator.
+
+    Attributes:
+        results: Dict of {generation: (avg_rally, win_rate)} finished so far.
+    """
+
+    def __init__(self, config_neat, record_matches=True, processes=1):
+        """Starts the validation worker pool.
+
+        Args:
+            config_neat: NEAT configuration object (sent to the workers once).
+            record_matches: Whether validation games are recorded to disk.
+            processes: Number of validation worker processes.
+        """
+        self.record_matches = record_matches
+        self.results = {}
+        self._pending = {}
+        self._pool = multiprocessing.Pool(processes=processes, initializer=_init_validation_worker,
+                                          initargs=(config_neat,))
+
+    def submit(self, generation, genome):
+        """Queues validation of a generation's genome (once per generation)."""
+        if generation in self._pending or generation in self.results:
+            return
+        # apply_async only queues the arguments; the pool pickles them later
+        # on its own thread, while training may already be changing the genome
+        snapshot = copy.deepcopy(genome)
+        self._pending[generation] = self._pool.apply_async(
+            _validate_in_background, (snapshot, generation, self.record_matches))
+
+    def poll(self):
+        """Collects finished validations without blocking.
+
+        Returns:
+            dict: {generation: (avg_rally, win_rate)} finished since the last call.
+        """
+        finished = {}
+        for generation, async_result in list(self._pending.items()):
+            if async_result.ready():
+                finished[generation] = self._result(generation, async_result)
+                del self._pending[generation]
+        self.results.update(finished)
+        return finished
+
+    def drain(self):
+        """Waits for every queued validation.
+
+        Returns:
+            dict: {generation: (avg_rally, win_rate)} finished since the last call.
+        """
+        finished = {}
+        for generation, async_result in sorted(self._pending.items()):
+            finished[generation] = self._result(generation, async_result)
+        self._pending = {}
+        self.results.update(finished)
+        return finished
+
+    @staticmethod
+    def _result(generation, async_result):
+        """Returns a finished validation's result, (0, 0) if the worker raised."""
+        try:
+            return tuple(async_result.get())
+        except Exception as e:
+            # A failed validation must not stop training or hold back later CSV rows
+            print(f"[Validation] Validating generation {generation} failed: {e!r}")
+            return 0, 0
+
+    def close(self):
+        """Waits for pending validations and stops the worker pool."""
+        if self._pool is not None:
+            self.drain()
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -155,7 +155,7 @@ def run_visual_training(seed_genome=None):
                 champion_genome = pickle.load(f)
             print(f"Loaded champion model: {os.path.basename(best_model_path)}")
             # Add to Hall of Fame
-            ai_module.HALL_OF_FAME = [champion_genome]
+            ai_module.HALL_OF_FAME[:] = [champion_genome]
         except Exception as e:
             print(f"Failed to load champion model: {e}")
     